@@ -119,7 +119,8 @@ this range to have at least 20 counts per group:
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
+import hashlib
 import logging
 import os
 from typing import Any, Literal, cast, overload, TYPE_CHECKING
@@ -145,11 +146,14 @@ from sherpa.utils.types import ArrayType, IdType, IdTypes, \
 # There are currently (Sep 2015) no tests that exercise the code that
 # uses the compile_energy_grid symbols.
 from sherpa.astro.utils import arf_fold, rmf_fold, filter_resp, \
-    compile_energy_grid, do_group, expand_grouped_mask
+    compile_energy_grid, do_group, expand_grouped_mask, GroupFilterPlan, \
+    group_adapt, group_adapt_snr, group_bins, group_counts, group_snr, \
+    group_width
+from sherpa.astro.utils.regionmask import region_extent, region_mask
 
 __doctest_requires__ = {
     '.': ['sherpatest'],  # requirements for module-level doctest
-    'DataPHA.group_counts': ['group']
+    'DataPHA.group_counts': ['sherpatest']
     }
 
 if TYPE_CHECKING:
@@ -166,17 +170,27 @@ except ImportError:
     warning('failed to import sherpa.astro.utils._region; Region routines ' +
             'will not be available')
 
+# The dynamic grouping schemes use the group module, from the CIAO
+# tools package, if it is available, otherwise the versions from
+# sherpa.astro.utils.
+#
 groupstatus = False
 try:
     import group as pygroup  # type: ignore
     groupstatus = True
 except ImportError:
     groupstatus = False
-    warning('the group module (from the CIAO tools package) is not ' +
-            'installed.\nDynamic grouping functions will not be available.')
+
+_native_grouping = {"grpNumBins": group_bins,
+                    "grpBinWidth": group_width,
+                    "grpNumCounts": group_counts,
+                    "grpSnr": group_snr,
+                    "grpAdaptive": group_adapt,
+                    "grpAdaptiveSnr": group_adapt_snr}
 
 
-__all__ = ('DataARF', 'DataRMF', 'DataPHA', 'DataIMG', 'DataIMGInt', 'DataRosatRMF')
+__all__ = ('DataARF', 'DataRMF', 'DataPHA', 'DataIMG', 'DataIMGInt', 'DataRosatRMF',
+           'notice_datasets')
 
 
 AnalysisType = Literal["channel", "energy", "wavelength"]
@@ -1587,6 +1601,12 @@ class DataPHA(Data1D):
     _related_fields = Data1D._related_fields + ("counts", "grouping", "quality",
                                                 "backscal", "areascal")
 
+    _plan: tuple | None = None
+    """The GroupFilterPlan and the state it was created for."""
+
+    _axes: dict | None = None
+    """The cached analysis-axis arrays, and the state they were created for."""
+
     def __init__(self,
                  name: str,
                  channel: ArrayType | None,
@@ -2566,6 +2586,68 @@ will be removed. The identifiers can be integers or strings.
 
         return instrument.Response1D(self)
 
+    def _get_cached_axis(self,
+                         key: tuple,
+                         sources: tuple,
+                         values: tuple,
+                         func: Callable[[], tuple[np.ndarray, ...]]
+                         ) -> tuple[np.ndarray, ...]:
+        """Return the analysis-axis arrays, re-using previous values.
+
+        The arrays are only re-created when the analysis state has
+        changed, so that repeated calls - such as when plotting or
+        fitting in wavelength units - do not have to rebuild them.
+
+        Parameters
+        ----------
+        key : tuple
+            Identifies the axis, and includes the units setting.
+        sources : tuple
+            The objects the axis is calculated from (such as the
+            channel array and the response). They are compared by
+            identity, so changing one of these arrays in place is not
+            detected.
+        values : tuple
+            Any arrays, such as the grouping, that are compared by
+            value.
+        func : callable
+            Creates the arrays when there is no valid cached version.
+
+        Returns
+        -------
+        arrays : tuple of ndarray
+            The arrays. Those not taken directly from sources are
+            marked as read only.
+
+        """
+
+        cache = self._axes
+        if cache is None:
+            cache = {}
+            self._axes = cache
+
+        stored = cache.get(key)
+        if stored is not None:
+            arrays, oldsources, oldvalues = stored
+            if all(a is b for a, b in zip(oldsources, sources)) and \
+               all(np.array_equal(a, b) if np.iterable(b) else a is b
+                   for a, b in zip(oldvalues, values)):
+                return arrays
+
+        arrays = func()
+        for arr in arrays:
+            # The source arrays can be returned as is, and they must
+            # remain writeable.
+            #
+            if not any(arr is src for src in sources):
+                arr.setflags(write=False)
+
+        def store(val):
+            return val.copy() if np.iterable(val) else val
+
+        cache[key] = (arrays, sources, tuple(store(v) for v in values))
+        return arrays
+
     def _get_ebins(self,
                    response_id: IdType | None = None,
                    group: bool = True
@@ -2648,11 +2730,16 @@ will be removed. The identifiers can be integers or strings.
         if self.channel is None:
             raise DataErr(f"data set '{self.name}' has no channel information")
 
-        if self.units == 'channel':
-            elo = self.channel
-            ehi = self.channel + 1
+        units = self.units
+        group = self.grouped and bool_cast(group)
+        if units == 'channel':
+            resp_id = None
+            arf, rmf = None, None
         else:
-            arf, rmf = self.get_response(response_id)
+            resp_id = self._fix_response_id(response_id)
+            arf, rmf = self.get_response(resp_id)
+
+        def calc():
             if rmf is not None:
                 if (rmf.e_min is None) or (rmf.e_max is None):
                     raise DataErr('noenergybins', 'RMF')
@@ -2665,19 +2752,31 @@ will be removed. The identifiers can be integers or strings.
                 elo = self.channel
                 ehi = self.channel + 1
 
-        if self.grouped and bool_cast(group):
-            elo = self.apply_grouping(elo, self._min)
-            ehi = self.apply_grouping(ehi, self._max)
+            if group:
+                elo = self.apply_grouping(elo, self._min)
+                ehi = self.apply_grouping(ehi, self._max)
+
+                if len(elo) == 0:
+                    raise DataErr('notmask')
 
-            if len(elo) == 0:
-                raise DataErr('notmask')
+            return (elo, ehi)
+
+        sources = (self.channel, arf, rmf)
+        if rmf is not None:
+            sources += (rmf.e_min, rmf.e_max)
+        elif arf is not None:
+            sources += (arf.energ_lo, arf.energ_hi)
+
+        values = (self.grouping, self.quality_filter) if group else ()
 
         # apply_grouping applies a quality filter to the output
         # but if we get here then there is no equivalent. This
         # is likely confusing, at best, but we don't have good
         # tests to check what we should be doing.
         #
-        return (elo, ehi)
+        out = self._get_cached_axis(("ebins", units, resp_id, group),
+                                    sources, values, calc)
+        return cast(tuple[np.ndarray, np.ndarray], out)
 
     def get_indep(self,
                   filter: bool = True
@@ -2756,6 +2855,31 @@ will be removed. The identifiers can be integers or strings.
 
         """
 
+        # Only the unfiltered grid is cached, since the filtered
+        # version depends on the response filter.
+        #
+        if not filter:
+            sources: tuple = ()
+            for resp_id in self.response_ids:
+                arf, rmf = self.get_response(resp_id)
+                sources += (arf, rmf)
+                if rmf is not None:
+                    sources += (rmf.energ_lo, rmf.energ_hi)
+                elif arf is not None:
+                    sources += (arf.energ_lo, arf.energ_hi)
+
+            key = ("indep", self.units, tuple(self.response_ids))
+            out = self._get_cached_axis(key, sources, (),
+                                        self._calc_indep)
+            return cast(tuple[np.ndarray, np.ndarray], out)
+
+        return self._calc_indep(filter=True)
+
+    def _calc_indep(self,
+                    filter: bool = False
+                    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the values returned by _get_indep."""
+
         energylist = []
         for resp_id in self.response_ids:
             arf, rmf = self.get_response(resp_id)
@@ -3309,6 +3433,10 @@ It is an integer or string.
         data = _check(data)
         ndata = len(data)
 
+        plan = self._get_group_plan(groupfunc, ndata)
+        if plan is not None:
+            return plan.apply(data, groupfunc.__name__)
+
         # We allow the data to have either (using the un-grouped data)
         #
         # - the size of the data object (all channels)
@@ -3358,6 +3486,58 @@ It is an integer or string.
         #
         return self._data_space.filter.apply(gdata)
 
+    def _get_group_plan(self,
+                        groupfunc: Callable,
+                        ndata: int
+                        ) -> GroupFilterPlan | None:
+        """Return the plan used by apply_filter, if it can be used.
+
+        The plan is re-created when the filter or grouping changes.
+        None is returned for those cases the plan does not support,
+        including all channels being filtered out, so that
+        apply_filter can handle them.
+        """
+
+        if groupfunc.__name__ not in ["sum", "_sum_sq", "_min", "_max",
+                                      "_middle"]:
+            return None
+
+        mask = self.mask
+        if mask is False:
+            return None
+
+        grouped = self.grouped
+        qfilt = self.quality_filter if grouped else None
+        grouping = self.grouping if grouped else None
+
+        # The filtered-data case is only supported when there is no
+        # quality filter.
+        #
+        if ndata != self.size and self.quality_filter is not None:
+            return None
+
+        # Compare by value, since the arrays can be changed in place.
+        #
+        stored = self._plan
+        if stored is not None:
+            plan, oldstate = stored
+            state = (mask, grouping, qfilt)
+            if all(np.array_equal(a, b) if np.iterable(b) else a is b
+                   for a, b in zip(oldstate, state)):
+                return plan if plan.nselected > 0 else None
+
+        try:
+            plan = GroupFilterPlan(self.size, grouping, mask, qfilt)
+        except DataErr:
+            # Let apply_filter report the problem.
+            return None
+
+        def store(val):
+            return val.copy() if np.iterable(val) else val
+
+        self._plan = (plan, (store(mask), store(grouping), store(qfilt)))
+        return plan if plan.nselected > 0 else None
+
     @overload
     def apply_grouping(self,
                        data: None,
@@ -3555,14 +3735,14 @@ It is an integer or string.
                        *args, **kwargs) -> None:
         """Group the data using the given function and arguments.
 
-        In order to support the grouping module being optional this
-        routine will error out if it is not loaded (each time it is
-        called). To support Sherpa 4.14.0 and earlier group_func can
-        be a callable, but it is expected to be a string which is the
-        name of the callable from the "group" module (which in this
-        module has been renamed to pygroup if it exists). It also allows
-        the user the capability of sending in a callable that they have
-        written without the need for the group library.
+        To support Sherpa 4.14.0 and earlier group_func can be a
+        callable, but it is expected to be a string which is the name
+        of the callable from the "group" module (which in this module
+        has been renamed to pygroup if it exists). If the group module
+        is not available then the equivalent routine from
+        sherpa.astro.utils is used. It also allows the user the
+        capability of sending in a callable that they have written
+        without the need for the group library.
 
         If group_func is a callable then it must return the grouping
         and quality arrays for the new scheme.
@@ -3570,15 +3750,15 @@ It is an integer or string.
         """
 
         if not callable(group_func):
-            if not groupstatus:
-                raise ImportErr('importfailed', 'group', 'dynamic grouping')
-
             # The assumption is that the symbol exists so it is
-            # not worth catching the AttributeError if it does not,
-            # because that's a programming error and would have been
-            # caught in testing.
+            # not worth catching the AttributeError or KeyError if it
+            # does not, because that's a programming error and would
+            # have been caught in testing.
             #
-            group_func = getattr(pygroup, group_func)
+            if groupstatus:
+                group_func = getattr(pygroup, group_func)
+            else:
+                group_func = _native_grouping[group_func]
 
         keys = list(kwargs.keys())[:]
         for key in keys:
@@ -3989,6 +4169,17 @@ It is an integer or string.
                             maxLength=maxLength, tabStops=tabStops,
                             errorCol=errorCol)
 
+    def _filter_state(self) -> tuple:
+        # The grouping, quality, scaling, and background data also
+        # affect the filtered values.
+        #
+        bkgs = tuple(self.get_background(bid)._filter_state()
+                     for bid in self.background_ids)
+        return super()._filter_state() + \
+            (self._grouping, self._grouped, self._quality,
+             self._quality_filter, self._subtracted, self.exposure,
+             self._backscal, self._areascal, bkgs)
+
     def eval_model_to_fit(self, modelfunc):
         model = super().eval_model_to_fit(modelfunc)
         return self.apply_filter(model)
@@ -4381,17 +4572,25 @@ It is an integer or string.
             return self.channel
 
         elo, ehi = self._get_ebins(response_id=response_id, group=False)
-        emid = (elo + ehi) / 2
+        units = self.units
 
-        if self.units == "energy":
-            return emid
+        def calc():
+            emid = (elo + ehi) / 2
 
-        # The units must be wavelength.
+            if units == "energy":
+                return (emid, )
+
+            # The units must be wavelength.
+            #
+            tiny = np.finfo(np.float32).tiny
+            # In case there are any 0-energy bins replace them
+            emid[emid == 0.0] = tiny
+            return (hc / emid, )
+
+        # The cached array is read only, so return a copy.
         #
-        tiny = np.finfo(np.float32).tiny
-        # In case there are any 0-energy bins replace them
-        emid[emid == 0.0] = tiny
-        return hc / emid
+        key = ("x", units, self._fix_response_id(response_id))
+        return self._get_cached_axis(key, (elo, ehi), (), calc)[0].copy()
 
     def get_xlabel(self) -> str:
         """The label for the independent axis.
@@ -5077,41 +5276,7 @@ It is an integer or string.
         """
 
         ignore = bool_cast(ignore)
-
-        # This condition is checked for in the _data_space.filter call
-        # at the end of the method, but it is easier to enforce it
-        # here so we do not need to worry about possible type errors
-        # when comparing string and number values.
-        #
-        for val, label in zip([lo, hi], ['lower', 'upper']):
-            if isinstance(val, str):
-                # match the error seen from other data classes here
-                raise DataErr('typecheck', f'{label} bound')
-
-        # Validate input
-        #
-        if lo is not None and hi is not None and lo > hi:
-            raise DataErr('bad', 'hi argument', 'must be >= lo')
-
-        # Ensure the limits are physically meaningful, that is
-        # energy and wavelengths are >= 0. Technically it should be
-        # > but using 0 is a nice value for a minimum. We do not
-        # enforce limits if channels are being used because it's
-        # not clear if channels can technically be negative.
-        #
-        # For channels we just require the numbers are integers.
-        #
-        if self.units == 'channel':
-            if lo is not None and not float(lo).is_integer():
-                raise DataErr('bad', 'lo argument', 'must be an integer channel value')
-            if hi is not None and not float(hi).is_integer():
-                raise DataErr('bad', 'hi argument', 'must be an integer channel value')
-
-        else:
-            if lo is not None and lo < 0:
-                raise DataErr('bad', 'lo argument', 'must be >= 0')
-            if hi is not None and hi < 0:
-                raise DataErr('bad', 'hi argument', 'must be >= 0')
+        self._check_notice_limits(lo, hi)
 
         # If any background IDs are actually given, then impose
         # the filter on those backgrounds *only*, and return.  Do
@@ -5159,15 +5324,87 @@ It is an integer or string.
             self.quality_filter = None
             self.notice_response(False)
 
-        # elo and ehi will be in channel (units=channel) or energy
-        # (units=energy or units=wavelength).
-        #
         try:
-            elo, ehi = self._get_ebins(group=self.grouped)
+            bins = self._get_notice_bins(lo, hi)
         except DataErr as de:
             info("Skipping dataset %s: %s", self.name, str(de))
             return
 
+        if bins is None:
+            return
+
+        lo, hi, elo, ehi = bins
+        self._data_space.filter.notice((None, lo), (hi, None),
+                                       (elo, ehi), ignore=ignore,
+                                       integrated=True)
+
+    def _check_notice_limits(self,
+                             lo: float | None,
+                             hi: float | None
+                             ) -> None:
+        """Check the notice limits are valid for the units setting."""
+
+        # This condition is checked for in the _data_space.filter call
+        # at the end of notice, but it is easier to enforce it
+        # here so we do not need to worry about possible type errors
+        # when comparing string and number values.
+        #
+        for val, label in zip([lo, hi], ['lower', 'upper']):
+            if isinstance(val, str):
+                # match the error seen from other data classes here
+                raise DataErr('typecheck', f'{label} bound')
+
+        # Validate input
+        #
+        if lo is not None and hi is not None and lo > hi:
+            raise DataErr('bad', 'hi argument', 'must be >= lo')
+
+        # Ensure the limits are physically meaningful, that is
+        # energy and wavelengths are >= 0. Technically it should be
+        # > but using 0 is a nice value for a minimum. We do not
+        # enforce limits if channels are being used because it's
+        # not clear if channels can technically be negative.
+        #
+        # For channels we just require the numbers are integers.
+        #
+        if self.units == 'channel':
+            if lo is not None and not float(lo).is_integer():
+                raise DataErr('bad', 'lo argument', 'must be an integer channel value')
+            if hi is not None and not float(hi).is_integer():
+                raise DataErr('bad', 'hi argument', 'must be an integer channel value')
+
+        else:
+            if lo is not None and lo < 0:
+                raise DataErr('bad', 'lo argument', 'must be >= 0')
+            if hi is not None and hi < 0:
+                raise DataErr('bad', 'hi argument', 'must be >= 0')
+
+    def _get_notice_bins(self,
+                         lo: float | None,
+                         hi: float | None
+                         ) -> tuple[float | None, float | None,
+                                    np.ndarray, np.ndarray] | None:
+        """Convert the notice limits to the filter arguments.
+
+        Returns
+        -------
+        bins : tuple or None
+            The lo and hi limits, converted to the units of the
+            elo and ehi arrays, and the elo and ehi arrays. None
+            is returned if the filter has no effect.
+
+        Raises
+        ------
+        sherpa.utils.err.DataErr
+            The bins can not be calculated.
+
+        """
+
+        # elo and ehi will be in channel (units=channel) or energy
+        # (units=energy or units=wavelength).
+        #
+        elo, ehi = self._get_ebins(group=self.grouped)
+
         emin = min(elo[[0, -1]])
         emax = max(ehi[[0, -1]])
 
@@ -5177,7 +5414,7 @@ It is an integer or string.
             lims = validate_wavelength_limits(lo, hi, emax)
             if lims is None:
                 # No useful filter to apply
-                return
+                return None
 
             lo, hi = lims
 
@@ -5192,9 +5429,31 @@ It is an integer or string.
             #
             hi += 1
 
-        self._data_space.filter.notice((None, lo), (hi, None),
-                                       (elo, ehi), ignore=ignore,
-                                       integrated=True)
+        return lo, hi, elo, ehi
+
+    def _get_notice_key(self) -> tuple | None:
+        """The values that _get_notice_bins depends on.
+
+        Datasets with the same key create the same filter from the
+        same limits. None is returned if the value can not be
+        determined.
+        """
+
+        if self.size is None or self.channel is None:
+            return None
+
+        src: tuple[np.ndarray | None, ...] = (self.channel,)
+        if self.units != 'channel':
+            arf, rmf = self.get_response()
+            if rmf is not None:
+                src = (rmf.e_min, rmf.e_max)
+            elif arf is not None:
+                src = (arf.energ_lo, arf.energ_hi)
+
+        if self.grouped:
+            src += (self.grouping, self.quality_filter)
+
+        return (self.units, self.size) + src
 
     def to_guess(self):
         elo, ehi = self._get_ebins(group=False)
@@ -5216,11 +5475,6 @@ It is an integer or string.
             y /= arf  # photons/keV/cm^2/sec or photons/Ang/cm^2/sec
         return (y, elo, ehi)
 
-    def to_fit(self, staterrfunc=None):
-        return (self.get_dep(True),
-                self.get_staterror(True, staterrfunc),
-                self.get_syserror(True))
-
     def to_plot(self, yfunc=None, staterrfunc=None, response_id=None):
         """Get arrays required to make plots
 
@@ -5383,6 +5637,162 @@ It is an integer or string.
         self.subtracted = False
 
 
+def _same_notice_key(key1: tuple, key2: tuple) -> bool:
+    """Do the two DataPHA._get_notice_key values match?"""
+
+    if key1[:2] != key2[:2] or len(key1) != len(key2):
+        return False
+
+    for val1, val2 in zip(key1[2:], key2[2:]):
+        if val1 is val2:
+            continue
+
+        if val1 is None or val2 is None or not np.array_equal(val1, val2):
+            return False
+
+    return True
+
+
+def notice_datasets(datasets: Sequence[Data],
+                    lo: float | None = None,
+                    hi: float | None = None,
+                    ignore: bool = False
+                    ) -> None:
+    """Apply the same notice or ignore call to a set of datasets.
+
+    This is the same as calling ``d.notice(lo, hi, ignore=ignore)``
+    for each dataset, but the channel selection is only calculated
+    once for PHA datasets which share the same analysis units,
+    channel or energy grid, and grouping. The background datasets
+    are also filtered.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    datasets : sequence of Data
+       The datasets to filter.
+    lo, hi : number or None, optional
+       The range to change. A value of None means the minimum or
+       maximum permitted value.
+    ignore : bool, optional
+       Set to True if the range should be ignored. The default is
+       to notice the range.
+
+    See Also
+    --------
+    DataPHA.notice
+
+    Examples
+    --------
+
+    >>> chans = np.arange(1, 11)
+    >>> pha1 = DataPHA("a", chans, np.ones(10))
+    >>> pha2 = DataPHA("b", chans, np.zeros(10))
+    >>> notice_datasets([pha1, pha2], 3, 7)
+    >>> pha2.get_filter()
+    '3:7'
+
+    """
+
+    ignore = bool_cast(ignore)
+
+    # Removing the filter does not need any calculation.
+    #
+    if lo is None and hi is None:
+        for data in datasets:
+            data.notice(lo, hi, ignore=ignore)
+
+        return
+
+    # Validate the arguments before changing anything, and collect
+    # the datasets that share a grid.
+    #
+    groups: list[tuple[tuple, list[DataPHA]]] = []
+    bkgs: dict[str, list[DataPHA]] = {}
+    for data in datasets:
+        if not isinstance(data, DataPHA):
+            data.notice(lo, hi, ignore=ignore)
+            continue
+
+        data._check_notice_limits(lo, hi)
+        for bid in data.background_ids:
+            bkgs.setdefault(data.units, []).append(data.get_background(bid))
+
+        key = data._get_notice_key()
+        if key is None:
+            groups.append(((), [data]))
+            continue
+
+        for gkey, members in groups:
+            if gkey and _same_notice_key(gkey, key):
+                members.append(data)
+                break
+        else:
+            groups.append((key, [data]))
+
+    # Each background is filtered using the units of its source
+    # dataset.
+    #
+    for units, bkglist in bkgs.items():
+        old_units = [bkg.units for bkg in bkglist]
+        try:
+            for bkg in bkglist:
+                bkg.units = units
+
+            notice_datasets(bkglist, lo, hi, ignore=ignore)
+        finally:
+            for bkg, old in zip(bkglist, old_units):
+                bkg.units = old
+
+    for _, members in groups:
+        try:
+            bins = members[0]._get_notice_bins(lo, hi)
+        except DataErr as de:
+            for data in members:
+                info("Skipping dataset %s: %s", data.name, str(de))
+
+            continue
+
+        if bins is None:
+            continue
+
+        blo, bhi, elo, ehi = bins
+        mask = filter_bins((None, blo), (bhi, None), (elo, ehi),
+                           integrated=True)
+        for data in members:
+            # Each dataset needs its own copy of the mask.
+            data._data_space.filter.combine(None if mask is None else mask.copy(),
+                                            ignore=ignore)
+
+
+# The transforms used to convert between each pair of coordinate
+# systems.
+#
+_COORD_TRANSFORMS = {frozenset(("logical", "physical")): ("sky", ),
+                     frozenset(("logical", "world")): ("sky", "eqpos"),
+                     frozenset(("physical", "world")): ("eqpos", )}
+
+
+def _transform_key(wcs: "WCS | None") -> tuple | None:
+    """The values that define a transform, for use as a cache key."""
+
+    if wcs is None:
+        return None
+
+    return (wcs.type, tuple(wcs.crval), tuple(wcs.crpix),
+            tuple(wcs.cdelt), wcs.crota, wcs.epoch, wcs.equinox)
+
+
+def _is_separable(wcs: "WCS | None") -> bool:
+    """Does the transform convert each axis independently?"""
+
+    if wcs is None:
+        return True
+
+    return wcs.type == "LINEAR" and wcs.crota == 0
+
+
 class DataIMG(Data2D):
     '''Image data set
 
@@ -5538,6 +5948,11 @@ class DataIMG(Data2D):
         #
         self._orig_indep_axis = (self.coord, x0, x1)
 
+        # The converted axes, keyed by the (base, coord) pair; see
+        # _get_coordsys.
+        #
+        self._coord_cache = {}
+
         super().__init__(name, x0, x1, y, shape, staterror, syserror)
 
         # special case the x-axis labels
@@ -5686,6 +6101,9 @@ class DataIMG(Data2D):
         #
         if state['_region'] is not None:
             state['_region'] = state['_region'].__str__()
+
+        # The converted axes can be large, and are easily re-created.
+        state.pop('_coord_cache', None)
         return state
 
     def __setstate__(self, state):
@@ -5713,6 +6131,8 @@ class DataIMG(Data2D):
         if self._orig_indep_axis is None:
             self._orig_indep_axis = (self.coord, self.x0, self.x1)
 
+        self.__dict__['_coord_cache'] = {}
+
         # This may check the data is correct, based on the coord setting,
         # but is it worth it? It may catch a case when data is loaded into
         # a system without WCS support.
@@ -5839,18 +6259,68 @@ class DataIMG(Data2D):
     # Convert from the _orig_indep_axis tuple (coord, x0, x1) to the
     # required data system (if it isn't already set).
     #
+    # The conversion is cached, since it can be expensive for large
+    # images (in particular for the world system), and the result only
+    # depends on the transforms and the shape of the data. When the
+    # transforms are linear and unrotated, and the axes form a grid,
+    # only the converted axis values are stored.
+    #
     def _get_coordsys(self, coord):
         if self.coord == coord:
             return self.get_indep()
 
         (base, x0, x1) = self._orig_indep_axis
-        x0 = x0.copy()
-        x1 = x1.copy()
         if base == coord:
-            return (x0, x1)
+            return (x0.copy(), x1.copy())
+
+        key = (_transform_key(self.sky), _transform_key(self.eqpos),
+               None if self.shape is None else tuple(self.shape))
+        stored = self._coord_cache.get((base, coord))
+        if stored is None or stored[0] != key or \
+           stored[1] is not x0 or stored[2] is not x1:
+            conv = getattr(self, f'_{base}_to_{coord}')
+            axes = self._get_grid_axes(x0, x1)
+            if axes is not None and \
+               all(_is_separable(getattr(self, name))
+                   for name in _COORD_TRANSFORMS[frozenset((base, coord))]):
+                ax0, ax1 = axes
+                c0, _ = conv(ax0, np.full(ax0.size, ax1[0]))
+                _, c1 = conv(np.full(ax1.size, ax0[0]), ax1)
+                value = ("grid", c0, c1)
+            else:
+                value = ("full", ) + tuple(conv(x0.copy(), x1.copy()))
+
+            stored = (key, x0, x1, value)
+            self._coord_cache[(base, coord)] = stored
 
-        conv = getattr(self, f'_{base}_to_{coord}')
-        return conv(x0, x1)
+        value = stored[3]
+        if value[0] == "grid":
+            c0, c1 = value[1:]
+            return (np.tile(c0, c1.size), np.repeat(c1, c0.size))
+
+        return (value[1].copy(), value[2].copy())
+
+    def _get_grid_axes(self, x0, x1):
+        """Return the axis values if x0 and x1 form a grid.
+
+        The grid must match the shape of the image, with x0 varying
+        fastest, as created by `from_2d_array`.
+        """
+
+        shape = self.shape
+        if shape is None or len(shape) != 2 or \
+           np.prod(shape) != len(x0) or len(x0) != len(x1):
+            return None
+
+        img0 = np.asarray(x0).reshape(shape)
+        img1 = np.asarray(x1).reshape(shape)
+        ax0 = img0[0]
+        ax1 = img1[:, 0]
+        if np.array_equal(img0, np.broadcast_to(ax0, shape)) and \
+           np.array_equal(img1, np.broadcast_to(ax1[:, np.newaxis], shape)):
+            return (ax0.copy(), ax1.copy())
+
+        return None
 
     def get_logical(self):
         return self._get_coordsys("logical")
@@ -5908,11 +6378,18 @@ class DataIMG(Data2D):
     def notice2d(self, val=None, ignore=False):
         """Apply a 2D filter.
 
+        .. versionchanged:: 4.19.0
+           The val argument can be a list of regions, which are
+           combined and evaluated in one pass. Only the pixels within
+           the bounding boxes of the shapes are checked, when the
+           coordinate system is not "world", and the masks are cached
+           (see `sherpa.astro.utils.regionmask.set_region_mask_cache`).
+
         Parameters
         ----------
-        val : str or None, optional
+        val : str, sequence of str, or None, optional
             The filter to apply. It can be a region string or a
-            filename.
+            filename, or a list of them.
         ignore : bool, optional
             If set then the filter should be ignored, not noticed.
 
@@ -5931,14 +6408,48 @@ class DataIMG(Data2D):
         if not regstatus:
             raise ImportErr('importfailed', 'region', 'notice2d')
 
-        # Crete the new region
+        if isinstance(val, str) or not np.iterable(val):
+            vals = [str(val).strip()]
+        else:
+            vals = [str(v).strip() for v in val]
+            if len(vals) == 0:
+                return
+
+        # Create the new region, combining multiple regions so they
+        # can be evaluated in one pass. The bounding boxes of the
+        # shapes are not used for world coordinates since the shapes
+        # need not be simple there (e.g. the region library may
+        # account for the spherical coordinates).
         #
-        val = str(val).strip()
-        reg = Region(val, os.path.isfile(val))
+        reg = None
+        extents: list | None = [] if self.coord != 'world' else None
+        stamps = []
+        for v in vals:
+            isfile = os.path.isfile(v)
+            newreg = Region(v, isfile)
+            reg = newreg if reg is None else reg.union(newreg)
+
+            if isfile:
+                stat = os.stat(v)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+                extents = None
+            else:
+                stamps.append(None)
+                if extents is not None:
+                    extent = region_extent(v)
+                    extents = None if extent is None else extents + extent
 
         # Calculate the mask for this region as an "included" region.
-        mask = reg.mask(self.get_x0(), self.get_x1())
-        mask = mask.astype(bool)
+        x0 = np.asarray(self.get_x0())
+        x1 = np.asarray(self.get_x1())
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(x0.tobytes())
+        digest.update(x1.tobytes())
+        shape = None if self.shape is None else tuple(self.shape)
+        key = (tuple(vals), tuple(stamps), shape, self.coord,
+               digest.hexdigest())
+        mask = region_mask(reg, x0, x1, shape=shape, extents=extents,
+                           key=key)
 
         # Apply the new mask to the existing mask.
         #
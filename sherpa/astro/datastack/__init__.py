@@ -221,12 +221,13 @@ import types
 from sherpa.astro import ui
 from sherpa.utils.logging import config_logger
 from sherpa.astro.datastack.ds import DataStack
+from sherpa.astro.datastack.columnar import ColumnarStack
 
 from .utils import set_template_id
 
 logger = config_logger(__name__)
 
-__all__ = ['set_template_id', 'DataStack',
+__all__ = ['set_template_id', 'DataStack', 'ColumnarStack',
            'clean', 'set_stack_verbosity', 'set_stack_verbose',
            ]
 
@@ -357,7 +358,8 @@ for attr in dir(ui):
         __all__.append(attr)
 
 for funcname in ['clear_stack', 'show_stack', 'get_stack_ids',
-                 'query', 'query_by_header_keyword', 'query_by_obsid']:
+                 'query', 'query_by_header_keyword', 'query_by_obsid',
+                 'to_columnar']:
     setattr(_module, funcname, _datastack_wrap(getattr(DataStack, funcname)))
     __all__.append(funcname)
 
@@ -0,0 +1,350 @@
+#
+#  Copyright (C) 2026  Smithsonian Astrophysical Observatory
+#
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""Store a stack of PHA datasets as contiguous arrays.
+
+The `ColumnarStack` class concatenates the channel data of a set of
+`sherpa.astro.data.DataPHA` objects, so that the grouping and
+filtering of the whole stack is applied with a single NumPy call,
+rather than a call per dataset. It is a `sherpa.data.DataSimulFit`
+object, and so can be used to fit the stack with one statistic call.
+
+.. versionadded:: 4.19.0
+
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from sherpa.astro.data import DataPHA, notice_datasets
+from sherpa.astro.utils import GroupFilterPlan
+from sherpa.data import DataSimulFit, _same_state
+from sherpa.utils.err import DataErr
+from sherpa.utils.numeric_types import SherpaFloat
+
+
+__all__ = ('ColumnarStack', )
+
+
+class ColumnarStack(DataSimulFit):
+    """Store a stack of PHA datasets as contiguous arrays.
+
+    The per-channel values of each dataset (counts, scaled
+    background, BACKSCAL, and grouping) are concatenated into a
+    single array, with the `offsets` attribute giving the start of
+    each dataset. The grouping and filter of each dataset are
+    converted into a single list of selected channels and group
+    boundaries, so that `to_fit` and `eval_model_to_fit` group and
+    filter the whole stack in one step.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    name : str
+        The name for the stack.
+    datasets : sequence of DataPHA
+        The datasets. There must be at least one, and each must
+        have its channels and counts set.
+
+    See Also
+    --------
+    sherpa.astro.datastack.DataStack.to_columnar
+
+    Notes
+    -----
+    The arrays are re-created when the filter, grouping, background
+    subtraction, or data of any of the datasets is changed, so the
+    datasets can still be changed directly, or with the UI layer.
+
+    The model for each dataset is evaluated separately, as each
+    has its own response, but the model values are grouped and
+    filtered as a single array.
+
+    Examples
+    --------
+
+    >>> chans = np.arange(1, 6)
+    >>> pha1 = DataPHA("a", chans, [1, 2, 3, 4, 5])
+    >>> pha2 = DataPHA("b", chans, [2, 2, 2, 2, 2])
+    >>> pha2.grouping = [1, -1, 1, -1, -1]
+    >>> pha2.group()
+    >>> stack = ColumnarStack("stack", [pha1, pha2])
+    >>> stack.notice(2, 5)
+    >>> stack.offsets
+    array([ 0,  5, 10])
+    >>> stack.get_dep()
+    array([2., 3., 4., 5., 4., 6.])
+
+    """
+
+    def __init__(self,
+                 name: str,
+                 datasets: Sequence[DataPHA]) -> None:
+        for data in datasets:
+            if not isinstance(data, DataPHA):
+                raise DataErr(f"data set '{data.name}' is not a PHA data set")
+
+            if data.size is None or data.counts is None:
+                raise DataErr("sizenotset", data.name)
+
+        # The concatenated arrays, and the dataset state they were
+        # created for.
+        #
+        self._columns: dict[str, np.ndarray] | None = None
+        self._state: tuple | None = None
+        super().__init__(name, datasets)
+
+    def _get_columns(self) -> dict[str, np.ndarray]:
+        """Return the concatenated arrays, re-creating them if needed."""
+
+        state = tuple(data._filter_state() for data in self.datasets)
+        if self._columns is not None and self._state is not None and \
+           _same_state(self._state, state):
+            return self._columns
+
+        sizes = [data.size for data in self.datasets]
+        offsets = np.zeros(len(sizes) + 1, dtype=int)
+        np.cumsum(sizes, out=offsets[1:])
+
+        counts = []
+        bkg = []
+        backscal = []
+        grouping = []
+        subtracted = []
+        selected = []
+        starts = []
+        nselected = []
+        ngroups = []
+        nsel = 0
+        for offset, data in zip(offsets, self.datasets):
+            nchan = data.size
+            counts.append(data.counts)
+            if data.background_ids:
+                bkg.append(data.sum_background_data() *
+                           np.ones(nchan, dtype=SherpaFloat))
+            else:
+                bkg.append(np.zeros(nchan, dtype=SherpaFloat))
+
+            scale = data.backscal
+            backscal.append(np.ones(nchan) if scale is None
+                            else scale * np.ones(nchan))
+
+            if data.grouped:
+                grouping.append(data.grouping)
+                plan = GroupFilterPlan(nchan, data.grouping, data.mask,
+                                       data.quality_filter)
+            else:
+                grouping.append(np.ones(nchan, dtype=int))
+                plan = GroupFilterPlan(nchan, mask=data.mask)
+
+            subtracted.append(np.full(nchan, data.subtracted))
+            selected.append(np.arange(nchan)[plan.index] + offset)
+            group_starts = np.arange(plan.nselected) \
+                if plan.offsets is None else plan.offsets
+            starts.append(group_starts + nsel)
+            nselected.append(plan.nselected)
+            ngroups.append(group_starts.size)
+            nsel += plan.nselected
+
+        def cumulative(vals):
+            out = np.zeros(len(vals) + 1, dtype=int)
+            np.cumsum(vals, out=out[1:])
+            return out
+
+        cols = {"offsets": offsets,
+                "counts": np.concatenate(counts).astype(SherpaFloat),
+                "background": np.concatenate(bkg),
+                "backscal": np.concatenate(backscal),
+                "grouping": np.concatenate(grouping),
+                "subtracted": np.concatenate(subtracted),
+                "selected": np.concatenate(selected),
+                "starts": np.concatenate(starts),
+                "selected_offsets": cumulative(nselected),
+                "group_offsets": cumulative(ngroups)}
+        for val in cols.values():
+            val.setflags(write=False)
+
+        self._columns = cols
+        self._state = state
+        return cols
+
+    @property
+    def nspec(self) -> int:
+        """The number of datasets in the stack."""
+        return len(self.datasets)
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """The start of each dataset in the channel arrays.
+
+        There is one more element than the number of datasets, so
+        the channels of dataset i are ``offsets[i]:offsets[i + 1]``.
+        """
+        return self._get_columns()["offsets"]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The counts of each channel, for all the datasets."""
+        return self._get_columns()["counts"]
+
+    @property
+    def background(self) -> np.ndarray:
+        """The scaled background counts of each channel.
+
+        The value is 0 for datasets with no background.
+        """
+        return self._get_columns()["background"]
+
+    @property
+    def backscal(self) -> np.ndarray:
+        """The BACKSCAL value of each channel."""
+        return self._get_columns()["backscal"]
+
+    @property
+    def grouping(self) -> np.ndarray:
+        """The grouping of each channel.
+
+        Datasets that are not grouped have each channel as a group.
+        """
+        return self._get_columns()["grouping"]
+
+    @property
+    def exposure(self) -> np.ndarray:
+        """The exposure time of each dataset (NaN if not set)."""
+        return np.asarray([np.nan if data.exposure is None
+                           else data.exposure for data in self.datasets])
+
+    def get_counts(self, idx: int) -> np.ndarray:
+        """Return the counts of a dataset, without copying them.
+
+        Parameters
+        ----------
+        idx : int
+            The position of the dataset in the stack, starting at 0.
+
+        Returns
+        -------
+        counts : ndarray
+            A read-only view of the counts.
+
+        """
+        offsets = self.offsets
+        return self.counts[offsets[idx]:offsets[idx + 1]]
+
+    def _group(self, vals: np.ndarray) -> np.ndarray:
+        """Group and filter the concatenated channel values.
+
+        The input can either contain all the channels or just the
+        selected channels.
+        """
+
+        cols = self._get_columns()
+        if vals.size == cols["counts"].size:
+            vals = vals[cols["selected"]]
+
+        if vals.size == 0:
+            return np.zeros(0, dtype=SherpaFloat)
+
+        return np.add.reduceat(vals, cols["starts"])
+
+    def notice(self,
+               lo: float | None = None,
+               hi: float | None = None,
+               ignore: bool = False
+               ) -> None:
+        """Notice or ignore a range in all the datasets.
+
+        See `sherpa.astro.data.notice_datasets`.
+        """
+        notice_datasets(self.datasets, lo, hi, ignore=ignore)
+
+    def ignore(self,
+               lo: float | None = None,
+               hi: float | None = None
+               ) -> None:
+        """Ignore a range in all the datasets."""
+        self.notice(lo, hi, ignore=True)
+
+    def subtract(self) -> None:
+        """Subtract the background from all the datasets."""
+        for data in self.datasets:
+            data.subtract()
+
+    def unsubtract(self) -> None:
+        """Remove the background subtraction from all the datasets."""
+        for data in self.datasets:
+            data.unsubtract()
+
+    def get_dep(self) -> np.ndarray:
+        """Return the grouped and filtered counts of all the datasets.
+
+        Returns
+        -------
+        dep : ndarray
+            The grouped and filtered counts, after any background
+            subtraction, of each dataset in turn.
+
+        """
+
+        cols = self._get_columns()
+        counts = cols["counts"]
+        if cols["subtracted"].any():
+            counts = counts - cols["subtracted"] * cols["background"]
+
+        return self._group(counts)
+
+    def to_fit(self, staterrfunc=None):
+        for data in self.datasets:
+            if data.subtracted or data.staterror is not None or \
+               data.syserror is not None:
+                return super().to_fit(staterrfunc)
+
+        dep = self.get_dep()
+        staterr = None if staterrfunc is None else staterrfunc(dep)
+        return dep, staterr, None
+
+    def eval_model_to_fit(self, modelfuncs):
+        cols = self._get_columns()
+        offsets = cols["offsets"]
+        soffsets = cols["selected_offsets"]
+
+        # The model can either return the values for the selected
+        # channels or for all channels (as the response models do).
+        #
+        vals = []
+        for idx, (func, data) in enumerate(zip(modelfuncs, self.datasets)):
+            start, end = soffsets[idx], soffsets[idx + 1]
+            if start == end:
+                continue
+
+            mvals = np.asarray(func(*data.get_indep(filter=True)))
+            if mvals.size == data.size:
+                mvals = mvals[cols["selected"][start:end] - offsets[idx]]
+            elif mvals.size != end - start:
+                raise DataErr("mismatchn", "filtered data", "model",
+                              end - start, mvals.size)
+
+            vals.append(mvals)
+
+        if len(vals) == 0:
+            return np.zeros(0, dtype=SherpaFloat)
+
+        return self._group(np.concatenate(vals))
@@ -23,8 +23,10 @@ from sherpa.utils.err import IOErr
 from sherpa.utils.formatting import html_table, html_from_sections
 from sherpa.utils import send_to_pager
 from sherpa.astro import ui
+from sherpa.astro.io import read_pha_files
+from .columnar import ColumnarStack
 from .utils import load_error_msg, load_wrapper, model_wrapper, \
-    simple_wrapper, fit_wrapper, plot_wrapper
+    simple_wrapper, ids_wrapper, fit_wrapper, plot_wrapper
 
 logger = config_logger(__name__)
 
@@ -251,7 +253,8 @@ class DataStack():
             self._add_dataset(dataid)
 
     # DOC-TODO This docstring can probably be expanded
-    def load_pha(self, id, arg=None, use_errors=False):
+    def load_pha(self, id, arg=None, use_errors=False, numcores=None,
+                 share_responses=False):
         """Load multiple data arrays.
 
         This extends ``sherpa.astro.ui.load_arrays`` to load multiple
@@ -260,6 +263,25 @@ class DataStack():
         The usual ``filename`` argument can be a stack file with multiple
         data files defined in it. In this case, the load function will be
         called as many times as datasets are included in the stack file.
+
+        .. versionchanged:: 4.19.0
+           The files in a stack file are read in parallel. The
+           numcores and share_responses arguments were added.
+
+        Parameters
+        ----------
+        numcores : int or None, optional
+           The maximum number of threads used to read in the files
+           of a stack file. The default is to use the number of
+           cores.
+        share_responses : bool, optional
+           Should the datasets of a stack file share the ARF and RMF
+           objects when they use the same files? This means that the
+           files are only read in once, but changes to a response -
+           including the filter applied when fitting datasets with
+           multiple responses - are seen by all the datasets, so
+           the default is for each dataset to have its own copy.
+
         """
         if arg is None:
             id, arg = arg, id
@@ -272,12 +294,34 @@ class DataStack():
                 raise AttributeError(load_error_msg(id))
 
         # File Stacks. If the file argument is a stack file, expand the
-        # file and call this function for each file in the stack.
+        # file and read in the files together.
         try:
-            for infile in stk.build(arg):
-                self._load_func(ui.load_pha, infile, use_errors)
+            infiles = stk.build(arg)
         except (NameError, OSError, IOErr):
             self._load_func(ui.load_pha, arg, use_errors)
+            return
+
+        try:
+            phasets = read_pha_files(infiles, use_errors=use_errors,
+                                     numcores=numcores,
+                                     share_responses=share_responses)
+        except (OSError, IOErr):
+            if len(infiles) != 1:
+                raise
+
+            # This matches the original behavior when the argument
+            # is not a stack file.
+            #
+            self._load_func(ui.load_pha, arg, use_errors)
+            return
+
+        kwargs = {"use_errors": True} if use_errors else {}
+        for infile, phaset in zip(infiles, phasets):
+            dataid = self._get_dataid()
+            logger.info('Loading dataset id {0}'.format(dataid))
+            ui._session._load_data(dataid, phaset, filename=infile,
+                                   kwargs=kwargs)
+            self._add_dataset(dataid)
 
     def thaw(self, *pars):
         """Apply the thaw command to specified parameters for each dataset.
@@ -381,6 +425,40 @@ class DataStack():
         """
         self._sherpa_par(ui.unlink, par, 'Unlinking %s')
 
+    def to_columnar(self, name='stack'):
+        """Return the PHA datasets of the stack as a ColumnarStack.
+
+        .. versionadded:: 4.19.0
+
+        Parameters
+        ----------
+        name : str, optional
+           The name of the returned object.
+
+        Returns
+        -------
+        stack : sherpa.astro.datastack.ColumnarStack
+           The datasets, in the order of the stack. The object
+           can be used to fit all the datasets with a single
+           statistic call.
+
+        Examples
+        --------
+
+        Fit all the datasets in the stack using the Cash statistic:
+
+        >>> from sherpa.fit import Fit
+        >>> from sherpa.models import SimulFitModel
+        >>> from sherpa.stats import Cash
+        >>> stack = to_columnar([])
+        >>> models = [ui.get_model(idval) for idval in get_stack_ids()]
+        >>> fit = Fit(stack, SimulFitModel('stack', models), Cash())
+        >>> res = fit.fit()
+
+        """
+        datasets = [ui.get_data(x['id']) for x in self.filter_datasets()]
+        return ColumnarStack(name, datasets)
+
     def query(self, func):
         """Return the data sets identified by a function.
 
@@ -505,8 +583,8 @@ class DataStack():
     set_bkg_full_model = model_wrapper(ui.set_bkg_full_model)
     subtract = simple_wrapper(ui.subtract)
     unsubtract = simple_wrapper(ui.unsubtract)
-    notice = simple_wrapper(ui.notice_id)
-    ignore = simple_wrapper(ui.ignore_id)
+    notice = ids_wrapper(ui.notice_id)
+    ignore = ids_wrapper(ui.ignore_id)
     get_arf = simple_wrapper(ui.get_arf)
     get_rmf = simple_wrapper(ui.get_rmf)
     get_response = simple_wrapper(ui.get_response)
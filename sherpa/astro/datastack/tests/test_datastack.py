@@ -26,10 +26,17 @@ import numpy as np
 
 import pytest
 
+from sherpa.utils.err import DataErr
 from sherpa.utils.testing import requires_fits, requires_group, requires_stk
 from sherpa.astro import ui
-from sherpa.astro import datastack
+from sherpa.astro import datastack, io
+from sherpa.astro.data import DataPHA
 from sherpa.astro.datastack import DataStack
+from sherpa.astro.instrument import create_delta_rmf
+from sherpa.data import Data1D, DataSimulFit
+from sherpa.fit import Fit
+from sherpa.models import SimulFitModel
+from sherpa.stats import Cash, Chi2DataVar
 
 from acis_bkg_model import acis_bkg_model
 
@@ -822,3 +829,169 @@ def test_wrapped_funcs_in_all():
     func = datastack.set_source
     assert 'set_model' in datastack.__all__
     assert 'set_source' in datastack.__all__
+
+
+def setup_columnar_stack():
+    """Create three PHA datasets in the default stack."""
+
+    chans = np.arange(1, 21)
+    egrid = np.linspace(0.1, 2.1, 21)
+    rmf = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                           e_max=egrid[1:])
+    counts = [chans % 5, chans % 3 + 2, np.full(20, 4)]
+    datastack.load_arrays([[chans, cts, DataPHA] for cts in counts])
+    for idval in datastack.get_stack_ids():
+        ui.set_rmf(idval, rmf)
+        ui.set_exposure(idval, 100)
+        ui.set_source(idval, ui.polynom1d.mdl)
+
+    ui.set_grouping(2, [1, -1, -1, -1] * 5)
+    ui.group(2)
+    mdl.c0 = 2
+    mdl.c1 = 0.5
+
+
+def check_columnar_stack(stack):
+    """Compare the stack to the separate datasets."""
+
+    ids = datastack.get_stack_ids()
+    datasets = [ui.get_data(idval) for idval in ids]
+    models = SimulFitModel('m', [ui.get_model(idval) for idval in ids])
+    simul = DataSimulFit('d', datasets)
+
+    expected = np.concatenate([d.get_dep(filter=True) for d in datasets])
+    assert stack.get_dep() == pytest.approx(expected)
+
+    stat = Chi2DataVar()
+    got = stack.to_fit(stat.calc_staterror)
+    exp = simul.to_fit(stat.calc_staterror)
+    assert got[0] == pytest.approx(exp[0])
+    assert got[1] == pytest.approx(exp[1])
+
+    mvals = stack.eval_model_to_fit(models)
+    assert mvals == pytest.approx(simul.eval_model_to_fit(models))
+    assert stat.calc_stat(stack, models)[0] == \
+        pytest.approx(stat.calc_stat(simul, models)[0])
+
+
+def test_columnar_stack(ds_setup):
+    """The columnar stack matches the separate datasets."""
+
+    setup_columnar_stack()
+    datastack.notice([], 0.5, 1.5)
+    stack = datastack.to_columnar([])
+    models = SimulFitModel('m', [ui.get_model(idval) for idval in [1, 2, 3]])
+    stat = Cash()
+    datasets = DataSimulFit('d', [ui.get_data(idval) for idval in [1, 2, 3]])
+    assert stat.calc_stat(stack, models)[0] == \
+        pytest.approx(stat.calc_stat(datasets, models)[0])
+
+    res1 = Fit(stack, models, stat).fit()
+    assert res1.succeeded
+    mdl.c0 = 2
+    mdl.c1 = 0.5
+    res2 = Fit(datasets, models, stat).fit()
+    assert res1.statval == pytest.approx(res2.statval)
+    assert res1.parvals == pytest.approx(res2.parvals)
+    assert isinstance(stack, datastack.ColumnarStack)
+    assert stack.nspec == 3
+    assert stack.offsets == pytest.approx([0, 20, 40, 60])
+    assert stack.get_counts(2) == pytest.approx([4] * 20)
+    assert not stack.counts.flags.writeable
+    assert stack.exposure == pytest.approx([100] * 3)
+
+    assert ui.get_filter(1) == '0.500000000000:1.500000000000'
+    assert ui.get_filter(2) == '0.500000000000:1.700000000000'
+    check_columnar_stack(stack)
+
+
+def test_columnar_stack_changes(ds_setup):
+    """Changes to the datasets are picked up."""
+
+    setup_columnar_stack()
+    stack = datastack.to_columnar([])
+    check_columnar_stack(stack)
+
+    ui.ignore_id(1, 0.8, 1.2)
+    ui.ungroup(2)
+    check_columnar_stack(stack)
+
+    stack.ignore(None, 0.4)
+    assert ui.get_filter(3) == '0.400000000000:2.100000000000'
+    check_columnar_stack(stack)
+
+    # The stack can include datasets with no selected channels.
+    #
+    ui.ignore_id(3)
+    expected = [ui.get_dep(idval, filter=True) for idval in [1, 2]]
+    assert stack.get_dep() == pytest.approx(np.concatenate(expected))
+
+    models = SimulFitModel('m', [ui.get_model(idval) for idval in [1, 2, 3]])
+    mvals = [ui.get_data(idval).eval_model_to_fit(ui.get_model(idval))
+             for idval in [1, 2]]
+    assert stack.eval_model_to_fit(models) == \
+        pytest.approx(np.concatenate(mvals))
+
+
+def test_columnar_stack_subtract(ds_setup):
+    """Background subtraction is supported."""
+
+    setup_columnar_stack()
+    for idval in datastack.get_stack_ids():
+        bkg = DataPHA('bkg', np.arange(1, 21), np.ones(20), exposure=200)
+        ui.set_bkg(idval, bkg)
+
+    stack = datastack.to_columnar([])
+    stack.subtract()
+    assert ui.get_data(1).subtracted
+    assert stack.background == pytest.approx(np.full(60, 0.5))
+    check_columnar_stack(stack)
+
+
+def test_columnar_stack_not_pha():
+    """Only PHA datasets are supported."""
+
+    with pytest.raises(DataErr,
+                       match="^data set 'x' is not a PHA data set$"):
+        datastack.ColumnarStack('stack', [Data1D('x', [1, 2], [3, 4])])
+
+
+class SplitStack:
+    """Support the comma-separated stack syntax when stk is missing."""
+
+    @staticmethod
+    def build(arg):
+        return arg.split(',')
+
+
+@requires_fits
+@pytest.mark.parametrize("share", [False, True])
+def test_load_pha_stack_responses(share, ds_setup, tmp_path, monkeypatch):
+    """The files are read in together and can share the responses."""
+
+    monkeypatch.setattr(datastack.ds, "stk", SplitStack, raising=False)
+
+    egrid = np.linspace(0.5, 1.5, 11)
+    rmf = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                           e_max=egrid[1:])
+    io.write_rmf(str(tmp_path / "src.rmf"), rmf)
+
+    infiles = []
+    for idx in range(3):
+        pha = DataPHA(f"p{idx}", np.arange(1, 11), np.arange(10) * idx)
+        pha.header["RESPFILE"] = "src.rmf"
+        infile = str(tmp_path / f"src{idx}.pha")
+        io.write_pha(infile, pha, ascii=False)
+        infiles.append(infile)
+
+    kwargs = {"share_responses": True} if share else {}
+    datastack.load_pha(','.join(infiles), numcores=2, **kwargs)
+    assert datastack.get_stack_ids() == [1, 2, 3]
+    rmfs = [ui.get_data(idval).get_rmf() for idval in [1, 2, 3]]
+    assert (rmfs[0] is rmfs[1]) == share
+    assert (rmfs[0] is rmfs[2]) == share
+    for idx in range(3):
+        data = ui.get_data(idx + 1)
+        assert data.name == infiles[idx]
+        assert data.counts == pytest.approx(np.arange(10) * idx)
+        assert ui._session._load_data_store[idx + 1]["filename"] == infiles[idx]
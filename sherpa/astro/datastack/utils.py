@@ -28,7 +28,7 @@ logger = config_logger(__name__)
 
 ID_STR = '__ID'
 
-__all__ = ['model_wrapper', 'load_wrapper', 'simple_wrapper',
+__all__ = ['model_wrapper', 'load_wrapper', 'simple_wrapper', 'ids_wrapper',
            'fit_wrapper', 'plot_wrapper', 'set_template_id',
            'load_error_msg', 'create_stack_model']
 
@@ -202,6 +202,26 @@ def simple_wrapper(func):
     return wrapfunc
 
 
+def ids_wrapper(func):
+    def wrapfunc(self, *args, **kwargs):
+        """Apply a Sherpa function to all the datasets with one call.
+
+        The function must accept a list of identifiers as its first
+        argument, which allows it to process the datasets together.
+        """
+        ids = [x['id'] for x in self.filter_datasets()]
+        if not ids:
+            return
+
+        logger.info('Running {0} with args={1} and kwargs={2} for ids={3}'.format(
+            func.__name__, args, kwargs, ids))
+        func(ids, *args, **kwargs)
+
+    wrapfunc.__name__ = func.__name__
+    wrapfunc.__doc__ = func.__doc__
+    return wrapfunc
+
+
 def fit_wrapper(func):
     def _fit(self, *args, **kwargs):
         """Fit or error analysis for all the datasets in the stack.
@@ -62,14 +62,23 @@ I/O backends shipped with sherpa:
 
 """
 
-from collections.abc import Callable, Sequence, Mapping
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Sequence, \
+    Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from configparser import ConfigParser
-from contextlib import suppress, AbstractContextManager
+from contextlib import contextmanager, nullcontext, suppress, \
+    AbstractContextManager
+import hashlib
 import importlib
 import importlib.metadata
+import json
 import logging
+import os
 from pathlib import Path
 import re
+import tempfile
+import threading
 from typing import TYPE_CHECKING, Any, Literal, Type, TypeVar
 from types import ModuleType
 
@@ -84,6 +93,7 @@ from sherpa.io import _check_args
 from sherpa.utils import is_subclass
 from sherpa.utils.err import ArgumentErr, DataErr, IOErr, IdentifierErr
 from sherpa.utils.numeric_types import SherpaFloat, SherpaUInt
+from sherpa.utils.parallel import ncpus
 
 from .types import NamesType, HdrTypeArg, HdrType, DataType, \
     Header, HeaderItem, Column, TableBlock, ImageBlock, \
@@ -91,7 +101,8 @@ from .types import NamesType, HdrTypeArg, HdrType, DataType, \
 
 
 # Skip functions that need input files in their examples
-__doctest_skip__ = ['read_table', 'read_image', 'read_ascii']
+__doctest_skip__ = ['read_table', 'read_image', 'read_ascii',
+                    'shared_responses', 'set_response_cache']
 
 __doctest_requires__ = {# for some tests pycrates would also do, but the syntax does not allow for an OR
                         '*': ['astropy'],
@@ -124,7 +135,9 @@ T = TypeVar('T')
 
 __all__ = ('backend', 'IO_BACKENDS', 'set_io_backend', 'TemporaryIOBackend',
            'read_table', 'read_image', 'read_arf', 'read_rmf', 'read_arrays',
-           'read_pha', 'write_image', 'write_pha', 'write_table',
+           'read_pha', 'read_pha_files', 'shared_responses',
+           'set_response_cache', 'clear_response_cache',
+           'write_image', 'write_pha', 'write_table',
            'write_arf', 'write_rmf',
            'pack_table', 'pack_image', 'pack_pha', 'read_table_blocks')
 
@@ -609,6 +622,30 @@ def read_arf(arg) -> DataARF:
     -------
     data : sherpa.astro.data.DataARF
 
+    See Also
+    --------
+    set_response_cache
+
+    Notes
+    -----
+    If `set_response_cache` has been used to enable caching then
+    the same object may be returned for repeated calls with the
+    same file name.
+
+    """
+
+    return _read_cached_response(arg, "arf", _parse_arf,
+                                 lambda filename, data: DataARF(filename, **data))
+
+
+def _parse_arf(arg) -> tuple[str, dict[str, Any]]:
+    """Read in the ARF data.
+
+    Returns
+    -------
+    filename, data : str, dict
+        The file name and the arguments needed to create a DataARF.
+
     """
 
     block, filename = backend.get_arf_data(arg)
@@ -628,7 +665,7 @@ def read_arf(arg) -> DataARF:
             "header": header,
             "ethresh": ogip_emin}
 
-    return DataARF(filename, **data)
+    return filename, data
 
 
 def _extract_rmf(matrix: MatrixBlock,
@@ -767,6 +804,29 @@ def read_rmf(arg) -> DataRMF:
     -------
     data : sherpa.astro.data.DataRMF or subclass
 
+    See Also
+    --------
+    set_response_cache
+
+    Notes
+    -----
+    If `set_response_cache` has been used to enable caching then
+    the same object may be returned for repeated calls with the
+    same file name.
+
+    """
+
+    return _read_cached_response(arg, "rmf", _parse_rmf, _rmf_factory)
+
+
+def _parse_rmf(arg) -> tuple[str, dict[str, Any]]:
+    """Read in the RMF data.
+
+    Returns
+    -------
+    filename, data : str, dict
+        The file name and the arguments needed to create a DataRMF.
+
     """
 
     matrixes, ebounds, filename = backend.get_rmf_data(arg)
@@ -784,7 +844,7 @@ def read_rmf(arg) -> DataRMF:
     #
     matrix = matrixes[0]
     data = _extract_rmf(matrix, ebounds, filename)
-    return _rmf_factory(filename, data)
+    return filename, data
 
 
 def _rmf_factory(filename: str,
@@ -800,6 +860,389 @@ def _rmf_factory(filename: str,
     return rmf_class(filename, **data)
 
 
+# The process-wide response cache, used by read_arf and read_rmf. The
+# in-memory cache maps from (kind, path, modification time, size) to
+# the file name, the arguments needed to create the response object,
+# and the size of the arrays in bytes, with the least-recently used
+# item first. The on-disk cache stores the arguments.
+#
+_response_cache: OrderedDict[tuple, tuple[str, dict[str, Any], int]] = \
+    OrderedDict()
+_response_cache_nbytes = 0
+_response_cache_maxbytes = 0
+_response_cache_dir: Path | None = None
+_response_cache_lock = threading.Lock()
+
+# Change this if the format of the on-disk cache changes.
+_RESPONSE_CACHE_VERSION = 1
+
+
+def set_response_cache(maxbytes: int = 0,
+                       cachedir: str | os.PathLike | None = None
+                       ) -> None:
+    """Cache the ARF and RMF data read in by read_arf and read_rmf.
+
+    The response data read in by `read_arf` and `read_rmf` can be
+    stored in memory, so that repeated reads of the same file - for
+    this or any other session in the process - do not need to read
+    the file, and it can also be stored on disk, so that later runs
+    can skip reading the FITS file. Files are considered the same if
+    they have the same path, modification time, and size. Each read
+    returns a new object, so changes made to a response are not
+    seen by other datasets.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    maxbytes : int, optional
+        The maximum size, in bytes, of the array data stored by the
+        in-memory cache. When the limit is reached the
+        least-recently used responses are removed from the cache. A
+        value of 0 turns off the in-memory cache.
+    cachedir : str, os.PathLike, or None, optional
+        The directory used to store the parsed response data, which
+        is created if needed. A value of None turns off the on-disk
+        cache.
+
+    See Also
+    --------
+    clear_response_cache, read_arf, read_rmf
+
+    Notes
+    -----
+    The caches are only used when the response is read from a file
+    name, rather than an object created by the I/O backend.
+
+    The files in the on-disk cache are not removed when the
+    response file changes, so the directory may need to be cleaned
+    out occasionally.
+
+    Examples
+    --------
+
+    Store up to 500 MB of response data in memory, and also save
+    the data to the directory "rspcache":
+
+    >>> set_response_cache(500 * 1024 * 1024, cachedir="rspcache")
+
+    Turn off the caches:
+
+    >>> set_response_cache()
+
+    """
+
+    global _response_cache_maxbytes, _response_cache_dir
+
+    if maxbytes < 0:
+        raise ArgumentErr("bad", "maxbytes", "must be 0 or positive")
+
+    if cachedir is not None:
+        cachedir = Path(cachedir)
+        try:
+            cachedir.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            raise IOErr("openfailed",
+                        f"unable to create {cachedir}: {exc}") from exc
+
+    with _response_cache_lock:
+        _response_cache_maxbytes = int(maxbytes)
+        _response_cache_dir = cachedir
+        _evict_responses()
+
+
+def clear_response_cache() -> None:
+    """Remove all the responses from the in-memory cache.
+
+    The on-disk cache, if set, is not changed.
+
+    .. versionadded:: 4.19.0
+
+    See Also
+    --------
+    set_response_cache
+
+    """
+
+    global _response_cache_nbytes
+
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache_nbytes = 0
+
+
+def _evict_responses() -> None:
+    """Drop the oldest responses until the cache is small enough.
+
+    The lock must be held when this is called.
+    """
+
+    global _response_cache_nbytes
+
+    while _response_cache and \
+          _response_cache_nbytes > _response_cache_maxbytes:
+        _, (_, _, nbytes) = _response_cache.popitem(last=False)
+        _response_cache_nbytes -= nbytes
+
+
+def _response_cache_path(key: tuple) -> Path:
+    """The name of the on-disk cache file for the response."""
+
+    assert _response_cache_dir is not None
+    label = f"{_RESPONSE_CACHE_VERSION}:{key!r}"
+    digest = hashlib.sha256(label.encode()).hexdigest()
+    return _response_cache_dir / f"{key[0]}-{digest[:32]}.npz"
+
+
+def _read_response_cache_file(key: tuple) -> dict[str, Any] | None:
+    """Read the response data from the on-disk cache, if it exists."""
+
+    path = _response_cache_path(key)
+    if not path.is_file():
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as fh:
+            meta = json.loads(str(fh["__meta__"]))
+            data = {name: fh[name] for name in fh.files
+                    if name != "__meta__"}
+
+    except (OSError, ValueError, KeyError) as exc:
+        warning("unable to read response cache file %s: %s", path, exc)
+        return None
+
+    if meta.pop("__version__", None) != _RESPONSE_CACHE_VERSION:
+        return None
+
+    data.update(meta)
+    return data
+
+
+def _write_response_cache_file(key: tuple, data: Mapping[str, Any]) -> None:
+    """Write the response data to the on-disk cache."""
+
+    def convert(val):
+        # Convert NumPy scalars in the header.
+        try:
+            return val.item()
+        except AttributeError:
+            return str(val)
+
+    arrays = {}
+    meta: dict[str, Any] = {"__version__": _RESPONSE_CACHE_VERSION}
+    for name, val in data.items():
+        if isinstance(val, np.ndarray):
+            arrays[name] = val
+        else:
+            meta[name] = val
+
+    path = _response_cache_path(key)
+    try:
+        arrays["__meta__"] = np.asarray(json.dumps(meta, default=convert))
+
+        # Write to a temporary file to avoid other processes seeing
+        # a partially-written file.
+        #
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp",
+                                         delete=False) as fh:
+            tmpname = fh.name
+            np.savez(fh, **arrays)
+
+        os.replace(tmpname, path)
+
+    except (OSError, TypeError, ValueError) as exc:
+        warning("unable to write response cache file %s: %s", path, exc)
+
+
+def _copy_response_data(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy the arrays and header used to create a response."""
+
+    return {name: val.copy() if isinstance(val, (np.ndarray, dict))
+            else val for name, val in data.items()}
+
+
+def _read_cached_response(arg,
+                          kind: str,
+                          parse: Callable[[Any], tuple[str, dict[str, Any]]],
+                          create: Callable[[str, dict[str, Any]], T]
+                          ) -> T:
+    """Read in a response, using the response cache if set.
+
+    Parameters
+    ----------
+    arg
+        The argument to read_arf or read_rmf.
+    kind : str
+        The response type ("arf" or "rmf").
+    parse : callable
+        Read in the response, returning the file name and the
+        arguments needed to create the response.
+    create : callable
+        Create the response object from the file name and the
+        arguments.
+
+    """
+
+    global _response_cache_nbytes
+
+    usecache = _response_cache_maxbytes > 0 or \
+        _response_cache_dir is not None
+    key = None
+    if usecache and isinstance(arg, str):
+        try:
+            stat = os.stat(arg)
+        except OSError:
+            pass
+        else:
+            key = (kind, os.path.realpath(arg), stat.st_mtime_ns,
+                   stat.st_size)
+
+    if key is None:
+        filename, data = parse(arg)
+        return create(filename, data)
+
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None:
+            _response_cache.move_to_end(key)
+
+    # Each call creates a new object, with its own copy of the
+    # arrays, so that changes to one response do not affect the
+    # others.
+    #
+    if entry is not None:
+        filename, data, _ = entry
+        return create(filename, _copy_response_data(data))
+
+    cachedir = _response_cache_dir
+    cached = None if cachedir is None else _read_response_cache_file(key)
+    if cached is None:
+        filename, data = parse(arg)
+        if cachedir is not None:
+            _write_response_cache_file(key, data)
+
+    else:
+        filename, data = arg, cached
+
+    out = create(filename, _copy_response_data(data))
+
+    nbytes = sum(val.nbytes for val in data.values()
+                 if isinstance(val, np.ndarray))
+    with _response_cache_lock:
+        if nbytes <= _response_cache_maxbytes and key not in _response_cache:
+            _response_cache[key] = (filename, data, nbytes)
+            _response_cache_nbytes += nbytes
+            _evict_responses()
+
+    return out
+
+
+# The responses read in while shared_responses is active, keyed by
+# the read function and the file name, modification time, and size.
+# A Future is stored so that a file requested by several threads is
+# only read once. The store is per-thread, so that a shared_responses
+# call does not affect reads made by other threads, and it is passed
+# to the worker threads created by read_pha_files.
+#
+_shared_state = threading.local()
+_shared_lock = threading.Lock()
+
+
+def _get_shared_store() -> dict[tuple, Future] | None:
+    """The store of shared responses for this thread, if set."""
+
+    return getattr(_shared_state, "store", None)
+
+
+@contextmanager
+def _use_shared_store(store: dict[tuple, Future] | None) -> Iterator[None]:
+    """Use the given store of shared responses in this thread."""
+
+    old = _get_shared_store()
+    _shared_state.store = store
+    try:
+        yield
+    finally:
+        _shared_state.store = old
+
+
+@contextmanager
+def shared_responses() -> Iterator[None]:
+    """Share the ARF and RMF objects created when reading PHA files.
+
+    Within this context the ARF and RMF files referenced by a PHA
+    file (e.g. by the ANCRFILE and RESPFILE keywords) are only read
+    once, and the same `sherpa.astro.data.DataARF` or
+    `sherpa.astro.data.DataRMF` object is used by each dataset that
+    refers to the file. Files are considered the same if they have
+    the same path, modification time, and size. The context can be
+    nested, and only applies to the current thread.
+
+    .. versionadded:: 4.19.0
+
+    Notes
+    -----
+    As the response objects are shared between datasets, changes
+    made to one of them - such as changing the ``specresp`` values
+    of an ARF or the filter applied to the response - will be seen
+    by all the datasets that use it. This includes the filter set
+    when fitting a dataset with multiple responses, so the datasets
+    should not be fit together in this case.
+
+    Examples
+    --------
+
+    Load in two files which use the same responses, which means that
+    the response files are only read in once:
+
+    >>> with shared_responses():
+    ...     pha1 = read_pha("src1.pi")
+    ...     pha2 = read_pha("src2.pi")
+    ...
+    >>> pha1.get_rmf() is pha2.get_rmf()
+    True
+
+    """
+
+    if _get_shared_store() is not None:
+        yield
+        return
+
+    with _use_shared_store({}):
+        yield
+
+
+def _read_response(filename: str,
+                   read_func: Callable[[str], T]) -> T:
+    """Read in the file, re-using the object if shared_responses is active."""
+
+    store = _get_shared_store()
+    if store is None:
+        return read_func(filename)
+
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return read_func(filename)
+
+    key = (read_func, os.path.realpath(filename), stat.st_mtime_ns,
+           stat.st_size)
+    with _shared_lock:
+        future = store.get(key)
+        owner = future is None
+        if future is None:
+            future = Future()
+            store[key] = future
+
+    if owner:
+        try:
+            future.set_result(read_func(filename))
+        except Exception as exc:
+            future.set_exception(exc)
+
+    return future.result()
+
+
 def _read_ancillary(header: Header,
                     key: str,
                     label: str,
@@ -850,7 +1293,7 @@ def _read_ancillary(header: Header,
     filename = str(dpath / Path(val.value))
     out = None
     try:
-        out = read_func(filename)
+        out = _read_response(filename, read_func)
         if output_once:
             info("read %s file %s", label, filename)
 
@@ -1088,10 +1531,14 @@ def _process_pha_backfile(filename: str,
 
 def read_pha(arg,
              use_errors: bool = False,
-             use_background: bool = False
+             use_background: bool = False,
+             share_responses: bool = False
              ) -> DataPHA | list[DataPHA]:
     """Create a DataPHA object.
 
+    .. versionchanged:: 4.19.0
+       The share_responses argument has been added.
+
     .. versionchanged:: 4.17.0
        Channel numbers that start at 0 are now left as is rather than
        be renumbered to start at 1.
@@ -1109,11 +1556,20 @@ def read_pha(arg,
     use_background : bool, optional
         Should the background PHA data (and optional responses) also
         be read in and associated with the data set?
+    share_responses : bool, optional
+        Should the rows of a type II file share the ARF and RMF
+        objects when they use the same files (see
+        `shared_responses`)? The default is for each dataset to
+        have its own copy of the responses.
 
     Returns
     -------
     data : sherpa.astro.data.DataPHA
 
+    See Also
+    --------
+    read_pha_files, shared_responses
+
     """
 
     pha, filename = backend.get_pha_data(arg,
@@ -1206,15 +1662,19 @@ def read_pha(arg,
 
             phas.append(TableBlock(pha.name, header=header, columns=cols))
 
+    # The rows of a type II file often use the same responses, but
+    # they are only shared when requested.
+    #
     output_once = True
     datasets = []
-    for p in phas:
-        data = _process_pha_block(filename, p,
-                                  output_once=output_once,
-                                  use_errors=use_errors,
-                                  use_background=use_background)
-        output_once = False
-        datasets.append(data)
+    with shared_responses() if share_responses else nullcontext():
+        for p in phas:
+            data = _process_pha_block(filename, p,
+                                      output_once=output_once,
+                                      use_errors=use_errors,
+                                      use_background=use_background)
+            output_once = False
+            datasets.append(data)
 
     if len(datasets) == 1:
         return datasets[0]
@@ -1222,6 +1682,73 @@ def read_pha(arg,
     return datasets
 
 
+def read_pha_files(args: Iterable,
+                   use_errors: bool = False,
+                   numcores: int | None = None,
+                   share_responses: bool = False
+                   ) -> list[DataPHA | list[DataPHA]]:
+    """Read in several PHA files.
+
+    The files are read in parallel, using threads, and any ARF or RMF
+    file used by several of the files can be read in once and shared
+    (see `shared_responses`).
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    args : iterable
+        The files to read in, where each element is the name of a
+        file or a representation of the file, as accepted by
+        `read_pha`.
+    use_errors : bool, optional
+        If the PHA file contains statistical error values for the
+        count (or count rate) column, should it be read in. This
+        defaults to ``False``.
+    numcores : int or None, optional
+        The maximum number of threads to use. The default is the
+        number of cores, as set by the ``numcores`` setting of
+        the ``[parallel]`` section of the configuration file.
+    share_responses : bool, optional
+        Should the datasets share the ARF and RMF objects when they
+        use the same files? The default is for each dataset to have
+        its own copy of the responses.
+
+    Returns
+    -------
+    datasets : list
+        The return value of `read_pha` for each file, in the same
+        order as the args argument.
+
+    See Also
+    --------
+    read_pha, shared_responses
+
+    """
+
+    args = list(args)
+    if numcores is None:
+        numcores = ncpus
+
+    nthreads = max(1, min(numcores, len(args)))
+
+    with shared_responses() if share_responses else nullcontext():
+        # The worker threads need to use the same responses as this
+        # thread.
+        #
+        store = _get_shared_store()
+
+        def read(arg):
+            with _use_shared_store(store):
+                return read_pha(arg, use_errors=use_errors)
+
+        if nthreads == 1:
+            return [read(arg) for arg in args]
+
+        with ThreadPoolExecutor(max_workers=nthreads) as pool:
+            return list(pool.map(read, args))
+
+
 def _empty_header(creator=False) -> Header:
     """Create an empty header."""
 
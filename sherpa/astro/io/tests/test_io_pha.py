@@ -30,6 +30,7 @@ until we have enough tests that make it worthwhile.
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 import numpy as np
@@ -38,7 +39,8 @@ import pytest
 
 from sherpa.astro.data import DataPHA
 from sherpa.astro import io
-from sherpa.utils.err import DataErr
+from sherpa.astro.instrument import create_arf, create_delta_rmf
+from sherpa.utils.err import DataErr, IOErr
 from sherpa.utils.logging import SherpaVerbosity
 from sherpa.utils.testing import requires_data, requires_fits
 
@@ -1517,3 +1519,161 @@ def test_write_pha_with_bad_quality(tmp_path):
     assert pha1.grouping == pytest.approx(group)
     assert pha1.quality == pytest.approx(quality)
     assert pha1.quality_filter is None
+
+
+def make_shared_response_files(tmp_path, nfiles=3):
+    """Write out PHA files which use the same ARF and RMF."""
+
+    egrid = np.linspace(0.5, 1.5, 11)
+    arf = create_arf(egrid[:-1], egrid[1:], np.linspace(10, 20, 10))
+    rmf = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                           e_max=egrid[1:])
+    io.write_arf(str(tmp_path / "src.arf"), arf, ascii=False)
+    io.write_rmf(str(tmp_path / "src.rmf"), rmf)
+
+    outfiles = []
+    for idx in range(nfiles):
+        pha = DataPHA(f"p{idx}", np.arange(1, 11), np.arange(10) + idx)
+        pha.exposure = 100
+        pha.header["ANCRFILE"] = "src.arf"
+        pha.header["RESPFILE"] = "src.rmf"
+        outfile = str(tmp_path / f"src{idx}.pha")
+        io.write_pha(outfile, pha, ascii=False)
+        outfiles.append(outfile)
+
+    return outfiles
+
+
+@requires_fits
+def test_shared_responses(tmp_path):
+    """The responses are only read in once."""
+
+    infiles = make_shared_response_files(tmp_path)
+    with SherpaVerbosity("ERROR"):
+        pha1 = io.read_pha(infiles[0])
+        pha2 = io.read_pha(infiles[1])
+        with io.shared_responses():
+            pha3 = io.read_pha(infiles[0])
+            pha4 = io.read_pha(infiles[1])
+
+    assert pha1.get_arf() is not pha2.get_arf()
+    assert pha1.get_rmf() is not pha2.get_rmf()
+    assert pha3.get_arf() is pha4.get_arf()
+    assert pha3.get_rmf() is pha4.get_rmf()
+    assert pha3.get_arf().specresp == pytest.approx(np.linspace(10, 20, 10))
+
+
+@requires_fits
+@pytest.mark.parametrize("numcores", [None, 1, 2])
+def test_read_pha_files(numcores, tmp_path):
+    """Several files can be read in at once."""
+
+    infiles = make_shared_response_files(tmp_path, nfiles=5)
+    with SherpaVerbosity("ERROR"):
+        phas = io.read_pha_files(infiles, numcores=numcores,
+                                 share_responses=True)
+
+    assert len(phas) == 5
+    arf = phas[0].get_arf()
+    rmf = phas[0].get_rmf()
+    for idx, pha in enumerate(phas):
+        assert pha.name == infiles[idx]
+        assert pha.counts == pytest.approx(np.arange(10) + idx)
+        assert pha.units == "energy"
+        assert pha.get_arf() is arf
+        assert pha.get_rmf() is rmf
+
+
+@requires_fits
+def test_read_pha_files_missing(tmp_path):
+    """An error is raised if a file is missing."""
+
+    infiles = make_shared_response_files(tmp_path, nfiles=2)
+    infiles.append(str(tmp_path / "not-a-file.pha"))
+    with SherpaVerbosity("ERROR"):
+        with pytest.raises(IOErr):
+            io.read_pha_files(infiles, numcores=2)
+
+
+def make_shared_response_pha2(tmp_path, nrows=2):
+    """Write out a PHA-II file whose rows use the same ARF and RMF."""
+
+    fits = pytest.importorskip("astropy.io.fits")
+
+    make_shared_response_files(tmp_path, nfiles=0)
+    nchan = 10
+    cols = [fits.Column(name="SPEC_NUM", format="J",
+                        array=np.arange(1, nrows + 1)),
+            fits.Column(name="CHANNEL", format=f"{nchan}J",
+                        array=np.tile(np.arange(1, nchan + 1), (nrows, 1))),
+            fits.Column(name="COUNTS", format=f"{nchan}J",
+                        array=np.arange(nrows * nchan).reshape(nrows, nchan))]
+    hdu = fits.BinTableHDU.from_columns(cols, name="SPECTRUM")
+    hdu.header["HDUCLASS"] = "OGIP"
+    hdu.header["HDUCLAS1"] = "SPECTRUM"
+    hdu.header["HDUCLAS4"] = "TYPE:II"
+    hdu.header["EXPOSURE"] = 100.0
+    hdu.header["ANCRFILE"] = "src.arf"
+    hdu.header["RESPFILE"] = "src.rmf"
+    outfile = str(tmp_path / "src.pha2")
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(outfile)
+    return outfile
+
+
+@requires_fits
+def test_read_pha_type2_separate_responses(tmp_path):
+    """The rows of a type II file do not share responses by default."""
+
+    infile = make_shared_response_pha2(tmp_path)
+    with SherpaVerbosity("ERROR"):
+        pha1, pha2 = io.read_pha(infile)
+
+    assert pha1.get_arf() is not pha2.get_arf()
+    assert pha1.get_rmf() is not pha2.get_rmf()
+
+    # Filtering one dataset does not change the responses of the other.
+    pha1.ignore(hi=0.9)
+    pha1.notice_response(True)
+    assert pha1.get_arf().get_indep()[0].size < 10
+    assert pha2.get_arf().get_indep()[0].size == 10
+
+
+@requires_fits
+def test_read_pha_type2_share_responses(tmp_path):
+    """The rows of a type II file can share responses."""
+
+    infile = make_shared_response_pha2(tmp_path)
+    with SherpaVerbosity("ERROR"):
+        pha1, pha2 = io.read_pha(infile, share_responses=True)
+
+    assert pha1.get_arf() is pha2.get_arf()
+    assert pha1.get_rmf() is pha2.get_rmf()
+
+
+@requires_fits
+def test_read_pha_files_separate_responses(tmp_path):
+    """read_pha_files does not share responses by default."""
+
+    infiles = make_shared_response_files(tmp_path)
+    with SherpaVerbosity("ERROR"):
+        pha1, pha2, pha3 = io.read_pha_files(infiles, numcores=2)
+
+    assert pha1.get_arf() is not pha2.get_arf()
+    assert pha2.get_rmf() is not pha3.get_rmf()
+
+
+@requires_fits
+def test_shared_responses_is_per_thread(tmp_path):
+    """shared_responses does not change reads made in other threads."""
+
+    infiles = make_shared_response_files(tmp_path, nfiles=2)
+    with SherpaVerbosity("ERROR"):
+        with io.shared_responses():
+            pha1 = io.read_pha(infiles[0])
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pha2 = pool.submit(io.read_pha, infiles[1]).result()
+
+            pha3 = io.read_pha(infiles[1])
+
+    assert pha1.get_arf() is not pha2.get_arf()
+    assert pha1.get_arf() is pha3.get_arf()
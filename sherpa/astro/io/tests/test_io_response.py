@@ -1268,3 +1268,208 @@ def test_rmf_fails_if_no_ebounds(tmp_path):
     with pytest.raises(IOErr,
                        match="^RMF delta-rmf has no E_MIN or E_MAX data$"):
         io.write_rmf(str(outfile), rmf, clobber=True)
+
+
+@pytest.fixture
+def response_cache():
+    """Ensure the response cache is reset after the test."""
+
+    yield
+    io.set_response_cache()
+    io.clear_response_cache()
+
+
+def make_response_files(tmp_path):
+    """Create an ARF and RMF for the response-cache tests."""
+
+    ebins = np.arange(0.1, 1.2, 0.1)
+    elo = ebins[:-1]
+    ehi = ebins[1:]
+    arf = create_arf(elo, ehi, np.arange(10, 30, 2))
+    rmf = create_delta_rmf(elo, ehi, e_min=elo, e_max=ehi)
+
+    arffile = str(tmp_path / "cache.arf")
+    rmffile = str(tmp_path / "cache.rmf")
+    io.write_arf(arffile, arf, ascii=False)
+    io.write_rmf(rmffile, rmf)
+    return arffile, rmffile
+
+
+@requires_fits
+def test_response_cache_off_by_default(tmp_path, response_cache):
+    """Without the cache each read creates a new object."""
+
+    arffile, rmffile = make_response_files(tmp_path)
+    assert io.read_arf(arffile) is not io.read_arf(arffile)
+    assert io.read_rmf(rmffile) is not io.read_rmf(rmffile)
+
+
+def count_reads(monkeypatch):
+    """Count the number of times the ARF and RMF files are read."""
+
+    calls = {"arf": 0, "rmf": 0}
+    get_arf_data = io.backend.get_arf_data
+    get_rmf_data = io.backend.get_rmf_data
+
+    def get_arf(*args, **kwargs):
+        calls["arf"] += 1
+        return get_arf_data(*args, **kwargs)
+
+    def get_rmf(*args, **kwargs):
+        calls["rmf"] += 1
+        return get_rmf_data(*args, **kwargs)
+
+    monkeypatch.setattr(io.backend, "get_arf_data", get_arf)
+    monkeypatch.setattr(io.backend, "get_rmf_data", get_rmf)
+    return calls
+
+
+@requires_fits
+def test_response_cache_memory(tmp_path, response_cache, monkeypatch):
+    """The file is only read once, until it changes."""
+
+    arffile, rmffile = make_response_files(tmp_path)
+    io.set_response_cache(1024 * 1024)
+    calls = count_reads(monkeypatch)
+
+    arf = io.read_arf(arffile)
+    rmf = io.read_rmf(rmffile)
+    arf2 = io.read_arf(arffile)
+    rmf2 = io.read_rmf(rmffile)
+    assert calls == {"arf": 1, "rmf": 1}
+
+    # Each read creates a new object, which does not share the
+    # arrays or the header.
+    #
+    assert arf2 is not arf
+    assert rmf2 is not rmf
+    assert arf2.specresp == pytest.approx(arf.specresp)
+    assert rmf2.matrix == pytest.approx(rmf.matrix)
+    assert not np.shares_memory(arf2.specresp, arf.specresp)
+    assert not np.shares_memory(rmf2.matrix, rmf.matrix)
+
+    arf.specresp *= 2
+    arf.header["CHANGED"] = True
+    rmf.notice([2, 3])
+    arf3 = io.read_arf(arffile)
+    rmf3 = io.read_rmf(rmffile)
+    assert calls == {"arf": 1, "rmf": 1}
+    assert arf3.specresp == pytest.approx(np.arange(10, 30, 2))
+    assert "CHANGED" not in arf3.header
+    assert rmf3.get_indep()[0].size == 10
+
+    # A different file - at least as far as the modification time
+    # and size are concerned - is re-read.
+    #
+    arf4 = create_arf(arf.energ_lo, arf.energ_hi, np.ones(10))
+    arf4.header["EXTRA"] = "keyword"
+    io.write_arf(arffile, arf4, ascii=False, clobber=True)
+
+    new = io.read_arf(arffile)
+    assert calls == {"arf": 2, "rmf": 1}
+    assert new.specresp == pytest.approx(np.ones(10))
+
+    io.clear_response_cache()
+    io.read_rmf(rmffile)
+    assert calls == {"arf": 2, "rmf": 2}
+
+
+@requires_fits
+def test_response_cache_evicts(tmp_path, response_cache, monkeypatch):
+    """The least-recently used response is removed."""
+
+    arffile, rmffile = make_response_files(tmp_path)
+
+    # The cache is large enough for the ARF (three arrays) but not
+    # the RMF.
+    #
+    arf = io.read_arf(arffile)
+    nbytes = arf.energ_lo.nbytes * 3
+
+    calls = count_reads(monkeypatch)
+    io.set_response_cache(nbytes)
+    io.read_arf(arffile)
+    io.read_arf(arffile)
+    assert calls == {"arf": 1, "rmf": 0}
+
+    # The RMF is too large to be cached, so the ARF remains.
+    io.read_rmf(rmffile)
+    io.read_rmf(rmffile)
+    io.read_arf(arffile)
+    assert calls == {"arf": 1, "rmf": 2}
+
+    # Reducing the cache size removes the ARF.
+    io.set_response_cache(nbytes - 1)
+    io.read_arf(arffile)
+    assert calls == {"arf": 2, "rmf": 2}
+
+
+@requires_fits
+def test_response_cache_disk(tmp_path, response_cache, monkeypatch):
+    """The on-disk cache avoids reading the file."""
+
+    arffile, rmffile = make_response_files(tmp_path)
+    cachedir = tmp_path / "cache"
+    io.set_response_cache(cachedir=cachedir)
+
+    arf = io.read_arf(arffile)
+    rmf = io.read_rmf(rmffile)
+    assert len(list(cachedir.glob("*.npz"))) == 2
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("file should not be read")
+
+    monkeypatch.setattr(io.backend, "get_arf_data", fail)
+    monkeypatch.setattr(io.backend, "get_rmf_data", fail)
+
+    # There is no in-memory cache, so new objects are created.
+    #
+    newarf = io.read_arf(arffile)
+    newrmf = io.read_rmf(rmffile)
+    assert isinstance(newarf, DataARF)
+    assert isinstance(newrmf, DataRMF)
+    assert newarf is not arf
+    assert newrmf is not rmf
+
+    assert newarf.name == arf.name
+    assert newarf.exposure is None
+    assert newarf.ethresh == pytest.approx(arf.ethresh)
+    assert newarf.header == arf.header
+    assert newarf.specresp == pytest.approx(arf.specresp)
+
+    assert newrmf.name == rmf.name
+    assert newrmf.detchans == 10
+    assert newrmf.offset == 1
+    assert newrmf.header == rmf.header
+    for field in ["energ_lo", "energ_hi", "n_grp", "f_chan", "n_chan",
+                  "matrix", "e_min", "e_max"]:
+        assert getattr(newrmf, field) == pytest.approx(getattr(rmf, field))
+
+
+@requires_fits
+def test_response_cache_disk_invalid(tmp_path, response_cache, caplog):
+    """An invalid cache file is ignored."""
+
+    arffile, _ = make_response_files(tmp_path)
+    cachedir = tmp_path / "cache"
+    io.set_response_cache(cachedir=cachedir)
+
+    io.read_arf(arffile)
+    cfiles = list(cachedir.glob("*.npz"))
+    assert len(cfiles) == 1
+    cfiles[0].write_text("not a npz file")
+
+    with caplog.at_level(logging.INFO, logger='sherpa'):
+        arf = io.read_arf(arffile)
+
+    assert arf.specresp == pytest.approx(np.arange(10, 30, 2))
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith("unable to read response cache file ")
+
+
+def test_response_cache_invalid_size(response_cache):
+    """maxbytes must not be negative."""
+
+    with pytest.raises(ArgumentErr,
+                       match="^Invalid maxbytes: 'must be 0 or positive'$"):
+        io.set_response_cache(-1)
@@ -38,7 +38,7 @@ import numpy as np
 import pytest
 
 from sherpa.astro.io import xstable
-from sherpa.utils.err import IOErr
+from sherpa.utils.err import IOErr, ModelErr
 from sherpa.utils.testing import requires_fits, requires_xspec
 
 
@@ -701,3 +701,201 @@ def test_atable_with_xfxp(tmp_path):
     #
     with pytest.raises(IOErr, match="^No support for NXFLTEXP=2 in "):
         load_tmod("foo", outfile)
+
+
+@requires_fits
+def test_grid_model_interpolated(tmp_path):
+    """Read in a table model without XSPEC.
+
+    This uses the same model as test_atable_interpolated, but the
+    interpolation is linear in a and log(b), so the expected values
+    can be calculated exactly.
+    """
+
+    outpath = tmp_path / "xs.mod"
+    outfile = str(outpath)
+
+    egrid = np.arange(0.5, 1.6, 0.1)
+    elo = egrid[:-1]
+    ehi = egrid[1:]
+    emid = (elo + ehi) / 2
+
+    p1 = xstable.Param("a", 1, 0.01, 0, 10, values=[0, 5, 10])
+    p2 = xstable.Param("b", 0.2, -0.01, 0.01, 10,
+                       values=[0.01, 0.1, 1, 10], loginterp=True)
+
+    def mkspec(pa, pb):
+        return (20 - pa) + np.log10(pb) * emid
+
+    pvals = [(pa, pb) for pa in p1.values for pb in p2.values]
+    spectra = [mkspec(*pv) for pv in pvals]
+
+    hdus = xstable.make_xstable_model("fake", elo, ehi,
+                                      params=[p1, p2], spectra=spectra)
+    xstable.write_xstable_model(outfile, hdus)
+
+    mdl = xstable.read_xstable_grid_model("foo", outfile)
+    assert isinstance(mdl, xstable.GridTableModel)
+    assert mdl.addmodel
+    assert mdl.filename == outfile
+
+    assert [p.name for p in mdl.pars] == ["a", "b", "norm"]
+    assert mdl.a.val == pytest.approx(1)
+    assert mdl.a.min == pytest.approx(0)
+    assert mdl.a.max == pytest.approx(10)
+    assert not mdl.a.frozen
+    assert mdl.b.val == pytest.approx(0.2)
+    assert mdl.b.frozen
+
+    mdl.a = 5
+    mdl.b = 0.1
+    assert mdl(elo, ehi) == pytest.approx(mkspec(5, 0.1), rel=1e-6)
+
+    mdl.a = 2
+    mdl.b = 0.09
+    mdl.norm = 2
+    assert mdl(elo, ehi) == pytest.approx(2 * mkspec(2, 0.09), rel=1e-6)
+
+    # The flux is conserved when regridding.
+    #
+    assert mdl(egrid[:-2:2], egrid[2::2]) == \
+        pytest.approx(2 * (mkspec(2, 0.09)[::2] + mkspec(2, 0.09)[1::2]),
+                      rel=1e-6)
+
+
+@requires_fits
+def test_grid_model_single_spectrum(tmp_path):
+    """Check the model outside the energy grid."""
+
+    outpath = tmp_path / "xs.mod"
+    outfile = str(outpath)
+
+    elo = [0.5, 0.7, 0.9]
+    ehi = [0.7, 0.9, 1.0]
+    model = [2, 4, 5]
+
+    hdus = make_single_model(elo, ehi, model, lolim=3, hilim=7)
+    xstable.write_xstable_model(outfile, hdus)
+
+    mdl = xstable.read_xstable_grid_model("foo", outfile)
+    assert [p.name for p in mdl.pars] == ["nop", "norm"]
+    assert mdl.nop.frozen
+
+    mdl.norm = 10
+    assert mdl(elo, ehi) == pytest.approx([20, 40, 50])
+
+    e2lo = [0.3, 0.4, 0.6, 0.8, 1.1]
+    e2hi = [0.4, 0.6, 0.8, 1.1, 1.2]
+    assert mdl(e2lo, e2hi) == pytest.approx([30, 10, 30, 70, 70])
+
+    with pytest.raises(ModelErr,
+                       match="^A non-overlapping integrated grid is required"):
+        mdl(elo)
+
+
+@requires_fits
+def test_grid_model_mtable(tmp_path):
+    """Multiplicative models average over the bins."""
+
+    outpath = tmp_path / "xs.mod"
+    outfile = str(outpath)
+
+    elo = [0.5, 0.7, 0.9]
+    ehi = [0.7, 0.9, 1.1]
+    model = [0.2, 0.4, 0.8]
+
+    hdus = make_single_model(elo, ehi, model, addmodel=False,
+                             lolim=1, hilim=1)
+    xstable.write_xstable_model(outfile, hdus)
+
+    mdl = xstable.read_xstable_grid_model("foo", outfile)
+    assert [p.name for p in mdl.pars] == ["nop"]
+    assert mdl(elo, ehi) == pytest.approx(model)
+    assert mdl([0.3, 0.6, 1.0], [0.6, 0.8, 1.2]) == \
+        pytest.approx([(0.2 * 0.1 + 0.2) / 0.3, 0.3, 0.9])
+
+    emdl = xstable.read_xstable_grid_model("foo", outfile, etable=True)
+    assert emdl(elo, ehi) == pytest.approx(np.exp(-np.asarray(model)))
+
+
+@requires_fits
+@pytest.mark.parametrize("redshift,escale,scale",
+                         [(True, False, 0.5), (False, True, 1)])
+def test_grid_model_redshift_escale(redshift, escale, scale, tmp_path):
+    """z=1 and escale=0.5 shift the spectrum by the same amount.
+
+    The redshift also reduces the flux by 1 + z.
+    """
+
+    outpath = tmp_path / "xs.mod"
+    outfile = str(outpath)
+
+    elo = np.asarray([1, 2, 3, 4])
+    ehi = elo + 1
+    model = [1, 2, 3, 4]
+
+    hdus = make_single_model(elo, ehi, model, redshift=redshift,
+                             escale=escale)
+    xstable.write_xstable_model(outfile, hdus)
+
+    mdl = xstable.read_xstable_grid_model("foo", outfile)
+    if redshift:
+        assert [p.name for p in mdl.pars] == ["nop", "redshift", "norm"]
+        mdl.redshift = 1
+    else:
+        assert [p.name for p in mdl.pars] == ["nop", "Escale", "norm"]
+        mdl.Escale = 0.5
+
+    expected = scale * np.asarray([1 + 2, 3 + 4])
+    assert mdl([0.5, 1.5], [1.5, 2.5]) == pytest.approx(expected)
+
+
+@requires_fits
+def test_grid_model_additional(tmp_path):
+    """The additional spectra are added, scaled by the parameter value."""
+
+    outpath = tmp_path / "xs.mod"
+    outfile = str(outpath)
+
+    elo = np.asarray([1, 2, 3])
+    ehi = elo + 1
+
+    p1 = xstable.Param("a", 1, 0.01, 1, 2, values=[1, 2])
+    a1 = xstable.BaseParam("b", 0, 0.01, -5, 5)
+    spectra = [np.asarray([1, 1, 1]), np.asarray([2, 2, 2])]
+    addspectra = [[np.asarray([1, 2, 3]), np.asarray([3, 4, 5])]]
+
+    hdus = xstable.make_xstable_model("fake", elo, ehi, params=[p1],
+                                      spectra=spectra, addparams=[a1],
+                                      addspectra=addspectra)
+    xstable.write_xstable_model(outfile, hdus)
+
+    mdl = xstable.read_xstable_grid_model("foo", outfile)
+    assert [p.name for p in mdl.pars] == ["a", "b", "norm"]
+
+    mdl.a = 1.5
+    mdl.b = 2
+    assert mdl(elo, ehi) == pytest.approx([1.5 + 2 * 2, 1.5 + 2 * 3,
+                                           1.5 + 2 * 4])
+
+
+@requires_fits
+def test_grid_model_xfxp(tmp_path):
+    """NXFLTEXP models are not supported."""
+
+    outpath = tmp_path / "xs.mod"
+    outfile = str(outpath)
+
+    elo = [0.5, 0.7, 0.9]
+    ehi = [0.7, 0.9, 1.0]
+    model = np.asarray([2, 4, 5])
+
+    p0 = xstable.Param("nop", 12, -1, 12, 12, values=[12])
+    hdus = xstable.make_xstable_model("fake", elo, ehi,
+                                      params=[p0],
+                                      spectra=[model, model / 10],
+                                      xfxp=["key: a", "key: b"])
+    xstable.write_xstable_model(outfile, hdus)
+
+    with pytest.raises(IOErr, match="^No support for NXFLTEXP=2 in "):
+        xstable.read_xstable_grid_model("foo", outfile)
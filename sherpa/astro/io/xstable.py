@@ -123,8 +123,12 @@ xstablemodel.mygauss
 Notes
 -----
 
-XSPEC models can be created without XSPEC support in Sherpa, but XSPEC
-support is needed to read the files in.
+XSPEC models can be created without XSPEC support in Sherpa. XSPEC
+support is needed to read the files in with
+`sherpa.astro.xspec.read_xstable_model`, but `read_xstable_grid_model`
+provides a version which does not need XSPEC, using the
+`sherpa.models.template.GridInterpolator` class to interpolate the
+spectra.
 
 For additive models it is assumed that the model values - that is,
 each bin - have units of photon/cm^2/s. This is easy to accidentally
@@ -142,11 +146,19 @@ from typing import Optional, Sequence, Union
 
 import numpy as np
 
+from sherpa.models.model import ArithmeticModel, modelCacher1d
+from sherpa.models.parameter import Parameter, hugeval
+from sherpa.models.template import GridInterpolator
+from sherpa.utils import bool_cast, rebin
+from sherpa.utils.err import IOErr, ModelErr
+from sherpa.utils.numeric_types import SherpaFloat
+
 from .types import HeaderItem, Header, Column, TableBlock, BlockList
 
 
 __all__ = ("BaseParam", "Param", "make_xstable_model",
-           "write_xstable_model")
+           "write_xstable_model", "GridTableModel",
+           "read_xstable_grid_model")
 
 __doctest_requires__ = {'*': ['sherpa.astro.xspec._xspec'],
                         }
@@ -713,3 +725,262 @@ def write_xstable_model(filename: str,
 
     from sherpa.astro import io
     io.backend.set_hdus(filename, hdus, clobber=clobber)
+
+
+class GridTableModel(ArithmeticModel):
+    """Evaluate an XSPEC table model without the XSPEC library.
+
+    The interpolated parameters are evaluated with multilinear
+    interpolation (using logarithmic spacing for those parameters
+    with a METHOD of 1), and the resulting spectrum is rebinned onto
+    the requested energy grid. Users are expected to create the model
+    with `read_xstable_grid_model`.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    name : str
+        The model name.
+    pars : sequence of Parameter
+        The interpolated and additional parameters, followed by the
+        Escale, redshift, and norm parameters, if used.
+    grid : GridInterpolator
+        The interpolator. It returns the interpolated spectrum
+        followed by the spectrum for each additional parameter.
+    energ_lo, energ_hi : ndarray
+        The energy grid (in keV) of the table.
+    nadd : int
+        The number of additional parameters.
+    addmodel : bool
+        Is this an additive model?
+    addredshift, addescale : bool
+        Are the redshift and Escale parameters included?
+    etable : bool
+        Is this an exponential table model?
+    lolim, hilim : float
+        The model value for bins below or above the table energy
+        grid.
+
+    See Also
+    --------
+    read_xstable_grid_model
+
+    Notes
+    -----
+    The model must be evaluated on an integrated (low and high edges)
+    energy grid. For additive models the flux is rebinned, so that it
+    is conserved, and for multiplicative models the bin-width weighted
+    average is used. Bins that do not overlap the table energy grid
+    are set to the lolim or hilim values.
+
+    """
+
+    def __init__(self, name, pars, grid, energ_lo, energ_hi, nadd,
+                 addmodel, addredshift=False, addescale=False,
+                 etable=False, lolim=0.0, hilim=0.0):
+        self.grid = grid
+        self.energ_lo = np.asarray(energ_lo, dtype=SherpaFloat)
+        self.energ_hi = np.asarray(energ_hi, dtype=SherpaFloat)
+        self.nadd = nadd
+        self.addmodel = addmodel
+        self.addredshift = addredshift
+        self.addescale = addescale
+        self.etable = etable
+        self.lolim = lolim
+        self.hilim = hilim
+        self.filename = None
+
+        for par in pars:
+            self.__dict__[par.name] = par
+
+        ArithmeticModel.__init__(self, name, pars)
+
+    @modelCacher1d
+    def calc(self, p, xlo, xhi=None, *args, **kwargs):
+        if xhi is None:
+            raise ModelErr("needsint")
+
+        p = list(p)
+        norm = p.pop() if self.addmodel else 1.0
+        z = p.pop() if self.addredshift else 0.0
+        escale = p.pop() if self.addescale else 1.0
+
+        nint = len(p) - self.nadd
+        spectra = self.grid(p[:nint])
+        nbins = self.energ_lo.size
+        spectrum = spectra[:nbins].copy()
+        for idx, pval in enumerate(p[nint:], 1):
+            spectrum += pval * spectra[idx * nbins:(idx + 1) * nbins]
+
+        scale = escale / (1 + z)
+        tlo = self.energ_lo * scale
+        thi = self.energ_hi * scale
+
+        xlo = np.asarray(xlo, dtype=SherpaFloat)
+        xhi = np.asarray(xhi, dtype=SherpaFloat)
+        if self.addmodel:
+            out = rebin(spectrum / (1 + z), tlo, thi, xlo, xhi)
+        else:
+            width = xhi - xlo
+            out = rebin(spectrum * (thi - tlo), tlo, thi, xlo, xhi)
+            out += self.lolim * np.clip(np.minimum(xhi, tlo[0]) - xlo, 0, None)
+            out += self.hilim * np.clip(xhi - np.maximum(xlo, thi[-1]), 0, None)
+            out /= width
+
+        out[xhi <= tlo[0]] = self.lolim
+        out[xlo >= thi[-1]] = self.hilim
+
+        if self.etable:
+            out = np.exp(-out)
+
+        return norm * out
+
+
+def read_xstable_grid_model(modelname: str,
+                            filename: str,
+                            etable: bool = False) -> GridTableModel:
+    """Read in an XSPEC table model without the XSPEC library.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    modelname : str
+        The identifier for this model component.
+    filename : str
+        The name of the FITS file containing the data, which should
+        match the XSPEC table model definition.
+    etable : bool, optional
+        Set if this is an etable (as there's no way to determine this
+        from the file itself).
+
+    Returns
+    -------
+    tablemodel : GridTableModel instance
+
+    See Also
+    --------
+    sherpa.astro.xspec.read_xstable_model
+
+    Notes
+    -----
+    There is no support for table models that provide multiple spectra
+    per parameter: that is, those with the NXFLTEXP keyword set.
+
+    Examples
+    --------
+
+    >>> mdl = read_xstable_grid_model('xmdl', 'bbrefl_1xsolar.fits')  # doctest: +SKIP
+
+    """
+
+    from sherpa.astro import io
+
+    blist, fname = io.backend.read_table_blocks(filename)
+    hdr = blist.header
+
+    def getkey(header, name, default=None):
+        item = header.get(name)
+        if item is None:
+            if default is None:
+                raise IOErr("nokeyword", fname, name)
+            return default
+
+        return item.value
+
+    if getkey(hdr, "HDUCLAS1") != "XSPEC TABLE MODEL":
+        raise IOErr(f"Not an XSPEC table model: {fname}")
+
+    nxfltexp = int(getkey(hdr, "NXFLTEXP", 1))
+    if nxfltexp > 1:
+        raise IOErr(f"No support for NXFLTEXP={nxfltexp} in {fname}")
+
+    addmodel = bool_cast(getkey(hdr, "ADDMODEL"))
+    addredshift = bool_cast(getkey(hdr, "REDSHIFT"))
+    addescale = bool_cast(getkey(hdr, "ESCALE", False))
+    lolim = float(getkey(hdr, "LOELIMIT", 0.0))
+    hilim = float(getkey(hdr, "HIELIMIT", 0.0))
+
+    blocks = {block.name.upper(): block for block in blist.blocks}
+    cols = {}
+    for bname in ["PARAMETERS", "ENERGIES", "SPECTRA"]:
+        try:
+            block = blocks[bname]
+        except KeyError:
+            raise IOErr(f"Unable to find the {bname} block in {fname}") from None
+
+        cols[bname] = {col.name.upper(): col.values for col in block.columns}
+
+    pblock = blocks["PARAMETERS"]
+    nint = int(getkey(pblock.header, "NINTPARM"))
+    nadd = int(getkey(pblock.header, "NADDPARM"))
+
+    pcols = cols["PARAMETERS"]
+    names = [str(name).strip().lower() for name in pcols["NAME"]]
+    pars = []
+    for idx, name in enumerate(names):
+        par = Parameter(modelname, name, pcols["INITIAL"][idx],
+                        min=pcols["BOTTOM"][idx], max=pcols["TOP"][idx],
+                        hard_min=pcols["MINIMUM"][idx],
+                        hard_max=pcols["MAXIMUM"][idx],
+                        frozen=pcols["DELTA"][idx] < 0)
+        pars.append(par)
+
+    nvals = pcols["NUMBVALS"]
+    axes = [np.asarray(pcols["VALUE"][idx][:nvals[idx]], dtype=SherpaFloat)
+            for idx in range(nint)]
+    log = [int(method) == 1 for method in pcols["METHOD"][:nint]]
+
+    scols = cols["SPECTRA"]
+    nrows = len(scols["INTPSPEC"])
+    paramval = np.asarray(scols["PARAMVAL"], dtype=SherpaFloat).reshape(nrows, -1)
+    spectra = [np.asarray(scols["INTPSPEC"], dtype=SherpaFloat).reshape(nrows, -1)]
+    for idx in range(1, nadd + 1):
+        spectra.append(np.asarray(scols[f"ADDSP{idx:03d}"],
+                                  dtype=SherpaFloat).reshape(nrows, -1))
+
+    spectra = np.hstack(spectra)
+
+    # Use the PARAMVAL column to find the grid location of each
+    # spectrum, rather than relying on the ordering of the rows.
+    #
+    shape = tuple(axis.size for axis in axes)
+    if np.prod(shape) != nrows:
+        raise IOErr(f"Expected {np.prod(shape)} spectra, found {nrows} in {fname}")
+
+    pos = []
+    for axis, pvals in zip(axes, paramval.T):
+        ipos = np.clip(np.searchsorted(axis, pvals), 0, axis.size - 1)
+        if not np.allclose(axis[ipos], pvals, rtol=1e-6):
+            raise IOErr(f"PARAMVAL does not match the parameter values in {fname}")
+
+        pos.append(ipos)
+
+    index = np.full(shape, -1, dtype=int)
+    index[tuple(pos)] = np.arange(nrows)
+    if np.any(index < 0):
+        raise IOErr(f"The spectra do not form a regular grid in {fname}")
+
+    grid = GridInterpolator(axes, index, lambda rows: spectra[rows], log=log)
+
+    if addescale:
+        pars.append(Parameter(modelname, 'Escale', 1, min=1e-5, max=100,
+                              hard_min=1e-5, hard_max=100, frozen=True))
+
+    if addredshift:
+        pars.append(Parameter(modelname, 'redshift', 0, min=0, max=5,
+                              hard_min=-0.999, hard_max=10, frozen=True))
+
+    if addmodel:
+        pars.append(Parameter(modelname, 'norm', 1.0, min=0.0, max=1.0e24,
+                              hard_min=0.0, hard_max=hugeval))
+
+    ecols = cols["ENERGIES"]
+    mdl = GridTableModel(modelname, pars, grid,
+                         ecols["ENERG_LO"], ecols["ENERG_HI"], nadd,
+                         addmodel=addmodel, addredshift=addredshift,
+                         addescale=addescale, etable=etable,
+                         lolim=lolim, hilim=hilim)
+    mdl.filename = fname
+    return mdl
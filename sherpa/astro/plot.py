@@ -380,7 +380,9 @@ class SourcePlot(shplot.SourceHistogramPlot):
         #
         self.xlabel = data.get_xlabel()
         self.title = f'Source Model of {data.name}'
-        self.xlo, self.xhi = data._get_indep(filter=False)
+        xlo, xhi = data._get_indep(filter=False)
+        self.xlo = xlo.copy()
+        self.xhi = xhi.copy()
 
         # Why do we not apply the mask at the end of prepare?
         #
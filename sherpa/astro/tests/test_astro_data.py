@@ -26,7 +26,9 @@ import numpy as np
 import pytest
 
 from sherpa.astro import hc
-from sherpa.astro.data import Data1D, DataARF, DataPHA, DataRMF, DataIMG, DataIMGInt
+from sherpa.astro import data as astro_data
+from sherpa.astro.data import Data1D, DataARF, DataPHA, DataRMF, DataIMG, DataIMGInt, \
+    notice_datasets
 from sherpa.astro.instrument import create_arf, create_delta_rmf
 from sherpa.astro.ui.utils import Session
 from sherpa.models.basic import Gauss1D, Gauss2D
@@ -4269,3 +4271,274 @@ def test_set_ylabel_img(make_data_path, coord, label):
     data = sherpa.astro.io.read_image(infile)
     data.set_ylabel(label)
     assert data.get_ylabel() == label
+
+
+def test_pha_cache_filtered_is_invalidated():
+    """Grouping and background changes clear the stored values."""
+
+    chans = np.arange(1, 7, dtype=int)
+    pha = DataPHA('src', chans, [2, 4, 1, 3, 5, 5])
+    bkg = DataPHA('bkg', chans, [1, 1, 0, 1, 2, 1])
+    pha.set_background(bkg)
+    pha.exposure = 10
+    bkg.exposure = 10
+    pha.notice(2, 6)
+
+    with pha.cache_filtered():
+        y1, _, _ = pha.to_fit()
+        assert pha.to_fit()[0] is y1
+        assert y1 == pytest.approx([4, 1, 3, 5, 5])
+
+        pha.subtract()
+        assert pha.to_fit()[0] == pytest.approx([3, 1, 2, 3, 4])
+
+        bkg.counts = [0, 0, 0, 0, 0, 1]
+        assert pha.to_fit()[0] == pytest.approx([4, 1, 3, 5, 4])
+
+        pha.unsubtract()
+        pha.grouping = [1, -1, 1, -1, 1, -1]
+        pha.group()
+        assert pha.to_fit()[0] == pytest.approx([6, 4, 10])
+
+        pha.ignore(5, 6)
+        assert pha.to_fit()[0] == pytest.approx([6, 4])
+
+
+def test_pha_apply_filter_inplace_changes():
+    """The stored grouping plan notices in-place changes."""
+
+    pha = DataPHA('src', np.arange(1, 7), [2, 4, 1, 3, 5, 5],
+                  grouping=[1, -1, 1, -1, 1, -1], quality=[0, 0, 0, 5, 0, 0])
+    pha.ignore_bad()
+    pha.mask = [True, True, True]
+    assert pha.get_dep(filter=True) == pytest.approx([6, 1, 10])
+
+    pha.mask[1] = False
+    assert pha.get_dep(filter=True) == pytest.approx([6, 10])
+
+    pha.grouping[4] = 1
+    pha.grouping[5] = 1
+    pha.mask = True
+    assert pha.get_dep(filter=True) == pytest.approx([6, 1, 5, 5])
+    assert pha.apply_filter(pha.counts, pha._max) == pytest.approx([4, 1, 5, 5])
+
+
+def make_notice_datasets():
+    """Create PHA datasets for the notice_datasets tests."""
+
+    chans = np.arange(1, 21)
+    egrid = np.linspace(0.1, 2.1, 21)
+    rmf1 = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                            e_max=egrid[1:])
+    rmf2 = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                            e_max=egrid[1:])
+
+    out = []
+    for idx in range(6):
+        pha = DataPHA(f"p{idx}", chans, np.arange(20) + idx)
+        pha.set_rmf(rmf1 if idx < 3 else rmf2)
+        pha.units = "energy"
+        out.append(pha)
+
+    bkg = DataPHA("bkg", chans, np.ones(20))
+    bkg.set_rmf(rmf1)
+    bkg.units = "channel"
+    out[0].set_background(bkg)
+
+    out[1].grouping = [1, -1] * 10
+    out[1].group()
+    out[2].units = "wavelength"
+    out[4].ignore(1.0, 1.2)
+    out[5].units = "channel"
+    return out
+
+
+@pytest.mark.parametrize("lo,hi,ignore",
+                         [(0.5, 1.5, False), (0.5, 1.5, True),
+                          (None, 0.7, True), (1.1, None, False),
+                          (None, None, True)])
+def test_notice_datasets_matches_notice(lo, hi, ignore):
+    """The bulk call matches the individual calls."""
+
+    dsets1 = make_notice_datasets()
+    dsets2 = make_notice_datasets()
+    for pha in dsets1:
+        if pha.units == "channel" and (lo, hi) != (None, None):
+            continue
+
+        pha.notice(lo, hi, ignore=ignore)
+
+    notice_datasets([pha for pha in dsets2
+                     if pha.units != "channel" or (lo, hi) == (None, None)],
+                    lo, hi, ignore=ignore)
+
+    for pha1, pha2 in zip(dsets1, dsets2):
+        assert pha2.get_filter() == pha1.get_filter()
+        assert pha2.units == pha1.units
+        for bid in pha1.background_ids:
+            bkg1 = pha1.get_background(bid)
+            bkg2 = pha2.get_background(bid)
+            assert bkg2.get_filter() == bkg1.get_filter()
+            assert bkg2.units == bkg1.units
+
+
+def test_notice_datasets_shares_calculation(monkeypatch):
+    """The filter is only calculated once for each grid."""
+
+    calls = []
+    orig = astro_data.filter_bins
+
+    def count(*args, **kwargs):
+        calls.append(1)
+        return orig(*args, **kwargs)
+
+    monkeypatch.setattr(astro_data, "filter_bins", count)
+
+    # The datasets use rmf1 (two grids as one is grouped), rmf2 (an
+    # identical grid), wavelength units, and channel units, and the
+    # background uses the same grid as rmf1.
+    #
+    dsets = make_notice_datasets()
+    dsets[2].units = "energy"
+    dsets[5].units = "energy"
+    notice_datasets(dsets, 0.5, 1.5)
+    assert len(calls) == 3
+    assert dsets[5].get_filter(format="%.1f") == "0.5:1.5"
+
+
+def test_notice_datasets_invalid():
+    """The filter is not changed if any limit is invalid."""
+
+    dsets = make_notice_datasets()
+    expected = [pha.get_filter() for pha in dsets]
+    with pytest.raises(DataErr,
+                       match="^unknown lo argument: 'must be an integer channel value'$"):
+        notice_datasets(dsets, 0.5, 1.5)
+
+    assert [pha.get_filter() for pha in dsets] == expected
+
+
+
+def test_pha_filter_does_not_change_source_arrays():
+    """Changing the filtered values does not change the data."""
+
+    chans = np.arange(1, 11)
+    pha = DataPHA("x", chans, chans * 2)
+    pha.backscal = np.asarray([0.1, 0.0, -1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+    orig = pha.backscal.copy()
+    pha.notice(2, 7)
+
+    # The scale values <= 0 are replaced by 1 in the returned array.
+    bscal = pha.get_backscal(group=True, filter=True)
+    assert bscal == pytest.approx([1, 1, 0.2, 0.3, 0.4, 0.5])
+    assert pha.backscal == pytest.approx(orig)
+
+    counts = pha.get_dep(filter=True)
+    assert not np.shares_memory(counts, pha.counts)
+
+    vals = pha.apply_filter(pha.counts)
+    vals[:] = -1
+    assert pha.counts == pytest.approx(chans * 2)
+
+
+def make_axis_pha():
+    """Create a PHA dataset for the analysis-axis cache tests."""
+
+    chans = np.arange(1, 11)
+    egrid = np.linspace(0.5, 1.5, 11)
+    rmf = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                           e_max=egrid[1:])
+    pha = DataPHA("axis", chans, np.ones(10))
+    pha.set_rmf(rmf)
+    pha.units = "wavelength"
+    return pha
+
+
+def test_pha_axis_cache_reuse():
+    """Repeated calls return the same arrays."""
+
+    pha = make_axis_pha()
+    x1 = pha.get_x()
+    x2 = pha.get_x()
+    assert x1 == pytest.approx(x2)
+
+    # The public accessor returns a copy of the cached array.
+    #
+    assert x1 is not x2
+    assert x1.flags.writeable
+    x1[0] = -1
+    assert pha.get_x()[0] == pytest.approx(x2[0])
+
+    lo1, hi1 = pha._get_indep()
+    lo2, hi2 = pha._get_indep()
+    assert lo1 is lo2
+    assert hi1 is hi2
+    assert not lo1.flags.writeable
+    assert lo1 == pytest.approx(hc / pha.get_rmf().energ_hi)
+
+    elo1, _ = pha._get_ebins()
+    elo2, _ = pha._get_ebins()
+    assert elo1 is elo2
+
+    # The response arrays are returned, and are not changed.
+    #
+    assert elo1 is pha.get_rmf().e_min
+    assert elo1.flags.writeable
+
+
+def test_pha_axis_cache_units():
+    """Changing the analysis setting changes the axis."""
+
+    pha = make_axis_pha()
+    wave = pha.get_x()
+    pha.units = "energy"
+    energy = pha.get_x()
+    assert energy == pytest.approx(np.linspace(0.55, 1.45, 10))
+    assert wave == pytest.approx(hc / energy)
+
+    pha.units = "channel"
+    assert pha.get_x() is pha.channel
+
+    pha.units = "wavelength"
+    assert pha.get_x() == pytest.approx(wave)
+
+
+def test_pha_axis_cache_response():
+    """Changing the response changes the axis."""
+
+    pha = make_axis_pha()
+    pha.units = "energy"
+    x1 = pha.get_x()
+
+    egrid = np.linspace(1, 2, 11)
+    rmf = create_delta_rmf(egrid[:-1], egrid[1:], e_min=egrid[:-1],
+                           e_max=egrid[1:])
+    pha.set_rmf(rmf)
+    x2 = pha.get_x()
+    assert x1 == pytest.approx(np.linspace(0.55, 1.45, 10))
+    assert x2 == pytest.approx(np.linspace(1.05, 1.95, 10))
+
+    lo, hi = pha._get_indep()
+    assert lo is rmf.energ_lo
+    assert hi is rmf.energ_hi
+
+
+def test_pha_axis_cache_grouping():
+    """Changing the grouping changes the axis."""
+
+    pha = make_axis_pha()
+    pha.units = "energy"
+    pha.grouping = [1, -1] * 5
+    pha.group()
+    lo, hi = pha._get_ebins()
+    assert lo == pytest.approx(np.linspace(0.5, 1.3, 5))
+    assert hi == pytest.approx(np.linspace(0.7, 1.5, 5))
+
+    pha.grouping[2:6] = [1, -1, -1, -1]
+    lo, hi = pha._get_ebins()
+    assert lo == pytest.approx([0.5, 0.7, 1.1, 1.3])
+    assert hi == pytest.approx([0.7, 1.1, 1.3, 1.5])
+
+    pha.ungroup()
+    lo, _ = pha._get_ebins()
+    assert lo is pha.get_rmf().e_min
@@ -1476,6 +1476,64 @@ def test_img_get_filter_excluded(make_test_image):
     assert d.get_filter() == shape
 
 
+@requires_region
+@pytest.mark.parametrize("coord", ["logical", "physical"])
+@pytest.mark.parametrize("shape",
+                         ["ellipse(4260,3840,3,2,30)",
+                          "circle(4247.8,3832.1,2)+rect(4258,3830,4264,3841)",
+                          "box(4255,3840,5,3,45)-circle(4255,3840,1)",
+                          "polygon(4250,3835,4262,3836,4256,3845)",
+                          "field()-circle(4255,3840,4)"])
+def test_img_notice2d_bounding_box(coord, shape):
+    """The mask does not depend on the use of bounding boxes."""
+
+    from sherpa.astro.utils._region import Region
+    from sherpa.astro.utils.regionmask import clear_region_mask_cache
+
+    clear_region_mask_cache()
+
+    # Both coordinate systems cover 4245-4274.5 and 3830-3849.5.
+    if coord == "logical":
+        x1, x0 = np.mgrid[3830:3850:0.5, 4245:4275:0.5]
+        sky = None
+    else:
+        x1, x0 = np.mgrid[1:41, 1:61]
+        sky = WCS("physical", "LINEAR", crval=[4245, 3830],
+                  crpix=[1, 1], cdelt=[0.5, 0.5])
+
+    d = DataIMG('d', x0.flatten(), x1.flatten(), np.ones(x0.size),
+                shape=x0.shape, sky=sky)
+    d.set_coord(coord)
+    d.notice2d(shape)
+
+    expected = Region(shape).mask(d.get_x0(), d.get_x1()).astype(bool)
+    assert d.mask == pytest.approx(expected)
+
+    # Check the cached version.
+    d.notice2d()
+    d.notice2d(shape)
+    assert d.mask == pytest.approx(expected)
+
+
+@requires_region
+@pytest.mark.parametrize("ignore", [False, True])
+def test_img_notice2d_list(ignore, make_test_image):
+    """Sending a list of regions is the same as sending each one."""
+
+    shapes = ['ellipse(4260,3840,3,2,0)', 'rect(4258,3830,4264,3841)',
+              'circle(4247.8,3832.1,2)']
+
+    d = make_test_image
+    for shape in shapes:
+        d.notice2d(shape, ignore=ignore)
+
+    expected = d.mask.copy()
+
+    d.notice2d()
+    d.notice2d(shapes, ignore=ignore)
+    assert d.mask == pytest.approx(expected)
+
+
 def check_ignore_ignore(d):
     """Check removing the shapes works as expected.
 
@@ -4103,6 +4161,80 @@ def test_img_world_get_world(path, make_test_image_world):
     assert b == pytest.approx(WORLD_X1)
 
 
+@requires_wcs
+def test_img_sky_get_physical_cached(make_test_image_sky):
+    """The physical axes are cached as separate axes."""
+
+    d = make_test_image_sky
+    x1, x0 = np.mgrid[1:3, 1:4]
+    x0 = (x0 + 2.0) * 2.0 + 2000.5
+    x1 = (x1 - 3.0) * 4.0 - 5000.5
+
+    for _ in range(2):
+        a, b = d.get_physical()
+        assert a == pytest.approx(x0.flatten())
+        assert b == pytest.approx(x1.flatten())
+
+    cached = d._coord_cache[("logical", "physical")][3]
+    assert cached[0] == "grid"
+    assert cached[1] == pytest.approx([2006.5, 2008.5, 2010.5])
+    assert cached[2] == pytest.approx([-5008.5, -5004.5])
+
+    # The returned values can be changed without changing the cache.
+    a[:] = 0
+    a, _ = d.get_physical()
+    assert a == pytest.approx(x0.flatten())
+
+
+@requires_wcs
+def test_img_world_get_world_cached(make_test_image_world):
+    """The world axes are cached, and the cache is reset when the WCS changes."""
+
+    d = make_test_image_world
+    a, b = d.get_world()
+    assert d._coord_cache[("logical", "world")][3][0] == "full"
+
+    a2, b2 = d.get_world()
+    assert a2 is not a
+    assert a2 == pytest.approx(WORLD_X0)
+    assert b2 == pytest.approx(WORLD_X1)
+
+    d.eqpos.crval = np.asarray([31.0, 10.0])
+    a3, _ = d.get_world()
+    assert a3 == pytest.approx(WORLD_X0 + 1, rel=1e-3)
+
+
+@requires_wcs
+def test_img_rotated_sky_not_separable():
+    """A rotated LINEAR transform is not stored as separate axes."""
+
+    sky = WCS("physical", "LINEAR", crval=[100, 200], crpix=[1, 1],
+              cdelt=[1, 1], crota=30)
+    x1, x0 = np.mgrid[1:3, 1:4]
+    d = DataIMG("rot", x0.flatten(), x1.flatten(), np.ones(x0.size),
+                shape=x0.shape, sky=sky)
+
+    expected = sky.apply(x0.flatten().astype(float), x1.flatten().astype(float))
+    a, b = d.get_physical()
+    assert d._coord_cache[("logical", "physical")][3][0] == "full"
+    assert a == pytest.approx(expected[0])
+    assert b == pytest.approx(expected[1])
+
+
+@requires_wcs
+def test_img_sky_coord_cache_not_pickled(make_test_image_sky):
+    """The cache is not included in the pickled state."""
+
+    d = make_test_image_sky
+    d.get_physical()
+    assert len(d._coord_cache) == 1
+
+    new = pickle.loads(pickle.dumps(d))
+    assert new._coord_cache == {}
+    a, b = new.get_physical()
+    assert a == pytest.approx(d.get_physical()[0])
+
+
 @requires_wcs
 @requires_region
 def test_img_sky_can_filter(make_test_image_sky):
@@ -7651,6 +7651,16 @@ class Session(sherpa.ui.utils.Session):
     notice.__doc__ = sherpa.ui.utils.Session.notice.__doc__
     notice.__annotations__ = sherpa.ui.utils.Session.notice.__annotations__
 
+    def _notice_all(self,
+                    datasets: Sequence[Data],
+                    lo=None, hi=None,
+                    **kwargs) -> None:
+        """Apply the same filter to each dataset.
+
+        PHA datasets which share the same grid are filtered together.
+        """
+        sherpa.astro.data.notice_datasets(datasets, lo, hi, **kwargs)
+
     # DOC-TODO: how best to document the region support?
     # DOC-TODO: I have not mentioned the support for radii in arcsec/minutes/degrees
     # or sexagessimal formats. Is this supported here?
@@ -16388,7 +16398,7 @@ class Session(sherpa.ui.utils.Session):
             # Returning the grid that this model represents is not as easy
             # as it should be, since there is no obvious API.
             #
-            bins = data._get_indep(filter=False)
+            bins = tuple(b.copy() for b in data._get_indep(filter=False))
         else:
             bins = data.get_indep(filter=False)
 
@@ -24,6 +24,8 @@
 
 """
 
+from collections.abc import Iterator
+
 import numpy as np
 
 from sherpa.astro import hc, charge_e
@@ -31,6 +33,7 @@ from sherpa.utils import filter_bins
 from sherpa.utils.err import IOErr, DataErr
 from sherpa.utils import guess
 from sherpa.utils.guess import ValueAndRange, get_position
+from sherpa.utils.numeric_types import SherpaFloat
 
 from ._utils import arf_fold, do_group, expand_grouped_mask, \
     filter_resp, is_in, rmf_fold, shrink_effarea
@@ -44,7 +47,10 @@ __all__ = ('arf_fold', 'rmf_fold', 'do_group', 'apply_pileup',
            'calc_source_sum', 'compile_energy_grid',
            'calc_kcorr',
            'expand_grouped_mask', 'is_in',
-           'get_xspec_position', 'get_xspec_norm')
+           'get_xspec_position', 'get_xspec_norm',
+           'GroupFilterPlan', 'group_bins', 'group_width',
+           'group_counts', 'group_snr', 'group_adapt', 'group_adapt_snr',
+           'group_spectra')
 
 
 
@@ -157,6 +163,923 @@ def compile_energy_grid(arglist):
     return [elo, ehi, htable]
 
 
+class GroupFilterPlan:
+    """Group and filter channel data in a single step.
+
+    The channel ranges of the selected groups are calculated once,
+    so that applying the grouping and filter to an array is a single
+    reduction over the selected channels, rather than grouping all
+    the channels with `do_group` and then filtering the groups.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    nchan : int
+        The number of channels.
+    grouping : ndarray or None, optional
+        The OGIP grouping array, where a value >= 0 starts a new
+        group and a negative value continues the group. If None then
+        each channel is its own group.
+    mask : bool or ndarray, optional
+        The groups to select. If an array it must match the number
+        of groups.
+    quality_filter : ndarray or None, optional
+        The channels to use when grouping (True means the channel is
+        used). This is ignored when grouping is None.
+
+    Attributes
+    ----------
+    index : slice or ndarray
+        The selected channels, in order.
+    offsets : ndarray or None
+        The start of each selected group within the selected channels,
+        or None if there is no grouping.
+
+    See Also
+    --------
+    do_group
+
+    Notes
+    -----
+    Channels before the start of the first group are not included in
+    any group, to match `do_group`.
+
+    Examples
+    --------
+
+    >>> plan = GroupFilterPlan(6, [1, -1, 1, -1, -1, 1], [True, False, True])
+    >>> plan.apply([1, 2, 3, 4, 5, 6])
+    array([3., 6.])
+    >>> plan.apply([[1, 2, 3, 4, 5, 6], [1, 1, 1, 1, 1, 1]], "_max")
+    array([[2., 6.],
+           [1., 1.]])
+
+    Arrays that only contain the selected channels can also be used:
+
+    >>> plan.nselected
+    3
+    >>> plan.apply([1, 2, 6])
+    array([3., 6.])
+
+    """
+
+    def __init__(self, nchan, grouping=None, mask=True,
+                 quality_filter=None):
+
+        self.nchan = int(nchan)
+        if grouping is None:
+            chans = np.arange(self.nchan)
+            starts = chans
+        else:
+            grouping = np.asarray(grouping)
+            if grouping.shape != (self.nchan, ):
+                raise DataErr("mismatchn", "channel", "grouping",
+                              self.nchan, grouping.size)
+
+            if quality_filter is None:
+                chans = np.arange(self.nchan)
+            else:
+                chans = np.flatnonzero(quality_filter)
+                grouping = grouping[chans]
+
+            starts = np.flatnonzero(grouping >= 0)
+
+        ngroups = starts.size
+        ends = np.append(starts[1:], chans.size)
+        if mask is True:
+            sel = slice(None)
+        elif mask is False:
+            sel = np.zeros(ngroups, dtype=bool)
+        else:
+            sel = np.asarray(mask, dtype=bool)
+            if sel.size != ngroups:
+                raise DataErr("mismatchn", "mask", "data array",
+                              sel.size, ngroups)
+
+        starts = starts[sel]
+        lengths = ends[sel] - starts
+        nsel = lengths.sum()
+
+        offsets = np.zeros(lengths.size, dtype=int)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+
+        # The channel numbers of the selected groups, which are
+        # converted to a slice if they are contiguous, as is the
+        # case for a simple filter.
+        #
+        idx = chans[np.repeat(starts - offsets, lengths) + np.arange(nsel)]
+        if nsel > 0 and idx[-1] - idx[0] + 1 == nsel:
+            self.index = slice(idx[0], idx[-1] + 1)
+        else:
+            self.index = idx
+
+        self.ngroups = lengths.size
+        self.nselected = int(nsel)
+        self.offsets = None if grouping is None else offsets
+
+    def apply(self, data, groupfunc="sum"):
+        """Group and filter the data.
+
+        Parameters
+        ----------
+        data : array_like
+            The values to group. The last axis must match either the
+            number of channels or the number of selected channels, and
+            any other axes are treated as separate arrays to group.
+        groupfunc : str, optional
+            The name of the grouping function: one of "sum",
+            "_sum_sq", "_min", "_max", and "_middle".
+
+        Returns
+        -------
+        grouped : ndarray
+            The grouped data for the selected groups. When there is
+            no grouping the input type is retained, otherwise the
+            values are converted to floating point.
+
+        """
+
+        offsets = self.offsets
+        data = np.asarray(data, dtype=None if offsets is None else SherpaFloat)
+        nlast = data.shape[-1]
+        if nlast == self.nchan:
+            data = data[..., self.index]
+
+            # A slice creates a view, but the caller may change the
+            # returned values.
+            #
+            if offsets is None and isinstance(self.index, slice):
+                return data.copy()
+
+        elif nlast != self.nselected:
+            raise DataErr("mismatchn", "filtered data", "array",
+                          self.nselected, nlast)
+        elif offsets is None:
+            return data.copy()
+
+        if offsets is None:
+            return data
+
+        if self.ngroups == 0:
+            return np.zeros(data.shape[:-1] + (0, ), dtype=SherpaFloat)
+
+        if groupfunc == "sum":
+            return np.add.reduceat(data, offsets, axis=-1)
+
+        if groupfunc == "_sum_sq":
+            return np.sqrt(np.add.reduceat(data * data, offsets, axis=-1))
+
+        if groupfunc == "_min":
+            return np.minimum.reduceat(data, offsets, axis=-1)
+
+        if groupfunc == "_max":
+            return np.maximum.reduceat(data, offsets, axis=-1)
+
+        if groupfunc == "_middle":
+            out = np.minimum.reduceat(data, offsets, axis=-1)
+            out += np.maximum.reduceat(data, offsets, axis=-1)
+            out /= 2
+            return out
+
+        raise ValueError(f"unsupported group function: {groupfunc}")
+
+
+# The dynamic grouping schemes. These follow the rules of the CIAO
+# grouping library (which is available as the optional group
+# module):
+#
+# - channels marked by tabStops are left ungrouped, with a grouping
+#   value of 0 and a quality of 0;
+# - a group starts with a grouping value of 1, and continues with -1;
+# - channels that can not be placed in a complete group are given a
+#   quality value of 2.
+#
+_GRP_BEGIN = 1
+_GRP_MIDDLE = -1
+_GRP_TABBED = 0
+_QUAL_GOOD = 0
+_QUAL_POOR = 2
+
+
+def _grouping_setup(nchan: int,
+                    tabStops
+                    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Create the grouping and quality arrays and the tab-stop mask."""
+
+    if tabStops is None:
+        tabs = np.zeros(nchan, dtype=bool)
+    else:
+        tabs = np.asarray(tabStops).astype(bool)
+        if tabs.shape != (nchan, ):
+            raise DataErr("mismatchn", "channels", "tabStops", nchan,
+                          tabs.size)
+
+    grouping = np.full(nchan, _GRP_TABBED, dtype=np.int16)
+    quality = np.full(nchan, _QUAL_GOOD, dtype=np.int16)
+    return grouping, quality, tabs
+
+
+def _free_runs(tabs: np.ndarray) -> np.ndarray:
+    """The [start, end) ranges of channels that are not tab stops."""
+
+    padded = np.concatenate(([True], tabs, [True]))
+    return np.flatnonzero(padded[1:] != padded[:-1]).reshape(-1, 2)
+
+
+def _set_group(grouping: np.ndarray,
+               quality: np.ndarray,
+               start: int,
+               end: int,
+               complete: bool = True) -> None:
+    """Mark channels start to end-1 as a group."""
+
+    grouping[start] = _GRP_BEGIN
+    grouping[start + 1:end] = _GRP_MIDDLE
+    quality[start:end] = _QUAL_GOOD if complete else _QUAL_POOR
+
+
+def _get_max_length(maxLength) -> float:
+    """Convert maxLength, where None or <= 0 means no limit.
+
+    As with the group library the value is not rounded, so a
+    maxLength of 2.5 allows groups of three channels to be created
+    by the sequential schemes, but only two for the adaptive ones.
+    """
+
+    if maxLength is None or maxLength <= 0:
+        return np.inf
+
+    return float(maxLength)
+
+
+def _get_errors(counts: np.ndarray, errorCol) -> np.ndarray | None:
+    """Validate the errorCol argument."""
+
+    if errorCol is None:
+        return None
+
+    err = np.asarray(errorCol, dtype=SherpaFloat)
+    if err.shape != counts.shape:
+        raise DataErr("mismatchn", "counts", "errorCol", counts.size,
+                      err.size)
+
+    return err
+
+
+def _group_fixed(nchan: int,
+                 width: int,
+                 tabStops
+                 ) -> tuple[np.ndarray, np.ndarray]:
+    """Group each run of channels into groups of width channels."""
+
+    grouping, quality, tabs = _grouping_setup(nchan, tabStops)
+    for start, end in _free_runs(tabs):
+        idx = np.arange(end - start)
+        grouping[start:end] = np.where(idx % width == 0, _GRP_BEGIN,
+                                       _GRP_MIDDLE)
+
+        # Any left-over channels form an incomplete group.
+        nleft = (end - start) % width
+        if nleft > 0:
+            quality[end - nleft:end] = _QUAL_POOR
+
+    return grouping, quality
+
+
+def _group_sequential(counts: np.ndarray,
+                      threshold: float,
+                      maxLength,
+                      tabStops
+                      ) -> tuple[np.ndarray, np.ndarray]:
+    """Group channels in order until the summed counts are >= threshold.
+
+    A group that reaches maxLength channels is complete, whatever
+    its counts, whereas one that is ended by a tab stop, or the last
+    channel, is incomplete.
+    """
+
+    nchan = counts.size
+    grouping, quality, tabs = _grouping_setup(nchan, tabStops)
+    limit = _get_max_length(maxLength)
+    maxlen = nchan + 1 if np.isinf(limit) else max(1, int(np.ceil(limit)))
+
+    # The running sum is restarted at the start of each group, so
+    # that the values match a sequential calculation.
+    #
+    def find_end(start, stop):
+        chunk = 16
+        sumc = 0.0
+        lo = start
+        while lo < stop:
+            hi = min(stop, lo + chunk)
+            csum = np.cumsum(np.concatenate(([sumc], counts[lo:hi])))[1:]
+            idx = np.flatnonzero(csum >= threshold)
+            if idx.size > 0:
+                return lo + idx[0] + 1
+
+            sumc = csum[-1]
+            lo = hi
+            chunk *= 2
+
+        return None
+
+    for start, end in _free_runs(tabs):
+        pos = start
+        while pos < end:
+            stop = min(end, pos + maxlen)
+            gend = find_end(pos, stop)
+            if gend is None:
+                _set_group(grouping, quality, pos, stop,
+                           complete=stop - pos == maxlen)
+                pos = stop
+            else:
+                _set_group(grouping, quality, pos, gend)
+                pos = gend
+
+    return grouping, quality
+
+
+def _group_snr(counts: np.ndarray,
+               snr: float,
+               maxLength,
+               tabStops,
+               errors: np.ndarray | None
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """Group channels in order until the signal-to-noise ratio is > snr.
+
+    This is a direct translation of the group library, including
+    its behavior when maxLength is reached (the channel is added to
+    the group but a new group is then started with it) and for the
+    last channel (which always ends with a quality of 0). When
+    errors is None the signal-to-noise ratio is the square root of
+    the summed counts.
+    """
+
+    nchan = counts.size
+    grouping, quality, tabs = _grouping_setup(nchan, tabStops)
+    maxlen = _get_max_length(maxLength)
+    last = nchan - 1
+
+    cvals = counts.tolist()
+    evals = None if errors is None else errors.tolist()
+
+    signal = 0.0
+    noise = 0.0
+    ratio2 = 0.0
+
+    def add(idx):
+        nonlocal signal, noise, ratio2
+        if evals is None:
+            if cvals[idx] != 0:
+                signal += cvals[idx]
+                ratio2 = signal
+        elif evals[idx] != 0:
+            signal += cvals[idx]
+            noise += evals[idx] * evals[idx]
+            ratio2 = signal / np.sqrt(noise)
+            ratio2 *= ratio2
+
+    def exceeded():
+        # The group library compares sqrt(ratio2) > snr, which is
+        # False for negative values.
+        return ratio2 > 0 and np.sqrt(ratio2) > snr
+
+    counter = 0
+    for idx in range(nchan):
+        if tabs[idx]:
+            if counter != 0:
+                _set_group(grouping, quality, idx - counter, idx,
+                           complete=False)
+                signal = noise = ratio2 = 0.0
+                counter = 0
+
+            continue
+
+        if idx == last:
+            add(idx)
+            if exceeded() or counter + 1 >= maxlen:
+                grouping[idx] = _GRP_MIDDLE if counter else _GRP_BEGIN
+                quality[idx] = _QUAL_GOOD
+                counter += 1
+            else:
+                _set_group(grouping, quality, idx - counter, idx + 1,
+                           complete=False)
+
+        elif counter + 1 >= maxlen or exceeded():
+            grouping[idx] = _GRP_MIDDLE
+            quality[idx] = _QUAL_GOOD
+            signal = noise = ratio2 = 0.0
+            counter = 0
+
+        if counter == 0:
+            add(idx)
+            grouping[idx] = _GRP_BEGIN
+            quality[idx] = _QUAL_GOOD
+            counter += 1
+
+        elif idx != last:
+            add(idx)
+            grouping[idx] = _GRP_MIDDLE
+            quality[idx] = _QUAL_GOOD
+            counter += 1
+
+    return grouping, quality
+
+
+def _count_windows(counts: np.ndarray,
+                   minimum: float
+                   ) -> Iterator[np.ndarray]:
+    """Which windows of 1, 2, ... channels contain >= minimum counts.
+
+    The sum over channels i to i + length - 1, for i < nchan - length,
+    is built up one channel at a time.
+    """
+
+    nchan = counts.size
+    sumc = np.zeros(nchan)
+    for length in range(1, nchan):
+        nwin = nchan - length
+        sumc = sumc[:nwin] + counts[length - 1:length - 1 + nwin]
+        yield sumc >= minimum
+
+
+def _snr_windows(counts: np.ndarray,
+                 snr: float,
+                 errors: np.ndarray | None
+                 ) -> Iterator[np.ndarray]:
+    """Which windows of 1, 2, ... channels have a signal-to-noise > snr.
+
+    This follows the group library. With errors the ratio is the
+    summed signal divided by the summed variance, ignoring channels
+    with a zero error. Without errors each channel with non-zero
+    counts adds the counts of the first channel in the window, and
+    the ratio is the square root of this value.
+    """
+
+    nchan = counts.size
+    signal = np.zeros(nchan)
+    noise = np.zeros(nchan)
+    ratio2 = np.zeros(nchan)
+    for length in range(1, nchan):
+        nwin = nchan - length
+        chans = slice(length - 1, length - 1 + nwin)
+        if errors is None:
+            valid = counts[chans] != 0
+            signal = signal[:nwin] + np.where(valid, counts[:nwin], 0)
+            ratio2 = signal
+        else:
+            err = errors[chans]
+            valid = err != 0
+            signal = signal[:nwin] + np.where(valid, counts[chans], 0)
+            noise = noise[:nwin] + np.where(valid, err * err, 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = signal / noise
+                ratio2 = np.where(valid, ratio * ratio, ratio2[:nwin])
+
+        with np.errstate(invalid="ignore"):
+            yield np.sqrt(ratio2) > snr
+
+
+def _group_adaptive(nchan: int,
+                    windows: Iterator[np.ndarray],
+                    maxLength,
+                    tabStops
+                    ) -> tuple[np.ndarray, np.ndarray]:
+    """Group the brightest regions first.
+
+    Groups of one channel are created first, then groups of two
+    channels from the remaining channels, and so on. The windows
+    iterator returns, for each width, which of the windows starting
+    at channel i, for i < nchan - width, are acceptable (so, as with
+    the group library, windows that end at the last channel are not
+    considered). The remaining channels are combined into incomplete
+    groups.
+    """
+
+    grouping, quality, tabs = _grouping_setup(nchan, tabStops)
+    maxlen = _get_max_length(maxLength)
+
+    used = tabs.copy()
+    for length, match in enumerate(windows, 1):
+        if length > maxlen:
+            break
+
+        nwin = nchan - length
+        cused = np.concatenate(([0], np.cumsum(used)))
+        free = cused[length:length + nwin] == cused[:nwin]
+        next_start = 0
+        for start in np.flatnonzero(match & free):
+            if start < next_start:
+                continue
+
+            end = start + length
+            _set_group(grouping, quality, start, end)
+            used[start:end] = True
+            next_start = end
+
+        if used.all():
+            break
+
+    # The left-over channels.
+    for start, end in _free_runs(used):
+        _set_group(grouping, quality, start, end, complete=False)
+
+    return grouping, quality
+
+
+def group_bins(nchan: int,
+               num: int,
+               tabStops=None
+               ) -> tuple[np.ndarray, np.ndarray]:
+    """Group into a fixed number of bins.
+
+    This is a native version of the ``grpNumBins`` routine from the
+    CIAO group module.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    nchan : int
+       The number of channels.
+    num : int
+       The number of groups. The group width is the number of
+       channels that are not tab stops divided by num, rounded down.
+    tabStops : array of int or bool, optional
+       Channels that are not to be grouped (True or non-zero values).
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays.
+
+    See Also
+    --------
+    group_counts, group_snr, group_spectra, group_width
+
+    Examples
+    --------
+
+    >>> group_bins(7, 2)
+    (array([ 1, -1, -1,  1, -1, -1,  1], dtype=int16), array([0, 0, 0, 0, 0, 0, 2], dtype=int16))
+
+    """
+
+    if num <= 0:
+        raise DataErr("bad", "num argument", "must be > 0")
+
+    _, _, tabs = _grouping_setup(nchan, tabStops)
+    width = int(np.sum(~tabs)) // int(num)
+    if width < 1:
+        raise DataErr("bad", "num argument",
+                      "must not exceed the number of channels")
+
+    return _group_fixed(nchan, width, tabStops)
+
+
+def group_width(nchan: int,
+                val: int,
+                tabStops=None
+                ) -> tuple[np.ndarray, np.ndarray]:
+    """Group into a fixed bin width.
+
+    This is a native version of the ``grpBinWidth`` routine from the
+    CIAO group module.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    nchan : int
+       The number of channels.
+    val : int
+       The number of channels in each group.
+    tabStops : array of int or bool, optional
+       Channels that are not to be grouped (True or non-zero values).
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays.
+
+    See Also
+    --------
+    group_bins, group_counts, group_snr, group_spectra
+
+    Examples
+    --------
+
+    >>> group_width(5, 2)
+    (array([ 1, -1,  1, -1,  1], dtype=int16), array([0, 0, 0, 0, 2], dtype=int16))
+
+    """
+
+    if val <= 0:
+        raise DataErr("bad", "val argument", "must be > 0")
+
+    return _group_fixed(nchan, int(val), tabStops)
+
+
+def group_counts(counts,
+                 num: float,
+                 maxLength=None,
+                 tabStops=None
+                 ) -> tuple[np.ndarray, np.ndarray]:
+    """Group into a minimum number of counts per bin.
+
+    This is a native version of the ``grpNumCounts`` routine from
+    the CIAO group module.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    counts : array of num
+       The counts in each channel.
+    num : number
+       The minimum number of counts in each group.
+    maxLength : int, optional
+       The maximum number of channels that can be combined into a
+       single group.
+    tabStops : array of int or bool, optional
+       Channels that are not to be grouped (True or non-zero values).
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays.
+
+    See Also
+    --------
+    group_adapt, group_snr, group_spectra
+
+    Examples
+    --------
+
+    >>> group_counts([3, 4, 1, 0, 2, 5, 2], 3)
+    (array([ 1,  1,  1, -1, -1,  1,  1], dtype=int16), array([0, 0, 0, 0, 0, 0, 2], dtype=int16))
+
+    """
+
+    counts = np.asarray(counts, dtype=SherpaFloat)
+    return _group_sequential(counts, num, maxLength, tabStops)
+
+
+def group_snr(counts,
+              snr: float,
+              maxLength=None,
+              tabStops=None,
+              errorCol=None
+              ) -> tuple[np.ndarray, np.ndarray]:
+    """Group into a minimum signal-to-noise ratio.
+
+    This is a native version of the ``grpSnr`` routine from the
+    CIAO group module.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    counts : array of num
+       The counts in each channel.
+    snr : number
+       The signal-to-noise ratio that must be exceeded by each group.
+    maxLength : int, optional
+       The maximum number of channels that can be combined into a
+       single group.
+    tabStops : array of int or bool, optional
+       Channels that are not to be grouped (True or non-zero values).
+    errorCol : array of num, optional
+       The error for each channel. If not set then Poisson errors
+       are used.
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays.
+
+    See Also
+    --------
+    group_adapt_snr, group_counts, group_spectra
+
+    Examples
+    --------
+
+    >>> group_snr([2, 6, 3, 4, 5, 3], 3)
+    (array([ 1, -1, -1,  1, -1, -1], dtype=int16), array([0, 0, 0, 0, 0, 0], dtype=int16))
+
+    """
+
+    counts = np.asarray(counts, dtype=SherpaFloat)
+    errors = _get_errors(counts, errorCol)
+    return _group_snr(counts, snr, maxLength, tabStops, errors)
+
+
+def group_adapt(counts,
+                minimum: float,
+                maxLength=None,
+                tabStops=None
+                ) -> tuple[np.ndarray, np.ndarray]:
+    """Adaptively group to a minimum number of counts.
+
+    This is a native version of the ``grpAdaptive`` routine from
+    the CIAO group module.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    counts : array of num
+       The counts in each channel.
+    minimum : number
+       The minimum number of counts in each group.
+    maxLength : int, optional
+       The maximum number of channels that can be combined into a
+       single group.
+    tabStops : array of int or bool, optional
+       Channels that are not to be grouped (True or non-zero values).
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays.
+
+    See Also
+    --------
+    group_adapt_snr, group_counts, group_spectra
+
+    Examples
+    --------
+
+    >>> group_adapt([2, 6, 3, 4, 5, 3], 5)
+    (array([ 1,  1,  1, -1,  1,  1], dtype=int16), array([2, 0, 0, 0, 0, 2], dtype=int16))
+
+    """
+
+    counts = np.asarray(counts, dtype=SherpaFloat)
+    return _group_adaptive(counts.size, _count_windows(counts, minimum),
+                           maxLength, tabStops)
+
+
+def group_adapt_snr(counts,
+                    minimum: float,
+                    maxLength=None,
+                    tabStops=None,
+                    errorCol=None
+                    ) -> tuple[np.ndarray, np.ndarray]:
+    """Adaptively group to a minimum signal-to-noise ratio.
+
+    This is a native version of the ``grpAdaptiveSnr`` routine from
+    the CIAO group module.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    counts : array of num
+       The counts in each channel.
+    minimum : number
+       The signal-to-noise ratio that must be exceeded by each group.
+    maxLength : int, optional
+       The maximum number of channels that can be combined into a
+       single group.
+    tabStops : array of int or bool, optional
+       Channels that are not to be grouped (True or non-zero values).
+    errorCol : array of num, optional
+       The error for each channel. If not set then Poisson errors
+       are used.
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays.
+
+    See Also
+    --------
+    group_adapt, group_snr, group_spectra
+
+    """
+
+    counts = np.asarray(counts, dtype=SherpaFloat)
+    errors = _get_errors(counts, errorCol)
+    return _group_adaptive(counts.size,
+                           _snr_windows(counts, minimum, errors),
+                           maxLength, tabStops)
+
+
+_GROUP_SCHEMES = {"bins": group_bins,
+                  "width": group_width,
+                  "counts": group_counts,
+                  "snr": group_snr,
+                  "adapt": group_adapt,
+                  "adapt_snr": group_adapt_snr}
+
+
+def group_spectra(scheme: str,
+                  counts,
+                  *args,
+                  tabStops=None,
+                  errorCol=None,
+                  **kwargs
+                  ) -> tuple[np.ndarray, np.ndarray]:
+    """Group a set of spectra with the same scheme.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    scheme : {'bins', 'width', 'counts', 'snr', 'adapt', 'adapt_snr'}
+       The grouping scheme, which selects `group_bins`, `group_width`,
+       `group_counts`, `group_snr`, `group_adapt`, or
+       `group_adapt_snr`.
+    counts : 2D array of num
+       The counts for each spectrum, with shape (nspec, nchan).
+    *args
+       The arguments for the scheme, after the counts or number of
+       channels argument.
+    tabStops : array of int or bool, optional
+       The tab stops to use. This can be a single array, used for
+       all spectra, or have the same shape as counts.
+    errorCol : 2D array of num, optional
+       The errors for the snr schemes, with the same shape as counts.
+    **kwargs
+       Any other arguments for the scheme, such as maxLength.
+
+    Returns
+    -------
+    grouping, quality : ndarray
+       The grouping and quality arrays, with shape (nspec, nchan).
+
+    Notes
+    -----
+    This is a convenience routine rather than a batched calculation.
+    The fixed-width schemes ('bins' and 'width') do not depend on
+    the counts, so they are only calculated once when the tab
+    stops are shared by all the spectra. The other schemes are
+    applied to each spectrum in turn, and the 'snr' scheme follows
+    the channel-by-channel loop of the group library.
+
+    Examples
+    --------
+
+    >>> counts = [[3, 4, 1, 0, 2, 5], [1, 1, 1, 1, 1, 1]]
+    >>> grouping, quality = group_spectra("counts", counts, 3)
+    >>> grouping
+    array([[ 1,  1,  1, -1, -1,  1],
+           [ 1, -1, -1,  1, -1, -1]], dtype=int16)
+    >>> quality
+    array([[0, 0, 0, 0, 0, 0],
+           [0, 0, 0, 0, 0, 0]], dtype=int16)
+
+    """
+
+    try:
+        func = _GROUP_SCHEMES[scheme]
+    except KeyError:
+        raise DataErr(f"unknown grouping scheme '{scheme}'") from None
+
+    counts = np.asarray(counts, dtype=SherpaFloat)
+    if counts.ndim != 2:
+        raise DataErr("counts must be a 2D array")
+
+    nspec, nchan = counts.shape
+    if tabStops is not None:
+        tabStops = np.asarray(tabStops)
+
+    shared = tabStops is None or tabStops.ndim == 1
+    grouping = np.empty((nspec, nchan), dtype=np.int16)
+    quality = np.empty((nspec, nchan), dtype=np.int16)
+
+    # The fixed-width schemes do not depend on the counts, so they
+    # only need to be calculated once if the tab stops are shared.
+    #
+    if scheme in ["bins", "width"]:
+        if shared:
+            grouping[:], quality[:] = func(nchan, *args, tabStops=tabStops,
+                                           **kwargs)
+            return grouping, quality
+
+        for idx, tabs in enumerate(tabStops):
+            grouping[idx], quality[idx] = func(nchan, *args, tabStops=tabs,
+                                               **kwargs)
+
+        return grouping, quality
+
+    if errorCol is not None:
+        errorCol = np.asarray(errorCol)
+
+    for idx, row in enumerate(counts):
+        tabs = tabStops if shared else tabStops[idx]
+        if errorCol is not None:
+            kwargs["errorCol"] = errorCol[idx]
+
+        grouping[idx], quality[idx] = func(row, *args, tabStops=tabs,
+                                           **kwargs)
+
+    return grouping, quality
+
+
 def bounds_check(lo, hi):
     """Ensure that the limits of a filter make sense.
 
@@ -0,0 +1,499 @@
+#
+#  Copyright (C) 2026  Smithsonian Astrophysical Observatory
+#
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""Calculate region masks for images.
+
+Evaluating a region for every pixel of a large image is expensive,
+particularly when the region consists of many small shapes. The
+routines here use the bounding box of each shape to restrict the
+pixels that need to be checked, and cache the masks so that
+repeated filters of the same image do not need to be re-calculated.
+
+The bounding boxes are calculated from the region string, so they are
+only available for the simple shapes - such as ``circle`` or
+``polygon`` - which are combined with the ``+``, ``|``, ``&``, and
+``-`` operators. Any region that can not be bounded - for example it
+is read from a file, uses ``field()``, or is an excluded shape - is
+evaluated for all the pixels.
+
+.. versionadded:: 4.19.0
+
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+import re
+import threading
+
+import numpy as np
+
+from sherpa.utils.err import ArgumentErr
+
+
+__all__ = ("region_extent", "region_mask",
+           "set_region_mask_cache", "clear_region_mask_cache")
+
+__doctest_skip__ = ['set_region_mask_cache']
+
+
+# The bounding box of a shape: (xlo, xhi, ylo, yhi).
+#
+Extent = tuple[float, float, float, float]
+
+# Match a single shape, allowing for a leading "!" to indicate
+# the shape is excluded.
+#
+_SHAPE = re.compile(r"^\s*(!?)\s*([A-Za-z]+)\s*\(([^()]*)\)\s*$")
+
+
+def _rotated(hx: float, hy: float, angle: float) -> tuple[float, float]:
+    """The half-widths of a rotated box."""
+
+    theta = np.deg2rad(angle)
+    cos = abs(np.cos(theta))
+    sin = abs(np.sin(theta))
+    return hx * cos + hy * sin, hx * sin + hy * cos
+
+
+def _circle(x: float, y: float, r: float, *args: float) -> Extent:
+    return x - r, x + r, y - r, y + r
+
+
+def _annulus(x: float, y: float, *radii: float) -> Extent:
+    return _circle(x, y, max(radii))
+
+
+def _pie(x: float, y: float, rin: float, rout: float,
+         *angles: float) -> Extent:
+    return _circle(x, y, max(rin, rout))
+
+
+def _ellipse(x: float, y: float, rx: float, ry: float,
+             angle: float = 0) -> Extent:
+    theta = np.deg2rad(angle)
+    cos = np.cos(theta)
+    sin = np.sin(theta)
+    hx = np.hypot(rx * cos, ry * sin)
+    hy = np.hypot(rx * sin, ry * cos)
+    return x - hx, x + hx, y - hy, y + hy
+
+
+def _box(x: float, y: float, w: float, h: float,
+         angle: float = 0) -> Extent:
+    hx, hy = _rotated(w / 2, h / 2, angle)
+    return x - hx, x + hx, y - hy, y + hy
+
+
+def _rectangle(x1: float, y1: float, x2: float, y2: float) -> Extent:
+    return min(x1, x2), max(x1, x2), min(y1, y2), max(y1, y2)
+
+
+def _rotrectangle(x1: float, y1: float, x2: float, y2: float,
+                  angle: float) -> Extent:
+    return _box((x1 + x2) / 2, (y1 + y2) / 2, abs(x2 - x1),
+                abs(y2 - y1), angle)
+
+
+def _polygon(*coords: float) -> Extent:
+    if len(coords) < 6 or len(coords) % 2 != 0:
+        raise ValueError("invalid polygon")
+
+    xs = coords[0::2]
+    ys = coords[1::2]
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+def _point(x: float, y: float) -> Extent:
+    return x, x, y, y
+
+
+# The shapes that can be bounded. Shapes not in this list - such as
+# field and sector - are treated as unbounded.
+#
+_EXTENTS: dict[str, Callable[..., Extent]] = {
+    "circle": _circle,
+    "annulus": _annulus,
+    "pie": _pie,
+    "ellipse": _ellipse,
+    "box": _box,
+    "rotbox": _box,
+    "rectangle": _rectangle,
+    "rect": _rectangle,
+    "rotrectangle": _rotrectangle,
+    "rotrect": _rotrectangle,
+    "polygon": _polygon,
+    "point": _point
+}
+
+
+def _split(expr: str, operators: str) -> list[tuple[str, str]]:
+    """Split an expression at the operators outside of parentheses.
+
+    Each element is the operator before the sub-expression (an empty
+    string for the first element) and the sub-expression.
+    """
+
+    out = []
+    depth = 0
+    start = 0
+    op = ""
+    for idx, char in enumerate(expr):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and char in operators:
+            out.append((op, expr[start:idx]))
+            op = char
+            start = idx + 1
+
+    out.append((op, expr[start:]))
+    return out
+
+
+def _shape_extent(expr: str) -> tuple[bool, Extent | None]:
+    """Return whether the shape is excluded and its bounding box.
+
+    The bounding box is None if it can not be calculated.
+    """
+
+    match = _SHAPE.match(expr)
+    if match is None:
+        return False, None
+
+    excluded = match.group(1) == "!"
+    func = _EXTENTS.get(match.group(2).lower())
+    if func is None:
+        return excluded, None
+
+    try:
+        args = [float(arg) for arg in match.group(3).split(",")]
+        extent = func(*args)
+    except (ValueError, TypeError):
+        return excluded, None
+
+    if not np.all(np.isfinite(extent)):
+        return excluded, None
+
+    return excluded, extent
+
+
+def region_extent(region: str) -> list[Extent] | None:
+    """Return the bounding boxes of the shapes in a region.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    region : str
+        The region expression, such as
+        ``"circle(100,200,5)+box(40,50,10,4,45)"``.
+
+    Returns
+    -------
+    extents : list of tuple or None
+        The bounding box of each component of the region, as
+        (xlo, xhi, ylo, yhi), where the region is contained within
+        the union of the boxes. The return value is None if the
+        region can not be bounded.
+
+    See Also
+    --------
+    region_mask
+
+    Notes
+    -----
+    The region is split into components at the ``+`` and ``|``
+    operators, and each component is bounded by the intersection of
+    the shapes combined with the ``&`` and ``-`` operators. Shapes
+    that are subtracted or excluded do not change the bounding box.
+    A component is unbounded if it starts with an excluded shape,
+    such as ``!circle(0,0,1)``, or if none of its shapes can be
+    bounded, which happens for ``field()``, ``sector``, unknown
+    shapes, and parameters that are not plain numbers, such as
+    sexagesimal positions.
+
+    Examples
+    --------
+
+    >>> region_extent("circle(100,200,5)")
+    [(95.0, 105.0, 195.0, 205.0)]
+    >>> region_extent("box(10,20,4,2)+circle(0,0,1)-circle(0,0,0.5)")
+    [(8.0, 12.0, 19.0, 21.0), (-1.0, 1.0, -1.0, 1.0)]
+    >>> region_extent("field()-circle(100,200,5)") is None
+    True
+
+    """
+
+    extents = []
+    for _, term in _split(region, "+|"):
+        lims = None
+        for op, factor in _split(term, "&-"):
+            if op == "" and factor.strip() == "":
+                # The term starts with a "-".
+                return None
+
+            excluded, extent = _shape_extent(factor)
+            if excluded and op == "":
+                return None
+
+            # Subtracted or excluded shapes do not restrict the term.
+            if excluded or op == "-" or extent is None:
+                continue
+
+            if lims is None:
+                lims = extent
+            else:
+                lims = (max(lims[0], extent[0]), min(lims[1], extent[1]),
+                        max(lims[2], extent[2]), min(lims[3], extent[3]))
+
+        if lims is None:
+            return None
+
+        # A term with an empty intersection contains no pixels.
+        if lims[0] > lims[1] or lims[2] > lims[3]:
+            continue
+
+        extents.append(tuple(float(lim) for lim in lims))
+
+    return extents
+
+
+def _axis_range(axis: np.ndarray, lo: float, hi: float
+                ) -> tuple[int, int] | None:
+    """The first and last index of the axis within lo to hi."""
+
+    # Allow for rounding errors at the edge of the shapes.
+    pad = 1e-8 * max(1.0, abs(lo), abs(hi))
+    idx = np.flatnonzero((axis >= lo - pad) & (axis <= hi + pad))
+    if idx.size == 0:
+        return None
+
+    return idx[0], idx[-1] + 1
+
+
+def _candidates(x0: np.ndarray,
+                x1: np.ndarray,
+                shape: Sequence[int],
+                extents: Sequence[Extent]
+                ) -> np.ndarray | None:
+    """The pixels that lie within the bounding boxes.
+
+    The return value is None if the coordinates do not form a grid,
+    where x0 only varies along the rows and x1 along the columns, or
+    the bounding boxes cover most of the image.
+    """
+
+    if len(shape) != 2 or x0.size != shape[0] * shape[1]:
+        return None
+
+    img0 = x0.reshape(shape)
+    img1 = x1.reshape(shape)
+    axis0 = img0[0]
+    axis1 = img1[:, 0]
+    if not (np.array_equal(img0, np.broadcast_to(axis0, shape)) and
+            np.array_equal(img1, np.broadcast_to(axis1[:, None], shape))):
+        return None
+
+    # The axes need not be monotonic, so do not assume the range of
+    # matching pixels is contiguous.
+    #
+    if np.any(np.diff(axis0) <= 0) and np.any(np.diff(axis0) >= 0):
+        return None
+    if np.any(np.diff(axis1) <= 0) and np.any(np.diff(axis1) >= 0):
+        return None
+
+    cand = np.zeros(shape, dtype=bool)
+    for xlo, xhi, ylo, yhi in extents:
+        cols = _axis_range(axis0, xlo, xhi)
+        if cols is None:
+            continue
+
+        rows = _axis_range(axis1, ylo, yhi)
+        if rows is None:
+            continue
+
+        cand[rows[0]:rows[1], cols[0]:cols[1]] = True
+
+    return np.flatnonzero(cand)
+
+
+# The cache of masks, indexed by a key provided by the caller. The
+# default size allows a number of masks for a 4096 by 4096 image to
+# be stored.
+#
+_mask_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+_mask_cache_nbytes = 0
+_mask_cache_maxbytes = 64 * 1024 * 1024
+_mask_cache_lock = threading.Lock()
+
+
+def set_region_mask_cache(maxbytes: int = 64 * 1024 * 1024) -> None:
+    """Set the size of the region-mask cache.
+
+    The masks created by `region_mask` when given a key are stored,
+    so that filtering an image with the same region does not need to
+    re-evaluate the region. The least-recently used masks are removed
+    when the cache gets too large.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    maxbytes : int, optional
+        The maximum size of the cache, in bytes. Each mask uses one
+        byte per pixel. A value of 0 turns off the cache.
+
+    See Also
+    --------
+    clear_region_mask_cache, region_mask
+
+    Examples
+    --------
+
+    Turn off the cache:
+
+    >>> set_region_mask_cache(0)
+
+    """
+
+    global _mask_cache_maxbytes
+
+    maxbytes = int(maxbytes)
+    if maxbytes < 0:
+        raise ArgumentErr("bad", "maxbytes", "must be 0 or positive")
+
+    with _mask_cache_lock:
+        _mask_cache_maxbytes = maxbytes
+        _evict_masks()
+
+
+def clear_region_mask_cache() -> None:
+    """Remove all the masks from the region-mask cache.
+
+    .. versionadded:: 4.19.0
+
+    See Also
+    --------
+    set_region_mask_cache
+
+    """
+
+    global _mask_cache_nbytes
+
+    with _mask_cache_lock:
+        _mask_cache.clear()
+        _mask_cache_nbytes = 0
+
+
+def _evict_masks() -> None:
+    """Remove masks until the cache is small enough.
+
+    The lock must be held.
+    """
+
+    global _mask_cache_nbytes
+
+    while _mask_cache and _mask_cache_nbytes > _mask_cache_maxbytes:
+        _, mask = _mask_cache.popitem(last=False)
+        _mask_cache_nbytes -= mask.nbytes
+
+
+def region_mask(region,
+                x0: np.ndarray,
+                x1: np.ndarray,
+                shape: Sequence[int] | None = None,
+                extents: Sequence[Extent] | None = None,
+                key: tuple | None = None
+                ) -> np.ndarray:
+    """Evaluate a region for a set of points.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    region
+        The region, which must have a ``mask(x0, x1)`` method, such
+        as `sherpa.astro.utils._region.Region`.
+    x0, x1 : ndarray
+        The coordinates of the points.
+    shape : sequence of int or None, optional
+        The image shape (in the NumPy order) of the points. This is
+        needed for the bounding boxes to be used.
+    extents : sequence of tuple or None, optional
+        The bounding boxes of the region, as returned by
+        `region_extent`. When given, and the points form a regular
+        grid, only the points within a box are sent to the region.
+        All the points are used when it is None.
+    key : tuple or None, optional
+        The key used to cache the mask. It must identify the region
+        and the coordinates, and is not used if None.
+
+    Returns
+    -------
+    mask : ndarray
+        A boolean array which is True for the points within the
+        region.
+
+    See Also
+    --------
+    region_extent, set_region_mask_cache
+
+    Notes
+    -----
+    All the shapes in the region are evaluated in a single call for
+    the points within the union of the bounding boxes, which means
+    that a region made up of many small shapes only needs to check
+    a small fraction of the image.
+
+    """
+
+    global _mask_cache_nbytes
+
+    if key is not None:
+        with _mask_cache_lock:
+            cached = _mask_cache.get(key)
+            if cached is not None:
+                _mask_cache.move_to_end(key)
+                return cached.copy()
+
+    x0 = np.asarray(x0)
+    x1 = np.asarray(x1)
+
+    idx = None
+    if shape is not None and extents is not None:
+        idx = _candidates(x0, x1, shape, extents)
+
+    if idx is None:
+        mask = np.asarray(region.mask(x0, x1)).astype(bool)
+    else:
+        mask = np.zeros(x0.size, dtype=bool)
+        if idx.size > 0:
+            mask[idx] = np.asarray(region.mask(x0[idx], x1[idx])).astype(bool)
+
+    if key is not None and 0 < mask.nbytes <= _mask_cache_maxbytes:
+        stored = mask.copy()
+        stored.setflags(write=False)
+        with _mask_cache_lock:
+            if key not in _mask_cache:
+                _mask_cache[key] = stored
+                _mask_cache_nbytes += stored.nbytes
+                _evict_masks()
+
+    return mask
@@ -24,18 +24,21 @@ import numpy as np
 
 import pytest
 
+import sherpa.astro.data
 from sherpa.astro.data import DataPHA, DataIMG, DataIMGInt
 from sherpa.astro.instrument import create_arf, create_delta_rmf, \
     matrix_to_rmf
 from sherpa.astro import ui
 from sherpa.astro import utils
-from sherpa.astro.utils import do_group, eqwidth, expand_grouped_mask, \
-    filter_resp, range_overlap_1dint
+from sherpa.astro.utils import GroupFilterPlan, do_group, eqwidth, \
+    expand_grouped_mask, filter_resp, range_overlap_1dint, group_adapt, \
+    group_adapt_snr, group_bins, group_counts, group_snr, group_spectra, \
+    group_width
 from sherpa.data import Data1D, Data1DInt, Data2D, Data2DInt
 from sherpa.models.basic import Const1D, NormGauss1D
 from sherpa.utils.err import DataErr, IOErr
 from sherpa.utils.testing import requires_data, requires_fits, \
-    requires_region
+    requires_group, requires_region
 
 
 # See https://github.com/sherpa/sherpa/issues/405
@@ -355,6 +358,275 @@ def test_do_group_single_group(func, expected):
     assert ans == pytest.approx([expected])
 
 
+@pytest.mark.parametrize("func", ["sum", "_sum_sq", "_min", "_max", "_middle"])
+@pytest.mark.parametrize("mask", [True,
+                                  [True] * 4,
+                                  [False, True, True, False],
+                                  [True, False, False, True]])
+def test_group_filter_plan_matches_do_group(func, mask):
+    """The plan matches do_group followed by the group filter."""
+
+    data = np.asarray([6, 4, 2, 1, -1, 3, 7, 2])
+    grouping = np.asarray([1, -1, 1, -1, -1, 1, 1, -1])
+    quality = np.asarray([0, 0, 0, 2, 0, 0, 0, 0])
+    qfilt = quality == 0
+
+    plan = GroupFilterPlan(8, grouping=grouping, mask=mask,
+                           quality_filter=qfilt)
+    expected = do_group(data[qfilt], grouping[qfilt], func)
+    expected = expected[np.asarray(mask)] if mask is not True else expected
+    assert plan.ngroups == expected.size
+    assert plan.apply(data, func) == pytest.approx(expected)
+
+    # The pre-filtered data can also be used.
+    filtered = data[qfilt][expand_grouped_mask(mask, grouping[qfilt])] \
+        if mask is not True else data[qfilt]
+    assert plan.nselected == filtered.size
+    assert plan.apply(filtered, func) == pytest.approx(expected)
+
+
+def test_group_filter_plan_no_grouping():
+    """Without grouping the data is just filtered (and keeps its type)."""
+
+    mask = np.asarray([False, True, True, False, True])
+    plan = GroupFilterPlan(5, mask=mask)
+    assert plan.offsets is None
+    assert plan.ngroups == 3
+    ans = plan.apply(np.arange(5))
+    assert ans == pytest.approx([1, 2, 4])
+    assert ans.dtype == np.arange(5).dtype
+
+
+@pytest.mark.parametrize("mask", [True, [False, True, True, True, False]])
+def test_group_filter_plan_no_grouping_copy(mask):
+    """The filtered data does not share memory with the input."""
+
+    data = np.arange(5)
+    plan = GroupFilterPlan(5, mask=mask)
+    ans = plan.apply(data)
+    assert not np.shares_memory(ans, data)
+    ans[:] = -1
+    assert data == pytest.approx([0, 1, 2, 3, 4])
+
+
+def test_group_filter_plan_batch():
+    """The plan can be applied to a set of spectra in one call."""
+
+    grouping = [1, -1, 1, -1, -1, 1]
+    mask = [True, False, True]
+    data = np.arange(18).reshape(3, 6)
+    plan = GroupFilterPlan(6, grouping=grouping, mask=mask)
+    ans = plan.apply(data)
+    assert ans.shape == (3, 2)
+    for row, got in zip(data, ans):
+        assert got == pytest.approx(do_group(row, grouping, "sum")[mask])
+
+
+def test_group_filter_plan_invalid():
+    """Check the errors."""
+
+    plan = GroupFilterPlan(4, grouping=[1, -1, 1, -1], mask=[True, False])
+    with pytest.raises(DataErr,
+                       match="^size mismatch between filtered data and array: 2 vs 3$"):
+        plan.apply([1, 2, 3])
+
+    with pytest.raises(ValueError, match="^unsupported group function: foo$"):
+        plan.apply([1, 2, 3, 4], "foo")
+
+
+# Several of these values match the checks made with the group module
+# in sherpa/astro/tests/test_astro_data.py.
+#
+@pytest.mark.parametrize("func,args,grouping,quality",
+                         [(group_counts, ([3, 4, 1, 0, 2, 5, 2, 2, 2], 3),
+                           [1, 1, 1, -1, -1, 1, 1, -1, 1],
+                           [0, 0, 0, 0, 0, 0, 0, 0, 2]),
+                          (group_counts, ([1, 2, 1, 0, 2, 2, 1], 5),
+                           [1, -1, -1, -1, -1, 1, -1],
+                           [0, 0, 0, 0, 0, 2, 2]),
+                          (group_snr, ([2, 6, 3, 4, 5, 3], 3),
+                           [1, -1, -1, 1, -1, -1], [0] * 6),
+                          (group_adapt, ([2, 6, 3, 4, 5, 3], 5),
+                           [1, 1, 1, -1, 1, 1], [2, 0, 0, 0, 0, 2]),
+                          (group_adapt, ([4, 2, 3, 1, 5, 6, 7], 6),
+                           [1, -1, 1, 1, -1, 1, 1], [0, 0, 2, 0, 0, 0, 2]),
+                          (group_adapt_snr, ([2, 6, 3, 4, 5, 3], 3),
+                           [1, 1, -1, 1, -1, -1], [2, 0, 0, 2, 2, 2]),
+                          (group_bins, (21, 3), [1, -1, -1, -1, -1, -1, -1] * 3,
+                           [0] * 21),
+                          (group_width, (7, 3), [1, -1, -1, 1, -1, -1, 1],
+                           [0] * 6 + [2])
+                          ])
+def test_group_schemes(func, args, grouping, quality):
+    """Check the native grouping schemes."""
+
+    grp, qual = func(*args)
+    assert grp.dtype == np.int16
+    assert grp == pytest.approx(grouping)
+    assert qual == pytest.approx(quality)
+
+
+def test_group_counts_tabstops():
+    """Tab stops are not grouped and end the current group."""
+
+    tabs = [0, 0, 1, 0, 0, 0, 1]
+    grp, qual = group_counts([4, 2, 3, 1, 5, 6, 7], 4, tabStops=tabs)
+    assert grp == pytest.approx([1, 1, 0, 1, -1, 1, 0])
+    assert qual == pytest.approx([0, 2, 0, 0, 0, 0, 0])
+
+
+def test_group_bins_tabstops():
+    """The width depends on the channels which are not tab stops."""
+
+    tabs = np.ones(21, dtype=bool)
+    tabs[4:7] = False
+    tabs[8:11] = False
+    tabs[12:15] = False
+    grp, qual = group_bins(21, 3, tabStops=tabs)
+    expected = [0] * 4 + [1, -1, -1] + [0] + [1, -1, -1] + [0] + \
+        [1, -1, -1] + [0] * 6
+    assert grp == pytest.approx(expected)
+    assert qual == pytest.approx([0] * 21)
+
+
+def test_group_snr_errorcol():
+    """The errors can be given."""
+
+    grp, qual = group_snr([2, 6, 3, 4, 5, 3], 3, errorCol=[1] * 6)
+    assert grp == pytest.approx([1, -1, 1, -1, 1, -1])
+    assert qual == pytest.approx([0] * 6)
+
+
+@pytest.mark.parametrize("func,args,kwargs,grouping,quality",
+                         [(group_counts, ([1] * 7 + [0] * 4, 3), {"maxLength": 3},
+                           [1, -1, -1] * 3 + [1, -1], [0] * 9 + [2, 2]),
+                          (group_snr, ([1, 2, 3, 2, 6, 7, 4, 2], 3), {},
+                           [1, -1, -1, -1, -1, 1, -1, -1], [0] * 8)
+                          ])
+def test_group_library_examples(func, args, kwargs, grouping, quality):
+    """Check cases where the group library has surprising behavior.
+
+    A group that reaches maxLength is complete, and the last channel
+    of the SNR scheme is always marked as good.
+    """
+
+    grp, qual = func(*args, **kwargs)
+    assert grp == pytest.approx(grouping)
+    assert qual == pytest.approx(quality)
+
+
+@requires_group
+@pytest.mark.parametrize("func,name,threshold",
+                         [(group_counts, "grpNumCounts", 5),
+                          (group_snr, "grpSnr", 2),
+                          (group_adapt, "grpAdaptive", 5),
+                          (group_adapt_snr, "grpAdaptiveSnr", 2)])
+@pytest.mark.parametrize("maxLength", [None, 0, 2, 2.5, 5])
+@pytest.mark.parametrize("tabstops", [False, True])
+@pytest.mark.parametrize("errors", [False, True])
+def test_group_matches_group_module(func, name, threshold, maxLength,
+                                    tabstops, errors):
+    """The native schemes match the group module."""
+
+    import group
+
+    if errors and name not in ["grpSnr", "grpAdaptiveSnr"]:
+        pytest.skip("errorCol is only used by the SNR schemes")
+
+    kwargs = {}
+    if maxLength is not None:
+        kwargs["maxLength"] = maxLength
+
+    rng = np.random.default_rng(8723)
+    for _ in range(20):
+        nchan = rng.integers(2, 40)
+        counts = rng.poisson(rng.uniform(0.2, 6), size=nchan).astype(float)
+        if tabstops:
+            kwargs["tabStops"] = (rng.uniform(size=nchan) < 0.15).astype(int)
+        if errors:
+            kwargs["errorCol"] = rng.uniform(0, 3, size=nchan) * \
+                (rng.uniform(size=nchan) > 0.1)
+
+        egrp, equal = getattr(group, name)(counts, threshold, **kwargs)
+        grp, qual = func(counts, threshold, **kwargs)
+        assert grp == pytest.approx(egrp)
+        assert qual == pytest.approx(equal)
+
+
+@requires_group
+@pytest.mark.parametrize("func,name,arg",
+                         [(group_bins, "grpNumBins", 4),
+                          (group_width, "grpBinWidth", 3)])
+@pytest.mark.parametrize("tabstops", [False, True])
+def test_group_fixed_matches_group_module(func, name, arg, tabstops):
+    """The fixed-width schemes match the group module."""
+
+    import group
+
+    rng = np.random.default_rng(2314)
+    for nchan in range(5, 40, 3):
+        kwargs = {}
+        if tabstops:
+            kwargs["tabStops"] = (rng.uniform(size=nchan) < 0.15).astype(int)
+
+        egrp, equal = getattr(group, name)(nchan, arg, **kwargs)
+        grp, qual = func(nchan, arg, **kwargs)
+        assert grp == pytest.approx(egrp)
+        assert qual == pytest.approx(equal)
+
+
+def test_group_invalid():
+    """Check some errors."""
+
+    with pytest.raises(DataErr,
+                       match="^size mismatch between channels and tabStops: 3 vs 2$"):
+        group_counts([1, 2, 3], 2, tabStops=[0, 0])
+
+    with pytest.raises(DataErr,
+                       match="^unknown num argument: 'must not exceed the number of channels'$"):
+        group_bins(3, 4)
+
+    with pytest.raises(DataErr,
+                       match="^unknown grouping scheme 'foo'$"):
+        group_spectra("foo", [[1, 2, 3]])
+
+
+@pytest.mark.parametrize("scheme,func,args",
+                         [("counts", group_counts, (5, )),
+                          ("snr", group_snr, (2, )),
+                          ("adapt", group_adapt, (8, )),
+                          ("adapt_snr", group_adapt_snr, (2.5, )),
+                          ("width", group_width, (4, )),
+                          ("bins", group_bins, (3, ))])
+def test_group_spectra(scheme, func, args):
+    """The batch version matches the individual calls."""
+
+    rng = np.random.default_rng(9237)
+    counts = rng.poisson(3, size=(5, 30))
+    tabs = np.zeros((5, 30), dtype=bool)
+    tabs[:, :2] = True
+    tabs[3, 20:] = True
+
+    grouping, quality = group_spectra(scheme, counts, *args, tabStops=tabs)
+    assert grouping.shape == (5, 30)
+    for row, tab, grp, qual in zip(counts, tabs, grouping, quality):
+        first = 30 if scheme in ["width", "bins"] else row
+        egrp, equal = func(first, *args, tabStops=tab)
+        assert grp == pytest.approx(egrp)
+        assert qual == pytest.approx(equal)
+
+
+def test_pha_dynamic_group_native(monkeypatch):
+    """The grouping works without the group module."""
+
+    monkeypatch.setattr(sherpa.astro.data, "groupstatus", False)
+    pha = DataPHA("ex", [1, 2, 3, 4, 5, 6, 7], [4, 2, 3, 1, 5, 6, 7])
+    pha.group_adapt(6)
+    assert pha.grouping == pytest.approx([1, -1, 1, 1, -1, 1, 1])
+    assert pha.quality == pytest.approx([0, 0, 2, 0, 0, 0, 2])
+    assert pha.get_dep(filter=True) == pytest.approx([6, 3, 6, 6, 7])
+
+
 def make_data(data_class):
     """Create a test data object of the given class.
 
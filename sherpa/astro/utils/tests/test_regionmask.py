@@ -0,0 +1,218 @@
+#
+#  Copyright (C) 2026  Smithsonian Astrophysical Observatory
+#
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+import numpy as np
+
+import pytest
+
+from sherpa.astro.utils import regionmask
+from sherpa.utils.err import ArgumentErr
+
+
+class Circles:
+    """A union of circles which records the points it is sent.
+
+    This allows the tests to run without the region library.
+    """
+
+    def __init__(self, circles):
+        self.circles = circles
+        self.npoints = []
+
+    def mask(self, x0, x1):
+        self.npoints.append(len(x0))
+        out = np.zeros(len(x0), dtype=int)
+        for x, y, r in self.circles:
+            out |= np.hypot(x0 - x, x1 - y) <= r
+
+        return out
+
+
+@pytest.fixture
+def clean_cache():
+    """Ensure the cache is reset after the test."""
+
+    regionmask.clear_region_mask_cache()
+    yield
+    regionmask.set_region_mask_cache()
+    regionmask.clear_region_mask_cache()
+
+
+def make_grid(nx=200, ny=150, start=1, step=1):
+    x1, x0 = np.mgrid[0:ny, 0:nx]
+    x0 = start + step * x0.flatten()
+    x1 = start + step * x1.flatten()
+    return x0, x1, (ny, nx)
+
+
+@pytest.mark.parametrize("region,expected",
+                         [("circle(100,200,5)", [(95, 105, 195, 205)]),
+                          ("Circle(100, 200, 5)", [(95, 105, 195, 205)]),
+                          ("annulus(0,0,2,4)", [(-4, 4, -4, 4)]),
+                          ("pie(0,0,1,3,0,90)", [(-3, 3, -3, 3)]),
+                          ("ellipse(10,20,4,2,0)", [(6, 14, 18, 22)]),
+                          ("ellipse(10,20,4,2,90)", [(8, 12, 16, 24)]),
+                          ("box(10,20,4,2)", [(8, 12, 19, 21)]),
+                          ("rotbox(10,20,4,2,90)", [(9, 11, 18, 22)]),
+                          ("rect(4,3,1,8)", [(1, 4, 3, 8)]),
+                          ("rectangle(1,3,4,8)", [(1, 4, 3, 8)]),
+                          ("polygon(1,2,5,-2,3,7)", [(1, 5, -2, 7)]),
+                          ("point(3,4)", [(3, 3, 4, 4)]),
+                          ("circle(0,0,1)+circle(10,0,2)",
+                           [(-1, 1, -1, 1), (8, 12, -2, 2)]),
+                          ("circle(0,0,1)|circle(10,0,2)",
+                           [(-1, 1, -1, 1), (8, 12, -2, 2)]),
+                          ("circle(0,0,5)-circle(0,0,1)", [(-5, 5, -5, 5)]),
+                          ("circle(0,0,5)&!circle(0,0,1)", [(-5, 5, -5, 5)]),
+                          ("circle(0,0,5)&box(3,0,2,2)", [(2, 4, -1, 1)]),
+                          ("field()&circle(0,0,1)", [(-1, 1, -1, 1)]),
+                          ("circle(-2,-3,1e-1)", [(-2.1, -1.9, -3.1, -2.9)]),
+                          ("circle(0,0,1)&box(10,0,2,2)", []),
+                          ("field()", None),
+                          ("field()-circle(0,0,1)", None),
+                          ("!circle(0,0,1)", None),
+                          ("-circle(0,0,1)", None),
+                          ("circle(0,0,1)+sector(0,0,10,20)", None),
+                          ("circle(12:00:00,+10:00:00,1')", None),
+                          ("polygon(1,2,3,4)", None),
+                          ("not a region", None)])
+def test_region_extent(region, expected):
+    got = regionmask.region_extent(region)
+    if expected is None:
+        assert got is None
+        return
+
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected):
+        assert g == pytest.approx(e)
+
+
+@pytest.mark.parametrize("start,step", [(1, 1), (4000.5, 0.5), (100, -1)])
+def test_region_mask_matches_full(start, step, clean_cache):
+    """Using the bounding boxes does not change the mask."""
+
+    x0, x1, shape = make_grid(start=start, step=step)
+    circles = [(start + step * 20, start + step * 30, 4.5),
+               (start + step * 150, start + step * 100, 7),
+               (start - step * 3, start, 5)]
+    region = Circles(circles)
+    expected = region.mask(x0, x1).astype(bool)
+    assert expected.sum() > 0
+
+    extents = [(x - r, x + r, y - r, y + r) for x, y, r in circles]
+    got = regionmask.region_mask(region, x0, x1, shape=shape,
+                                 extents=extents)
+    assert got.dtype == bool
+    assert got == pytest.approx(expected)
+
+    # Only a small fraction of the image was checked, in one call.
+    assert len(region.npoints) == 2
+    assert region.npoints[1] < x0.size / 10
+
+
+def test_region_mask_outside(clean_cache):
+    """The region does not need to be called."""
+
+    x0, x1, shape = make_grid()
+    region = Circles([(-100, -100, 5)])
+    got = regionmask.region_mask(region, x0, x1, shape=shape,
+                                 extents=[(-105, -95, -105, -95)])
+    assert not got.any()
+    assert region.npoints == []
+
+
+@pytest.mark.parametrize("extents,shape",
+                         [(None, (150, 200)),
+                          ([(15, 25, 25, 35)], None)])
+def test_region_mask_all_points(extents, shape, clean_cache):
+    """All the points are checked without the extents or shape."""
+
+    x0, x1, _ = make_grid()
+    region = Circles([(20, 30, 5)])
+    got = regionmask.region_mask(region, x0, x1, shape=shape,
+                                 extents=extents)
+    assert got.sum() == 81
+    assert region.npoints == [x0.size]
+
+
+def test_region_mask_not_a_grid(clean_cache):
+    """All the points are checked if the coordinates are rotated."""
+
+    x0, x1, shape = make_grid()
+    x0, x1 = x0 + 0.1 * x1, x1 - 0.1 * x0
+    region = Circles([(20, 30, 5)])
+    expected = region.mask(x0, x1).astype(bool)
+    got = regionmask.region_mask(region, x0, x1, shape=shape,
+                                 extents=[(15, 25, 25, 35)])
+    assert got == pytest.approx(expected)
+    assert region.npoints == [x0.size, x0.size]
+
+
+def test_region_mask_cache(clean_cache):
+    """The mask is cached when given a key."""
+
+    x0, x1, shape = make_grid()
+    region = Circles([(20, 30, 5)])
+    mask1 = regionmask.region_mask(region, x0, x1, key=("a", ))
+    mask2 = regionmask.region_mask(region, x0, x1, key=("a", ))
+    assert region.npoints == [x0.size]
+    assert mask2 == pytest.approx(mask1)
+
+    # The cached value is not changed by changing the returned mask.
+    mask2[:] = True
+    mask3 = regionmask.region_mask(region, x0, x1, key=("a", ))
+    assert mask3 == pytest.approx(mask1)
+
+    regionmask.region_mask(region, x0, x1, key=("b", ))
+    assert region.npoints == [x0.size, x0.size]
+
+    regionmask.clear_region_mask_cache()
+    regionmask.region_mask(region, x0, x1, key=("a", ))
+    assert len(region.npoints) == 3
+
+
+def test_region_mask_cache_evicts(clean_cache):
+    """The least-recently used masks are removed."""
+
+    x0, x1, shape = make_grid()
+    region = Circles([(20, 30, 5)])
+    regionmask.set_region_mask_cache(2 * x0.size)
+    for key in ["a", "b", "a", "c", "a"]:
+        regionmask.region_mask(region, x0, x1, key=(key, ))
+
+    assert len(region.npoints) == 3
+
+    regionmask.region_mask(region, x0, x1, key=("b", ))
+    assert len(region.npoints) == 4
+
+
+def test_region_mask_cache_off(clean_cache):
+
+    x0, x1, shape = make_grid()
+    region = Circles([(20, 30, 5)])
+    regionmask.set_region_mask_cache(0)
+    regionmask.region_mask(region, x0, x1, key=("a", ))
+    regionmask.region_mask(region, x0, x1, key=("a", ))
+    assert len(region.npoints) == 2
+
+
+def test_set_region_mask_cache_invalid(clean_cache):
+    with pytest.raises(ArgumentErr,
+                       match="^Invalid maxbytes: 'must be 0 or positive'$"):
+        regionmask.set_region_mask_cache(-1)
@@ -117,27 +117,30 @@ dependent axis (``y``) then filter to select only those values between
 """
 
 from abc import ABCMeta
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
 import logging
 from typing import Any, Literal, overload
 import warnings
 
 import numpy as np
 
+from sherpa.models.model import BinaryOpModel
 from sherpa.models.regrid import EvaluationSpace1D, IntegratedAxis, PointAxis
 from sherpa.utils import NoNewAttributesAfterInit, formatting, \
     print_fields, create_expr, create_expr_integrated, \
-    calc_total_error, bool_cast, filter_bins
+    calc_total_error, bool_cast, filter_bins, sao_fcmp
+from sherpa.utils import eps as _fcmp_eps
 from sherpa.utils.err import DataErr
 from sherpa.utils.numeric_types import SherpaFloat
-from sherpa.utils.parallel import parallel_map_funcs
+from sherpa.utils.parallel import ResidentPool
 from sherpa.utils.types import ArrayType, ModelFunc, StatErrFunc
 
 warning = logging.getLogger(__name__).warning
 
 
 __all__ = ('Data', 'DataSimulFit', 'Data1D', 'Data1DInt',
-           'Data1DAsymmetricErrs', 'Data2D', 'Data2DInt')
+           'Data1DAsymmetricErrs', 'Data2D', 'Data2DInt', 'Data2DEvents')
 
 
 # The alias does not really save any characters, but it's used
@@ -591,8 +594,27 @@ class Filter:
     the independent axes.
 
     """
+
+    # The class-level value is needed for objects pickled before the
+    # version field was added.
+    #
+    _version: int = 0
+
     def __init__(self) -> None:
         self._mask: np.ndarray | bool = True
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """A counter that is increased each time the mask is set.
+
+        Changing the elements of the mask array in place does not
+        change the version.
+
+        .. versionadded:: 4.19.0
+
+        """
+        return self._version
 
     @property
     def mask(self) -> np.ndarray | bool:
@@ -609,6 +631,8 @@ class Filter:
         if val is None:
             raise DataErr('ismask')
 
+        self._version += 1
+
         # The code below has to deal with bool-like values, such as
         # numpy.ma.nomask (this evaluates to False but is not a bool),
         # and numpy.bool_ values. The following code is intended to
@@ -789,7 +813,41 @@ class Filter:
                 raise DataErr('typecheck', label)
 
         mask = filter_bins(mins, maxes, axislist, integrated=integrated)
+        self.combine(mask, ignore=ignore)
+
+    def combine(self,
+                mask: np.ndarray | None,
+                ignore: bool = False
+                ) -> None:
+        """Combine a selection with the current filter.
 
+        This is the second half of `notice`, for when the selection
+        has already been calculated (e.g. by
+        `sherpa.utils.filter_bins`).
+
+        .. versionadded:: 4.19.0
+
+        Parameters
+        ----------
+        mask : ndarray or None
+           The selected elements. A value of None means all elements
+           are selected. The array may be changed by this call.
+        ignore : bool, optional
+           If True the selection is to be ignored, otherwise it is
+           included.
+
+        Examples
+        --------
+
+        >>> f = Filter()
+        >>> f.combine(np.asarray([True, True, False]))
+        >>> f.combine(np.asarray([False, True, False]), ignore=True)
+        >>> f.mask
+        array([ True, False, False])
+
+        """
+
+        ignore = bool_cast(ignore)
         if mask is None:
             self.mask = not ignore
         elif not ignore:
@@ -805,6 +863,339 @@ class Filter:
                 self.mask &= mask
 
 
+def _is_ascending(axis: np.ndarray) -> bool:
+    """Is the array sorted in ascending order (and not contain NaN)?"""
+
+    if axis.ndim != 1:
+        return False
+
+    with np.errstate(invalid="ignore"):
+        return bool(np.all(axis[1:] >= axis[:-1]))
+
+
+def _axis_range(lo: float | None,
+                hi: float | None,
+                axis: np.ndarray,
+                integrated: bool
+                ) -> tuple[int, int]:
+    """The index range [start, end) of a sorted axis that matches filter_bins.
+
+    The tolerance used by `sherpa.utils.filter_bins` is applied by
+    checking the elements next to the bisection point.
+    """
+
+    nelem = axis.size
+    start = 0
+    end = nelem
+    if lo is not None:
+        if integrated:
+            # Include values > lo
+            start = int(np.searchsorted(axis, lo, side="right"))
+            while start < nelem and sao_fcmp(lo, axis[start], _fcmp_eps) == 0:
+                start += 1
+        else:
+            # Include values >= lo
+            start = int(np.searchsorted(axis, lo, side="left"))
+            while start > 0 and sao_fcmp(lo, axis[start - 1], _fcmp_eps) == 0:
+                start -= 1
+
+    if hi is not None:
+        if integrated:
+            # Include values < hi
+            end = int(np.searchsorted(axis, hi, side="left"))
+            while end > 0 and sao_fcmp(hi, axis[end - 1], _fcmp_eps) == 0:
+                end -= 1
+        else:
+            # Include values <= hi
+            end = int(np.searchsorted(axis, hi, side="right"))
+            while end < nelem and sao_fcmp(hi, axis[end], _fcmp_eps) == 0:
+                end += 1
+
+    return start, end
+
+
+class IntervalFilter(Filter):
+    """A filter for one-dimensional data stored as index ranges.
+
+    The selected elements are stored as a sorted list of
+    non-overlapping ``[start, end)`` index ranges rather than a
+    boolean array. When the axes sent to `notice` are sorted in
+    ascending order the ranges are updated by bisection, and the
+    `mask` array is only created when it is requested. Unsorted axes,
+    or setting the `mask` attribute directly, revert to the behavior
+    of `Filter`.
+
+    .. versionadded:: 4.19.0
+
+    Notes
+    -----
+    The mask array can be changed in place, as with `Filter`, in
+    which case the ranges are no longer used.
+
+    The check that an axis is sorted is only made the first time
+    the axis is seen, so the axis values should not be changed in
+    place.
+
+    Examples
+    --------
+
+    >>> f = IntervalFilter()
+    >>> xs = np.arange(1, 11)
+    >>> f.notice([2], [8], (xs, ))
+    >>> f.notice([4], [5], (xs, ), ignore=True)
+    >>> f.intervals
+    array([[1, 3],
+           [5, 8]])
+    >>> f.mask
+    array([False,  True,  True, False, False,  True,  True,  True, False,
+           False])
+
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._intervals: np.ndarray | None = None
+        self._nelem = 0
+        self._sorted: tuple[tuple[np.ndarray, ...], bool] | None = None
+
+        # The mask created from the ranges, which is used to check
+        # whether the mask has been changed in place.
+        #
+        self._interval_mask: np.ndarray | None = None
+
+    @property
+    def intervals(self) -> np.ndarray | None:
+        """The selected index ranges, or None.
+
+        The return value is a (n, 2) array of the start and end
+        (exclusive) indexes of each range, or None when the filter
+        is stored as a mask.
+        """
+        self._check_intervals()
+        if self._intervals is None:
+            return None
+
+        return self._intervals.copy()
+
+    @property
+    def mask(self) -> np.ndarray | bool:
+        """Mask array for dependent variable
+
+        Returns
+        -------
+        mask : bool or numpy.ndarray
+        """
+        if self._mask is None:
+            self._interval_mask = self._make_mask()
+            self._mask = self._interval_mask.copy()
+
+        return self._mask
+
+    @mask.setter
+    def mask(self, val: ArrayType | bool) -> None:
+        Filter.mask.fset(self, val)
+        self._intervals = None
+        self._interval_mask = None
+
+    def _make_mask(self) -> np.ndarray:
+        """Convert the ranges to a (read-only) mask."""
+
+        assert self._intervals is not None
+        edges = np.zeros(self._nelem + 1, dtype=int)
+        np.add.at(edges, self._intervals[:, 0], 1)
+        np.add.at(edges, self._intervals[:, 1], -1)
+        mask = np.cumsum(edges[:-1]) > 0
+        mask.flags.writeable = False
+        return mask
+
+    def _set_intervals(self, intervals: np.ndarray) -> None:
+        """Change the ranges, which invalidates the mask."""
+
+        self._intervals = intervals
+        self._mask = None
+        self._interval_mask = None
+        self._version += 1
+
+    def _check_intervals(self) -> None:
+        """Drop the ranges if the mask has been changed in place."""
+
+        if self._intervals is None or self._interval_mask is None:
+            return
+
+        if not np.array_equal(self._mask, self._interval_mask):
+            self._intervals = None
+            self._interval_mask = None
+
+    def _is_sorted(self, axes: tuple[np.ndarray, ...]) -> bool:
+        """Are all the axes sorted (the answer is cached by identity)?"""
+
+        if self._sorted is not None:
+            old, answer = self._sorted
+            if len(old) == len(axes) and \
+               all(a is b for a, b in zip(old, axes)):
+                return answer
+
+        answer = all(_is_ascending(axis) for axis in axes)
+        self._sorted = (axes, answer)
+        return answer
+
+    def combine(self,
+                mask: np.ndarray | None,
+                ignore: bool = False
+                ) -> None:
+        # The ranges do not describe the combined mask.
+        if self._intervals is not None:
+            self.mask = self.mask.copy()
+
+        super().combine(mask, ignore=ignore)
+
+    def notice(self,
+               mins: ArrayType,
+               maxes: ArrayType,
+               axislist: Sequence[ArrayType],
+               ignore: bool = False,
+               integrated: bool = False
+               ) -> None:
+        """Select a range to notice or ignore (remove).
+
+        The arguments match `Filter.notice`.
+
+        """
+
+        ignore = bool_cast(ignore)
+        for vals, label in zip([mins, maxes, axislist],
+                               ['lower bound', 'upper bound', 'grid']):
+            if any(isinstance(val, str) for val in vals):
+                raise DataErr('typecheck', label)
+
+        axes = tuple(np.asarray(axis) for axis in axislist)
+        sizes = {axis.size for axis in axes}
+        if len(sizes) != 1 or not self._is_sorted(axes):
+            super().notice(mins, maxes, axislist, ignore=ignore,
+                           integrated=integrated)
+            return
+
+        nelem = sizes.pop()
+        start = 0
+        end = nelem
+        used = False
+        for lo, hi, axis in zip(mins, maxes, axes):
+            if lo is None and hi is None:
+                continue
+
+            used = True
+            alo, ahi = _axis_range(lo, hi, axis, integrated)
+            start = max(start, alo)
+            end = min(end, ahi)
+
+        if not used:
+            self.mask = not ignore
+            return
+
+        self._check_intervals()
+        if self._intervals is not None and self._nelem == nelem:
+            current = self._intervals
+        elif self._mask is True or self._mask is False:
+            # Filter.notice replaces the True mask when noticing, and
+            # inverts the False mask when ignoring.
+            current = np.asarray([[0, nelem]] if ignore else [],
+                                 dtype=int).reshape(-1, 2)
+        else:
+            padded = np.concatenate(([False], self.mask, [False]))
+            current = np.flatnonzero(padded[1:] != padded[:-1]).reshape(-1, 2)
+
+        self._nelem = nelem
+        if ignore:
+            self._set_intervals(_remove_interval(current, start, end))
+        else:
+            self._set_intervals(_add_interval(current, start, end))
+
+
+def _add_interval(intervals: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Add [start, end) to the sorted, non-overlapping, ranges."""
+
+    if start >= end:
+        return intervals
+
+    starts = intervals[:, 0]
+    ends = intervals[:, 1]
+
+    # Ranges that overlap or touch the new range are merged.
+    first = int(np.searchsorted(ends, start, side="left"))
+    last = int(np.searchsorted(starts, end, side="right"))
+    if first < last:
+        start = min(start, int(starts[first]))
+        end = max(end, int(ends[last - 1]))
+
+    return np.concatenate((intervals[:first], [[start, end]],
+                           intervals[last:]))
+
+
+def _remove_interval(intervals: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Remove [start, end) from the sorted, non-overlapping, ranges."""
+
+    if start >= end:
+        return intervals
+
+    starts = intervals[:, 0]
+    ends = intervals[:, 1]
+
+    first = int(np.searchsorted(ends, start, side="right"))
+    last = int(np.searchsorted(starts, end, side="left"))
+    if first >= last:
+        return intervals
+
+    pieces = []
+    if starts[first] < start:
+        pieces.append([int(starts[first]), start])
+    if ends[last - 1] > end:
+        pieces.append([end, int(ends[last - 1])])
+
+    return np.concatenate((intervals[:first],
+                           np.asarray(pieces, dtype=int).reshape(-1, 2),
+                           intervals[last:]))
+
+
+def _same_state(old: tuple, new: tuple) -> bool:
+    """Are the two filter states the same?
+
+    Elements are compared by identity, apart from tuples, which are
+    compared element by element, and scalars, which are compared by
+    value.
+    """
+
+    if len(old) != len(new):
+        return False
+
+    for a, b in zip(old, new):
+        if a is b:
+            continue
+
+        if isinstance(a, tuple) and isinstance(b, tuple):
+            if _same_state(a, b):
+                continue
+
+            return False
+
+        if np.isscalar(a) and np.isscalar(b) and a == b:
+            continue
+
+        return False
+
+    return True
+
+
+def _read_only(val):
+    """Return a read-only view of an array (other values are unchanged)."""
+
+    if not isinstance(val, np.ndarray):
+        return val
+
+    out = val.view()
+    out.flags.writeable = False
+    return out
+
+
 class BaseData(metaclass=ABCMeta):
     """
     Base class for all data classes. Left for compatibility with older versions.
@@ -879,6 +1270,9 @@ class Data(NoNewAttributesAfterInit, BaseData):
     _staterror: np.ndarray | None = None
     _syserror: np.ndarray | None = None
 
+    _filtered: dict | None = None
+    """The filtered arrays stored while cache_filtered is active."""
+
     ndim: int | None = None
     "The dimensionality of the dataset, if defined, or None."
 
@@ -1494,6 +1888,94 @@ class Data(NoNewAttributesAfterInit, BaseData):
         kwargs['ignore'] = True
         self.notice(*args, **kwargs)
 
+    def _filter_state(self) -> tuple:
+        """The values that the filtered arrays depend on.
+
+        This is used by `cache_filtered` to decide whether stored
+        values can be re-used, and so should be extended by
+        subclasses which have additional state.
+        """
+
+        filt = self._data_space.filter
+        return (self._data_space, filt, filt.version, self._y,
+                self._staterror, self._syserror)
+
+    @contextmanager
+    def cache_filtered(self) -> Iterator[None]:
+        """Re-use the filtered data while the context is active.
+
+        The `to_fit` and `eval_model_to_fit` methods normally apply
+        the filter to the data each time they are called. Within this
+        context the filtered values are calculated once and then
+        re-used until the filter, the independent or dependent axes,
+        or the errors are changed. The stored arrays are read only.
+        It is used when fitting, as these values are requested for
+        each model evaluation.
+
+        .. versionadded:: 4.19.0
+
+        Notes
+        -----
+        Changes made to the elements of an array - such as the mask or
+        the dependent axis - rather than setting a new array are not
+        recognized, and so should not be made within this context.
+
+        Examples
+        --------
+
+        >>> d = Data1D("x", [1, 2, 3, 4], [3, 5, 2, 7])
+        >>> d.ignore(xhi=1)
+        >>> with d.cache_filtered():
+        ...     y, _, _ = d.to_fit()
+        ...
+        >>> print(y)
+        [5 2 7]
+
+        """
+
+        if self._filtered is not None:
+            yield
+            return
+
+        self._filtered = {}
+        try:
+            yield
+        finally:
+            self._filtered = None
+
+    def _get_filtered(self,
+                      key: Any,
+                      func: Callable[[], Any]
+                      ) -> Any:
+        """Return func(), re-using the stored value if available.
+
+        The value is only stored when `cache_filtered` is active.
+        """
+
+        cache = self._filtered
+        if cache is None:
+            return func()
+
+        state = self._filter_state()
+        old = cache.get("state")
+        if old is None or not _same_state(old, state):
+            cache.clear()
+            cache["state"] = state
+
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        val = func()
+        if isinstance(val, tuple):
+            val = tuple(_read_only(v) for v in val)
+        else:
+            val = _read_only(val)
+
+        cache[key] = val
+        return val
+
     def _can_apply_model(self, modelfunc: ModelFunc) -> None:
         """Check if model dimensions match data dimensions."""
 
@@ -1514,7 +1996,9 @@ class Data(NoNewAttributesAfterInit, BaseData):
         """Evaluate the model on the independent axis after filtering."""
 
         self._can_apply_model(modelfunc)
-        return modelfunc(*self.get_indep(filter=True))
+        indep = self._get_filtered("indep",
+                                   lambda: self.get_indep(filter=True))
+        return modelfunc(*indep)
 
     def to_guess(self) -> tuple[np.ndarray | None, ...]:
 
@@ -1531,9 +2015,10 @@ class Data(NoNewAttributesAfterInit, BaseData):
                ) -> tuple[np.ndarray | None,
                           ArrayType | None,
                           np.ndarray | None]:
-        return (self.get_dep(True),
-                self.get_staterror(True, staterrfunc),
-                self.get_syserror(True))
+        return self._get_filtered(("fit", staterrfunc),
+                                  lambda: (self.get_dep(True),
+                                           self.get_staterror(True, staterrfunc),
+                                           self.get_syserror(True)))
 
     def __str__(self) -> str:
         """
@@ -1553,6 +2038,26 @@ class Data(NoNewAttributesAfterInit, BaseData):
         return r
 
 
+class _ResidentModel:
+    """Evaluate a model for a dataset in a DataSimulFit worker process.
+
+    The parameter values are sent with each call, since the worker
+    has its own copy of the model. Linked parameters are sent their
+    current value, which removes the link in the worker copy.
+    """
+
+    def __init__(self, data: Data, model: ModelFunc) -> None:
+        self.data = data
+        self.model = model
+        self.pars = tuple(getattr(model, "pars", ()))
+
+    def __call__(self, vals: Sequence[float]) -> np.ndarray:
+        for par, val in zip(self.pars, vals):
+            par.val = val
+
+        return self.data.eval_model_to_fit(self.model)
+
+
 class DataSimulFit(NoNewAttributesAfterInit):
     """Store multiple data sets.
 
@@ -1569,6 +2074,13 @@ class DataSimulFit(NoNewAttributesAfterInit):
         The datasets to be stored; there must be at least one. They are
         assumed to behave as `sherpa.data.Data` objects, but there is no
         check for this condition.
+    numcores : int, optional
+        The number of processes used to evaluate the models. When
+        greater than one the datasets, and their models, are copied to
+        worker processes the first time the model is evaluated. Within
+        `cache_filtered`, such as during a fit, the workers are kept
+        and each evaluation then only sends the parameter values to
+        them.
 
     Attributes
     ----------
@@ -1578,6 +2090,15 @@ class DataSimulFit(NoNewAttributesAfterInit):
     --------
     sherpa.models.model.SimulFitModel
 
+    Notes
+    -----
+    .. versionchanged:: 4.19.0
+       When numcores is greater than one the worker processes are
+       re-used between model evaluations within `cache_filtered`,
+       which is used for each fit. They are re-created if the models
+       or the data change, and are stopped when the context ends or
+       with the `close` method.
+
     Examples
     --------
 
@@ -1601,28 +2122,135 @@ class DataSimulFit(NoNewAttributesAfterInit):
         self.numcores = numcores
         super().__init__()
 
+    # The worker processes and the models and data state they were
+    # created for. This is not a callable, as the pool is, so it can
+    # be changed after NoNewAttributesAfterInit.__init__. The workers
+    # are only kept while cache_filtered is active, which is tracked
+    # by _cache_depth.
+    #
+    _resident: tuple[ResidentPool, tuple] | None = None
+    _cache_depth: int = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_resident", None)
+        state.pop("_cache_depth", None)
+        return state
+
+    def close(self) -> None:
+        """Stop any worker processes used to evaluate the models.
+
+        .. versionadded:: 4.19.0
+
+        """
+
+        if self._resident is not None:
+            self._resident[0].close()
+
+        self._resident = None
+
+    @contextmanager
+    def cache_filtered(self) -> Iterator[None]:
+        """Re-use the filtered data of each dataset.
+
+        See `Data.cache_filtered`.
+
+        .. versionadded:: 4.19.0
+
+        """
+
+        with ExitStack() as stack:
+            for data in self.datasets:
+                cm = getattr(data, "cache_filtered", None)
+                if cm is not None:
+                    stack.enter_context(cm())
+
+            self._cache_depth += 1
+            try:
+                yield
+            finally:
+                self._cache_depth -= 1
+                if self._cache_depth == 0:
+                    self.close()
+
+    def _pool_state(self) -> tuple:
+        """The data state that the worker processes depend on."""
+
+        state = []
+        for data in self.datasets:
+            get_state = getattr(data, "_filter_state", None)
+            if get_state is not None:
+                state.append(get_state())
+                continue
+
+            mask = data.mask
+            state.append(np.array(mask, copy=True) if np.iterable(mask)
+                         else mask)
+
+        return tuple(state)
+
+    def _same_pool_state(self, old: tuple, new: tuple) -> bool:
+        """Can workers created for the old state be used for new?"""
+
+        for a, b in zip(old, new):
+            if isinstance(a, tuple) and isinstance(b, tuple):
+                if not _same_state(a, b):
+                    return False
+
+            elif isinstance(a, tuple) or isinstance(b, tuple) or \
+                 not np.array_equal(a, b):
+                return False
+
+        return True
+
+    def _get_pool(self,
+                  modelfuncs: Sequence[ModelFunc]
+                  ) -> ResidentPool:
+        """Return the worker processes for these models.
+
+        The workers are re-created if the models or the data have
+        changed since they were started.
+        """
+
+        key = (tuple(id(func) for func in modelfuncs), self._pool_state())
+        if self._resident is not None:
+            pool, (oldids, oldstate) = self._resident
+            if oldids == key[0] and \
+               self._same_pool_state(oldstate, key[1]):
+                return pool
+
+        self.close()
+        funcs = [_ResidentModel(data, func)
+                 for func, data in zip(modelfuncs, self.datasets)]
+        pool = ResidentPool(funcs, self.numcores)
+        self._resident = (pool, key)
+        return pool
+
     def eval_model_to_fit(self,
                           modelfuncs: Sequence[ModelFunc]
                           ) -> np.ndarray:
-        if self.numcores == 1:
-            total_model = []
-            for func, data in zip(modelfuncs, self.datasets):
-                tmp_model = data.eval_model_to_fit(func)
-                total_model.append(tmp_model)
-
-            return np.concatenate(total_model)
-
-        # best to make this a different derived class
-        funcs = []
-        datasets = []
+        if self.numcores != 1:
+            pool = self._get_pool(modelfuncs)
+            try:
+                if pool.nprocs > 0:
+                    args = [[par.val for par in func.pars]
+                            for func in pool.funcs]
+                    return np.concatenate(pool(args))
+            finally:
+                # The models can have state that is not a parameter,
+                # such as a table model or a PSF, so the workers are
+                # only re-used within cache_filtered (that is, for a
+                # single fit).
+                #
+                if self._cache_depth == 0:
+                    self.close()
+
+        total_model = []
         for func, data in zip(modelfuncs, self.datasets):
-            funcs.append(func)
-            datasets.append(data.get_indep(filter=False))
-        total_model = parallel_map_funcs(funcs, datasets, self.numcores)
-        all_model = []
-        for model, data in zip(total_model, self.datasets):
-            all_model.append(data.apply_filter(model))
-        return np.concatenate(all_model)
+            tmp_model = data.eval_model_to_fit(func)
+            total_model.append(tmp_model)
+
+        return np.concatenate(total_model)
 
     def to_fit(self,
                staterrfunc: StatErrFunc | None = None
@@ -1921,6 +2549,21 @@ class Data1D(Data):
 
         """
 
+        filt = self._data_space.filter
+        if isinstance(filt, IntervalFilter):
+            intervals = filt.intervals
+            if intervals is not None and intervals.size > 0:
+                # Only the end points of each range are needed.
+                x = self.get_x()
+                def conv(start, end):
+                    out = format % x[start]
+                    if x[start] == x[end - 1]:
+                        return out
+
+                    return out + f"{delim}{format % x[end - 1]}"
+
+                return ",".join(conv(*interval) for interval in intervals)
+
         x = self.get_x(filter=True)
         if np.iterable(self.mask):
             mask = self.mask
@@ -2087,6 +2730,45 @@ class Data1D(Data):
 
         Data.notice(self, (xlo,), (xhi,), ignore)
 
+    def use_interval_filter(self, flag: bool = True) -> None:
+        """Change how the filter is stored.
+
+        Storing the filter as a set of ranges, rather than a mask,
+        makes `notice`, `ignore`, and `get_filter` faster for large
+        data sets with a sorted independent axis.
+
+        .. versionadded:: 4.19.0
+
+        Parameters
+        ----------
+        flag : bool, optional
+            Use `IntervalFilter` when True, otherwise `Filter`. The
+            current filter is retained.
+
+        Examples
+        --------
+
+        >>> import numpy as np
+        >>> x = np.arange(1, 1001)
+        >>> d = Data1D('example', x, np.ones_like(x))
+        >>> d.use_interval_filter()
+        >>> d.notice(100, 200)
+        >>> d.ignore(150, 160)
+        >>> d.get_filter(format='%i')
+        '100:149,161:200'
+
+        """
+
+        old = self._data_space.filter
+        if isinstance(old, IntervalFilter) == bool_cast(flag):
+            return
+
+        new = IntervalFilter() if flag else Filter()
+        mask = old.mask
+        new.mask = mask if np.isscalar(mask) else mask.copy()
+        new._version = old.version + 1
+        self._data_space.filter = new
+
     @property
     def x(self) -> np.ndarray | None:
         """
@@ -2841,6 +3523,258 @@ class Data2DInt(Data2D):
         return self._data_space.x1hi
 
 
+def _additive_terms(model: ModelFunc) -> list[ModelFunc]:
+    """Split a model expression into the terms that are added together."""
+
+    if isinstance(model, BinaryOpModel) and model.op is np.add:
+        return _additive_terms(model.lhs) + _additive_terms(model.rhs)
+
+    return [model]
+
+
+class Data2DEvents(Data2D):
+    '''2D event data for sparse Poisson fits.
+
+    The data is stored as the positions of the events, or of the
+    pixels which contain events, rather than as an image, along with
+    the pixel grid used to calculate the predicted number of events.
+    This allows the `sherpa.stats.SparseCash` statistic to evaluate
+    the model only at the event positions, which is much faster than
+    fitting an image when most of the pixels are empty.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    name : str
+        The name of the dataset.
+    x0, x1 : array-like
+        The position of each event, or of each pixel containing
+        events.
+    x0grid, x1grid : array-like
+        The centers of the pixels along each axis. The predicted
+        number of events is the sum of the model over this grid,
+        and so the model values are taken to be per pixel.
+    y : array-like or None, optional
+        The number of events at each position. If not set then each
+        position is a single event.
+
+    See Also
+    --------
+    sherpa.stats.SparseCash
+
+    Notes
+    -----
+    The `notice` and `ignore` methods filter both the events and the
+    grid. Changing the `mask` attribute directly only changes the
+    events.
+
+    The sum of each additive component of the model over the grid is
+    cached, and only re-calculated when the parameter values of the
+    component change. The `clear_integral_cache` method should be
+    used if a component is changed in any other way (such as
+    changing the data of a table model).
+
+    Examples
+    --------
+
+    Create a dataset from an image, keeping only the non-zero pixels:
+
+    >>> import numpy as np
+    >>> img = np.zeros((400, 500))
+    >>> img[200, 300] = 3
+    >>> img[210, 305] = 1
+    >>> x1, x0 = np.nonzero(img)
+    >>> evt = Data2DEvents("evt", x0 + 1, x1 + 1,
+    ...                    np.arange(1, 501), np.arange(1, 401),
+    ...                    y=img[x1, x0])
+    >>> evt.y
+    array([3., 1.])
+
+    '''
+    _fields: FieldsType = ("name", "x0", "x1", "y", "x0grid", "x1grid")
+
+    # The number of parameter values to store for each model
+    # component.
+    #
+    integral_cache_size: int = 8
+
+    def __init__(self,
+                 name: str,
+                 x0: ArrayType | None,
+                 x1: ArrayType | None,
+                 x0grid: ArrayType,
+                 x1grid: ArrayType,
+                 y: ArrayType | None = None
+                 ) -> None:
+        self._x0grid = self._check_grid_axis(x0grid, "x0grid")
+        self._x1grid = self._check_grid_axis(x1grid, "x1grid")
+        self._grid_filter = Filter()
+        self._grid_cache: tuple[int, np.ndarray, np.ndarray] | None = None
+        self._integral_cache: dict[int, tuple[ModelFunc, dict]] = {}
+        if y is None and x0 is not None:
+            y = np.ones(len(x0), dtype=SherpaFloat)
+
+        super().__init__(name, x0, x1, y)
+
+    @staticmethod
+    def _check_grid_axis(axis: ArrayType, label: str) -> np.ndarray:
+        out = np.asarray(axis, dtype=SherpaFloat)
+        if out.ndim != 1 or out.size == 0:
+            raise DataErr(f"{label} must be a one-dimensional array")
+
+        return out
+
+    def __getstate__(self):
+        # The cached values can be large, and contain references to
+        # the models.
+        #
+        state = self.__dict__.copy()
+        state["_grid_cache"] = None
+        state["_integral_cache"] = {}
+        return state
+
+    @property
+    def x0grid(self) -> np.ndarray:
+        """The pixel centers along the first axis."""
+        return self._x0grid
+
+    @property
+    def x1grid(self) -> np.ndarray:
+        """The pixel centers along the second axis."""
+        return self._x1grid
+
+    @property
+    def grid_mask(self) -> np.ndarray | bool:
+        """The filter applied to the grid (flattened, with x0 varying fastest)."""
+        return self._grid_filter.mask
+
+    def get_grid(self, filter: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """Return the coordinates of the grid pixels.
+
+        Parameters
+        ----------
+        filter : bool, optional
+            Should the filter be applied?
+
+        Returns
+        -------
+        x0, x1 : ndarray
+            The pixel centers, as flattened arrays with x0 varying
+            fastest.
+
+        """
+
+        if filter:
+            version = self._grid_filter.version
+            if self._grid_cache is not None and \
+               self._grid_cache[0] == version:
+                return self._grid_cache[1:]
+
+        x1, x0 = np.meshgrid(self._x1grid, self._x0grid, indexing="ij")
+        x0 = x0.ravel()
+        x1 = x1.ravel()
+        if not filter:
+            return x0, x1
+
+        x0 = _read_only(self._grid_filter.apply(x0))
+        x1 = _read_only(self._grid_filter.apply(x1))
+        self._grid_cache = (version, x0, x1)
+        return x0, x1
+
+    def notice(self,
+               x0lo: float | None = None,
+               x0hi: float | None = None,
+               x1lo: float | None = None,
+               x1hi: float | None = None,
+               ignore: bool = False
+               ) -> None:
+        super().notice(x0lo, x0hi, x1lo, x1hi, ignore=ignore)
+        self._grid_filter.notice((x0lo, x1lo), (x0hi, x1hi),
+                                 self.get_grid(), ignore=ignore)
+
+    def clear_integral_cache(self) -> None:
+        """Remove the stored model sums."""
+        self._integral_cache = {}
+
+    def eval_model_integral(self,
+                            modelfunc: ModelFunc,
+                            trunc_value: float | None = None
+                            ) -> float:
+        """Return the sum of the model over the filtered grid.
+
+        Parameters
+        ----------
+        modelfunc
+            The model to evaluate.
+        trunc_value : float or None, optional
+            If set, model values less than 0 are replaced by this
+            value.
+
+        Returns
+        -------
+        total : float
+            The predicted number of events.
+
+        Notes
+        -----
+        The sum and minimum of each additive component are stored,
+        so that the model only has to be evaluated over the grid for
+        those components whose parameters have changed. When
+        ``trunc_value`` is set and the sum of the minimum values is
+        negative the whole model is evaluated.
+
+        """
+
+        # Only keep the cached values for the current components.
+        #
+        old = self._integral_cache
+        new = {}
+        total = 0.0
+        minval = 0.0
+        grid = None
+        version = self._grid_filter.version
+        for term in _additive_terms(modelfunc):
+            try:
+                key = (version, ) + tuple(p.val for p in term.pars)
+            except AttributeError:
+                key = None
+
+            stored = old.get(id(term))
+            if stored is not None and stored[0] is term:
+                values = stored[1]
+            else:
+                values = {}
+
+            try:
+                value = values[key]
+            except KeyError:
+                if grid is None:
+                    grid = self.get_grid(filter=True)
+
+                mvals = np.asarray(term(*grid))
+                value = (float(mvals.sum()), float(mvals.min()))
+                if key is not None:
+                    if len(values) >= self.integral_cache_size:
+                        del values[next(iter(values))]
+
+                    values[key] = value
+
+            new[id(term)] = (term, values)
+            total += value[0]
+            minval += value[1]
+
+        self._integral_cache = new
+        if trunc_value is None or minval >= 0:
+            return total
+
+        if grid is None:
+            grid = self.get_grid(filter=True)
+
+        mvals = np.asarray(modelfunc(*grid))
+        return float(np.maximum(mvals, trunc_value).sum())
+
+
 # Notebook representations
 #
 def html_data1d(data: Data1D) -> str:
@@ -31,16 +31,19 @@ from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 
-from sherpa.data import Data, DataSimulFit
+from sherpa.data import Data, Data2D, Data2DInt, DataSimulFit
 from sherpa.estmethods import EstMethod, Covariance, EstNewMin
+from sherpa.instrument import ConvolutionModel
 from sherpa.models import Model, SimulFitModel
 from sherpa.models.parameter import Parameter
+from sherpa.models.regrid import rebin_int
 from sherpa.optmethods import OptMethod, LevMar, NelderMead
 from sherpa.stats import Stat, Chi2, Chi2Gehrels, Cash, Chi2ModVar, \
     LeastSq, Likelihood
 from sherpa.utils import NoNewAttributesAfterInit, print_fields, erf, \
     bool_cast, list_to_open_interval, sao_fcmp, formatting
 from sherpa.utils.err import DataErr, EstErr, FitErr, SherpaErr
+from sherpa.utils.numeric_types import SherpaFloat
 from sherpa.utils.types import ArrayType, FitFunc, IdType, IdTypes, \
     OptReturn, StatFunc, StatResults
 
@@ -58,8 +61,13 @@ def evaluates_model(func):
     def run(fit, *args, **kwargs):
 
         cache = kwargs.pop('cache', True)
+
+        # The filtered data is re-used while the model is evaluated.
+        cm = getattr(fit.data, "cache_filtered", nullcontext)
         fit.model.startup(cache=cache)
-        result = func(fit, *args, **kwargs)
+        with cm():
+            result = func(fit, *args, **kwargs)
+
         fit.model.teardown()
         return result
 
@@ -672,6 +680,61 @@ class IterCallback:
         return output
 
 
+def _block_sum(data: Data2D, vals: ArrayType, factor: int) -> np.ndarray:
+    """Sum the image values in blocks of factor by factor pixels.
+
+    Rows and columns that do not fill a block are dropped, following
+    `sherpa.models.regrid.rebin_int`.
+    """
+    vals = np.asarray(vals, dtype=SherpaFloat).reshape(data.shape)
+    return rebin_int(vals, factor, factor).flatten()
+
+
+def _pyramid_level(data: Data2D, factor: int) -> Data2D | None:
+    """Create the block-summed version of an image.
+
+    The independent axes are the mean coordinates of each block, so
+    that they are in the same coordinate system as the input data,
+    and any errors are added in quadrature. A block is only noticed
+    if all its pixels are noticed. None is returned if the image is
+    too small, or no block is noticed.
+    """
+
+    assert data.shape is not None
+    ny, nx = data.shape
+    if ny < factor or nx < factor:
+        return None
+
+    area = factor * factor
+    mask = data.mask
+    if np.iterable(mask):
+        newmask = _block_sum(data, mask, factor) == area
+        if not newmask.any():
+            return None
+    elif mask:
+        newmask = None
+    else:
+        return None
+
+    def errors(vals):
+        if vals is None:
+            return None
+        return np.sqrt(_block_sum(data, np.square(vals), factor))
+
+    x0, x1 = data.get_indep(filter=False)
+    out = Data2D(f"{data.name}_block{factor}",
+                 _block_sum(data, x0, factor) / area,
+                 _block_sum(data, x1, factor) / area,
+                 _block_sum(data, data.get_dep(filter=False), factor),
+                 shape=(ny // factor, nx // factor),
+                 staterror=errors(data.staterror),
+                 syserror=errors(data.syserror))
+    if newmask is not None:
+        out.mask = newmask
+
+    return out
+
+
 # Since this is an internal class, it's not derived from
 # NoNewAttributesAfterInit.
 #
@@ -735,7 +798,8 @@ class IterFit:
         self.itermethod_opts = iopts
 
         self.funcs: dict[str, FitFunc]
-        self.funcs = {'sigmarej': self.sigmarej}
+        self.funcs = {'sigmarej': self.sigmarej,
+                      'pyramid': self.pyramid}
 
         self.current_func: FitFunc | None
         self.current_func = None
@@ -1010,6 +1074,114 @@ class IterFit:
         assert final_fit_results is not None  # safety check
         return final_fit_results
 
+    def pyramid(self,
+                statfunc: StatFunc,
+                pars: ArrayType,
+                parmins: ArrayType,
+                parmaxes: ArrayType,
+                statargs: Any = None,
+                statkwargs: Any = None,
+                cache: bool = True
+                ) -> OptReturn:
+        """Fit block-summed images before fitting the full-resolution data.
+
+        The `pyramid` scheme fits a sequence of coarser versions of
+        the images, where each coarse pixel is the sum of a square
+        block of pixels, created with `sherpa.models.regrid.rebin_int`.
+        The best-fit parameters of each level are used as the starting
+        point for the next level, ending with a fit to the original
+        data. Most of the optimizer iterations, when the parameters are
+        far from the best-fit location, are therefore made with
+        cheaper model evaluations.
+
+        .. versionadded:: 4.19.0
+
+        Raises
+        ------
+        `sherpa.utils.err.FitErr`
+            This exception is raised if the factors are not valid,
+            the data is not an image (a 2D dataset with the shape
+            set), or the model includes a convolution, such as a PSF.
+
+        Notes
+        -----
+        The following keys are looked for in the `itermethod_opts`
+        dictionary:
+
+        ========  =================  ===========
+        Key       Type               Description
+        ========  =================  ===========
+        factors   sequence of int    The block sizes of the coarse levels,
+                                     each greater than 1. They are fit in
+                                     decreasing order.
+        ========  =================  ===========
+
+        The coarse model is the model evaluated at the mean position
+        of each block, multiplied by the number of pixels in the block.
+        Rows and columns that do not fill a block are not used, a block
+        is only used if all its pixels are noticed, and levels with
+        fewer noticed pixels than there are free parameters are
+        skipped. Any errors are added in quadrature. Only the fit to
+        the original data is sent to `statfunc`, although the ``nfev``
+        value includes the evaluations from all the levels.
+
+        """
+
+        if statargs is not None or statkwargs is not None:
+            warning("statargs/kwargs set but values unused")
+
+        factors = self.itermethod_opts['factors']
+        if not np.iterable(factors) or isinstance(factors, str):
+            raise FitErr(
+                "'factors' value for pyramid method must be a sequence of integers")
+
+        for factor in factors:
+            if not isinstance(factor, (int, np.integer)):
+                raise FitErr(
+                    "'factors' value for pyramid method must be a sequence of integers")
+            if factor < 2:
+                raise FitErr("'factors' values must be greater than one")
+
+        for d in self.data.datasets:
+            if not isinstance(d, Data2D) or isinstance(d, Data2DInt) or \
+               d.shape is None:
+                raise FitErr(f"The pyramid method requires image data, but data set '{d.name}' is a {type(d).__name__}")
+
+        for mdl in self.model.parts:
+            if any(isinstance(part, ConvolutionModel)
+                   for part in mdl.get_parts()):
+                raise FitErr(f"The pyramid method can not be used with the convolution model '{mdl.name}'")
+
+        npars = len(self.model.thawedpars)
+        nfev = 0
+        for factor in sorted(set(int(f) for f in factors), reverse=True):
+            levels = [_pyramid_level(d, factor) for d in self.data.datasets]
+            if any(level is None for level in levels):
+                continue
+
+            data = DataSimulFit(f'pyramid data {factor}', tuple(levels))
+            if sum(level.mask.sum() if np.iterable(level.mask) else
+                   level.size for level in levels) < npars:
+                continue
+
+            area = factor * factor
+            model = SimulFitModel(f'pyramid model {factor}',
+                                  tuple(area * mdl for mdl in self.model.parts))
+            callback = IterCallback(data=data, model=model, stat=self.stat)
+            result = self.method.fit(callback,
+                                     pars=self.model.thawedpars,
+                                     parmins=parmins,
+                                     parmaxes=parmaxes)
+            self.model.thawedpars = result[1]
+            nfev += callback.nfev
+
+        final_fit_results = self.method.fit(statfunc,
+                                            pars=self.model.thawedpars,
+                                            parmins=parmins,
+                                            parmaxes=parmaxes)
+        final_fit_results[4]['nfev'] = final_fit_results[4].get('nfev', 0) + nfev
+        return final_fit_results
+
     def fit(self,
             statfunc: StatFunc,
             pars: ArrayType,
@@ -26,12 +26,14 @@ import numpy
 from sherpa.data import Data, Data1D, Data2D
 from sherpa.models import ArithmeticModel, ArithmeticConstantModel, \
     ArithmeticFunctionModel, CompositeModel, Model
+from sherpa.models.basic import TableModel, TableModelBase
 from sherpa.models.parameter import Parameter
-from sherpa.models.regrid import EvaluationSpace1D, EvaluationSpace2D, rebin_2d
+from sherpa.models.regrid import EvaluationSpace1D, EvaluationSpace2D, Rebin2D
 from sherpa.utils import bool_cast, NoNewAttributesAfterInit
+from sherpa.utils.convolve import make_convolver
 from sherpa.utils.err import PSFErr
 from sherpa.utils._psf import extract_kernel, get_padsize, normalize, \
-    pad_data, set_origin, tcdData, unpad_data
+    pad_data, set_origin, unpad_data
 
 import sherpa
 info = logging.getLogger(__name__).info
@@ -43,6 +45,27 @@ __all__ = ('Kernel', 'PSFKernel', 'RadialProfileKernel', 'PSFModel',
            'ConvolutionModel', 'PSFSpace2D')
 
 
+# The maximum fraction of the data that a cutout can cover for it to
+# be used by PSFKernel.
+#
+CUTOUT_FRACTION = 0.5
+
+
+def _uses_fixed_grid(func) -> bool:
+    """Does the model evaluated by func ignore the grid it is given?
+
+    Table models return one value per table element, whatever the
+    grid, so they can not be evaluated on a cutout.
+    """
+
+    mdl = getattr(func, "__self__", None)
+    if not isinstance(mdl, Model):
+        return False
+
+    return any(isinstance(part, (TableModel, TableModelBase))
+               for part in [mdl] + mdl.get_parts())
+
+
 def make_renorm_shape(shape):
     """Given a shape, calculate the appropriate renorm_shape."""
 
@@ -142,11 +165,11 @@ class Kernel(NoNewAttributesAfterInit):
         self.do_pad = do_pad
         self.pad_mask = pad_mask
         self.frac = None
-        self._tcd = tcdData()
+        self._tcd = make_convolver()
         super().__init__()
 
     def __setstate__(self, state):
-        state['_tcd'] = tcdData()
+        state['_tcd'] = make_convolver()
         self.__dict__.update(state)
 
     def __getstate__(self):
@@ -237,11 +260,11 @@ class ConvolutionKernel(Model):
     def __init__(self, kernel, name='conv'):
         self.kernel = kernel
         self.name = name
-        self._tcd = tcdData()
+        self._tcd = make_convolver()
         super().__init__(name)
 
     def __setstate__(self, state):
-        state['_tcd'] = tcdData()
+        state['_tcd'] = make_convolver()
         self.__dict__.update(state)
 
     def __getstate__(self):
@@ -290,12 +313,20 @@ class ConvolutionKernel(Model):
 
 
 class PSFKernel(Kernel):
-    "class for PSF convolution kernels"
+    """class for PSF convolution kernels
+
+    .. versionchanged:: 4.19.0
+       The cutout argument has been added. When set, and a 2D
+       dataset has been filtered to a small area, the model is only
+       evaluated and convolved on the bounding box of the noticed
+       pixels, plus a margin for the kernel.
+
+    """
 
     def __init__(self, dshape, kshape, is_model=False, norm=True, frozen=True,
                  center=None, size=None, lo=None, hi=None, width=None,
                  args=[], kwargs={},
-                 pad_mask=None, do_pad=False, origin=None):
+                 pad_mask=None, do_pad=False, origin=None, cutout=True):
 
         self.is_model = is_model
         self.size = size
@@ -303,6 +334,13 @@ class PSFKernel(Kernel):
         self.hi = hi
         self.width = width
         self.radial = 0
+        self.cutout = cutout
+
+        # The cutout, calculated when first needed, and the data
+        # shape sent to the convolution code in the last call.
+        #
+        self._cutout = None
+        self._conv_dshape = None
         super().__init__(dshape, kshape, norm, frozen,
                          center, args, kwargs,
                          do_pad, pad_mask, origin)
@@ -313,6 +351,13 @@ class PSFKernel(Kernel):
         if origin is None:
             self.origin = origin
 
+    def __setstate__(self, state):
+        # Old versions of the class did not have the cutout fields.
+        state.setdefault('cutout', True)
+        state.setdefault('_cutout', None)
+        state.setdefault('_conv_dshape', None)
+        super().__setstate__(state)
+
     def __str__(self):
         ss = [
             f"is_model = {self.is_model}",
@@ -382,6 +427,110 @@ class PSFKernel(Kernel):
     def init_data(self, data):
         return (data, self.dshape)
 
+    def convolve(self, data, dshape, kernel, kshape):
+        # The convolution code caches the kernel FFT, which depends
+        # on the grid size, so it must be cleared when switching
+        # between the cutout and the full grid.
+        #
+        dshape = tuple(dshape)
+        if self._conv_dshape is not None and self._conv_dshape != dshape:
+            self._tcd.clear_kernel_fft()
+
+        self._conv_dshape = dshape
+        return super().convolve(data, dshape, kernel, kshape)
+
+    def _get_cutout(self):
+        """Return the cutout to use, or None.
+
+        The cutout is the bounding box of the noticed pixels, padded
+        by the kernel size, so that the convolution of the noticed
+        pixels does not depend on the pixels outside the cutout. It
+        is only used when the padded box lies within the data, as
+        otherwise the result depends on the pixels that wrap around
+        the edge of the grid, and when it is significantly smaller
+        than the data.
+
+        The return value is the indices of the cutout pixels in the
+        data, the cutout shape (in the same order as dshape), the
+        mask of the noticed pixels within the cutout, and the
+        independent axes of the cutout.
+        """
+
+        if self._cutout is not None:
+            return self._cutout or None
+
+        self._cutout = False
+        if not self.cutout or self.ndim != 2 or self.skshape is None:
+            return None
+
+        shape = tuple(self.dshape)[::-1]
+        mask = numpy.asarray(self.pad_mask)
+        if mask.dtype != bool or mask.size != numpy.prod(shape):
+            return None
+
+        mask = mask.reshape(shape)
+        rows = numpy.flatnonzero(mask.any(axis=1))
+        cols = numpy.flatnonzero(mask.any(axis=0))
+        if rows.size == 0:
+            return None
+
+        margin = numpy.asarray(self.skshape)[::-1] - 1
+        r0 = rows[0] - margin[0]
+        r1 = rows[-1] + margin[0] + 1
+        c0 = cols[0] - margin[1]
+        c1 = cols[-1] + margin[1] + 1
+        if r0 < 0 or c0 < 0 or r1 > shape[0] or c1 > shape[1]:
+            return None
+
+        cshape = (int(r1 - r0), int(c1 - c0))
+        if cshape[0] * cshape[1] > CUTOUT_FRACTION * mask.size:
+            return None
+
+        idx = numpy.arange(mask.size).reshape(shape)[r0:r1, c0:c1].ravel()
+        cmask = mask[r0:r1, c0:c1].ravel()
+        cargs = [numpy.asarray(arg)[idx] for arg in self.args]
+        self._cutout = (idx, cshape[::-1], cmask, cargs)
+        return self._cutout
+
+    def calc(self, pl, pr, lhs, rhs, *args, **kwargs):
+        if self.do_pad and len(args[0]) == numpy.prod(self.dshape):
+            self.do_pad = False
+
+        if not self.do_pad:
+            return super().calc(pl, pr, lhs, rhs, *args, **kwargs)
+
+        if self.kernel is None or not self.frozen:
+            kernel = lhs(pl, *self.args, **self.kwargs)
+            (self.kernel, self.skshape) = self.init_kernel(kernel)
+
+        cutout = self._get_cutout()
+        if cutout is not None and _uses_fixed_grid(rhs):
+            self._cutout = False
+            cutout = None
+
+        if cutout is not None:
+            idx, cdshape, cmask, cargs = cutout
+
+            # Other models which ignore the grid may return the values
+            # for all the pixels. Any other size means the cutout can
+            # not be used.
+            #
+            data = numpy.asarray(rhs(pr, *cargs, **self.kwargs))
+            if data.size == numpy.prod(self.dshape):
+                data = data[idx]
+
+            if data.size == idx.size:
+                vals = self.convolve(data, cdshape, self.kernel,
+                                     self.skshape)
+                return vals[cmask]
+
+            self._cutout = False
+
+        data = rhs(pr, *self.args, **self.kwargs)
+        (data, dshape) = self.init_data(data)
+        vals = self.convolve(data, dshape, self.kernel, self.skshape)
+        return self.deinit(vals)
+
 
 class RadialProfileKernel(PSFKernel):
     "class for 1D radial profile PSF convolution kernels"
@@ -486,6 +635,18 @@ class PSFModel(Model):
     kernel : sherpa.data.Data instance, callable, or None, optional
         The kernel used to convolve models. This can be changed.
 
+    Attributes
+    ----------
+    cutout : bool
+        When set, and a 2D dataset has been filtered so that the
+        noticed pixels cover a small part of the data, the model is
+        only evaluated and convolved on the bounding box of the
+        noticed pixels, plus a margin for the kernel. It only takes
+        effect when the result is the same as using all the pixels.
+        The default is True.
+
+        .. versionadded:: 4.19.0
+
     Notes
     -----
     A number of attributes are displayed as parameters, if set, but
@@ -508,6 +669,7 @@ class PSFModel(Model):
         self._origin = None
         self._center = None
         self._must_rebin = False
+        self._rebin = None
         self._model = None
 
         self._kernel = None
@@ -520,6 +682,7 @@ class PSFModel(Model):
         self.kernel = kernel
         self.data_space = None
         self.psf_space = None
+        self.cutout = True
         super().__init__(name)
 
     def _get_kernel(self):
@@ -759,7 +922,7 @@ they do not match.
         psf_space_evaluation = self.model.calc(p, *args, **kwargs)
 
         if self._must_rebin:
-            return rebin_2d(psf_space_evaluation, self.psf_space, self.data_space).ravel()
+            return self._rebin.apply(psf_space_evaluation).ravel()
 
         return psf_space_evaluation
 
@@ -882,6 +1045,8 @@ they do not match.
             self._set_model(RadialProfileKernel(dshape, kshape, **kwargs))
             return
 
+        # Old versions of the class did not have the cutout field.
+        kwargs['cutout'] = getattr(self, "cutout", True)
         self._set_model(PSFKernel(dshape, kshape, **kwargs))
 
     def _get_kernel_data(self, data, subkernel=True):
@@ -1008,6 +1173,7 @@ they do not match.
                 raise PSFErr("ndim")
 
             self._must_rebin = False
+            self._rebin = None
             return (indep, data.get_dims())
 
         # Evaluate model in PSF space. Note that if we get here then
@@ -1017,6 +1183,7 @@ they do not match.
             self.data_space = EvaluationSpace2D(*indep)
             self.psf_space = PSFSpace2D(self.data_space, self, data.sky.cdelt)
             self._must_rebin = True
+            self._rebin = Rebin2D(self.psf_space, self.data_space)
             return (self.psf_space.grid, self.psf_space.shape)
 
         # PSF has worse resolution, error out
@@ -108,6 +108,115 @@ def clean_kwargs2d(model, kwargs):
     return clean_kwargs(ALLOWED_KEYWORDS_2D, model, kwargs)
 
 
+# 4 log(2), used by the gaussian models.
+GFACTOR = 4 * numpy.log(2)
+
+
+def _grid_axes(args, kwargs):
+    """Return the axes if the model is evaluated on a rectangular grid.
+
+    The grid must be a set of points, flattened so that x0 varies
+    fastest (as created by ``numpy.mgrid`` and used by
+    `sherpa.astro.data.DataIMG`). Separable models can then be
+    evaluated along each axis and combined, rather than evaluated
+    at every point.
+
+    Parameters
+    ----------
+    args : sequence
+        The positional arguments sent to the calc method.
+    kwargs : dict
+        The keyword arguments sent to the calc method.
+
+    Returns
+    -------
+    axes : tuple of ndarray or None
+        The x0 and x1 values of the grid, or None if the arguments
+        do not describe a grid of at least 2 by 2 points.
+
+    """
+
+    if len(args) != 2 or "x0hi" in kwargs or "x1hi" in kwargs:
+        return None
+
+    x0 = numpy.asarray(args[0])
+    x1 = numpy.asarray(args[1])
+    if x0.ndim != 1 or x0.shape != x1.shape or x0.size < 4:
+        return None
+
+    # Find the length of the first row, checking the second element
+    # first so that most non-gridded data is quickly rejected.
+    #
+    start = x1[0]
+    if x1[1] != start:
+        return None
+
+    nx = 2
+    step = 256
+    while nx < x0.size:
+        diff = x1[nx:nx + step] != start
+        if diff.any():
+            nx += int(diff.argmax())
+            break
+
+        nx += diff.size
+        step *= 2
+
+    ny = x0.size // nx
+    if ny < 2 or x0.size % nx != 0:
+        return None
+
+    img0 = x0.reshape(ny, nx)
+    img1 = x1.reshape(ny, nx)
+    if not (img0 == img0[0]).all() or not (img1 == img1[:, :1]).all():
+        return None
+
+    return img0[0], img1[:, 0]
+
+
+def _outer(f0, f1):
+    """Combine the values along each axis of a grid (see _grid_axes)."""
+    return numpy.multiply.outer(f1, f0).ravel()
+
+
+def _is_unrotated(theta):
+    """Is the angle zero once wrapped to 0 to 2 pi (as done by the C code)?"""
+
+    if not numpy.isfinite(theta):
+        return False
+
+    while theta >= 2 * numpy.pi:
+        theta -= 2 * numpy.pi
+
+    while theta < 0:
+        theta += 2 * numpy.pi
+
+    return theta == 0
+
+
+def _gauss2d_grid(p, axes, norm=1.0):
+    """Evaluate the Gauss2D and NormGauss2D models on a grid.
+
+    This returns None if the model is not separable.
+    """
+
+    fwhm, xpos, ypos, ellip, theta, ampl = p
+    if fwhm == 0 or ellip == 1:
+        return None
+
+    if ellip == 0:
+        ellip2 = 1.0
+    elif _is_unrotated(theta):
+        ellip2 = (1 - ellip) * (1 - ellip)
+    else:
+        return None
+
+    scale = GFACTOR / (fwhm * fwhm)
+    f0 = numpy.exp(-scale * (axes[0] - xpos)**2)
+    f1 = numpy.exp(-scale * (axes[1] - ypos)**2 / ellip2)
+    return _outer(f0 * (ampl / norm), f1)
+
+
 class Box1D(RegriddableModel1D):
     """One-dimensional box function.
 
@@ -1569,6 +1678,12 @@ class Gauss2D(RegriddableModel2D):
     @modelCacher
     def calc(self, p, *args, **kwargs):
         kwargs = clean_kwargs2d(self, kwargs)
+        axes = _grid_axes(args, kwargs)
+        if axes is not None:
+            out = _gauss2d_grid(p, axes)
+            if out is not None:
+                return out
+
         return _modelfcts.gauss2d(p, *args, **kwargs)
 
 
@@ -1651,6 +1766,14 @@ class SigmaGauss2D(Gauss2D):
     @modelCacher
     def calc(self, p, *args, **kwargs):
         kwargs = clean_kwargs2d(self, kwargs)
+        axes = _grid_axes(args, kwargs)
+        sigma_a, sigma_b, xpos, ypos, theta, ampl = p
+        if axes is not None and sigma_a != 0 and sigma_b != 0 and \
+           (sigma_a == sigma_b or _is_unrotated(theta)):
+            f0 = numpy.exp(-0.5 * ((axes[0] - xpos) / sigma_a)**2)
+            f1 = numpy.exp(-0.5 * ((axes[1] - ypos) / sigma_b)**2)
+            return _outer(f0 * ampl, f1)
+
         return _modelfcts.sigmagauss2d(p, *args, **kwargs)
 
 
@@ -1754,6 +1877,15 @@ class NormGauss2D(RegriddableModel2D):
     @modelCacher
     def calc(self, p, *args, **kwargs):
         kwargs = clean_kwargs2d(self, kwargs)
+        axes = _grid_axes(args, kwargs)
+        if axes is not None:
+            fwhm, ellip = p[0], p[3]
+            norm = (numpy.pi / GFACTOR) * fwhm * fwhm * \
+                numpy.sqrt(1.0 - ellip * ellip)
+            out = _gauss2d_grid(p, axes, norm=norm)
+            if out is not None:
+                return out
+
         return _modelfcts.ngauss2d(p, *args, **kwargs)
 
 
@@ -1865,6 +1997,14 @@ class Polynom2D(RegriddableModel2D):
     @modelCacher
     def calc(self, p, *args, **kwargs):
         kwargs = clean_kwargs2d(self, kwargs)
+        axes = _grid_axes(args, kwargs)
+        if axes is not None:
+            # The coefficient of x0^i x1^j is p[3 * i + j].
+            coeffs = numpy.asarray(p, dtype=float).reshape(3, 3)
+            pow0 = numpy.vander(axes[0], 3, increasing=True)
+            pow1 = numpy.vander(axes[1], 3, increasing=True)
+            return (pow1 @ coeffs.T @ pow0.T).ravel()
+
         return _modelfcts.poly2d(p, *args, **kwargs)
 
 
@@ -1994,6 +2134,12 @@ class TableModel(ArithmeticModel):
 
     """
 
+    # The cached interpolation, which is not set for objects pickled
+    # by older versions of Sherpa.
+    #
+    __grid = None
+    __grid_y = None
+
     @property
     def method(self):
         """The interpolation method, used when x is not None in the load call.
@@ -2013,6 +2159,7 @@ class TableModel(ArithmeticModel):
         # this if the method has not changed but is it worth it?)
         #
         self.cache_clear()
+        self._clear_grid()
 
     def __init__(self, name='tablemodel'):
         # these attributes should remain somewhat private
@@ -2024,6 +2171,8 @@ class TableModel(ArithmeticModel):
         self.__x = None
         self.__y = None
         self.__filtered_y = None
+        self.__grid = None
+        self.__grid_y = None
         self.filename = None
         self._method = linear_interp
         self.ampl = Parameter(name, 'ampl', 1)
@@ -2095,6 +2244,7 @@ class TableModel(ArithmeticModel):
 
         # clear the filtered array
         self.__filtered_y = None
+        self._clear_grid()
 
         if x is None:
             return
@@ -2150,6 +2300,7 @@ class TableModel(ArithmeticModel):
         # Clear out the setting. If needed it will get reset.
         #
         self.__filtered_y = None
+        self._clear_grid()
 
         # If we are interpolating the data we do not care about the
         # data mask.
@@ -2172,6 +2323,31 @@ class TableModel(ArithmeticModel):
 
         self.__filtered_y = self.__y[mask]
 
+    def _clear_grid(self):
+        """Remove the interpolated values stored by _interpolate_grid."""
+        self.__grid = None
+        self.__grid_y = None
+
+    def _interpolate_grid(self, x0):
+        """Interpolate the table onto x0.
+
+        The interpolated values are stored, along with a copy of the
+        grid, so that repeated evaluations on the same grid - such as
+        during a fit, where only the ampl parameter changes - do not
+        need to re-interpolate the table. The stored values are
+        removed by load, fold, or changing the method.
+        """
+
+        x0 = numpy.asarray(x0)
+        grid = self.__grid
+        if grid is None or grid.shape != x0.shape or \
+           not numpy.array_equal(grid, x0):
+            self.__grid_y = interpolate(x0, self.__x, self.__y,
+                                        function=self.method)
+            self.__grid = x0.copy()
+
+        return self.__grid_y
+
     @modelCacher1d
     def calc(self, p, x0, x1=None, *args, **kwargs):
         """Evaluate the model.
@@ -2186,7 +2362,7 @@ class TableModel(ArithmeticModel):
             raise ModelErr("The tablemodel's load method must be called first")
 
         if self.__x is not None:
-            return p[0] * interpolate(x0, self.__x, self.__y, function=self.method)
+            return p[0] * self._interpolate_grid(x0)
 
         if (self.__filtered_y is not None and
               len(x0) == len(self.__filtered_y)):
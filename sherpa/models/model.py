@@ -325,7 +325,8 @@ import warnings
 
 import numpy as np
 
-from sherpa.models.regrid import EvaluationSpace1D, ModelDomainRegridder1D, EvaluationSpace2D, ModelDomainRegridder2D
+from sherpa.models.regrid import EvaluationSpace1D, ModelDomainRegridder1D, EvaluationSpace2D, ModelDomainRegridder2D, \
+    PixelIntegrator2D
 from sherpa.utils import NoNewAttributesAfterInit, formatting
 from sherpa.utils.err import ModelErr, ParameterErr
 from sherpa.utils.numeric_types import SherpaFloat
@@ -1705,6 +1706,51 @@ class RegriddableModel2D(RegriddableModel):
         regridder = ModelDomainRegridder2D(eval_space)
         return regridder.apply_to(self)
 
+    def oversample(self,
+                   factor: int = 4,
+                   core_factor: int | None = None,
+                   core_radius: float | None = None,
+                   center: Sequence[float] | None = None
+                   ) -> RegridWrappedModel:
+        """Integrate the model over pixels by oversampling.
+
+        .. versionadded:: 4.19.0
+
+        Parameters
+        ----------
+        factor : int, optional
+            The number of sub-pixels along each axis.
+        core_factor : int or None, optional
+            The number of sub-pixels along each axis for the pixels
+            within core_radius of the center.
+        core_radius : number or None, optional
+            The size of the core, in the units of the independent
+            axes.
+        center : pair of numbers or None, optional
+            The center of the core. If None then the get_center
+            method is used.
+
+        Returns
+        -------
+        model : RegridWrappedModel
+            The model, which uses sub-pixels for integrated grids.
+
+        See Also
+        --------
+        sherpa.models.regrid.PixelIntegrator2D
+
+        Examples
+        --------
+        >>> from sherpa.models.basic import Gauss2D
+        >>> gmdl = Gauss2D()
+        >>> mdl = gmdl.oversample(4, core_factor=16, core_radius=3)
+
+        """
+        integrator = PixelIntegrator2D(factor, core_factor=core_factor,
+                                       core_radius=core_radius,
+                                       center=center)
+        return integrator.apply_to(self)
+
 
 class UnaryOpModel(CompositeModel, ArithmeticModel):
     """Apply an operator to a model expression.
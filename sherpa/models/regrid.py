@@ -29,7 +29,6 @@ match the desired grid.
 """
 
 from abc import ABCMeta, abstractmethod
-import itertools
 import logging
 import warnings
 
@@ -890,6 +889,23 @@ class ModelDomainRegridder2D():
         self.evaluation_space = evaluation_space\
             if evaluation_space is not None else EvaluationSpace2D()
 
+        # The last requested grid, and the Rebin2D object used to
+        # map the evaluation space to it.
+        #
+        self._requested = None
+        self._rebin = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_requested'] = None
+        state['_rebin'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_requested', None)
+        self.__dict__.setdefault('_rebin', None)
+
     @property
     def grid(self):
         return self.evaluation_space.grid
@@ -937,10 +953,30 @@ class ModelDomainRegridder2D():
         if self.evaluation_space.is_empty:  # Simply pass through
             return modelfunc(pars, *args, **kwargs)
 
-        requested_eval_space = self._make_and_validate_grid(args)
+        requested_eval_space = self._get_requested_space(args)
 
         return self._evaluate(requested_eval_space, pars, modelfunc, **kwargs)
 
+    def _get_requested_space(self, args_array):
+        """Return the requested grid, re-using the last one if possible.
+
+        Creating the evaluation space requires finding the unique
+        axis values, so the space is re-used when the arguments and
+        the evaluation space have not changed.
+        """
+
+        cached = self._requested
+        if cached is not None and cached[0] is self.evaluation_space and \
+           len(cached[1]) == len(args_array) and \
+           all(np.array_equal(old, new)
+               for old, new in zip(cached[1], args_array)):
+            return cached[2]
+
+        space = self._make_and_validate_grid(args_array)
+        self._requested = (self.evaluation_space,
+                           [np.array(arg) for arg in args_array], space)
+        return space
+
     def _make_and_validate_grid(self, args_array):
         """
         Validate input grid and check whether it's point or integrated.
@@ -977,7 +1013,259 @@ class ModelDomainRegridder2D():
             return requested_space.zeros_like()
 
         y = modelfunc(pars, *self.grid, **kwargs)
-        return rebin_2d(y, self.evaluation_space, requested_space).ravel()
+
+        rebin = self._rebin
+        if rebin is None or \
+           not rebin.matches(self.evaluation_space, requested_space):
+            rebin = Rebin2D(self.evaluation_space, requested_space)
+            self._rebin = rebin
+
+        return rebin.apply(y).ravel()
+
+
+class PixelIntegrator2D():
+    """Integrate 2D models over pixels by oversampling.
+
+    The integrated versions of the 2D models, such as
+    `sherpa.models.basic.Gauss2D`, use adaptive numerical integration
+    for each pixel, which can be slow for large images. This class
+    instead evaluates the model at the centers of a N by N grid of
+    sub-pixels for each pixel, and sums them, which trades accuracy
+    for speed. The pixels near the core of the model - that is,
+    within `core_radius` of the center - can be evaluated with a
+    larger oversampling factor.
+
+    This class is not used directly in a model expression; instead
+    it creates an instance that is used to evaluate the model.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    factor : int, optional
+        The number of sub-pixels along each axis.
+    core_factor : int or None, optional
+        The number of sub-pixels along each axis for the pixels near
+        the core. If None then `factor` is used for all pixels.
+    core_radius : number or None, optional
+        The pixels whose centers lie within this distance of the
+        center are treated as being in the core. It is in the units
+        of the independent axes.
+    center : pair of numbers or None, optional
+        The position of the core. If None then the get_center method
+        of the model is used, if it exists.
+    name : str, optional
+        The default name is 'integrate2d'.
+
+    See Also
+    --------
+    sherpa.models.model.RegriddableModel2D.oversample
+
+    Notes
+    -----
+    The sub-pixel grid for the pixels outside the core is cached,
+    up to `cache_bytes` in size, and re-used while the grid does not
+    change. Points, rather than pixels, and models with the
+    integrate setting turned off are evaluated directly.
+
+    Examples
+    --------
+
+    Integrate a gaussian using 3 by 3 sub-pixels, with 15 by 15
+    sub-pixels used within 5 pixels of the center:
+
+    >>> from sherpa.models.basic import Gauss2D
+    >>> gmdl = Gauss2D()
+    >>> gmdl.xpos = 10
+    >>> gmdl.ypos = 12
+    >>> gmdl.fwhm = 2
+    >>> integrator = PixelIntegrator2D(3, core_factor=15, core_radius=5)
+    >>> mdl = integrator.apply_to(gmdl)
+    >>> x1, x0 = np.mgrid[0:20, 0:25]
+    >>> x0 = x0.flatten()
+    >>> x1 = x1.flatten()
+    >>> y = mdl(x0, x1, x0 + 1, x1 + 1)
+
+    """
+
+    cache_bytes = 128 * 1024 * 1024
+    """The maximum size of the cached sub-pixel grid, in bytes."""
+
+    chunk_size = 1024 * 1024
+    """The maximum number of points sent to the model in one call."""
+
+    def __init__(self, factor=4, core_factor=None, core_radius=None,
+                 center=None, name='integrate2d'):
+        self.name = name
+        self.factor = self._validate_factor(factor, "factor")
+        self.core_factor = None if core_factor is None else \
+            self._validate_factor(core_factor, "core_factor")
+        self.core_radius = core_radius
+        self.center = center
+        self.integrate = True
+        self._get_center = None
+
+        # The grid used to create the cached sub-pixel grid, and the
+        # sub-pixel grid.
+        #
+        self._grid = None
+        self._subgrid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_grid'] = None
+        state['_subgrid'] = None
+        return state
+
+    @staticmethod
+    def _validate_factor(factor, name):
+        try:
+            value = int(factor)
+        except (TypeError, ValueError):
+            raise ModelErr(f"{name} must be an integer, not {factor}") from None
+
+        if value < 1 or value != factor:
+            raise ModelErr(f"{name} must be a positive integer, not {factor}")
+
+        return value
+
+    def apply_to(self, model):
+        """Integrate a model over each pixel by oversampling."""
+        from sherpa.models.model import RegridWrappedModel
+        self._get_center = getattr(model, "get_center", None)
+        return RegridWrappedModel(model, self)
+
+    @staticmethod
+    def _subpixels(x0lo, x1lo, x0hi, x1hi, factor):
+        """The sub-pixel centers, with the sub-pixels as the last axis."""
+
+        frac = (np.arange(factor) + 0.5) / factor
+        x0 = x0lo[:, None] + (x0hi - x0lo)[:, None] * frac[None, :]
+        x1 = x1lo[:, None] + (x1hi - x1lo)[:, None] * frac[None, :]
+        x0 = np.broadcast_to(x0[:, None, :], (x0lo.size, factor, factor))
+        x1 = np.broadcast_to(x1[:, :, None], (x0lo.size, factor, factor))
+        return (x0.reshape(x0lo.size, -1), x1.reshape(x0lo.size, -1))
+
+    def _get_subgrid(self, grid):
+        """Return the sub-pixel grid using factor, using the cache."""
+
+        if self._grid is not None and \
+           all(np.array_equal(a, b) for a, b in zip(self._grid, grid)):
+            return self._subgrid
+
+        subgrid = self._subpixels(*grid, self.factor)
+        nbytes = sum(axis.nbytes for axis in subgrid)
+        if nbytes <= self.cache_bytes:
+            self._grid = tuple(axis.copy() for axis in grid)
+            self._subgrid = subgrid
+        else:
+            self._grid = None
+            self._subgrid = None
+
+        return subgrid
+
+    def _integrate(self, pars, modelfunc, subgrid, area, **kwargs):
+        """Evaluate the model on the sub-pixels and sum them."""
+
+        npix, nsub = subgrid[0].shape
+        out = np.zeros(npix)
+        step = max(1, self.chunk_size // nsub)
+        for start in range(0, npix, step):
+            end = min(start + step, npix)
+            x0 = subgrid[0][start:end].ravel()
+            x1 = subgrid[1][start:end].ravel()
+            vals = np.asarray(modelfunc(pars, x0, x1, **kwargs))
+            out[start:end] = vals.reshape(end - start, nsub).mean(axis=1)
+
+        return out * area
+
+    def _get_core(self, x0, x1):
+        """Return the mask of the pixels in the core, or None."""
+
+        if self.core_factor is None or self.core_radius is None or \
+           self.core_factor == self.factor:
+            return None
+
+        center = self.center
+        if center is None:
+            if self._get_center is None:
+                return None
+
+            try:
+                center = self._get_center()
+            except NotImplementedError:
+                return None
+
+        dist = np.hypot(x0 - center[0], x1 - center[1])
+        core = dist <= self.core_radius
+        return core if core.any() else None
+
+    def calc(self, pars, modelfunc, *args, **kwargs):
+        """Evaluate the model integrated over the pixels.
+
+        Parameters
+        ----------
+        pars : sequence of numbers
+            The parameter values of the model.
+        modelfunc
+            The model to evaluate (the calc attribute of the model)
+        args
+            The grid to evaluate the model on. When it is integrated
+            (xlo, ylo, xhi, yhi) the model is integrated over each
+            pixel, otherwise the model is evaluated at each point.
+        kwargs
+            Keyword arguments for the model.
+
+        """
+
+        if len(args) != 4 or not self.integrate:
+            return modelfunc(pars, *args, **kwargs)
+
+        grid = tuple(np.asarray(arg, dtype=float) for arg in args)
+        x0lo, x1lo, x0hi, x1hi = grid
+        if x0lo.size == 0:
+            return np.zeros(0)
+
+        area = (x0hi - x0lo) * (x1hi - x1lo)
+        core = self._get_core((x0lo + x0hi) / 2, (x1lo + x1hi) / 2)
+        if core is None:
+            subgrid = self._get_subgrid(grid)
+            return self._integrate(pars, modelfunc, subgrid, area, **kwargs)
+
+        # Only the pixels outside the core are evaluated with the
+        # cached grid, to avoid re-calculating the sub-pixel grid as
+        # the core moves.
+        #
+        out = np.zeros(x0lo.size)
+        outer = ~core
+        if outer.any():
+            subgrid = self._get_subgrid(grid)
+            subgrid = (subgrid[0][outer], subgrid[1][outer])
+            out[outer] = self._integrate(pars, modelfunc, subgrid,
+                                         area[outer], **kwargs)
+
+        subgrid = self._subpixels(x0lo[core], x1lo[core], x0hi[core],
+                                  x1hi[core], self.core_factor)
+        out[core] = self._integrate(pars, modelfunc, subgrid, area[core],
+                                    **kwargs)
+        return out
+
+
+def _rebin_scale(from_space, to_space):
+    """The pixel ratios of the x and y axes used by rebin_2d."""
+
+    if hasattr(from_space, "data_2_psf_pixel_size_ratio"):
+        ratio = from_space.data_2_psf_pixel_size_ratio
+        return 1/ratio[0], 1/ratio[1]
+
+    return (from_space.x_axis.size / to_space.x_axis.size,
+            from_space.y_axis.size / to_space.y_axis.size)
+
+
+def _is_int_scale(scale_x, scale_y):
+    """Are the pixel ratios close enough to integers for rebin_int?"""
+    return (abs(scale_x - round(scale_x)) <= PIXEL_RATIO_THRESHOLD
+            and abs(scale_y - round(scale_y)) <= PIXEL_RATIO_THRESHOLD)
 
 
 def rebin_2d(y, from_space, to_space):
@@ -987,13 +1275,7 @@ def rebin_2d(y, from_space, to_space):
     from_x_dim = from_space.x_axis.size
     from_y_dim = from_space.y_axis.size
 
-    if hasattr(from_space, "data_2_psf_pixel_size_ratio"):
-        ratio = from_space.data_2_psf_pixel_size_ratio
-        scale_x, scale_y = 1/ratio[0], 1/ratio[1]
-    else:
-        scale_x = from_x_dim / to_x_dim
-        scale_y = from_y_dim / to_y_dim
-
+    scale_x, scale_y = _rebin_scale(from_space, to_space)
     scale = scale_x * scale_y
 
     if scale == 1:
@@ -1002,13 +1284,139 @@ def rebin_2d(y, from_space, to_space):
     reshaped_y = y.reshape(from_x_dim, from_y_dim)
     reshaped_scaled_y = reshaped_y / scale
 
-    if (abs(scale_x - round(scale_x)) > PIXEL_RATIO_THRESHOLD
-            or abs(scale_y - round(scale_y)) > PIXEL_RATIO_THRESHOLD):
+    if not _is_int_scale(scale_x, scale_y):
         return rebin_no_int(reshaped_scaled_y, dimensions=(to_x_dim, to_y_dim))
 
     return rebin_int(reshaped_scaled_y, int(round(scale_x)), int(round(scale_y)))
 
 
+def _rebin_weights(nin, nout):
+    """The rebin_no_int weights for an axis.
+
+    Each input pixel adds a fraction of its value to the output
+    pixel it starts in, and the remainder to the following output
+    pixel. As the output pixels increase with the input pixel, each
+    of these is stored as (targets, starts, weights) values, where
+    the weighted input pixels are summed from each start value and
+    added to the target pixel. The return value is the number of
+    output pixels and the two sets of values.
+    """
+
+    idx = np.arange(nin)
+    lo = idx * nout // nin
+    top, frac = np.divmod(idx + 1, nin / float(nout))
+    delta = top - lo
+    weight = np.where((delta == 0) | ((delta == 1) & (frac == 0)),
+                      1.0, 1.0 - frac)
+    hi = np.minimum(nout - 1, lo + 1)
+
+    out = []
+    for index, wgt in [(lo, weight), (hi, 1 - weight)]:
+        starts = np.flatnonzero(np.diff(index, prepend=-1))
+        out.append((index[starts], starts, wgt))
+
+    return nout, out
+
+
+def _apply_rebin_axis(array, weights):
+    """Apply the _rebin_weights values to the first axis of array."""
+
+    nout, terms = weights
+    result = np.zeros((nout, ) + array.shape[1:])
+    for targets, starts, wgt in terms:
+        result[targets] += np.add.reduceat(array * wgt[:, np.newaxis],
+                                           starts, axis=0)
+
+    return result
+
+
+def _apply_rebin_weights(array, weights_x, weights_y):
+    """Rebin a 2D array given the _rebin_weights for each axis."""
+
+    result = _apply_rebin_axis(array, weights_x)
+    return _apply_rebin_axis(result.T, weights_y).T
+
+
+class Rebin2D():
+    """Rebin 2D model values from one grid to another.
+
+    This gives the same results as `rebin_2d`, but the mapping
+    between the two grids - that is, the block size for integer
+    pixel ratios or the weights used by `rebin_no_int` otherwise -
+    is calculated when the object is created, so that it can be
+    re-used for multiple evaluations.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    from_space : EvaluationSpace2D
+        The grid of the input values.
+    to_space : EvaluationSpace2D
+        The grid of the output values.
+
+    See Also
+    --------
+    rebin_2d
+
+    """
+
+    def __init__(self, from_space, to_space):
+        self.from_shape = (from_space.x_axis.size, from_space.y_axis.size)
+        self.to_shape = (to_space.x_axis.size, to_space.y_axis.size)
+        self.key = self._make_key(from_space, to_space)
+
+        scale_x, scale_y = _rebin_scale(from_space, to_space)
+        self.scale = scale_x * scale_y
+        self.factors = None
+        self.weights = None
+        if self.scale == 1:
+            return
+
+        if _is_int_scale(scale_x, scale_y):
+            self.factors = (int(round(scale_x)), int(round(scale_y)))
+        else:
+            self.weights = (_rebin_weights(self.from_shape[0], self.to_shape[0]),
+                            _rebin_weights(self.from_shape[1], self.to_shape[1]))
+
+    @staticmethod
+    def _make_key(from_space, to_space):
+        """The values of the grids that the mapping depends on."""
+        ratio = getattr(from_space, "data_2_psf_pixel_size_ratio", None)
+        return (from_space.x_axis.size, from_space.y_axis.size,
+                to_space.x_axis.size, to_space.y_axis.size,
+                None if ratio is None else tuple(ratio))
+
+    def matches(self, from_space, to_space):
+        """Can the object be used to rebin between these grids?"""
+        return self.key == self._make_key(from_space, to_space)
+
+    def apply(self, y):
+        """Rebin the values.
+
+        Parameters
+        ----------
+        y : array_like
+            The values on the from_space grid.
+
+        Returns
+        -------
+        rebinned : ndarray
+            The values on the to_space grid. The array is
+            two-dimensional unless the grids have the same pixel
+            size, in which case y is returned.
+        """
+
+        if self.scale == 1:
+            return y
+
+        scaled_y = np.asarray(y).reshape(self.from_shape) / self.scale
+        if self.factors is not None:
+            return rebin_int(scaled_y, *self.factors)
+
+        return _apply_rebin_weights(scaled_y, *self.weights)
+
+
 def rebin_int(array, scale_x, scale_y):
     """Rebin array by an integer scale on both x and y
 
@@ -1079,39 +1487,15 @@ def rebin_no_int(array, dimensions=None, scale=None):
             raise RuntimeError('')
     elif scale is not None:
         if isinstance(scale, (float, int)):
-            dimensions = map(int, map(round, map(lambda x: x * scale, array.shape)))
+            dimensions = [int(round(x * scale)) for x in array.shape]
         elif len(scale) != len(array.shape):
             raise RuntimeError('')
     else:
         raise RuntimeError('Incorrect parameters to rebin.\n\trebin(array, dimensions=(x,y))\n\trebin(array, scale=a')
 
-    dY, dX = map(divmod, map(float, array.shape), dimensions)
-
-    result = np.zeros(dimensions)
-    for j, i in itertools.product(*map(range, array.shape)):
-        (J, dj) = divmod(j * dimensions[0], array.shape[0])
-        (I, di) = divmod(i * dimensions[1], array.shape[1])
-        (J1, dj1) = divmod(j + 1, array.shape[0] / float(dimensions[0]))
-        (I1, di1) = divmod(i + 1, array.shape[1] / float(dimensions[1]))
-
-        # Moving to new bin
-        # Is this a discrete bin?
-        dx, dy = 0, 0
-        if (I1 - I == 0) | ((I1 - I == 1) & (di1 == 0)):
-            dx = 1
-        else:
-            dx = 1 - di1
-        if (J1 - J == 0) | ((J1 - J == 1) & (dj1 == 0)):
-            dy = 1
-        else:
-            dy = 1 - dj1
-        # Prevent it from allocating outide the array
-        I_ = min(dimensions[1] - 1, I + 1)
-        J_ = min(dimensions[0] - 1, J + 1)
-        result[J, I] += array[j, i] * dx * dy
-        result[J_, I] += array[j, i] * (1 - dy) * dx
-        result[J, I_] += array[j, i] * dy * (1 - dx)
-        result[J_, I_] += array[j, i] * (1 - dx) * (1 - dy)
+    result = _apply_rebin_weights(array,
+                                  _rebin_weights(array.shape[0], dimensions[0]),
+                                  _rebin_weights(array.shape[1], dimensions[1]))
 
     allowError = 0.001
     assert array.sum() == 0 or \
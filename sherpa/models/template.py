@@ -108,20 +108,28 @@ array([5.34, 6.12, 6.  ])
 
 """
 
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import reduce
+import os
 from typing import Callable
-import operator
 
 import numpy as np
 
-from sherpa.utils.err import ModelErr
+from sherpa.utils import linear_interp
+from sherpa.utils.err import IOErr, ModelErr
+from sherpa.utils.numeric_types import SherpaFloat
 
 from .parameter import Parameter
 from .model import ArithmeticModel, modelCacher1d
 from .basic import FixedTableModel, TableModelBase, InterpolatedTableModel1D
 
 __all__ = ('TemplateModel', 'InterpolatingTemplateModel',
-           'KNNInterpolator', 'Template', 'add_interpolator',
-           'create_template_model', 'reset_interpolators')
+           'KNNInterpolator', 'MultilinearInterpolator', 'Template',
+           'TemplateLibrary', 'GridInterpolator',
+           'add_interpolator', 'create_template_model',
+           'reset_interpolators', 'read_template_library',
+           'write_template_library')
 
 
 # This is reset by reset_interpolators below.
@@ -233,36 +241,288 @@ class KNNInterpolator(InterpolatingTemplateModel):
             self.k = k
 
         self.order = order
+
+        # Store the template locations as a single contiguous array
+        # so that the distances to all the templates can be
+        # calculated in one call.
+        #
+        self._points = np.ascontiguousarray(template_model.parvals,
+                                            dtype=SherpaFloat)
         InterpolatingTemplateModel.__init__(self, name, template_model)
 
     def _calc_distances(self, point):
-        """What are the distances for the given set of parameters?"""
-        distances = []
-        for i, t_point in enumerate(self.template_model.parvals):
-            dist = np.linalg.norm(point - t_point, self.order)
-            distances.append((i, dist))
+        """What are the k nearest templates to the given parameters?
+
+        Returns
+        -------
+        idx, distances : ndarray, ndarray
+            The indexes of the k nearest templates and their distances
+            from the point, ordered by increasing distance. Templates
+            at the same distance are ordered by index.
 
-        return sorted(distances, key=operator.itemgetter(1))
+        """
+        dists = np.linalg.norm(self._points - np.asarray(point),
+                               ord=self.order, axis=1)
+
+        # Rather than sort all the distances, find the k-th smallest
+        # value and then only sort those templates that are at least as
+        # close as it (which will usually be k values but may be more
+        # when there are ties).
+        #
+        k = min(self.k, dists.size)
+        if k < dists.size:
+            kth = np.partition(dists, k - 1)[k - 1]
+            idx = np.flatnonzero(dists <= kth)
+        else:
+            idx = np.arange(dists.size)
+
+        idx = idx[np.argsort(dists[idx], kind="stable")[:k]]
+        return idx, dists[idx]
 
     def interpolate(self, point, x_out):
-        distances = self._calc_distances(point)
-        if distances[0][1] == 0:
-            return self.template_model.templates[distances[0][0]]
-
-        k_distances = distances[:self.k]
-        weights = [(idx, 1/np.array(distance)) for idx, distance in k_distances]
-        y_out = np.zeros(len(x_out))
-        for idx, weight in weights:
-            y_out += self.template_model.templates[idx].calc((weight,), x_out)
-
-        sum_weights = sum(1 / weight for (idx, weight) in k_distances)
-        y_out /= sum_weights
+        idx, distances = self._calc_distances(point)
+        if distances[0] == 0:
+            return self.template_model.templates[idx[0]]
+
+        weights = 1 / distances
+        templates = self.template_model.templates
+        y_k = np.asarray([templates[i].calc((1.0,), x_out) for i in idx])
+        y_out = weights @ y_k / weights.sum()
         if x_out is None:
             return FixedTableModel('fixed', y=y_out)
         else:
             return InterpolatedTableModel1D('interpolated', x=x_out, y=y_out)
 
 
+class GridInterpolator:
+    """Multilinear interpolation of spectra defined on a regular grid.
+
+    The spectra are defined at every point of a regular grid in
+    parameter space - that is, the outer product of the values for
+    each parameter - and the spectrum at a given location is
+    calculated by multilinear interpolation of the 2^N spectra at the
+    corners of the grid cell containing the location. The corner
+    spectra are cached, so they are only re-created when the location
+    moves to a different cell.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    axes : sequence of 1D arrays
+        The grid values for each parameter, in increasing order.
+    index : ndarray of int
+        The row, as sent to get_rows, for each grid point. The shape
+        must match the axes.
+    get_rows : callable
+        This is called with a 1D array of row numbers and it returns
+        the spectra for these rows as a 2D array.
+    log : bool or sequence of bool, optional
+        Should the interpolation be done in logarithmic space for
+        each parameter? If a single value is given it is used for all
+        parameters. Parameters using logarithmic interpolation must
+        have positive grid values.
+
+    Notes
+    -----
+    The location is restricted to the grid, so there is no
+    extrapolation.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> y = np.asarray([[1, 2], [3, 6], [5, 10], [7, 14]])
+    >>> index = np.arange(4).reshape(2, 2)
+    >>> grid = GridInterpolator([[0, 1], [0, 10]], index, lambda idx: y[idx])
+    >>> grid([0.5, 5])
+    array([4., 8.])
+
+    """
+
+    def __init__(self, axes, index, get_rows, log=False):
+        self.axes = [np.asarray(axis, dtype=SherpaFloat) for axis in axes]
+        self.index = np.asarray(index)
+        self.get_rows = get_rows
+
+        nax = len(self.axes)
+        shape = tuple(axis.size for axis in self.axes)
+        if self.index.shape != shape:
+            raise ModelErr(f"index has shape {self.index.shape}, expected {shape}")
+
+        if np.isscalar(log):
+            log = [log] * nax
+        elif len(log) != nax:
+            raise ModelErr(f"log has {len(log)} elements, expected {nax}")
+
+        self.log = [bool(flag) for flag in log]
+        for axis, flag in zip(self.axes, self.log):
+            if np.any(np.diff(axis) <= 0):
+                raise ModelErr("grid values must be in increasing order")
+
+            if flag and axis[0] <= 0:
+                raise ModelErr("grid values must be positive for logarithmic interpolation")
+
+        # The interpolation is done on the transformed axes.
+        #
+        self._axes = [np.log(axis) if flag else axis
+                      for axis, flag in zip(self.axes, self.log)]
+
+        # The offsets of the 2^N corners from the lower corner of a
+        # cell, with the last parameter changing fastest (this matches
+        # the ordering of the weights created by np.outer).
+        #
+        self._offsets = np.indices((2,) * nax).reshape(nax, -1)
+
+        self._cell = None
+        self._corners = None
+
+    def clear_cache(self):
+        """Remove the cached corner spectra."""
+        self._cell = None
+        self._corners = None
+
+    def _locate(self, point):
+        """Return the lower corner of the cell and the fractional position."""
+
+        cell = []
+        fracs = []
+        for axis, val in zip(self._axes, np.log(point, where=self.log,
+                                                  out=np.array(point, dtype=SherpaFloat))):
+            n = axis.size
+            if n == 1:
+                cell.append(0)
+                fracs.append(0.0)
+                continue
+
+            i = int(np.clip(np.searchsorted(axis, val, side='right') - 1,
+                            0, n - 2))
+            t = (val - axis[i]) / (axis[i + 1] - axis[i])
+            cell.append(i)
+            fracs.append(min(max(t, 0.0), 1.0))
+
+        return tuple(cell), fracs
+
+    def __call__(self, point):
+        """Interpolate the spectra to the given location.
+
+        Parameters
+        ----------
+        point : sequence of float
+            The parameter values, which must match the order of the
+            axes.
+
+        Returns
+        -------
+        spectrum : ndarray
+
+        """
+
+        point = np.asarray(point, dtype=SherpaFloat)
+        if point.shape != (len(self.axes), ):
+            raise ModelErr(f"point must have {len(self.axes)} elements")
+
+        cell, fracs = self._locate(point)
+        if cell != self._cell:
+            # Parameters with a single value use the same index for
+            # both corners.
+            #
+            maxidx = np.asarray([axis.size - 1 for axis in self.axes])[:, None]
+            corners = np.minimum(np.asarray(cell)[:, None] + self._offsets,
+                                 maxidx)
+            rows = self.index[tuple(corners)]
+            self._corners = np.asarray(self.get_rows(rows), dtype=SherpaFloat)
+            self._cell = cell
+
+        weights = reduce(np.outer, [[1 - t, t] for t in fracs],
+                         np.ones(1)).ravel()
+        return weights @ self._corners
+
+
+class MultilinearInterpolator(InterpolatingTemplateModel):
+    """Use multilinear interpolation for parameters.
+
+    The templates must form a regular grid - that is, there is a
+    template for every combination of the parameter values - although
+    they can be given in any order.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    name : str
+        The name of the model
+    template_model : TemplateModel instance
+        The templates to use.
+    log : bool or sequence of bool, optional
+        Should the interpolation use logarithmic rather than linear
+        spacing for each parameter?
+
+    See Also
+    --------
+    GridInterpolator, KNNInterpolator, TemplateModel
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> from sherpa.models.template import add_interpolator, create_template_model
+    >>> from sherpa.models.basic import InterpolatedTableModel1D
+    >>> x = [1, 2, 3]
+    >>> parvals = np.asarray([[1], [2], [3]])
+    >>> templates = [InterpolatedTableModel1D(x=x, y=[p, 2 * p, 3 * p])
+    ...              for p in [1, 2, 3]]
+    >>> mdl = create_template_model("model", ["a"], parvals, templates,
+    ...                             template_interpolator_name="multilinear")
+    >>> mdl.a = 2.5
+    >>> mdl(x)
+    array([2.5, 5. , 7.5])
+
+    """
+
+    def __init__(self, name, template_model, log=False):
+        parvals = np.asarray(template_model.parvals, dtype=SherpaFloat)
+        axes = [np.unique(col) for col in parvals.T]
+
+        shape = tuple(axis.size for axis in axes)
+        if np.prod(shape) != parvals.shape[0]:
+            raise ModelErr("The templates do not form a regular grid")
+
+        index = np.full(shape, -1, dtype=int)
+        pos = tuple(np.searchsorted(axis, col)
+                    for axis, col in zip(axes, parvals.T))
+        index[pos] = np.arange(parvals.shape[0])
+        if np.any(index < 0):
+            raise ModelErr("The templates do not form a regular grid")
+
+        self._x_out = None
+        self._grid = GridInterpolator(axes, index, self._get_rows, log=log)
+        InterpolatingTemplateModel.__init__(self, name, template_model)
+
+    def _get_rows(self, rows):
+        templates = self.template_model.templates
+        return [templates[i].calc((1.0,), self._x_out) for i in rows]
+
+    def fold(self, data):
+        self._grid.clear_cache()
+        super().fold(data)
+
+    def interpolate(self, point, x_out):
+        # The corner spectra depend on the grid they were evaluated on.
+        #
+        if x_out is None or self._x_out is None or \
+           np.shape(x_out) != self._x_out.shape or \
+           not np.array_equal(x_out, self._x_out):
+            self._x_out = None if x_out is None else np.array(x_out)
+            self._grid.clear_cache()
+
+        y_out = self._grid(point)
+        if x_out is None:
+            return FixedTableModel('fixed', y=y_out)
+
+        return InterpolatedTableModel1D('interpolated', x=x_out, y=y_out)
+
+
 class Template(KNNInterpolator):
     """The Template class.
 
@@ -287,12 +547,21 @@ class TemplateModel(ArithmeticModel):
     parvals : sequence of sequence of float
         The parameter values for each template.
     templates : sequence of TableModelBase
-        The template for each element of parvals.
+        The template for each element of parvals. This can be a
+        `TemplateLibrary`, in which case the templates are only
+        created when needed.
 
     See Also
     --------
     TemplateModel, KNNInterpolator
 
+    Notes
+    -----
+    .. versionchanged:: 4.19.0
+       The index attribute now maps from the parameter values to the
+       position of the template in the templates attribute, rather
+       than to the template itself.
+
     """
 
     def __init__(self,
@@ -324,7 +593,7 @@ class TemplateModel(ArithmeticModel):
             if ngot != npars:
                 raise ModelErr(f"parvals[{ii}] has length {ngot}, expected {npars}")
 
-            self.index[tuple(parval)] = templates[ii]
+            self.index[tuple(parval)] = ii
 
         ArithmeticModel.__init__(self, name, pars)
         self.is_discrete = True
@@ -337,6 +606,10 @@ class TemplateModel(ArithmeticModel):
         data : sherpa.data.Data instance
 
         """
+        if isinstance(self.templates, TemplateLibrary):
+            self.templates.fold(data)
+            return
+
         for template in self.templates:
             # FixedTemplateModel and subclasses need a fold call,
             # while InterpolatedTableModel1D does not (and doesn't have a "fold" method).
@@ -387,10 +660,12 @@ class TemplateModel(ArithmeticModel):
 
         """
         try:
-            return self.index[tuple(p)]
+            idx = self.index[tuple(p)]
         except KeyError:
             raise ModelErr("Interpolation of template parameters was disabled for this model, but parameter values not in the template library have been requested. Please use gridsearch method and make sure the sequence option is consistent with the template library") from None
 
+        return self.templates[idx]
+
     @modelCacher1d
     def calc(self, p, x0, x1=None, *args, **kwargs):
         table_model = self.query(p)
@@ -400,6 +675,260 @@ class TemplateModel(ArithmeticModel):
         return table_model(x0, x1, *args, **kwargs)
 
 
+class TemplateLibrary(Sequence):
+    """Store a set of templates as a single 2D array.
+
+    The templates are stored as rows of a 2D array, which can be a
+    memory-mapped array (see `read_template_library`), so that only
+    those templates that are used need to be read into memory. The
+    table model for a template is only created when the template is
+    accessed, and a limited number of these models are retained.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    y : 2D array
+        The dependent axis values, with one row per template.
+    x : sequence of float or None, optional
+        The independent axis values, which are shared by all the
+        templates. If set then each template is a
+        `sherpa.models.basic.InterpolatedTableModel1D` instance,
+        otherwise a `sherpa.models.basic.FixedTableModel`.
+    method : callable, optional
+        The interpolation method used when x is set.
+    name : str, optional
+        The prefix for the template names (the index of the template
+        is appended to it).
+    cache_size : int, optional
+        The maximum number of table models to retain. It must be 1
+        or greater.
+
+    See Also
+    --------
+    TemplateModel, read_template_library, write_template_library
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> from sherpa.models.template import TemplateLibrary, create_template_model
+    >>> x = [50, 100, 150, 250]
+    >>> y = np.asarray([[1, 2, 3, 4], [3, 7, 4, 8], [10, 15, 0, 12]])
+    >>> lib = TemplateLibrary(y, x=x)
+    >>> mdl = create_template_model("model", ["alpha"],
+    ...                             np.asarray([[5], [17], [25]]), lib)
+    >>> mdl.alpha = 16
+    >>> mdl(x)
+    array([3.7, 7.8, 3.6, 8.4])
+
+    """
+
+    def __init__(self, y, x=None, method=linear_interp,
+                 name='template', cache_size=128):
+        if np.ndim(y) != 2:
+            raise ModelErr(f"y must be 2D, sent {np.ndim(y)}D")
+
+        if x is not None:
+            x = np.asarray(x)
+            if x.ndim != 1 or x.size != y.shape[1]:
+                raise ModelErr(f"size mismatch between x and y: {x.size} vs {y.shape[1]}")
+
+        if cache_size < 1:
+            raise ModelErr(f"cache_size must be 1 or greater, not {cache_size}")
+
+        self.y = y
+        self.x = x
+        self.method = method
+        self.name = name
+        self.cache_size = cache_size
+        self._data = None
+        self._cache: OrderedDict[int, TableModelBase] = OrderedDict()
+
+    def __len__(self):
+        return self.y.shape[0]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        idx = int(idx)
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if idx < 0 or idx >= n:
+            raise IndexError("template index out of range")
+
+        try:
+            template = self._cache[idx]
+            self._cache.move_to_end(idx)
+            return template
+        except KeyError:
+            pass
+
+        name = f"{self.name}{idx}"
+        if self.x is None:
+            template = FixedTableModel(name, y=self.y[idx])
+            if self._data is not None:
+                template.fold(self._data)
+        else:
+            template = InterpolatedTableModel1D(name, x=self.x,
+                                                y=self.y[idx],
+                                                method=self.method)
+
+        template.ampl.freeze()
+        self._cache[idx] = template
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return template
+
+    def fold(self, data):
+        """Ensure the templates match the data filtering.
+
+        The data is retained so that templates created after this
+        call are also filtered.
+
+        Parameters
+        ----------
+        data : sherpa.data.Data instance
+
+        """
+
+        if self.x is not None:
+            return
+
+        self._data = data
+        for template in self._cache.values():
+            template.fold(data)
+
+
+def write_template_library(dirname: str,
+                           names: list[str],
+                           parvals: np.ndarray,
+                           y: np.ndarray,
+                           x: np.ndarray | None = None,
+                           clobber: bool = False) -> None:
+    """Write out a set of templates so they can be memory mapped.
+
+    The templates are stored in a directory as NumPy ``.npy`` files:
+    ``templates.npy`` contains the 2D array of dependent-axis values,
+    ``index.npy`` the parameter values for each template (as a
+    structured array whose fields are the parameter names), and
+    ``x.npy`` the independent axis, if set.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    dirname : str
+        The directory to use. It is created if it does not exist.
+    names : sequence of str
+        The parameter names.
+    parvals : ndarray
+        The parameter values, as a 2D array of shape (ntemplates,
+        npars).
+    y : ndarray
+        The template values, as a 2D array of shape (ntemplates,
+        nbins).
+    x : ndarray or None, optional
+        The independent axis, which is shared by all the templates.
+    clobber : bool, optional
+        If the library already exists, should it be over-written?
+
+    See Also
+    --------
+    read_template_library
+
+    """
+
+    parvals = np.asarray(parvals, dtype=SherpaFloat)
+    y = np.asarray(y)
+    if parvals.ndim != 2:
+        raise ValueError(f"parvals must be 2D, sent {parvals.ndim}D")
+    if y.ndim != 2:
+        raise ValueError(f"y must be 2D, sent {y.ndim}D")
+    if parvals.shape[1] != len(names):
+        raise ValueError(f"number of parvals and names do not match: {parvals.shape[1]} vs {len(names)}")
+    if parvals.shape[0] != y.shape[0]:
+        raise ValueError(f"number of parvals and templates do not match: {parvals.shape[0]} vs {y.shape[0]}")
+
+    templatefile = os.path.join(dirname, "templates.npy")
+    if not clobber and os.path.exists(templatefile):
+        raise IOErr("filefound", templatefile)
+
+    os.makedirs(dirname, exist_ok=True)
+
+    index = np.zeros(parvals.shape[0],
+                     dtype=[(name, SherpaFloat) for name in names])
+    for name, col in zip(names, parvals.T):
+        index[name] = col
+
+    np.save(templatefile, np.ascontiguousarray(y))
+    np.save(os.path.join(dirname, "index.npy"), index)
+
+    xfile = os.path.join(dirname, "x.npy")
+    if x is not None:
+        np.save(xfile, np.asarray(x))
+    elif os.path.exists(xfile):
+        os.remove(xfile)
+
+
+def read_template_library(dirname: str,
+                          method: Callable = linear_interp,
+                          mmap_mode: str | None = 'r'
+                          ) -> tuple[list[str], np.ndarray, TemplateLibrary]:
+    """Read in a set of templates written by write_template_library.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    dirname : str
+        The directory containing the library.
+    method : callable, optional
+        The interpolation method used to map the templates onto the
+        grid used to evaluate the model (only used if the
+        independent axis was saved).
+    mmap_mode : str or None, optional
+        The memory-mapping mode used to read the template values
+        (see `numpy.load`). Use ``None`` to read all the templates
+        into memory.
+
+    Returns
+    -------
+    names, parvals, templates : list of str, ndarray, TemplateLibrary
+        The arguments needed by `create_template_model`.
+
+    See Also
+    --------
+    create_template_model, write_template_library
+
+    Examples
+    --------
+
+    >>> names, parvals, templates = read_template_library("grid/")  # doctest: +SKIP
+    >>> mdl = create_template_model("mdl", names, parvals, templates)  # doctest: +SKIP
+
+    """
+
+    templatefile = os.path.join(dirname, "templates.npy")
+    if not os.path.isfile(templatefile):
+        raise IOErr("filenotfound", templatefile)
+
+    index = np.load(os.path.join(dirname, "index.npy"))
+    names = list(index.dtype.names)
+    parvals = np.asarray([index[name] for name in names],
+                         dtype=SherpaFloat).T
+
+    y = np.load(templatefile, mmap_mode=mmap_mode)
+
+    xfile = os.path.join(dirname, "x.npy")
+    x = np.load(xfile) if os.path.isfile(xfile) else None
+
+    return names, parvals, TemplateLibrary(y, x=x, method=method)
+
+
 def create_template_model(modelname: str,
                           names: list[str],
                           parvals: np.ndarray,
@@ -418,7 +947,7 @@ def create_template_model(modelname: str,
         (nelem, npars), where nelem is the number of parameter values
         and npars the number of parameters (which must match the names
         parameter).
-    templates : sequence of TableModelBase instances
+    templates : sequence of TableModelBase instances or TemplateLibrary
         The model for each set of parameters (each row of parvals).
         It must match the first dimension of parvals.
     template_interpolator_name : str or None, optional
@@ -483,7 +1012,8 @@ def reset_interpolators() -> None:
 
     d = globals()
     d["interpolators"] = {
-        'default': (Template, {'k': 2, 'order': 2})
+        'default': (Template, {'k': 2, 'order': 2}),
+        'multilinear': (MultilinearInterpolator, {})
     }
 
 
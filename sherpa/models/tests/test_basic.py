@@ -282,3 +282,77 @@ def test_tablemodel_invalid_y(cls):
             tbl.load([1, 2, "x"])
         else:
             tbl.load([3, 4, 5], [1, 2, "x"])
+
+
+def make_grid():
+    """A non-square grid, flattened with x0 varying fastest."""
+
+    x1, x0 = np.mgrid[-20:21:0.5, -30:31:0.7]
+    return x0.flatten(), x1.flatten()
+
+
+@pytest.mark.parametrize("cls,pars",
+                         [(basic.Gauss2D, {"fwhm": 7, "xpos": 1.3, "ypos": -2.2,
+                                           "ampl": 3}),
+                          (basic.Gauss2D, {"fwhm": 7, "xpos": 1.3, "ypos": -2.2,
+                                           "ellip": 0.4, "ampl": 3}),
+                          (basic.Gauss2D, {"fwhm": 7, "ellip": 0.4,
+                                           "theta": 2 * np.pi}),
+                          (basic.Gauss2D, {"fwhm": 7, "theta": 1.2}),
+                          (basic.Gauss2D, {"fwhm": 7, "ellip": 0.4, "theta": 1.2}),
+                          (basic.NormGauss2D, {"fwhm": 7, "xpos": 1.3,
+                                               "ypos": -2.2, "ellip": 0.4,
+                                               "ampl": 3}),
+                          (basic.SigmaGauss2D, {"sigma_a": 3, "sigma_b": 5,
+                                                "xpos": 1.3, "ypos": -2.2}),
+                          (basic.SigmaGauss2D, {"sigma_a": 3, "sigma_b": 3,
+                                                "theta": 0.7}),
+                          (basic.SigmaGauss2D, {"sigma_a": 3, "sigma_b": 5,
+                                                "theta": 0.7}),
+                          (basic.Polynom2D, {"c": 1, "cy1": 2, "cy2": -0.1,
+                                             "cx1": 0.3, "cx1y1": 0.01,
+                                             "cx1y2": 0.2, "cx2": -0.4,
+                                             "cx2y1": 0.05, "cx2y2": 0.001})])
+def test_2d_grid_matches_points(cls, pars):
+    """Evaluating on a grid matches the evaluation of each point."""
+
+    x0, x1 = make_grid()
+    mdl = cls()
+    for name, val in pars.items():
+        setattr(mdl, name, val)
+
+    got = mdl(x0, x1)
+    assert got.shape == x0.shape
+
+    # Evaluate the points separately, so that the grid is not used.
+    expected = np.concatenate([mdl([a], [b]) for a, b in zip(x0, x1)])
+    assert got == pytest.approx(expected, rel=1e-12, abs=1e-300)
+
+    # The order of the points should not matter
+    idx = np.random.default_rng(2734).permutation(x0.size)
+    assert mdl(x0[idx], x1[idx]) == pytest.approx(got[idx], rel=1e-12,
+                                                  abs=1e-300)
+
+
+def test_grid_axes():
+    """Check what is considered a grid."""
+
+    x0, x1 = make_grid()
+    axes = basic._grid_axes((x0, x1), {})
+    assert axes is not None
+    assert axes[0] == pytest.approx(np.arange(-30, 31, 0.7))
+    assert axes[1] == pytest.approx(np.arange(-20, 21, 0.5))
+
+    assert basic._grid_axes((x0, x1), {"x0hi": x0, "x1hi": x1}) is None
+    assert basic._grid_axes((x0, x1, x0, x1), {}) is None
+    assert basic._grid_axes((x1, x0), {}) is None
+    assert basic._grid_axes((x0[:-1], x1[:-1]), {}) is None
+
+    # A single row or column is not treated as a grid.
+    assert basic._grid_axes(([1, 2, 3, 4], [1, 1, 1, 1]), {}) is None
+    assert basic._grid_axes(([1, 1, 1, 1], [1, 2, 3, 4]), {}) is None
+
+    # Change a single coordinate.
+    x0 = x0.copy()
+    x0[-5] += 0.1
+    assert basic._grid_axes((x0, x1), {}) is None
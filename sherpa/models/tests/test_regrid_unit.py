@@ -18,6 +18,8 @@
 #  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 #
 
+import math
+import pickle
 import re
 
 import numpy as np
@@ -28,7 +30,7 @@ import pytest
 from sherpa.models.model import Model, ArithmeticModel, BinaryOpModel, \
     CompositeModel, ArithmeticConstantModel, ArithmeticFunctionModel, \
     RegriddableModel1D, RegridWrappedModel, UnaryOpModel
-from sherpa.models.basic import Box1D, Const1D, Gauss1D, \
+from sherpa.models.basic import Box1D, Const1D, Gauss1D, Gauss2D, \
     PowLaw1D, StepLo1D
 from sherpa.models.parameter import Parameter
 from sherpa.instrument import PSFModel
@@ -40,7 +42,8 @@ from sherpa.utils.err import DataErr, ModelErr
 from sherpa.utils.numeric_types import SherpaFloat
 
 from sherpa.models.regrid import ModelDomainRegridder1D, EvaluationSpace1D, \
-    EvaluationSpace2D, PointAxis, IntegratedAxis
+    EvaluationSpace2D, PointAxis, IntegratedAxis, PixelIntegrator2D, \
+    ModelDomainRegridder2D, Rebin2D, rebin_2d, rebin_no_int
 
 
 @pytest.fixture(params=[True, False])
@@ -1601,3 +1604,252 @@ def test_evaluationspace_empty_contains(cls):
     espace2 = cls()
     with pytest.raises(DataErr, match="^Axis is empty or has a size of 0$"):
         _ = espace1 in espace2
+
+
+def make_pixel_grid():
+    """A 30 by 25 grid of pixels, each 0.5 by 1."""
+
+    x1, x0 = np.mgrid[0:25, 0:30]
+    x0 = x0.flatten() * 0.5
+    x1 = x1.flatten() * 1.0
+    return x0, x1, x0 + 0.5, x1 + 1
+
+
+def gauss2d_pixels(xpos, ypos, fwhm, ampl, x0lo, x1lo, x0hi, x1hi):
+    """The exact integral of a circular Gauss2D over each pixel."""
+
+    erf = np.frompyfunc(math.erf, 1, 1)
+    sigma = fwhm / np.sqrt(8 * np.log(2))
+
+    def term(lo, hi, pos):
+        scale = sigma * np.sqrt(2)
+        vals = erf((hi - pos) / scale) - erf((lo - pos) / scale)
+        return vals.astype(float) / 2
+
+    return ampl * 2 * np.pi * sigma * sigma * \
+        term(x0lo, x0hi, xpos) * term(x1lo, x1hi, ypos)
+
+
+def make_gauss2d():
+    gmdl = Gauss2D()
+    gmdl.xpos = 7.1
+    gmdl.ypos = 12.3
+    gmdl.fwhm = 1.5
+    gmdl.ampl = 10
+    return gmdl
+
+
+@pytest.mark.parametrize("factor,tol", [(1, 0.2), (4, 0.02), (16, 2e-3)])
+def test_pixelintegrator2d(factor, tol):
+    """The accuracy improves with the oversampling factor."""
+
+    gmdl = make_gauss2d()
+    grid = make_pixel_grid()
+    expected = gauss2d_pixels(7.1, 12.3, 1.5, 10, *grid)
+
+    mdl = gmdl.oversample(factor)
+    assert isinstance(mdl, RegridWrappedModel)
+    assert mdl.name == "integrate2d(gauss2d)"
+
+    got = mdl(*grid)
+    assert got == pytest.approx(expected, abs=tol * expected.max())
+    assert got.sum() == pytest.approx(expected.sum(), rel=1e-3)
+
+
+@pytest.mark.parametrize("center", [None, (7.1, 12.3)])
+def test_pixelintegrator2d_core(center):
+    """The core pixels use a larger factor."""
+
+    gmdl = make_gauss2d()
+    grid = make_pixel_grid()
+    expected = gauss2d_pixels(7.1, 12.3, 1.5, 10, *grid)
+
+    core = PixelIntegrator2D(2, core_factor=16, core_radius=3,
+                             center=center).apply_to(gmdl)
+    fine = PixelIntegrator2D(16).apply_to(gmdl)
+    coarse = PixelIntegrator2D(2).apply_to(gmdl)
+
+    got = core(*grid)
+    x0 = (grid[0] + grid[2]) / 2
+    x1 = (grid[1] + grid[3]) / 2
+    idx = np.hypot(x0 - 7.1, x1 - 12.3) <= 3
+    assert got[idx] == pytest.approx(fine(*grid)[idx])
+    assert got[~idx] == pytest.approx(coarse(*grid)[~idx])
+
+    err_core = np.abs(got - expected).max()
+    err_coarse = np.abs(coarse(*grid) - expected).max()
+    assert err_core < err_coarse / 10
+
+
+def test_pixelintegrator2d_core_follows_model():
+    """The core moves with the model when center is not set."""
+
+    gmdl = make_gauss2d()
+    grid = make_pixel_grid()
+    mdl = gmdl.oversample(1, core_factor=16, core_radius=2)
+    mdl(*grid)
+
+    gmdl.xpos = 3.2
+    gmdl.ypos = 20.4
+    expected = gauss2d_pixels(3.2, 20.4, 1.5, 10, *grid)
+    got = mdl(*grid)
+    assert got.max() == pytest.approx(expected.max(), rel=2e-3)
+
+
+def test_pixelintegrator2d_grid_cache():
+    """The sub-pixel grid is re-created when the grid changes."""
+
+    gmdl = make_gauss2d()
+    integrator = PixelIntegrator2D(3)
+    mdl = integrator.apply_to(gmdl)
+    grid = make_pixel_grid()
+    mdl(*grid)
+    assert integrator._grid is not None
+    subgrid = integrator._subgrid
+
+    mdl(*grid)
+    assert integrator._subgrid is subgrid
+
+    newgrid = [axis + 0.25 for axis in grid]
+    expected = gauss2d_pixels(7.1, 12.3, 1.5, 10, *newgrid)
+    got = mdl(*newgrid)
+    assert integrator._subgrid is not subgrid
+    assert got == pytest.approx(expected, abs=0.05 * expected.max())
+
+
+def test_pixelintegrator2d_chunks():
+    """The evaluation can be split into chunks."""
+
+    gmdl = make_gauss2d()
+    grid = make_pixel_grid()
+    expected = gmdl.oversample(4)(*grid)
+
+    integrator = PixelIntegrator2D(4)
+    integrator.chunk_size = 100
+    integrator.cache_bytes = 0
+    got = integrator.apply_to(gmdl)(*grid)
+    assert integrator._grid is None
+    assert got == pytest.approx(expected)
+
+
+def test_pixelintegrator2d_points():
+    """Points are evaluated directly."""
+
+    gmdl = make_gauss2d()
+    x0, x1, _, _ = make_pixel_grid()
+    mdl = gmdl.oversample(4)
+    assert mdl(x0, x1) == pytest.approx(gmdl(x0, x1))
+
+
+def test_pixelintegrator2d_no_integrate():
+    """The integrate setting is respected."""
+
+    gmdl = make_gauss2d()
+    gmdl.integrate = False
+    grid = make_pixel_grid()
+    mdl = gmdl.oversample(4)
+    assert mdl(*grid) == pytest.approx(gmdl(*grid))
+
+
+@pytest.mark.parametrize("factor", [0, -2, 2.5, "x", None])
+def test_pixelintegrator2d_invalid_factor(factor):
+    with pytest.raises(ModelErr,
+                       match="^factor must be a"):
+        PixelIntegrator2D(factor)
+
+
+def rebin_no_int_loop(array, dimensions):
+    """The per-pixel version of rebin_no_int used prior to 4.19.0."""
+
+    result = np.zeros(dimensions)
+    nx, ny = array.shape
+    for j in range(nx):
+        for i in range(ny):
+            jlo = j * dimensions[0] // nx
+            ilo = i * dimensions[1] // ny
+            jhi, dj = divmod(j + 1, nx / dimensions[0])
+            ihi, di = divmod(i + 1, ny / dimensions[1])
+            dx = 1 if ihi - ilo == 0 or (ihi - ilo == 1 and di == 0) else 1 - di
+            dy = 1 if jhi - jlo == 0 or (jhi - jlo == 1 and dj == 0) else 1 - dj
+            i2 = min(dimensions[1] - 1, ilo + 1)
+            j2 = min(dimensions[0] - 1, jlo + 1)
+            result[jlo, ilo] += array[j, i] * dx * dy
+            result[j2, ilo] += array[j, i] * (1 - dy) * dx
+            result[jlo, i2] += array[j, i] * dy * (1 - dx)
+            result[j2, i2] += array[j, i] * (1 - dx) * (1 - dy)
+
+    return result
+
+
+@pytest.mark.parametrize("shape,dims",
+                         [((3, 3), (2, 2)),
+                          ((10, 7), (3, 4)),
+                          ((17, 23), (5, 23)),
+                          ((30, 30), (7, 11)),
+                          ((4, 5), (9, 11))])
+def test_rebin_no_int_matches_loop(shape, dims):
+    """The weights match the per-pixel calculation."""
+
+    rng = np.random.default_rng(9283)
+    array = rng.random(shape)
+    got = rebin_no_int(array, dimensions=dims)
+    assert got.shape == dims
+    assert got == pytest.approx(rebin_no_int_loop(array, dims))
+    assert got.sum() == pytest.approx(array.sum())
+
+
+@pytest.mark.parametrize("from_size,to_size",
+                         [(12, 12), (24, 12), (36, 12), (30, 12), (25, 10)])
+def test_rebin2d_matches_rebin_2d(from_size, to_size):
+    """Rebin2D gives the same results as rebin_2d."""
+
+    from_axis = np.linspace(0, 10, from_size)
+    to_axis = np.linspace(0, 10, to_size)
+    from_space = EvaluationSpace2D(from_axis, from_axis[:-2])
+    to_space = EvaluationSpace2D(to_axis, to_axis[:-1])
+
+    rng = np.random.default_rng(2372)
+    y = rng.random(from_size * (from_size - 2))
+    expected = rebin_2d(y, from_space, to_space)
+
+    rebin = Rebin2D(from_space, to_space)
+    assert rebin.matches(from_space, to_space)
+    assert not rebin.matches(to_space, from_space)
+    assert rebin.apply(y) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("size", [20, 30])
+def test_regridder2d_caches_mapping(size):
+    """The requested space and rebinning are re-used."""
+
+    axis = np.linspace(0, 9, size)
+    regrid = ModelDomainRegridder2D(EvaluationSpace2D(axis, axis))
+    mdl = regrid.apply_to(Gauss2D())
+
+    x1, x0 = np.mgrid[0:10, 0:10]
+    x0 = x0.flatten()
+    x1 = x1.flatten()
+    expected = rebin_2d(Gauss2D()(*regrid.grid),
+                        regrid.evaluation_space,
+                        EvaluationSpace2D(x0, x1)).ravel()
+    got = mdl(x0, x1)
+    assert got == pytest.approx(expected)
+
+    requested = regrid._requested
+    rebin = regrid._rebin
+    assert mdl(x0, x1) == pytest.approx(expected)
+    assert regrid._requested is requested
+    assert regrid._rebin is rebin
+
+    # A different grid is not re-used, even with the same size.
+    x0 = x0 * 0.8
+    with pytest.warns(UserWarning,
+                      match="^requested space and evaluation space do not overlap"):
+        assert mdl(x0, x1) == pytest.approx(np.zeros(100))
+
+    assert regrid._requested is not requested
+    assert regrid._requested[1][0] == pytest.approx(x0)
+
+    new = pickle.loads(pickle.dumps(regrid))
+    assert new._requested is None
+    assert new._rebin is None
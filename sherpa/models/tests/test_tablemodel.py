@@ -610,6 +610,55 @@ def test_cache_method(cls):
     assert y == pytest.approx([5, 12])
 
 
+def test_tablemodel_interpolates_once():
+    """The interpolated values are re-used when only ampl changes."""
+
+    calls = []
+
+    def interp(xout, xin, yin):
+        calls.append(len(xout))
+        return linear_interp(xout, xin, yin)
+
+    mdl = TableModel()
+    mdl.load([1, 2, 3], [5, 2, 12])
+    mdl.method = interp
+
+    for ampl in [1, 2, 4]:
+        mdl.ampl = ampl
+        assert mdl([1.4, 2.6]) == pytest.approx([3.8 * ampl, 8 * ampl])
+
+    assert calls == [2]
+
+    # A new grid, load, or fold call requires a re-interpolation.
+    #
+    assert mdl([1.4, 2.6, 3]) == pytest.approx([15.2, 32, 48])
+    assert calls == [2, 3]
+
+    mdl.load([1, 2, 3], [5, 2, 12])
+    mdl.method = interp
+    mdl.ampl = 2
+    assert mdl([1.4, 2.6]) == pytest.approx([7.6, 16])
+    assert calls == [2, 3, 2]
+
+    mdl.fold(Data1D("x", [1, 2, 3], [1, 1, 1]))
+    mdl.ampl = 1
+    assert mdl([1.4, 2.6]) == pytest.approx([3.8, 8])
+    assert calls == [2, 3, 2, 2]
+
+
+def test_tablemodel_old_pickle():
+    """A TableModel pickled before the grid cache was added can be used."""
+
+    mdl = TableModel()
+    mdl.load([1, 2, 3], [5, 2, 12])
+
+    # Mimic an old version of the model.
+    del mdl.__dict__["_TableModel__grid"]
+    del mdl.__dict__["_TableModel__grid_y"]
+    mdl = pickle.loads(pickle.dumps(mdl))
+    assert mdl([1.4, 2.6]) == pytest.approx([3.8, 8])
+
+
 @pytest.mark.parametrize("cls", TABLE_MODELS)
 def test_pickle_none(cls, tmp_path):
     """Can we save/restore a TableModel with no data?"""
@@ -29,9 +29,10 @@ from sherpa.data import Data1D
 from sherpa.models.basic import FixedTableModel, InterpolatedTableModel1D, Gauss1D
 from sherpa.models.parameter import Parameter
 from sherpa.models.template import Template, TemplateModel, \
+    GridInterpolator, MultilinearInterpolator, TemplateLibrary, read_template_library, write_template_library, \
     create_template_model
 from sherpa.ui.utils import Session
-from sherpa.utils.err import ModelErr
+from sherpa.utils.err import IOErr, ModelErr
 from sherpa.utils.testing import has_package_from_list, requires_data
 
 
@@ -506,6 +507,298 @@ def test_interpolate_par3(order, k, pval1, pval2, pval3, expected):
     assert tmpl(x) == pytest.approx(expected)
 
 
+@pytest.mark.parametrize("k,pval,expected",
+                         [(1, [1.5, 1], [0]),
+                          (2, [1.5, 1], [0, 1]),
+                          (3, [1.5, 1], [0, 1, 2]),
+                          (3, [1.2, 2], [0, 2, 1]),
+                          (10, [1.2, 2], [0, 2, 1, 3])])
+def test_knn_distances_ties(k, pval, expected):
+    """Templates at the same distance are ordered by index."""
+
+    x = np.asarray([2, 4, 6])
+    templates = []
+    for scale in [1, 2, 3, 4]:
+        template = InterpolatedTableModel1D()
+        template.load(x, np.ones_like(x) * scale)
+        templates.append(template)
+
+    pvals = np.asarray([[1, 1], [2, 1], [1, 3], [2, 3]])
+    tmpl = create_template_model("bob", ["pa", "pb"], pvals, templates)
+    tmpl.k = k
+
+    idx, dists = tmpl._calc_distances(pval)
+    assert idx == pytest.approx(expected)
+    assert np.all(np.diff(dists) >= 0)
+
+
+def test_knn_many_templates():
+    """Check the nearest templates are found for a large library."""
+
+    x = np.asarray([2, 4, 6])
+    rng = np.random.default_rng(3872)
+    pvals = rng.uniform(0, 10, size=(5000, 2))
+    templates = []
+    for p1, p2 in pvals:
+        template = InterpolatedTableModel1D()
+        template.load(x, p1 * x + p2)
+        templates.append(template)
+
+    tmpl = create_template_model("bob", ["pa", "pb"], pvals, templates)
+    tmpl.k = 4
+
+    point = np.asarray([4.3, 6.1])
+    dists = np.linalg.norm(pvals - point, axis=1)
+    expected = np.argsort(dists)[:4]
+
+    idx, got = tmpl._calc_distances(point)
+    assert idx == pytest.approx(expected)
+    assert got == pytest.approx(dists[expected])
+
+    weights = 1 / dists[expected]
+    yexp = weights @ (pvals[expected, 0][:, None] * x + pvals[expected, 1][:, None])
+    yexp /= weights.sum()
+
+    tmpl.pa = point[0]
+    tmpl.pb = point[1]
+    assert tmpl(x) == pytest.approx(yexp)
+
+
+def make_library_data():
+    """Templates for y = p1 * x + p2"""
+
+    x = np.asarray([2, 4, 6, 8])
+    pvals = np.asarray([[p1, p2] for p2 in [1, 2, 3] for p1 in [1, 2]])
+    y = pvals[:, 0][:, None] * x + pvals[:, 1][:, None]
+    return x, pvals, y
+
+
+@pytest.mark.parametrize("interp", [None, "default"])
+def test_template_library_matches_templates(interp):
+    """A TemplateLibrary acts like a list of InterpolatedTableModel1D."""
+
+    x, pvals, y = make_library_data()
+    templates = [InterpolatedTableModel1D(x=x, y=yrow) for yrow in y]
+    lib = TemplateLibrary(y, x=x)
+    assert len(lib) == 6
+
+    tmpl1 = create_template_model("a", ["pa", "pb"], pvals, templates,
+                                  template_interpolator_name=interp)
+    tmpl2 = create_template_model("b", ["pa", "pb"], pvals, lib,
+                                  template_interpolator_name=interp)
+
+    xgrid = [3, 5, 7]
+    for pa, pb in [(1, 1), (2, 3), (1, 2)]:
+        tmpl1.pa = pa
+        tmpl1.pb = pb
+        tmpl2.pa = pa
+        tmpl2.pb = pb
+        assert tmpl2(xgrid) == pytest.approx(tmpl1(xgrid))
+
+
+def test_template_library_is_lazy():
+    """Only the requested templates are created."""
+
+    x, pvals, y = make_library_data()
+    lib = TemplateLibrary(y, x=x, cache_size=2)
+    tmpl = create_template_model("a", ["pa", "pb"], pvals, lib,
+                                 template_interpolator_name=None)
+    assert len(lib._cache) == 0
+
+    tmpl.pa = 2
+    tmpl.pb = 3
+    assert tmpl(x) == pytest.approx(2 * x + 3)
+    assert list(lib._cache) == [5]
+
+    assert lib[0] is lib[0]
+    assert lib[-1] is lib[5]
+    assert list(lib._cache) == [0, 5]
+
+    lib[1]
+    assert list(lib._cache) == [5, 1]
+
+    with pytest.raises(IndexError):
+        lib[6]
+
+
+def test_template_library_fold():
+    """Templates without an x axis are filtered by fold."""
+
+    _, pvals, y = make_library_data()
+    lib = TemplateLibrary(y)
+    tmpl = create_template_model("a", ["pa", "pb"], pvals, lib,
+                                 template_interpolator_name=None)
+
+    d = Data1D("x", [1, 2, 3, 4], [1, 2, 3, 4])
+    d.ignore(xhi=1.5)
+
+    tmpl.pa = 2
+    tmpl.pb = 1
+    lib[0]
+    tmpl.fold(d)
+
+    # Check both a template created before and after the fold call.
+    #
+    assert lib[0]([2, 3, 4]) == pytest.approx(y[0][1:])
+    assert tmpl([2, 3, 4]) == pytest.approx(y[1][1:])
+
+
+@pytest.mark.parametrize("withx", [True, False])
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_template_library_roundtrip(withx, mmap_mode, tmp_path):
+    """Can we write out and read back in a library?"""
+
+    x, pvals, y = make_library_data()
+    outdir = str(tmp_path / "lib")
+    write_template_library(outdir, ["pa", "pb"], pvals, y,
+                           x=x if withx else None)
+
+    names, parvals, lib = read_template_library(outdir, mmap_mode=mmap_mode)
+    assert names == ["pa", "pb"]
+    assert parvals == pytest.approx(pvals)
+    assert isinstance(lib, TemplateLibrary)
+    assert lib.y == pytest.approx(y)
+    if withx:
+        assert lib.x == pytest.approx(x)
+    else:
+        assert lib.x is None
+
+    assert isinstance(lib.y, np.memmap) == (mmap_mode is not None)
+
+    tmpl = create_template_model("a", names, parvals, lib)
+    tmpl.pa = 1
+    tmpl.pb = 3
+    assert tmpl(x) == pytest.approx(x + 3)
+
+
+def test_template_library_clobber(tmp_path):
+    """The library is not over-written by default."""
+
+    x, pvals, y = make_library_data()
+    outdir = str(tmp_path)
+    write_template_library(outdir, ["pa", "pb"], pvals, y, x=x)
+    with pytest.raises(IOErr,
+                       match="^file '.*templates.npy' exists and clobber is not set$"):
+        write_template_library(outdir, ["pa", "pb"], pvals, y)
+
+    write_template_library(outdir, ["pa", "pb"], pvals, 2 * y,
+                           clobber=True)
+    _, _, lib = read_template_library(outdir)
+    assert lib.x is None
+    assert lib.y == pytest.approx(2 * y)
+
+
+def test_template_library_session(tmp_path):
+    """load_template_model accepts a template library."""
+
+    x, pvals, y = make_library_data()
+    outdir = str(tmp_path / "lib")
+    write_template_library(outdir, ["pa", "pb"], pvals, y, x=x)
+
+    s = Session()
+    s.load_template_model("tmpl", outdir)
+    tmpl = s.get_model_component("tmpl")
+    assert isinstance(tmpl, Template)
+    assert tmpl.pa.val == pytest.approx(1)
+    assert tmpl.pb.val == pytest.approx(1)
+    assert tmpl(x) == pytest.approx(x + 1)
+
+
+def test_grid_interpolator_caches_corners():
+    """The corner spectra are only requested when the cell changes."""
+
+    y = np.arange(24).reshape(6, 4) * 1.0
+    calls = []
+
+    def get_rows(rows):
+        calls.append(list(rows))
+        return y[rows]
+
+    # Use a non-trivial mapping between grid point and row.
+    #
+    index = np.asarray([[5, 4], [3, 2], [1, 0]])
+    grid = GridInterpolator([[1, 2, 3], [10, 20]], index, get_rows)
+
+    assert grid([1, 10]) == pytest.approx(y[5])
+    assert calls == [[5, 4, 3, 2]]
+
+    assert grid([1.5, 15]) == pytest.approx((y[5] + y[4] + y[3] + y[2]) / 4)
+    assert grid([1.25, 20]) == pytest.approx((3 * y[4] + y[2]) / 4)
+    assert len(calls) == 1
+
+    assert grid([2.5, 10]) == pytest.approx((y[3] + y[1]) / 2)
+    assert calls[1] == [3, 2, 1, 0]
+
+    grid.clear_cache()
+    assert grid([3, 20]) == pytest.approx(y[0])
+    assert len(calls) == 3
+
+
+def test_grid_interpolator_log():
+    """Check logarithmic interpolation and clipping to the grid."""
+
+    y = np.asarray([[1.0], [3.0]])
+    grid = GridInterpolator([[1, 100]], np.arange(2).reshape(2),
+                            lambda rows: y[rows], log=True)
+
+    assert grid([10]) == pytest.approx([2])
+    assert grid([0.5]) == pytest.approx([1])
+    assert grid([200]) == pytest.approx([3])
+
+
+@pytest.mark.parametrize("args,msg",
+                         [(([[1, 2]], np.arange(3)),
+                           r"^index has shape \(3,\), expected \(2,\)$"),
+                          (([[2, 1]], np.arange(2)),
+                           "^grid values must be in increasing order$"),
+                          (([[0, 1]], np.arange(2), True),
+                           "^grid values must be positive for logarithmic interpolation$"),
+                          (([[1, 2]], np.arange(2), [True, False]),
+                           "^log has 2 elements, expected 1$")])
+def test_grid_interpolator_invalid(args, msg):
+
+    axes, index = args[:2]
+    log = args[2] if len(args) > 2 else False
+    with pytest.raises(ModelErr, match=msg):
+        GridInterpolator(axes, index, lambda rows: rows, log=log)
+
+
+@pytest.mark.parametrize("pa,pb", [(1, 1), (1.5, 2.5), (2, 1.2), (1.9, 3)])
+def test_multilinear_interpolator(pa, pb):
+    """Linear models are recovered exactly.
+
+    The templates are sent in a random order to check the grid is
+    reconstructed.
+    """
+
+    x = np.asarray([2, 4, 6, 8])
+    pvals = np.asarray([[p1, p2] for p2 in [1, 2, 3] for p1 in [1, 2]])
+    rng = np.random.default_rng(2873)
+    pvals = pvals[rng.permutation(len(pvals))]
+    templates = [InterpolatedTableModel1D(x=x, y=p1 * x + p2)
+                 for p1, p2 in pvals]
+
+    tmpl = create_template_model("bob", ["pa", "pb"], pvals, templates,
+                                 template_interpolator_name="multilinear")
+    assert isinstance(tmpl, MultilinearInterpolator)
+
+    tmpl.pa = pa
+    tmpl.pb = pb
+    assert tmpl(x) == pytest.approx(pa * x + pb)
+    assert tmpl([3, 5]) == pytest.approx(pa * np.asarray([3, 5]) + pb)
+
+
+def test_multilinear_interpolator_not_a_grid():
+
+    x = np.asarray([2, 4, 6])
+    pvals = np.asarray([[1, 1], [2, 1], [1, 2]])
+    templates = [InterpolatedTableModel1D(x=x, y=x) for _ in pvals]
+    with pytest.raises(ModelErr,
+                       match="^The templates do not form a regular grid$"):
+        create_template_model("bob", ["pa", "pb"], pvals, templates,
+                              template_interpolator_name="multilinear")
+
+
 @pytest.mark.parametrize("pa,expected",
                          [(1, [4.8, 6, 7.6, 8.2, 10]),
                           (1.5, [10.4, 11, 16.466667, 18.516667, 24.66667]),
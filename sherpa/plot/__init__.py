@@ -87,6 +87,7 @@ from sherpa.stats import Stat, Likelihood, LeastSq, Chi2XspecVar
 from sherpa.utils import NoNewAttributesAfterInit, erf, \
     bool_cast, parallel_map, dataspace1d, histogram1d, \
     get_error_estimates, display_fields
+from sherpa.utils.parallel import multi, ncpus
 from sherpa.utils.err import ArgumentTypeErr, ConfidenceErr, \
     IdentifierErr, PlotErr, StatErr
 from sherpa.utils.numeric_types import SherpaFloat
@@ -3672,6 +3673,77 @@ class RegionProjectionWorker:
         return self.fit.calc_stat()
 
 
+class RegionProjectionStripWorker:
+    """Evaluate a strip of the RegionProjection grid.
+
+    The points are processed in order, and each fit starts from the
+    solution of the previous point, so the points should be ordered
+    so that consecutive points are neighbours on the grid (see
+    `region_strips`). The first point of the strip starts from the
+    parameter values used to create the worker.
+
+    .. versionadded:: 4.19.0
+
+    See Also
+    --------
+    RegionProjectionWorker
+
+    """
+
+    def __init__(self, worker, fit, start):
+        self.worker = worker
+        self.fit = fit
+        self.start = start
+
+    def __call__(self, points):
+        self.fit.model.thawedpars = self.start
+        return [self.worker(pars) for pars in points]
+
+
+def region_strips(nx: int, ny: int, nstrips: int) -> list[np.ndarray]:
+    """Split a grid into strips that are traversed in serpentine order.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    nx, ny : int
+        The number of columns and rows in the grid. The grid is
+        assumed to be stored in row-major order, so the point at
+        (row, column) has index ``row * nx + column``.
+    nstrips : int
+        The number of strips. It is restricted to lie between 1
+        and ny.
+
+    Returns
+    -------
+    strips : list of ndarray
+        The grid indices for each strip. A strip contains a set of
+        consecutive rows, with the column order reversed for
+        alternate rows, so that each point is a neighbour of the
+        preceding point.
+
+    Examples
+    --------
+
+    >>> region_strips(3, 4, 2)
+    [array([0, 1, 2, 5, 4, 3]), array([ 6,  7,  8, 11, 10,  9])]
+
+    """
+
+    nstrips = max(1, min(nstrips, ny))
+    edges = [int(round(i * ny / nstrips)) for i in range(nstrips + 1)]
+    cols = np.arange(nx)
+
+    strips = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        rows = [row * nx + (cols if (row - lo) % 2 == 0 else cols[::-1])
+                for row in range(lo, hi)]
+        strips.append(np.concatenate(rows))
+
+    return strips
+
+
 def return_none(cache=None):
     """dummy implementation of callback for multiprocessing"""
     return None
@@ -3755,8 +3827,11 @@ class RegionProjection(Confidence2D):
             par1.freeze()
 
             worker = RegionProjectionWorker(par0, par1, fit, otherpars)
-            results = parallel_map(worker, grid, self.numcores)
-            self.y = np.asarray(results)
+            if otherpars:
+                self.y = self._calc_strips(worker, fit, grid)
+            else:
+                results = parallel_map(worker, grid, self.numcores)
+                self.y = np.asarray(results)
 
         finally:
             # Set back data after we changed it
@@ -3770,6 +3845,34 @@ class RegionProjection(Confidence2D):
             fit.model.thawedpars = oldpars
             fit.method = oldfitmethod
 
+    def _calc_strips(self, worker, fit, grid):
+        """Fit the grid points using warm-started strips.
+
+        The grid is split into strips of consecutive rows, one per
+        process, and each strip is traversed in serpentine order so
+        that every fit starts from the solution of a neighbouring
+        point rather than the best-fit location.
+        """
+
+        nx = np.unique(self.x0).size
+        ny = grid.shape[0] // nx
+
+        ncores = ncpus if self.numcores is None else self.numcores
+        if not multi:
+            ncores = 1
+
+        strips = region_strips(nx, ny, ncores)
+        stripworker = RegionProjectionStripWorker(worker, fit,
+                                                  fit.model.thawedpars)
+        results = parallel_map(stripworker, [grid[idx] for idx in strips],
+                               ncores)
+
+        y = np.zeros(grid.shape[0], dtype=SherpaFloat)
+        for idx, res in zip(strips, results):
+            y[idx] = res
+
+        return y
+
 
 class RegionUncertaintyWorker:
     """Used to evaluate the model by RegionUncertainty.
@@ -395,6 +395,54 @@ def test_region_projection(setup_confidence):
     # setup_confidence.rp.contour()
 
 
+@pytest.mark.parametrize("nx,ny,nstrips,expected",
+                         [(3, 4, 1, [[0, 1, 2, 5, 4, 3, 6, 7, 8, 11, 10, 9]]),
+                          (3, 4, 2, [[0, 1, 2, 5, 4, 3], [6, 7, 8, 11, 10, 9]]),
+                          (2, 3, 3, [[0, 1], [2, 3], [4, 5]]),
+                          (2, 2, 5, [[0, 1], [2, 3]]),
+                          (2, 2, 0, [[0, 1, 3, 2]])])
+def test_region_strips(nx, ny, nstrips, expected):
+    """Check the serpentine ordering used by RegionProjection."""
+
+    strips = sherpaplot.region_strips(nx, ny, nstrips)
+    assert len(strips) == len(expected)
+    for got, exp in zip(strips, expected):
+        assert got == pytest.approx(exp)
+
+
+@pytest.mark.parametrize("numcores", [1, 2, 3])
+def test_region_projection_numcores(numcores, setup_confidence):
+    """The results should not depend on how the grid is split up."""
+
+    rp = setup_confidence.rp
+    rp.prepare(fac=5, nloop=(6, 5), numcores=numcores)
+    rp.calc(setup_confidence.f,
+            setup_confidence.g1.fwhm,
+            setup_confidence.g1.ampl)
+
+    ru = setup_confidence.ru
+    ru.prepare(fac=5, nloop=(6, 5))
+    ru.calc(setup_confidence.f,
+            setup_confidence.g1.fwhm,
+            setup_confidence.g1.ampl)
+
+    # The fit can only improve on the statistic found when the
+    # other parameters are held fixed.
+    #
+    assert len(rp.y) == 30
+    assert numpy.all(rp.y <= ru.y + 1e-6)
+
+    # Check against the serial version.
+    #
+    rp1 = sherpaplot.RegionProjection()
+    rp1.prepare(fac=5, nloop=(6, 5), numcores=1)
+    rp1.calc(setup_confidence.f,
+             setup_confidence.g1.fwhm,
+             setup_confidence.g1.ampl)
+
+    assert rp.y == pytest.approx(rp1.y, rel=1e-4)
+
+
 def test_region_uncertainty(setup_confidence):
     _rux0 = numpy.array(
         [12.56113491,  13.91494395,  15.268753,  16.62256204, 17.97637108,
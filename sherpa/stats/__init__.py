@@ -27,7 +27,7 @@ import warnings
 import numpy as np
 
 from sherpa import get_config
-from sherpa.data import Data, DataSimulFit
+from sherpa.data import Data, Data2DEvents, DataSimulFit
 from sherpa.models import Model, SimulFitModel
 from sherpa.utils import NoNewAttributesAfterInit, igamc
 from sherpa.utils.err import FitErr, StatErr
@@ -38,7 +38,7 @@ from . import _statfcts  # type: ignore
 __all__ = ('Stat', 'Cash', 'CStat', 'CStatNegativePenalty', 'LeastSq',
            'Chi2Gehrels', 'Chi2ConstVar', 'Chi2DataVar', 'Chi2ModVar',
            'Chi2XspecVar', 'Chi2',
-           'UserStat', 'WStat')
+           'UserStat', 'WStat', 'SparseCash')
 
 
 config = ConfigParser()
@@ -600,6 +600,117 @@ class CStatNegativePenalty(CStat):
         return d.sum() + penalty, np.sqrt(np.abs(d))
 
 
+class SparseCash(Likelihood):
+    """Poisson Log-likelihood function for event data.
+
+    This is the `Cash` statistic, but calculated so that the model
+    only has to be evaluated where there are events, which makes it
+    suitable for fitting sparse images. The data must be
+    `sherpa.data.Data2DEvents` objects.
+
+    The Cash statistic, for bins i, is
+
+        C = 2 * (sum)_i [ M(i) - D(i) log M(i) ]
+
+    As the second term is zero when D(i) is zero it can be written as
+
+        C = 2 * [ N - (sum)_j D(j) log M(j) ]
+
+    where N is the sum of the model over all the pixels of the grid
+    and j are the positions of the events, or the pixels that contain
+    events. When the events are located at the pixel centers the
+    statistic is the same as `Cash` applied to the image, and when
+    each position is a single event it is the unbinned Cash
+    statistic.
+
+    .. versionadded:: 4.19.0
+
+    See Also
+    --------
+    Cash, sherpa.data.Data2DEvents
+
+    Notes
+    -----
+    The sum over the grid is calculated separately for each additive
+    component of the model, and is only re-calculated when the
+    parameters of the component change (see
+    `sherpa.data.Data2DEvents.eval_model_integral`).
+
+    As with `Cash`, the ``truncate`` and ``trunc_value`` settings are
+    used when a model value at an event is 0 or negative.
+
+    """
+
+    def __init__(self, name: str = 'sparsecash') -> None:
+        super().__init__(name=name)
+
+    @staticmethod
+    def _calc(data, model, weight, trunc_value):
+        """Calculate the terms of the statistic for the events.
+
+        The return values are -2 (sum) D log M and, for each
+        event, the CStat term 2 [M - D + D log(D / M)], which does
+        not include the model in the pixels with no events.
+        """
+
+        if np.any(model <= 0.0):
+            if trunc_value <= 0:
+                raise StatErr("Model values are negative and truncation value is not positive")
+
+            model = np.maximum(model, trunc_value)
+
+        dlogm = data * np.log(model)
+        terms = model - data - dlogm
+        pos = data > 0
+        terms[pos] += data[pos] * np.log(data[pos])
+        if weight is not None:
+            dlogm = dlogm * weight
+            terms = terms * weight
+
+        return -2 * dlogm.sum(), 2 * terms
+
+    def _validate_inputs(self,
+                         data: Data | DataSimulFit,
+                         model: Model
+                         ) -> tuple[DataSimulFit, SimulFitModel]:
+        data, model = super()._validate_inputs(data, model)
+        for dobj in data.datasets:
+            if not isinstance(dobj, Data2DEvents):
+                raise StatErr(f"The {self.name} statistic requires "
+                              f"event data, but data set '{dobj.name}' "
+                              f"is a {type(dobj).__name__}")
+
+        return data, model
+
+    def calc_stat(self,
+                  data: Data | DataSimulFit,
+                  model: Model
+                  ) -> StatResults:
+        data, model = self._validate_inputs(data, model)
+        fitdata = data.to_fit(staterrfunc=self.calc_staterror)
+        modeldata = data.eval_model_to_fit(model)
+        stat, terms = self._calc(fitdata[0], modeldata, None,
+                                 truncation_value)
+
+        # Add the predicted number of events. The per-bin values have
+        # an extra element for each dataset, for the model in the
+        # pixels with no events, so that they can be used by the
+        # levmar optimizer.
+        #
+        extra = []
+        start = 0
+        for dobj, mdl in zip(data.datasets, model.parts):
+            integral = 2 * dobj.eval_model_integral(mdl, truncation_value)
+            end = start + len(dobj.get_dep(True))
+            mvals = np.maximum(modeldata[start:end], truncation_value)
+            extra.append(integral - 2 * mvals.sum())
+            stat += integral
+            start = end
+
+        fvec = np.sqrt(np.abs(np.concatenate((terms, extra))))
+        return stat, fvec
+
+
 class Chi2(Stat):
     """A Gaussian Log-likelihood function.
 
@@ -48,15 +48,17 @@ from numpy.testing import assert_almost_equal, assert_equal
 
 from sherpa.astro.data import DataPHA
 from sherpa.astro.instrument import create_delta_rmf
-from sherpa.data import Data1D, Data1DInt, Data2D, DataSimulFit
+from sherpa.data import Data1D, Data1DInt, Data2D, Data2DEvents, \
+    DataSimulFit
 from sherpa.models.model import SimulFitModel
-from sherpa.models.basic import Const1D, Polynom1D, FixedTableModel
+from sherpa.models.basic import Const1D, Const2D, Gauss2D, Polynom1D, \
+    Polynom2D, FixedTableModel
 from sherpa.astro.models import Lorentz2D
 from sherpa.utils.err import DataErr, FitErr, StatErr
 
 from sherpa.stats import LeastSq, Chi2, Chi2Gehrels, Chi2DataVar, \
     Chi2ConstVar, Chi2ModVar, Chi2XspecVar, Cash, CStat, \
-    CStatNegativePenalty, WStat, UserStat
+    CStatNegativePenalty, WStat, UserStat, SparseCash
 
 
 def setup_single(stat, sys):
@@ -1357,3 +1359,119 @@ def test_cstat_negative_model(stat, expected):
     statobj = stat()
     answer, _ = statobj.calc_stat(data, model)
     assert answer == pytest.approx(expected)
+
+
+def make_sparse_image():
+    """Return a sparse image as Data2D and Data2DEvents objects."""
+
+    x1, x0 = np.mgrid[1:31, 1:41]
+    img = np.zeros(x0.shape)
+    img[12, 20] = 3
+    img[13, 20] = 1
+    img[12, 21] = 2
+    img[25, 5] = 1
+
+    x0 = x0.flatten()
+    x1 = x1.flatten()
+    img = img.flatten()
+    d2 = Data2D("img", x0, x1, img, shape=(30, 40))
+
+    idx = img > 0
+    evt = Data2DEvents("evt", x0[idx], x1[idx], np.arange(1, 41),
+                       np.arange(1, 31), y=img[idx])
+    return d2, evt
+
+
+def make_sparse_model():
+    src = Gauss2D()
+    src.xpos = 20.5
+    src.ypos = 13.5
+    src.fwhm = 2
+    src.ampl = 1.5
+    bkg = Const2D()
+    bkg.c0 = 0.002
+    return src + bkg
+
+
+def test_sparsecash_matches_cash():
+    """The statistic matches Cash for binned data."""
+
+    d2, evt = make_sparse_image()
+    mdl = make_sparse_model()
+
+    expected, _ = Cash().calc_stat(d2, mdl)
+    stat, fvec = SparseCash().calc_stat(evt, mdl)
+    assert stat == pytest.approx(expected)
+
+    # The per-bin values are the CStat values (with one extra
+    # element for the empty pixels).
+    #
+    assert fvec.size == 5
+    cstat, _ = CStat().calc_stat(d2, mdl)
+    assert (fvec**2).sum() == pytest.approx(cstat)
+
+
+def test_sparsecash_filter():
+    """The filter is applied to the events and the grid."""
+
+    d2, evt = make_sparse_image()
+    mdl = make_sparse_model()
+    for d in [d2, evt]:
+        d.notice(10, 30, 5, 20)
+
+    expected, _ = Cash().calc_stat(d2, mdl)
+    stat, _ = SparseCash().calc_stat(evt, mdl)
+    assert stat == pytest.approx(expected)
+
+
+def test_sparsecash_negative_model():
+    """The model is truncated, as with Cash."""
+
+    d2, evt = make_sparse_image()
+    mdl = Polynom2D()
+    mdl.c = 0.5
+    mdl.cx1 = -0.02
+
+    expected, _ = Cash().calc_stat(d2, mdl)
+    stat, _ = SparseCash().calc_stat(evt, mdl)
+    assert stat == pytest.approx(expected)
+
+
+def test_sparsecash_unbinned():
+    """Each position is a single event."""
+
+    x0 = np.asarray([2.2, 3.7, 3.1])
+    x1 = np.asarray([1.4, 2.1, 2.9])
+    evt = Data2DEvents("evt", x0, x1, [1, 2, 3, 4], [1, 2, 3])
+    mdl = Polynom2D()
+    mdl.c = 1
+    mdl.cx1 = 0.5
+
+    gx1, gx0 = np.mgrid[1:4, 1:5]
+    expected = 2 * (mdl(gx0.flatten(), gx1.flatten()).sum() -
+                    np.log(mdl(x0, x1)).sum())
+    stat, _ = SparseCash().calc_stat(evt, mdl)
+    assert stat == pytest.approx(expected)
+
+
+def test_sparsecash_simulfit():
+    """Multiple datasets are supported."""
+
+    d2, evt = make_sparse_image()
+    mdl = make_sparse_model()
+    expected, _ = Cash().calc_stat(d2, mdl)
+
+    data = DataSimulFit("both", (evt, evt))
+    model = SimulFitModel("both", (mdl, mdl))
+    stat, fvec = SparseCash().calc_stat(data, model)
+    assert stat == pytest.approx(2 * expected)
+    assert fvec.size == 10
+
+
+def test_sparsecash_requires_events():
+
+    d2, _ = make_sparse_image()
+    with pytest.raises(StatErr,
+                       match="^The sparsecash statistic requires event data, "
+                       "but data set 'img' is a Data2D$"):
+        SparseCash().calc_stat(d2, make_sparse_model())
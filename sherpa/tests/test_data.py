@@ -19,6 +19,7 @@
 #
 
 import logging
+import pickle
 import re
 import warnings
 
@@ -27,8 +28,9 @@ import numpy
 import pytest
 
 from sherpa.data import Data, Data1D, DataSimulFit, Data1DInt, \
-    Data2D, Data2DInt, BaseData, IntegratedDataSpace2D, Filter
-from sherpa.models import Polynom1D, Polynom2D
+    Data2D, Data2DInt, Data2DEvents, BaseData, IntegratedDataSpace2D, \
+    Filter, IntervalFilter
+from sherpa.models import Const2D, Polynom1D, Polynom2D
 from sherpa.utils.err import NotImplementedErr, DataErr
 from sherpa.ui.utils import Session
 from sherpa.astro.ui.utils import Session as AstroSession
@@ -2753,3 +2755,355 @@ def test_get_filter_when_empty_1d(data_class, args):
     with pytest.raises(TypeError,
                        match=r"object of type 'NoneType' has no len\(\)"):
         _ = data.get_filter()
+
+
+def test_filter_version():
+    """The version changes when the mask is set."""
+
+    f = Filter()
+    assert f.version == 0
+
+    f.mask = True
+    assert f.version == 1
+
+    f.notice([2], [4], ([1, 2, 3, 4, 5], ))
+    assert f.version > 1
+
+
+def test_filter_version_old_pickle():
+    """A filter pickled before the version field existed can be used."""
+
+    d = Data1D("x", [1, 2, 3, 4, 5], [2, 3, 4, 5, 6])
+    d.ignore(xhi=1)
+
+    # Mimic an old version of the filter.
+    del d._data_space.filter._version
+    d = pickle.loads(pickle.dumps(d))
+    assert d._data_space.filter.version == 0
+
+    d.ignore(4, 4)
+    assert d.mask == pytest.approx([False, True, True, False, True])
+    assert d._data_space.filter.version == 1
+
+
+def test_cache_filtered_reuses_values():
+    """The filtered values are only calculated once."""
+
+    calls = []
+
+    def staterrfunc(y):
+        calls.append(len(y))
+        return numpy.sqrt(y)
+
+    d = Data1D("x", [1, 2, 3, 4], [4, 9, 16, 25])
+    d.ignore(xhi=1)
+    with d.cache_filtered():
+        y1, e1, s1 = d.to_fit(staterrfunc)
+        y2, e2, s2 = d.to_fit(staterrfunc)
+
+    assert calls == [3]
+    assert y2 is y1
+    assert e2 is e1
+    assert s1 is None
+    assert s2 is None
+    assert y1 == pytest.approx([9, 16, 25])
+    assert e1 == pytest.approx([3, 4, 5])
+
+    # The stored values are read only.
+    with pytest.raises(ValueError,
+                       match="assignment destination is read-only"):
+        y1[0] = 2
+
+    # The data itself can still be changed.
+    d.y[1] = 10
+    assert d.y == pytest.approx([4, 10, 16, 25])
+
+    # Outside the context the values are re-calculated.
+    y3, _, _ = d.to_fit(staterrfunc)
+    assert y3 == pytest.approx([10, 16, 25])
+    assert calls == [3, 3]
+
+
+@pytest.mark.parametrize("change", ["notice", "mask", "set_dep", "staterror",
+                                    "indep"])
+def test_cache_filtered_is_invalidated(change):
+    """Changing the data clears the stored values."""
+
+    d = Data1D("x", [1, 2, 3, 4], [4, 9, 16, 25])
+    mdl = Polynom1D()
+    mdl.c0 = 0
+    mdl.c1 = 1
+    with d.cache_filtered():
+        assert d.to_fit()[0] == pytest.approx([4, 9, 16, 25])
+        assert d.eval_model_to_fit(mdl) == pytest.approx([1, 2, 3, 4])
+
+        if change == "notice":
+            d.notice(2, 3)
+            y = [9, 16]
+            m = [2, 3]
+        elif change == "mask":
+            d.mask = [True, False, True, False]
+            y = [4, 16]
+            m = [1, 3]
+        elif change == "set_dep":
+            d.set_dep([1, 2, 3, 4])
+            y = [1, 2, 3, 4]
+            m = [1, 2, 3, 4]
+        elif change == "staterror":
+            d.staterror = [1, 1, 2, 2]
+            y = [4, 9, 16, 25]
+            m = [1, 2, 3, 4]
+        elif change == "indep":
+            d.indep = (numpy.asarray([2, 4, 6, 8]), )
+            y = [4, 9, 16, 25]
+            m = [2, 4, 6, 8]
+        else:
+            assert False, change
+
+        dep, staterr, _ = d.to_fit()
+        assert dep == pytest.approx(y)
+        assert d.eval_model_to_fit(mdl) == pytest.approx(m)
+
+        if change == "staterror":
+            assert staterr == pytest.approx([1, 1, 2, 2])
+        else:
+            assert staterr is None
+
+
+def test_cache_filtered_simulfit():
+    """The cache is used for each dataset."""
+
+    d1 = Data1D("x", [1, 2, 3], [4, 9, 16])
+    d2 = Data1D("y", [1, 2], [2, 3])
+    d = DataSimulFit("xy", [d1, d2])
+    with d.cache_filtered():
+        y1, _, _ = d1.to_fit()
+        y2, _, _ = d1.to_fit()
+        assert y2 is y1
+        assert d.to_fit()[0] == pytest.approx([4, 9, 16, 2, 3])
+
+    assert d1.to_fit()[0] is not y1
+
+
+@pytest.mark.parametrize("integrated", [False, True])
+def test_interval_filter_matches_filter(integrated):
+    """The interval and mask representations agree."""
+
+    rng = numpy.random.default_rng(3273)
+    xlo = numpy.sort(rng.integers(0, 20, size=40)).astype(float)
+    axes = (xlo, xlo + 1) if integrated else (xlo, )
+
+    for _ in range(50):
+        f1 = Filter()
+        f2 = IntervalFilter()
+        for _ in range(6):
+            lo, hi = rng.choice([None, *range(-2, 23)], size=2)
+            ignore = bool(rng.integers(2))
+            if integrated:
+                args = ([None, lo], [hi, None], axes)
+            else:
+                args = ([lo], [hi], axes)
+
+            f1.notice(*args, ignore=ignore, integrated=integrated)
+            f2.notice(*args, ignore=ignore, integrated=integrated)
+            if numpy.isscalar(f1.mask):
+                assert f2.mask is f1.mask
+            else:
+                assert f2.mask == pytest.approx(f1.mask)
+
+
+def test_interval_filter_unsorted():
+    """An unsorted axis uses the mask."""
+
+    f = IntervalFilter()
+    f.notice([2], [4], ([1, 2, 3, 4, 5], ))
+    assert f.intervals == pytest.approx(numpy.asarray([[1, 4]]))
+
+    version = f.version
+    f.notice([5], [5], ([5, 4, 3, 2, 1], ))
+    assert f.intervals is None
+    assert f.mask == pytest.approx([True, True, True, True, False])
+    assert f.version > version
+
+
+def test_interval_filter_mask_changed_in_place():
+    """The mask can be changed in place, which removes the ranges."""
+
+    xs = numpy.arange(1, 11)
+    f = IntervalFilter()
+    f.notice([2], [8], (xs, ))
+    mask = f.mask
+    assert mask.flags.writeable
+    mask[4] = False
+    assert f.mask[4] == False
+    assert f.intervals is None
+
+    # Further filters build on the changed mask.
+    f.notice([7], [7], (xs, ), ignore=True)
+    assert f.mask == pytest.approx([False, True, True, True, False,
+                                    True, False, True, False, False])
+    assert f.intervals == pytest.approx(numpy.asarray([[1, 4], [5, 6], [7, 8]]))
+
+
+def test_data1d_use_interval_filter():
+    """The filter can be changed and get_filter is unchanged."""
+
+    x = numpy.arange(0.4, 2.6, 0.2)
+    d1 = Data1D("x", x, numpy.ones_like(x))
+    d2 = Data1D("x", x, numpy.ones_like(x))
+    d1.ignore(1.5, 1.7)
+    d2.ignore(1.5, 1.7)
+    d2.use_interval_filter()
+    assert d2.mask == pytest.approx(d1.mask)
+
+    for d in [d1, d2]:
+        d.notice(0.8, 1.2)
+        d.ignore(1.1, 1.1)
+        d.ignore(2.2, None)
+        d.notice(2.4, 3)
+
+    assert d2.get_filter(format="%.1f") == "0.4:1.4,1.8:2.0,2.4"
+    assert d2.get_filter(format="%.1f") == d1.get_filter(format="%.1f")
+    assert d2.get_dep(filter=True) == pytest.approx(d1.get_dep(filter=True))
+
+    # Changing the mask directly is supported.
+    d2.mask = d1.mask
+    assert d2.get_filter(format="%.1f") == d1.get_filter(format="%.1f")
+
+    d2.use_interval_filter(False)
+    assert type(d2._data_space.filter) is Filter
+    assert d2.mask == pytest.approx(d1.mask)
+
+
+
+def make_events():
+    """Three events on a 4 by 3 grid."""
+
+    return Data2DEvents("evt", [1, 3, 3], [10, 10, 12],
+                        [1, 2, 3, 4], [10, 11, 12], y=[2, 1, 4])
+
+
+def test_data2devents_create():
+
+    evt = make_events()
+    assert evt.y == pytest.approx([2, 1, 4])
+    assert evt.x0grid == pytest.approx([1, 2, 3, 4])
+    assert evt.x1grid == pytest.approx([10, 11, 12])
+    assert evt.shape is None
+
+    x0, x1 = evt.get_grid()
+    assert x0 == pytest.approx([1, 2, 3, 4] * 3)
+    assert x1 == pytest.approx([10] * 4 + [11] * 4 + [12] * 4)
+
+
+def test_data2devents_default_counts():
+
+    evt = Data2DEvents("evt", [1.2, 3.5], [10.1, 11.7], [1, 2, 3, 4],
+                       [10, 11, 12])
+    assert evt.y == pytest.approx([1, 1])
+
+
+@pytest.mark.parametrize("x0grid,x1grid,label",
+                         [([], [1, 2], "x0grid"),
+                          ([1, 2], [[1, 2]], "x1grid")])
+def test_data2devents_invalid_grid(x0grid, x1grid, label):
+
+    with pytest.raises(DataErr,
+                       match=f"^{label} must be a one-dimensional array$"):
+        Data2DEvents("evt", [1], [1], x0grid, x1grid)
+
+
+def test_data2devents_notice():
+    """The filter is applied to the events and the grid."""
+
+    evt = make_events()
+    evt.notice(2, 4, 10, 11)
+    assert evt.get_dep(filter=True) == pytest.approx([1])
+
+    x0, x1 = evt.get_grid(filter=True)
+    assert x0 == pytest.approx([2, 3, 4, 2, 3, 4])
+    assert x1 == pytest.approx([10, 10, 10, 11, 11, 11])
+
+    evt.ignore(None, None, 11, None)
+    assert evt.grid_mask.sum() == 3
+    assert evt.eval_model_integral(Const2D()) == pytest.approx(3)
+
+    evt.notice()
+    assert evt.grid_mask is True
+    assert evt.eval_model_integral(Const2D()) == pytest.approx(12)
+
+
+CALLS = []
+
+
+class CountingConst2D(Const2D):
+    """Record the size of each evaluation."""
+
+    def calc(self, p, x0, x1, *args, **kwargs):
+        CALLS.append(len(x0))
+        return super().calc(p, x0, x1, *args, **kwargs)
+
+
+def test_data2devents_integral_cache():
+    """Only the components that have changed are evaluated."""
+
+    evt = make_events()
+    mdl1 = CountingConst2D("m1")
+    mdl2 = CountingConst2D("m2")
+    mdl1.cache = 0
+    mdl2.cache = 0
+    mdl2.c0 = 2
+    mdl = mdl1 + mdl2
+
+    CALLS.clear()
+    assert evt.eval_model_integral(mdl) == pytest.approx(36)
+    assert CALLS == [12, 12]
+
+    assert evt.eval_model_integral(mdl) == pytest.approx(36)
+    assert CALLS == [12, 12]
+
+    mdl2.c0 = 3
+    assert evt.eval_model_integral(mdl) == pytest.approx(48)
+    assert CALLS == [12, 12, 12]
+
+    # The previous value is still available
+    mdl2.c0 = 2
+    assert evt.eval_model_integral(mdl) == pytest.approx(36)
+    assert CALLS == [12, 12, 12]
+
+    evt.clear_integral_cache()
+    assert evt.eval_model_integral(mdl) == pytest.approx(36)
+    assert CALLS == [12, 12, 12, 12, 12]
+
+    # Changing the filter means the values are re-calculated.
+    evt.notice(2, 3)
+    assert evt.eval_model_integral(mdl) == pytest.approx(18)
+    assert CALLS == [12, 12, 12, 12, 12, 6, 6]
+
+
+def test_data2devents_integral_truncated():
+    """Negative model values are replaced when trunc_value is set."""
+
+    evt = make_events()
+    mdl = Polynom2D()
+    mdl.c = 10.5
+    mdl.cy1 = -1
+
+    assert evt.eval_model_integral(mdl) == pytest.approx(-6)
+    assert evt.eval_model_integral(mdl, trunc_value=0.1) == \
+        pytest.approx(4 * (0.5 + 0.1 + 0.1))
+
+
+def test_data2devents_pickle():
+    """The cached values are not pickled."""
+
+    evt = make_events()
+    evt.eval_model_integral(Const2D())
+    evt.get_grid(filter=True)
+    assert len(evt._integral_cache) == 1
+
+    new = pickle.loads(pickle.dumps(evt))
+    assert new._integral_cache == {}
+    assert new._grid_cache is None
+    assert new.y == pytest.approx([2, 1, 4])
+    assert new.eval_model_integral(Const2D()) == pytest.approx(12)
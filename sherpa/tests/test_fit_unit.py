@@ -96,19 +96,20 @@ import numpy as np
 
 import pytest
 
-from sherpa.fit import Fit, StatInfoResults
-from sherpa.data import Data1D, Data2D, DataSimulFit
+from sherpa.fit import Fit, StatInfoResults, _pyramid_level
+from sherpa.data import Data1D, Data2D, Data2DEvents, DataSimulFit
 from sherpa.astro.data import DataPHA
 from sherpa.astro.instrument import create_delta_rmf
+from sherpa.instrument import PSFModel
 from sherpa.models.model import SimulFitModel
-from sherpa.models.basic import Const1D, Const2D, Gauss1D, Polynom1D,\
-    Scale1D, StepLo1D
+from sherpa.models.basic import Const1D, Const2D, Gauss1D, Gauss2D, \
+    Polynom1D, Scale1D, StepLo1D
 from sherpa.utils.err import DataErr, EstErr, FitErr, StatErr, SherpaErr
 from sherpa.utils import poisson_noise
 
 from sherpa.stats import LeastSq, Chi2, Chi2Gehrels, Chi2DataVar, \
     Chi2ConstVar, Chi2ModVar, Chi2XspecVar, Likelihood, \
-    Cash, CStat, WStat, UserStat
+    Cash, CStat, WStat, UserStat, SparseCash
 
 from sherpa.optmethods import LevMar, NelderMead, MonCar
 from sherpa.estmethods import Covariance, Confidence
@@ -2475,15 +2476,19 @@ def test_fit_iterfit_single_sigmarej_chi2gehrels():
     assert fr.dof == 4
 
 
-def test_fit_iterfit_single_sigmarej_ignore_chi2gehrels():
+@pytest.mark.parametrize("interval", [False, True])
+def test_fit_iterfit_single_sigmarej_ignore_chi2gehrels(interval):
     """Very limited test of iterated-fit code.
 
     This ignores some data before the fit since this checks
-    logic that is not tested above.
+    logic that is not tested above. The sigmarej code changes
+    the mask in place, which has to work with the interval filter.
     """
 
     statobj = Chi2Gehrels()
     fit = setup_single_iter(statobj, sigmarej=True)
+    if interval:
+        fit.data.use_interval_filter()
 
     fit.data.ignore(4, 6)
     fit.data.staterror = None
@@ -2509,6 +2514,147 @@ def test_fit_iterfit_single_sigmarej_ignore_chi2gehrels():
     assert fr.dof == 3
 
 
+def setup_pyramid(factors=(4, 2)):
+    """Create an image and model for testing the pyramid method."""
+
+    rng = np.random.default_rng(2371)
+    x1, x0 = np.mgrid[1:49, 1:65]
+    x0 = x0.flatten()
+    x1 = x1.flatten()
+
+    src = Gauss2D("src")
+    bkg = Const2D("bkg")
+    mdl = src + bkg
+
+    src.xpos = 38
+    src.ypos = 20
+    src.fwhm = 6
+    src.ampl = 20
+    bkg.c0 = 1
+    img = rng.poisson(mdl(x0, x1)).astype(float)
+
+    src.xpos = 30
+    src.ypos = 28
+    src.fwhm = 10
+    src.ampl = 5
+    bkg.c0 = 2
+
+    data = Data2D("img", x0, x1, img, shape=(48, 64))
+    if factors is None:
+        iopts = None
+    else:
+        iopts = {'name': 'pyramid', 'factors': factors}
+
+    return Fit(data, mdl, stat=Cash(), itermethod_opts=iopts)
+
+
+def test_pyramid_level():
+    """Check the block-summed image."""
+
+    x1, x0 = np.mgrid[1:4, 1:6]
+    y = np.arange(15)
+    data = Data2D("img", x0.flatten(), x1.flatten(), y, shape=(3, 5),
+                  staterror=np.ones(15))
+
+    # The leading row and column are dropped.
+    level = _pyramid_level(data, 2)
+    assert level.shape == (1, 2)
+    assert level.x0 == pytest.approx([2.5, 4.5])
+    assert level.x1 == pytest.approx([2.5, 2.5])
+    assert level.y == pytest.approx([6 + 7 + 11 + 12, 8 + 9 + 13 + 14])
+    assert level.staterror == pytest.approx([2, 2])
+    assert level.syserror is None
+    assert level.mask is True
+
+    # A block is only noticed when all its pixels are.
+    data.notice(x0hi=4)
+    level = _pyramid_level(data, 2)
+    assert level.mask == pytest.approx([True, False])
+
+    assert _pyramid_level(data, 4) is None
+
+
+@pytest.mark.parametrize("method", [LevMar, NelderMead])
+def test_fit_iterfit_pyramid(method):
+    """The pyramid fit should match the normal fit."""
+
+    fit1 = setup_pyramid(factors=None)
+    fit1.method = method()
+    res1 = fit1.fit()
+    assert res1.succeeded
+
+    fit2 = setup_pyramid()
+    fit2.method = method()
+    res2 = fit2.fit()
+    assert res2.succeeded
+
+    assert res2.statval == pytest.approx(res1.statval)
+    assert res2.parvals == pytest.approx(res1.parvals, rel=1e-3)
+    assert res2.numpoints == 48 * 64
+
+
+def test_fit_iterfit_pyramid_filter():
+    """Check a filtered image can be used."""
+
+    fit1 = setup_pyramid(factors=None)
+    fit1.data.notice(x0lo=20, x1hi=40)
+    res1 = fit1.fit()
+
+    fit2 = setup_pyramid(factors=[2, 3])
+    fit2.data.notice(x0lo=20, x1hi=40)
+    res2 = fit2.fit()
+
+    assert res2.statval == pytest.approx(res1.statval)
+    assert res2.parvals == pytest.approx(res1.parvals, rel=1e-3)
+    assert res2.numpoints == res1.numpoints
+
+
+def test_fit_iterfit_pyramid_skips_small_levels():
+    """Levels larger than the image are skipped."""
+
+    fit1 = setup_pyramid(factors=None)
+    res1 = fit1.fit()
+
+    fit2 = setup_pyramid(factors=[64])
+    res2 = fit2.fit()
+
+    assert res2.nfev == res1.nfev
+    assert res2.parvals == pytest.approx(res1.parvals)
+
+
+@pytest.mark.parametrize("factors,emsg",
+                         [(2, "'factors' value for pyramid method must be a sequence of integers"),
+                          ([2.5], "'factors' value for pyramid method must be a sequence of integers"),
+                          ([4, 1], "'factors' values must be greater than one")])
+def test_fit_iterfit_pyramid_invalid_factors(factors, emsg):
+
+    fit = setup_pyramid(factors=factors)
+    with pytest.raises(FitErr, match=f"^{emsg}$"):
+        fit.fit()
+
+
+def test_fit_iterfit_pyramid_needs_image():
+
+    data = Data1D("x", [1, 2, 3, 4, 5], [2, 4, 12, 3, 4])
+    iopts = {'name': 'pyramid', 'factors': [2]}
+    fit = Fit(data, Const1D(), stat=Cash(), itermethod_opts=iopts)
+    with pytest.raises(FitErr,
+                       match="^The pyramid method requires image data, but data set 'x' is a Data1D$"):
+        fit.fit()
+
+
+def test_fit_iterfit_pyramid_no_convolution():
+
+    fit = setup_pyramid()
+    psf = PSFModel("psf", Gauss2D("kern"))
+    psf.fold(fit.data)
+    fit.model = psf(fit.model)
+    fit._iterfit.model = SimulFitModel("simulfit model", (fit.model, ))
+    with pytest.raises(FitErr,
+                       match="^The pyramid method can not be used with the convolution model 'psf"):
+        fit.fit()
+
+
 def test_wstat_rstat_qval_fields_not_none():
     """It turns out there are other tests that check if rstat/qval
     are populated, but leave these in.
@@ -3466,3 +3612,43 @@ def test_change_stat_after_fit_object_creation():
     # While both converge, the statval is obviously different.
     assert res_ls.statval != res_chig.statval
     assert res_ls.statname != res_chig.statname
+
+
+@pytest.mark.parametrize("method", [LevMar, NelderMead])
+def test_fit_sparsecash_matches_cash(method):
+    """Fitting the events gives the same result as the image."""
+
+    rng = np.random.default_rng(8723)
+    x1, x0 = np.mgrid[1:61, 1:81]
+    x0 = x0.flatten()
+    x1 = x1.flatten()
+
+    src = Gauss2D()
+    bkg = Const2D()
+    mdl = src + bkg
+
+    def set_pars(xpos, ypos, fwhm, c0):
+        src.xpos = xpos
+        src.ypos = ypos
+        src.fwhm = fwhm
+        src.ampl = 2
+        bkg.c0 = c0
+
+    set_pars(42, 28, 4, 0.01)
+    img = rng.poisson(mdl(x0, x1)).astype(float)
+    idx = img > 0
+
+    d2 = Data2D("img", x0, x1, img, shape=(60, 80))
+    evt = Data2DEvents("evt", x0[idx], x1[idx], np.arange(1, 81),
+                       np.arange(1, 61), y=img[idx])
+
+    set_pars(40, 30, 5, 0.02)
+    res1 = Fit(d2, mdl, Cash(), method()).fit()
+    assert res1.succeeded
+
+    set_pars(40, 30, 5, 0.02)
+    res2 = Fit(evt, mdl, SparseCash(), method()).fit()
+    assert res2.succeeded
+
+    assert res2.statval == pytest.approx(res1.statval)
+    assert res2.parvals == pytest.approx(res1.parvals, rel=1e-3)
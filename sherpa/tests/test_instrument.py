@@ -23,6 +23,7 @@ Add tests for sherpa.instrument that are not covered elsewhere.
 """
 
 import logging
+import pickle
 
 import numpy as np
 
@@ -32,7 +33,7 @@ from sherpa.data import Data1D, Data2D
 from sherpa.instrument import Kernel, PSFModel, RadialProfileKernel, \
     ConvolutionKernel, PSFKernel
 from sherpa.models.basic import Box1D, Box2D, Const1D, Const2D, Gauss1D, \
-    StepLo1D, FixedTableModel
+    Gauss2D, StepLo1D, FixedTableModel
 from sherpa.utils.err import PSFErr
 
 
@@ -1013,3 +1014,149 @@ def test_psfmodel_get_kernel_no_subkernel():
     assert response.name == "kernel"
     assert response.x == pytest.approx([1, 2, 3])
     assert response.y == pytest.approx([7, 2, 1])
+
+
+def make_cutout_data(xlo, xhi, ylo, yhi):
+    """A 2D dataset with a rectangle noticed, with a hole in it."""
+
+    x1, x0 = np.mgrid[1:51, 1:61]
+    shape = x0.shape
+    data = Data2D("cutout", x0.flatten(), x1.flatten(),
+                  np.ones(x0.size), shape=shape)
+
+    mask = (x0 >= xlo) & (x0 <= xhi) & (x1 >= ylo) & (x1 <= yhi)
+    mask[(x0 == (xlo + xhi) // 2) & (x1 == (ylo + yhi) // 2)] = False
+    data.mask = mask.flatten()
+    return data
+
+
+def eval_cutout(data, cutout, src=None):
+    """Evaluate a convolved model to the filtered data."""
+
+    if src is None:
+        src = Gauss2D()
+        src.xpos = 30
+        src.ypos = 23
+        src.fwhm = 4
+        src.ampl = 100
+
+    kernel = Gauss2D("k")
+    kernel.xpos = 30
+    kernel.ypos = 25
+    kernel.fwhm = 3
+    psf = PSFModel("psf", kernel)
+    psf.size = [7, 9]
+    psf.cutout = cutout
+    psf.fold(data)
+    return psf, psf(src)
+
+
+def test_psfmodel_cutout():
+    """The cutout gives the same answer as using all the data."""
+
+    data = make_cutout_data(25, 35, 20, 26)
+    psf1, mdl1 = eval_cutout(data, False)
+    psf2, mdl2 = eval_cutout(data, True)
+    expected = data.eval_model_to_fit(mdl1)
+    got = data.eval_model_to_fit(mdl2)
+    assert got.size == data.mask.sum()
+    assert got == pytest.approx(expected)
+    assert expected.max() > 1
+
+    assert psf1.model._cutout is False
+    idx, cshape, cmask, cargs = psf2.model._cutout
+
+    # The cutout is padded by 6 pixels in x and 8 in y (in the order
+    # used for dshape).
+    assert cshape == (23, 23)
+    assert cmask.sum() == got.size
+
+    # Check the cached values (the kernel FFT depends on the grid
+    # size) and that the full grid can be evaluated.
+    #
+    assert data.eval_model_to_fit(mdl2) == pytest.approx(expected)
+
+    x0, x1 = data.get_indep()
+    assert mdl2(x0, x1) == pytest.approx(mdl1(x0, x1))
+
+
+@pytest.mark.parametrize("xlo,xhi,ylo,yhi",
+                         [(3, 10, 20, 26),  # too close to the edge
+                          (5, 55, 10, 40)])  # too large
+def test_psfmodel_cutout_not_used(xlo, xhi, ylo, yhi):
+    """The cutout is not used when it could change the results."""
+
+    data = make_cutout_data(xlo, xhi, ylo, yhi)
+    _, mdl1 = eval_cutout(data, False)
+    psf2, mdl2 = eval_cutout(data, True)
+    expected = data.eval_model_to_fit(mdl1)
+    assert data.eval_model_to_fit(mdl2) == pytest.approx(expected)
+    assert psf2.model._cutout is False
+
+
+@pytest.mark.parametrize("fold", [False, True])
+def test_psfmodel_cutout_table_model(fold):
+    """The cutout is not used when the model depends on the grid size."""
+
+    data = make_cutout_data(25, 35, 20, 26)
+    x0, x1 = data.get_indep()
+    src = FixedTableModel()
+    src.load(x0 * 10 + x1)
+    if fold:
+        src.fold(data)
+
+    _, mdl1 = eval_cutout(data, False, src=src)
+    psf2, mdl2 = eval_cutout(data, True, src=src)
+    expected = data.eval_model_to_fit(mdl1)
+    assert data.eval_model_to_fit(mdl2) == pytest.approx(expected)
+    assert psf2.model._cutout is False
+
+
+def test_psfmodel_cutout_full_grid_model():
+    """A model that returns the values for all pixels is supported."""
+
+    data = make_cutout_data(25, 35, 20, 26)
+    x0, x1 = data.get_indep()
+    vals = x0 * 10 + x1
+
+    def src(*args):
+        return vals
+
+    _, mdl1 = eval_cutout(data, False, src=src)
+    psf2, mdl2 = eval_cutout(data, True, src=src)
+    expected = data.eval_model_to_fit(mdl1)
+    assert data.eval_model_to_fit(mdl2) == pytest.approx(expected)
+    assert psf2.model._cutout is not False
+
+
+def test_psfmodel_cutout_model_error():
+    """An error when evaluating the model on the cutout is not hidden."""
+
+    data = make_cutout_data(25, 35, 20, 26)
+
+    def src(x0, x1):
+        if len(x0) != data.size:
+            raise ValueError("not the full grid")
+
+        return x0 * 10 + x1
+
+    _, mdl = eval_cutout(data, True, src=src)
+    with pytest.raises(ValueError, match="^not the full grid$"):
+        data.eval_model_to_fit(mdl)
+
+
+def test_psfkernel_old_pickle():
+    """A folded PSF pickled before the cutout fields were added can be used."""
+
+    data = make_cutout_data(25, 35, 20, 26)
+    _, mdl1 = eval_cutout(data, False)
+    expected = data.eval_model_to_fit(mdl1)
+
+    psf, mdl = eval_cutout(data, True)
+
+    # Mimic an old version of the kernel.
+    for key in ["cutout", "_cutout", "_conv_dshape"]:
+        del psf.model.__dict__[key]
+
+    mdl = pickle.loads(pickle.dumps(mdl))
+    assert data.eval_model_to_fit(mdl) == pytest.approx(expected)
@@ -57,7 +57,7 @@ import sherpa.models.model
 from sherpa.models.model import Model, SimulFitModel
 from sherpa.models.parameter import Parameter
 from sherpa.models.template import add_interpolator, create_template_model, \
-    reset_interpolators
+    read_template_library, reset_interpolators
 import sherpa.optmethods
 from sherpa.optmethods import OptMethod
 import sherpa.plot
@@ -297,9 +297,14 @@ def report_filter_change(idstr: str,
 def notice_data_range(get_data: Callable[[IdType], Data],
                       ids: IdTypes,
                       lo, hi,
-                      kwargs) -> None:
+                      kwargs,
+                      notice_all: Callable[..., None] | None = None
+                      ) -> None:
     """Filter each dataset and report the change in filter.
 
+    .. versionchanged:: 4.19.0
+       The notice_all argument has been added.
+
     Parameters
     ----------
     get_data : callable
@@ -314,6 +319,10 @@ def notice_data_range(get_data: Callable[[IdType], Data],
         The extra arguments to pass to the Data `notice`, and
         the "bkg_id" identifier if the data to be filtered is a
         background PHA component instead.
+    notice_all : callable or None, optional
+        If set, it is called with the list of datasets, lo, hi, and
+        the extra arguments, to filter all the datasets in one go,
+        otherwise the `notice` method of each dataset is used.
 
     Notes
     -----
@@ -330,6 +339,7 @@ def notice_data_range(get_data: Callable[[IdType], Data],
     #
     bkg_id = kwargs.pop("bkg_id", None)
 
+    todo = []
     for idval in ids:
         idstr = f"dataset {idval}"
         data = get_data(idval)
@@ -337,8 +347,9 @@ def notice_data_range(get_data: Callable[[IdType], Data],
             data = data.get_background(bkg_id)
             idstr += f": background {bkg_id}"
 
-        ofilter = _get_filter(data)
-        data.notice(lo, hi, **kwargs)
+        todo.append((idstr, data))
+
+    def report(idstr, data, ofilter):
         nfilter = _get_filter(data)
 
         try:
@@ -349,6 +360,19 @@ def notice_data_range(get_data: Callable[[IdType], Data],
 
         report_filter_change(idstr, ofilter, nfilter, xlabel)
 
+    if notice_all is None:
+        for idstr, data in todo:
+            ofilter = _get_filter(data)
+            data.notice(lo, hi, **kwargs)
+            report(idstr, data, ofilter)
+
+        return
+
+    ofilters = [_get_filter(data) for _, data in todo]
+    notice_all([data for _, data in todo], lo, hi, **kwargs)
+    for (idstr, data), ofilter in zip(todo, ofilters):
+        report(idstr, data, ofilter)
+
 
 @overload
 def calc_multiplot_size(rows: int,
@@ -445,7 +469,9 @@ def read_template_model(modelname, templatefile,
        The identifier for this table model.
     templatefile : str
        The name of the file to read in. This file lists the template
-       data files.
+       data files. It can also be the name of a directory created by
+       `sherpa.models.template.write_template_library`, in which case
+       the templates are memory mapped rather than read in.
     sep : str, optional
        The separator character. The default is ``' '``.
     comment : str, optional
@@ -467,6 +493,13 @@ def read_template_model(modelname, templatefile,
 
     """
 
+    if os.path.isdir(templatefile):
+        parnames, parvals, templates = read_template_library(templatefile,
+                                                             method=method)
+        return create_template_model(modelname, parnames, parvals,
+                                     templates,
+                                     template_interpolator_name=template_interpolator_name)
+
     if sherpa.utils.is_binary_file(templatefile):
         raise IOErr("notascii", templatefile)
 
@@ -955,7 +988,9 @@ class Session(NoNewAttributesAfterInit):
                                           'maxiters': 5,
                                           'hrej': 3,
                                           'lrej': 3,
-                                          'grow': 0}}
+                                          'grow': 0},
+                             'pyramid': {'name': 'pyramid',
+                                         'factors': (4, 2)}}
 
         self._stats: dict[str, Stat] = {}
         self._estmethods: dict[str, EstMethod] = {}
@@ -2656,7 +2691,7 @@ class Session(NoNewAttributesAfterInit):
 
         Returns
         -------
-        name : {'none', 'sigmarej'}
+        name : {'none', 'pyramid', 'sigmarej'}
            The name of the iterative fitting scheme set by
            `set_iter_method`.
 
@@ -2750,7 +2785,7 @@ class Session(NoNewAttributesAfterInit):
         --------
 
         >>> list_iter_methods()
-        ['none', 'sigmarej']
+        ['none', 'pyramid', 'sigmarej']
 
         """
         keys = list(self._itermethods.keys())
@@ -2765,15 +2800,19 @@ class Session(NoNewAttributesAfterInit):
         Control whether an iterative scheme should be applied to
         the fit.
 
+        .. versionchanged:: 4.19.0
+           The "pyramid" scheme has been added.
+
         .. versionchanged:: 4.14.1
            The "primini" scheme has been removed from Sherpa.
 
         Parameters
         ----------
-        meth : { 'none', 'sigmarej' }
+        meth : { 'none', 'pyramid', 'sigmarej' }
            The name of the scheme used during the fit; 'none' means no
-           scheme is used. It is only valid to change the scheme
-           when a chi-square statistic is in use.
+           scheme is used. The 'sigmarej' scheme is only valid when a
+           chi-square statistic is in use, and the 'pyramid' scheme
+           is only valid for image data.
 
         Raises
         ------
@@ -2824,6 +2863,13 @@ class Session(NoNewAttributesAfterInit):
         has converged. The error removal can be asymmetric, since
         there are separate parameters for the lower and upper limits.
 
+        The ``pyramid`` scheme first fits block-summed versions of
+        the images, starting with the largest block size, and uses
+        the best-fit parameters of each fit as the starting point of
+        the next, ending with a fit of the original image. This can
+        reduce the time taken to fit large images, since most of the
+        model evaluations are made on the smaller images.
+
         References
         ----------
 
@@ -2902,6 +2948,14 @@ class Session(NoNewAttributesAfterInit):
            value is ``0`` then the fit will run until it has
            converged.
 
+        The supported fields for the ``pyramid`` scheme are:
+
+        factors
+           The block sizes used to create the coarse images. Each
+           value must be an integer greater than 1, and they are
+           fit from largest to smallest. Levels where the image is
+           smaller than the block size are skipped.
+
         Examples
         --------
 
@@ -2913,6 +2967,13 @@ class Session(NoNewAttributesAfterInit):
         >>> set_iter_method_opt('hrej', 5)
         >>> fit()
 
+        Fit the image after fitting versions binned by 8, 4, and
+        then 2 pixels:
+
+        >>> set_iter_method('pyramid')
+        >>> set_iter_method_opt('factors', [8, 4, 2])
+        >>> fit()
+
         """
         _check_str_type(optname, "optname")
         if (optname not in self._current_itermethod or
@@ -2954,6 +3015,7 @@ class Session(NoNewAttributesAfterInit):
          'cstat',
          'cstatnegativepenalty',
          'leastsq',
+         'sparsecash',
          'userstat',
          'wstat']
 
@@ -3058,6 +3120,9 @@ class Session(NoNewAttributesAfterInit):
         the numerical measure that determines how closely the model
         represents the data.
 
+        .. versionchanged:: 4.19.0
+           The sparsecash statistic has been added.
+
         .. versionchanged:: 4.18.0
            The cstatnegativepenalty statistic has been added.
 
@@ -3135,6 +3200,11 @@ class Session(NoNewAttributesAfterInit):
            The least-squares statisic (the error is not used in this
            statistic).
 
+        sparsecash
+           The cash statistic for `sherpa.data.Data2DEvents` data,
+           which only evaluates the model at the event positions
+           (apart from the sum of the model over the grid).
+
         References
         ----------
 
@@ -5679,6 +5749,18 @@ class Session(NoNewAttributesAfterInit):
                          clobber=clobber, sep=sep, comment=comment,
                          linebreak=linebreak, format=format)
 
+    def _notice_all(self,
+                    datasets: Sequence[Data],
+                    lo=None, hi=None,
+                    **kwargs) -> None:
+        """Apply the same filter to each dataset.
+
+        This is used by notice, ignore, notice_id, and ignore_id,
+        and can be overridden to filter the datasets in bulk.
+        """
+        for data in datasets:
+            data.notice(lo, hi, **kwargs)
+
     def _notice_expr(self,
                      expr: str | None = None,
                      **kwargs) -> None:
@@ -5825,7 +5907,8 @@ class Session(NoNewAttributesAfterInit):
 
         # Jump through the data sets in "order".
         #
-        notice_data_range(self.get_data, self.list_data_ids(), lo, hi, kwargs)
+        notice_data_range(self.get_data, self.list_data_ids(), lo, hi, kwargs,
+                          notice_all=self._notice_all)
 
     # DOC-NOTE: inclusion of bkg_id is technically wrong, as it
     # should only be in the sherpa.astro.ui version, but it is not
@@ -6050,7 +6133,8 @@ class Session(NoNewAttributesAfterInit):
         # Unlike notice() we do not sort the id list as this
         # was set by the user.
         #
-        notice_data_range(self.get_data, idvals, lo, hi, kwargs)
+        notice_data_range(self.get_data, idvals, lo, hi, kwargs,
+                          notice_all=self._notice_all)
 
     # DOC-NOTE: inclusion of bkg_id is technically wrong, as it
     # should only be in the sherpa.astro.ui version, but it is not
@@ -7624,7 +7708,10 @@ class Session(NoNewAttributesAfterInit):
            The identifier for this table model.
         templatefile : str
            The name of the file to read in. This file lists the
-           template data files.
+           template data files. It can also be the name of a
+           directory created by
+           `sherpa.models.template.write_template_library`, in which
+           case the templates are memory mapped rather than read in.
         dstype : data class to use, optional
            What type of data is to be used. This is currently unused.
         sep : str, optional
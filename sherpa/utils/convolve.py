@@ -0,0 +1,638 @@
+#
+#  Copyright (C) 2026  Smithsonian Astrophysical Observatory
+#
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""Select the code used to convolve models with a kernel.
+
+The convolution kernels in `sherpa.instrument` use a "convolver"
+object to calculate the convolution. The default is to use the
+bundled TCD library, which uses complex transforms, but it can be
+changed to use the real-valued transforms from NumPy or SciPy,
+which are generally faster, with `set_convolution_backend`. All the
+backends calculate the same values.
+
+The NumPy and SciPy backends can also avoid the FFT of the whole
+grid: small kernels are applied directly, by summing shifted copies
+of the data, and - when the grid size is not suited to an FFT -
+large grids can be split into blocks and combined with the
+overlap-add method. The default is to pick the method with the
+lowest estimated cost.
+
+.. versionadded:: 4.19.0
+
+"""
+
+from collections.abc import Sequence
+import itertools
+import math
+from typing import Any
+
+import numpy as np
+
+from sherpa.utils._psf import tcdData
+from sherpa.utils.err import ArgumentErr
+
+try:
+    import scipy.fft
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+# The example changes the backend.
+__doctest_skip__ = ['set_convolution_backend']
+
+
+__all__ = ('CONVOLUTION_BACKENDS', 'CONVOLUTION_METHODS', 'FFTConvolver', 'next_fast_len',
+           'get_convolution_backend', 'set_convolution_backend',
+           'make_convolver')
+
+
+CONVOLUTION_BACKENDS = ("tcd", "numpy", "scipy")
+"""The names of the supported convolution backends."""
+
+_backend = "tcd"
+_workers: int | None = None
+_method = "auto"
+
+
+def next_fast_len(size: int) -> int:
+    """Return the smallest "fast" FFT length.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    size : int
+        The minimum length.
+
+    Returns
+    -------
+    nsize : int
+        The smallest number, greater than or equal to size and at
+        least 2, whose only prime factors are 2, 3, and 5.
+
+    Examples
+    --------
+
+    >>> next_fast_len(7)
+    8
+    >>> next_fast_len(3125)
+    3125
+    >>> next_fast_len(3126)
+    3200
+
+    """
+
+    nsize = max(int(size), 2)
+    while True:
+        val = nsize
+        for factor in (2, 3, 5):
+            while val % factor == 0:
+                val //= factor
+
+        if val == 1:
+            return nsize
+
+        nsize += 1
+
+
+CONVOLUTION_METHODS = ("auto", "direct", "overlap-add", "fft")
+"""The methods supported by `FFTConvolver`."""
+
+# The approximate cost, in nanoseconds per element of the grid, of
+# the parts of the convolution, used to select the method. These were
+# estimated from timing the NumPy routines, and are only meant to
+# give the relative costs. The direct costs are per kernel element,
+# the FFT cost is per transform and is multiplied by log2 of the
+# transform size, and the block costs are the extra overhead of the
+# overlap-add method for 1D and 2D grids. The FFT of a length that is
+# not a product of small primes is significantly slower.
+#
+_COST_DIRECT_1D = 0.4
+_COST_DIRECT = 1.5
+_COST_FFT = 1.0
+_COST_OVERHEAD = 3.0
+_COST_BLOCKS = (20.0, 60.0)
+_COST_NOT_FAST = 8.0
+
+# The number of elements processed at a time by the direct method.
+#
+_DIRECT_CHUNK = 16384
+
+
+class FFTConvolver:
+    """Convolve data with a kernel using real-valued FFTs.
+
+    This provides the same interface, and calculates the same
+    values, as the TCD-based convolution used by
+    `sherpa.instrument`. The convolution is circular, and is done
+    on a grid which is the larger of the data and kernel sizes
+    along each axis (for 2D data the grid is then increased to
+    the next fast FFT size). The kernel is shifted so that its
+    origin is at the first pixel.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    fftlib : {"numpy", "scipy"}, optional
+        The module used to calculate the FFTs.
+    workers : int or None, optional
+        The number of threads used by the SciPy transforms. It is
+        ignored by the NumPy transforms.
+    method : {"auto", "direct", "overlap-add", "fft"}, optional
+        How the convolution is calculated: "direct" sums up shifted
+        copies of the data, "overlap-add" convolves blocks of the
+        data with FFTs sized to match the kernel, and "fft" uses a
+        single FFT of the whole grid. The "auto" setting chooses
+        the method with the lowest estimated cost, based on the
+        kernel and grid sizes.
+
+    Notes
+    -----
+    The kernel, and its transform, are calculated the first time
+    `convolve` is called and then re-used, until
+    `clear_kernel_fft` is called (or the grid size changes). The
+    padded array used for the data is also re-used. The FFT plans
+    are cached by the FFT library.
+
+    """
+
+    def __init__(self,
+                 fftlib: str = "numpy",
+                 workers: int | None = None,
+                 method: str = "auto"
+                 ) -> None:
+        if fftlib == "scipy":
+            if not HAS_SCIPY:
+                raise ArgumentErr("bad", "fftlib", "scipy is not available")
+
+        elif fftlib != "numpy":
+            raise ArgumentErr("bad", "fftlib",
+                              f"'{fftlib}' is not 'numpy' or 'scipy'")
+
+        if method not in CONVOLUTION_METHODS:
+            raise ArgumentErr("bad", "method",
+                              f"'{method}' is not one of " +
+                              ", ".join(CONVOLUTION_METHODS))
+
+        self.fftlib = fftlib
+        self.workers = workers
+        self.method = method
+        self._clear_cache()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in ["_kernel", "_origin", "_grid", "_kernel_fft",
+                     "_block_fft", "_buffer", "_buffer_dims"]:
+            state[name] = None
+
+        return state
+
+    def _clear_cache(self) -> None:
+        # The kernel, stored in NumPy axis order, and its origin.
+        self._kernel: np.ndarray | None = None
+        self._origin: tuple[int, ...] | None = None
+        self._grid: tuple[int, ...] | None = None
+
+        # The transform of the kernel for the "fft" and
+        # "overlap-add" methods.
+        self._kernel_fft: np.ndarray | None = None
+        self._block_fft: np.ndarray | None = None
+
+        # The padded data.
+        self._buffer: np.ndarray | None = None
+        self._buffer_dims: tuple[int, ...] | None = None
+
+    def clear_kernel_fft(self) -> None:
+        """Remove the cached kernel and its transform."""
+        self._kernel = None
+        self._kernel_fft = None
+        self._block_fft = None
+
+    def _rfftn(self,
+               vals: np.ndarray,
+               shape: tuple[int, ...] | None = None
+               ) -> np.ndarray:
+        """Transform the last axes of vals (all of them if shape is None)."""
+
+        if shape is None:
+            shape = vals.shape
+
+        axes = tuple(range(vals.ndim - len(shape), vals.ndim))
+        if self.fftlib == "scipy":
+            return scipy.fft.rfftn(vals, s=shape, axes=axes,
+                                   workers=self.workers)
+
+        return np.fft.rfftn(vals, s=shape, axes=axes)
+
+    def _irfftn(self,
+                vals: np.ndarray,
+                shape: tuple[int, ...]
+                ) -> np.ndarray:
+        """Inverse transform the last axes of vals."""
+
+        axes = tuple(range(vals.ndim - len(shape), vals.ndim))
+        if self.fftlib == "scipy":
+            return scipy.fft.irfftn(vals, s=shape, axes=axes,
+                                    workers=self.workers)
+
+        return np.fft.irfftn(vals, s=shape, axes=axes)
+
+    @staticmethod
+    def _block_shape(kshape: tuple[int, ...],
+                     grid: tuple[int, ...]
+                     ) -> tuple[int, ...]:
+        """The FFT size used for each block in the overlap-add method."""
+
+        # The transform size must be at least twice the kernel size
+        # (the addition of the blocks relies on this), and it should
+        # not be larger than needed for the grid.
+        #
+        return tuple(next_fast_len(min(max(4 * k, 32), n + k - 1))
+                     for k, n in zip(kshape, grid))
+
+    def select_method(self,
+                      kshape: Sequence[int],
+                      grid: Sequence[int],
+                      nkernel: int | None = None
+                      ) -> str:
+        """Select the convolution method.
+
+        Parameters
+        ----------
+        kshape, grid : sequence of int
+            The kernel and grid shapes.
+        nkernel : int or None, optional
+            The number of non-zero kernel elements. If not set then
+            all the elements are assumed to be non-zero.
+
+        Returns
+        -------
+        method : str
+            The method with the lowest estimated cost: "direct",
+            "overlap-add", or "fft". If the method is not "auto"
+            then it is returned.
+
+        """
+
+        if self.method != "auto":
+            return self.method
+
+        kshape = tuple(kshape)
+        grid = tuple(grid)
+        ngrid = math.prod(grid)
+        if nkernel is None:
+            nkernel = math.prod(kshape)
+
+        # The kernel transform is cached, so the "fft" and
+        # "overlap-add" methods need two transforms per evaluation.
+        #
+        direct = _COST_DIRECT_1D if len(grid) == 1 else _COST_DIRECT
+        fft = 2 * _COST_FFT * math.log2(max(ngrid, 2))
+        if any(next_fast_len(n) != n for n in grid):
+            fft *= _COST_NOT_FAST
+
+        costs = {"direct": direct * nkernel + _COST_OVERHEAD,
+                 "fft": fft + _COST_OVERHEAD}
+
+        fshape = self._block_shape(kshape, grid)
+        block = [f - k + 1 for f, k in zip(fshape, kshape)]
+        if all(f < n for f, n in zip(fshape, grid)):
+            ratio = math.prod(f / b for f, b in zip(fshape, block))
+            overhead = _COST_BLOCKS[min(len(grid), 2) - 1]
+            costs["overlap-add"] = 2 * _COST_FFT * ratio * \
+                math.log2(max(math.prod(fshape), 2)) + overhead
+
+        return min(costs, key=lambda name: costs[name])
+
+    def _wrap(self, vals: np.ndarray) -> np.ndarray:
+        """Extend the grid periodically to cover the kernel.
+
+        The linear convolution of the result with the kernel, after
+        removing the kernel size minus one elements from the start
+        of each axis, matches the circular convolution.
+        """
+
+        assert self._kernel is not None
+        assert self._origin is not None
+        pads = [(k - 1 - o, o)
+                for k, o in zip(self._kernel.shape, self._origin)]
+        return np.pad(vals, pads, mode="wrap")
+
+    def _convolve_direct(self, vals: np.ndarray) -> np.ndarray:
+        """Convolve by summing shifted copies of the data."""
+
+        kernel = self._kernel
+        assert kernel is not None
+        ext = self._wrap(vals)
+        if kernel.ndim == 1:
+            return np.convolve(ext, kernel, mode="valid")
+
+        # Use the flattened array so that each shifted copy is a
+        # contiguous slice. The output contains the valid region
+        # along with some extra elements (at the end of each row)
+        # which are removed.
+        #
+        strides = [math.prod(ext.shape[axis + 1:])
+                   for axis in range(ext.ndim)]
+        extra = sum((k - 1) * stride
+                    for k, stride in zip(kernel.shape[1:], strides[1:]))
+        nout = vals.shape[0] * strides[0]
+        flat = np.zeros(ext.size + extra)
+        flat[:ext.size] = ext.ravel()
+
+        # Process the output in chunks to reduce the memory traffic.
+        #
+        terms = [(sum((k - 1 - i) * stride
+                      for k, i, stride in zip(kernel.shape, idx, strides)),
+                  kernel[idx])
+                 for idx in zip(*np.nonzero(kernel))]
+        out = np.zeros(nout)
+        tmp = np.empty(min(nout, _DIRECT_CHUNK))
+        for lo in range(0, nout, _DIRECT_CHUNK):
+            hi = min(lo + _DIRECT_CHUNK, nout)
+            chunk = out[lo:hi]
+            work = tmp[:hi - lo]
+            for start, kval in terms:
+                np.multiply(flat[start + lo:start + hi], kval, out=work)
+                chunk += work
+
+        out = out.reshape((vals.shape[0], ) + ext.shape[1:])
+        return out[tuple(slice(0, n) for n in vals.shape)]
+
+    def _convolve_fft(self, vals: np.ndarray) -> np.ndarray:
+        """Convolve using a single FFT."""
+
+        kernel = self._kernel
+        assert kernel is not None
+        assert self._origin is not None
+        kfft = self._kernel_fft
+        if kfft is None:
+            kpad = np.zeros(vals.shape)
+            kpad[tuple(slice(0, n) for n in kernel.shape)] = kernel
+            kpad = np.roll(kpad, [-o for o in self._origin],
+                           axis=tuple(range(kernel.ndim)))
+            kfft = self._rfftn(kpad)
+            self._kernel_fft = kfft
+
+        return self._irfftn(self._rfftn(vals) * kfft, vals.shape)
+
+    def _convolve_overlap_add(self, vals: np.ndarray) -> np.ndarray:
+        """Convolve blocks of the data using the overlap-add method.
+
+        All the blocks are transformed in a single call.
+        """
+
+        kernel = self._kernel
+        assert kernel is not None
+        kshape = kernel.shape
+        ndim = kernel.ndim
+        fshape = self._block_shape(kshape, vals.shape)
+        block = tuple(f - k + 1 for f, k in zip(fshape, kshape))
+
+        kfft = self._block_fft
+        if kfft is None:
+            kfft = self._rfftn(kernel, fshape)
+            self._block_fft = kfft
+
+        # Split the extended data into blocks, with the block
+        # indexes first: (nb0, nb1, ..., b0, b1, ...).
+        #
+        ext = self._wrap(vals)
+        nblocks = tuple(-(-n // b) for n, b in zip(ext.shape, block))
+        blocks = np.zeros([nb * b for nb, b in zip(nblocks, block)])
+        blocks[tuple(slice(0, n) for n in ext.shape)] = ext
+
+        interleaved = [v for nb, b in zip(nblocks, block) for v in (nb, b)]
+        order = list(range(0, 2 * ndim, 2)) + list(range(1, 2 * ndim, 2))
+        blocks = blocks.reshape(interleaved).transpose(order)
+
+        conv = self._irfftn(self._rfftn(blocks, fshape) * kfft, fshape)
+
+        # Each block result covers at most two blocks along each
+        # axis: the first b elements and then the remaining f - b
+        # elements. Add each of the (up to) 2^ndim parts to the
+        # output.
+        #
+        out = np.zeros([v for nb, b in zip(nblocks, block)
+                        for v in (nb + 1, b)])
+        back = [0] * (2 * ndim)
+        for axis in range(ndim):
+            back[order[axis]] = axis
+            back[order[ndim + axis]] = ndim + axis
+
+        for part in itertools.product((0, 1), repeat=ndim):
+            src = (Ellipsis, ) + tuple(slice(p * b, f if p else b)
+                                       for p, b, f in zip(part, block, fshape))
+            dst = tuple(v for p, nb, b, f in zip(part, nblocks, block, fshape)
+                        for v in (slice(p, p + nb),
+                                  slice(0, f - b if p else b)))
+            out[dst] += conv[src].transpose(back)
+
+        out = out.reshape([(nb + 1) * b for nb, b in zip(nblocks, block)])
+        return out[tuple(slice(k - 1, k - 1 + n)
+                         for k, n in zip(kshape, vals.shape))]
+
+    def convolve(self,
+                 data: Sequence[float] | np.ndarray,
+                 kernel: Sequence[float] | np.ndarray,
+                 dims_src: int | Sequence[int],
+                 dims_kern: int | Sequence[int],
+                 origin: int | Sequence[int]
+                 ) -> np.ndarray:
+        """Convolve the data with the kernel.
+
+        Parameters
+        ----------
+        data, kernel : array_like
+            The data and kernel, as 1D arrays.
+        dims_src, dims_kern : int or sequence of int
+            The dimensions of the data and kernel, with the first
+            element being the fastest-varying axis (so the reverse
+            of the NumPy shape).
+        origin : int or sequence of int
+            The origin of the kernel, using the same axis order as
+            dims_kern.
+
+        Returns
+        -------
+        result : ndarray
+            The convolved data, as a 1D array. For 1D data the size
+            matches the larger of the data and kernel, otherwise it
+            matches the data.
+
+        """
+
+        dsrc = [int(v) for v in np.atleast_1d(dims_src)]
+        dkern = [int(v) for v in np.atleast_1d(dims_kern)]
+        orig = [int(v) for v in np.atleast_1d(origin)]
+        ndim = len(dkern)
+        if len(dsrc) != ndim or len(orig) != ndim:
+            raise TypeError("input array sizes do not match, dims_src: "
+                            f"{len(dsrc)} vs dims_kern: {ndim}")
+
+        data = np.asarray(data, dtype=float)
+        if data.size != np.prod(dsrc):
+            raise TypeError("input array sizes do not match dimensions, "
+                            f"source size: {data.size} vs source dim: "
+                            f"{np.prod(dsrc)}")
+
+        grid = [max(nd, nk) for nd, nk in zip(dsrc, dkern)]
+        if ndim > 1:
+            grid = [next_fast_len(n) for n in grid]
+
+        # Convert to the NumPy axis order.
+        #
+        shape = tuple(grid[::-1])
+        dshape = tuple(dsrc[::-1])
+        dslice = tuple(slice(0, n) for n in dshape)
+
+        if self._kernel is None or self._grid != shape:
+            kernel = np.asarray(kernel, dtype=float)
+            if kernel.size != np.prod(dkern):
+                raise TypeError("input array sizes do not match dimensions, "
+                                f"kernel size: {kernel.size} vs kernel dim: "
+                                f"{np.prod(dkern)}")
+
+            kshape = tuple(dkern[::-1])
+            self._kernel = kernel.reshape(kshape).copy()
+            self._origin = tuple(o % n for o, n in zip(orig[::-1], kshape))
+            self._grid = shape
+            self._kernel_fft = None
+            self._block_fft = None
+
+        if dshape == shape:
+            vals = data.reshape(shape)
+        else:
+            buffer = self._buffer
+            if buffer is None or buffer.shape != shape or \
+               self._buffer_dims != dshape:
+                buffer = np.zeros(shape)
+                self._buffer = buffer
+                self._buffer_dims = dshape
+
+            buffer[dslice] = data.reshape(dshape)
+            vals = buffer
+
+        method = self.select_method(self._kernel.shape, shape,
+                                    np.count_nonzero(self._kernel))
+        if method == "direct":
+            out = self._convolve_direct(vals)
+        elif method == "overlap-add":
+            out = self._convolve_overlap_add(vals)
+        else:
+            out = self._convolve_fft(vals)
+
+        if ndim > 1:
+            out = out[dslice]
+
+        return out.ravel()
+
+
+def get_convolution_backend() -> str:
+    """Return the name of the convolution backend.
+
+    .. versionadded:: 4.19.0
+
+    See Also
+    --------
+    set_convolution_backend
+
+    """
+    return _backend
+
+
+def set_convolution_backend(name: str,
+                            workers: int | None = None,
+                            method: str = "auto"
+                            ) -> None:
+    """Change the code used for convolution.
+
+    The change is used by kernels created after this call.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    name : {"tcd", "numpy", "scipy"}
+        The backend to use: "tcd" is the original C code, and
+        "numpy" and "scipy" use the `FFTConvolver` class.
+    workers : int or None, optional
+        The number of threads used by the "scipy" backend.
+    method : {"auto", "direct", "overlap-add", "fft"}, optional
+        The convolution method used by the "numpy" and "scipy"
+        backends. The default is to select the method based on the
+        kernel and data sizes.
+
+    See Also
+    --------
+    get_convolution_backend
+
+    Examples
+    --------
+
+    Use the SciPy FFT routines, with four threads:
+
+    >>> set_convolution_backend("scipy", workers=4)
+
+    """
+
+    global _backend, _workers, _method
+
+    if name not in CONVOLUTION_BACKENDS:
+        raise ArgumentErr("bad", "convolution backend",
+                          f"'{name}' is not one of " +
+                          ", ".join(CONVOLUTION_BACKENDS))
+
+    if name == "scipy" and not HAS_SCIPY:
+        raise ArgumentErr("bad", "convolution backend",
+                          "scipy is not available")
+
+    if method not in CONVOLUTION_METHODS:
+        raise ArgumentErr("bad", "method",
+                          f"'{method}' is not one of " +
+                          ", ".join(CONVOLUTION_METHODS))
+
+    _backend = name
+    _workers = workers
+    _method = method
+
+
+def make_convolver() -> Any:
+    """Create the object used to convolve data.
+
+    .. versionadded:: 4.19.0
+
+    Returns
+    -------
+    convolver
+        An object with convolve and clear_kernel_fft methods, based
+        on the current backend.
+
+    See Also
+    --------
+    set_convolution_backend
+
+    """
+
+    if _backend == "tcd":
+        return tcdData()
+
+    return FFTConvolver(_backend, workers=_workers, method=_method)
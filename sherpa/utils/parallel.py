@@ -46,6 +46,7 @@ from configparser import ConfigParser
 import inspect
 import logging
 from typing import Any, Final, Protocol, TypeVar
+import weakref
 
 import numpy as np
 
@@ -275,7 +276,7 @@ multi
 
 __all__ = ("multi", "ncpus", "context",
            "parallel_map", "parallel_map_funcs", "parallel_map_rng",
-           "run_tasks")
+           "run_tasks", "ResidentPool")
 
 
 # Can this be replaced by itertools.batched once Python 3.12 is the
@@ -724,6 +725,233 @@ def parallel_map_funcs(funcs, datasets, numcores=None):
     return run_tasks(procs, err_q, out_q)
 
 
+def resident_worker(funcs: Sequence[Callback[Any, Any]],
+                    conn: Any) -> None:
+    """Evaluate a set of functions each time arguments are received.
+
+    The loop exits when None is received.
+
+    Parameters
+    ----------
+    funcs : sequence of callable
+       The functions to call. Each accepts a single argument.
+    conn : multiprocessing.connection.Connection
+       The channel used to receive the arguments - a list with an
+       element per function - and to send the (flag, values) reply,
+       where flag is True on success and values is the list of return
+       values, or False and the exception that was raised.
+
+    """
+
+    while True:
+        try:
+            args = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        if args is None:
+            break
+
+        try:
+            vals = [f(arg) for f, arg in zip(funcs, args)]
+        except Exception as e:
+            msg: tuple[bool, Any] = (False, e)
+        else:
+            msg = (True, vals)
+
+        try:
+            conn.send(msg)
+        except Exception as e:
+            # The exception, or a return value, may not be picklable.
+            conn.send((False, RuntimeError(str(e))))
+
+    conn.close()
+
+
+class ResidentPool:
+    """Evaluate functions in long-lived worker processes.
+
+    Unlike `parallel_map_funcs`, the functions are only sent to the
+    worker processes once, when the pool is created, and each call
+    only sends the arguments and returns the results. This makes it
+    suitable for functions that are called many times, such as
+    evaluating the model for each data set in a simultaneous fit.
+
+    .. versionadded:: 4.19.0
+
+    Parameters
+    ----------
+    funcs : sequence of callable
+       The functions to evaluate. Each accepts a single argument.
+       The functions are split into ``numcores`` groups, and each
+       group is run in its own process. As the processes use copies
+       of the functions, any state they need must be sent as the
+       argument.
+    numcores : int or None, optional
+       The number of processes to use. When set to ``None``, all the
+       available CPUs on the machine - as set either by the
+       'numcores' setting of the 'parallel' section of Sherpa's
+       preferences or by multiprocessing.cpu_count - are used. It is
+       reduced to match the number of functions if necessary. If
+       only one process would be used, or multiprocessing is not
+       available, then the functions are evaluated by the calling
+       process.
+
+    See Also
+    --------
+    parallel_map_funcs
+
+    Notes
+    -----
+    The processes are started when the pool is created and remain
+    until `close` is called, which is also done when the pool is
+    used as a context manager or when it is garbage collected.
+
+    Examples
+    --------
+
+    >>> import numpy as np
+    >>> with ResidentPool([np.sum, np.max], numcores=2) as pool:
+    ...     print(pool([[1, 2, 3], [4, 5]]))
+    ...     print(pool([[2, 3], [6, 1]]))
+    ...
+    [np.int64(6), np.int64(5)]
+    [np.int64(5), np.int64(6)]
+
+    """
+
+    def __init__(self,
+                 funcs: Sequence[Callback[Any, Any]],
+                 numcores: int | None = None
+                 ) -> None:
+        for func in funcs:
+            if not callable(func):
+                raise TypeError(f"input func '{repr(func)}' is not callable")
+
+        self.funcs = list(funcs)
+        nfuncs = len(self.funcs)
+        ncores = ncpus if numcores is None else numcores
+        ncores = min(ncores, nfuncs)
+
+        self._conns: list = []
+        self._procs: list = []
+        self._slices: list[slice] = []
+        self._finalizer: weakref.finalize | None = None
+        if not _multi or ncores < 2:
+            return
+
+        assert context is not None
+
+        idx = [int(round(i * nfuncs / float(ncores))) for i in range(ncores + 1)]
+        self._slices = [slice(idx[i], idx[i + 1]) for i in range(ncores)]
+
+        debug("ResidentPool: starting %d processes for %d functions",
+              ncores, nfuncs)
+        try:
+            for slc in self._slices:
+                parent, child = context.Pipe()  # type: ignore[attr-defined]
+                proc = context.Process(target=resident_worker,
+                                       args=(self.funcs[slc], child),
+                                       daemon=True)
+                proc.start()
+                child.close()
+                self._conns.append(parent)
+                self._procs.append(proc)
+        except BaseException:
+            self.close()
+            raise
+
+        self._finalizer = weakref.finalize(self, _close_pool,
+                                           self._conns, self._procs)
+
+    @property
+    def nprocs(self) -> int:
+        """The number of worker processes (0 when run serially)."""
+        return len(self._procs)
+
+    def __enter__(self) -> "ResidentPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __call__(self, args: Sequence[Any]) -> list[Any]:
+        """Evaluate each function with its argument.
+
+        Parameters
+        ----------
+        args : sequence
+           The arguments, which must match the number of functions.
+
+        Returns
+        -------
+        vals : list
+           The return value of each function.
+
+        """
+
+        if len(args) != len(self.funcs):
+            raise TypeError(f"input funcs ({len(self.funcs)}) and args "
+                            f"({len(args)}) size must be same")
+
+        if not self._procs:
+            return [f(arg) for f, arg in zip(self.funcs, args)]
+
+        try:
+            for conn, slc in zip(self._conns, self._slices):
+                conn.send(list(args[slc]))
+
+            replies = [conn.recv() for conn in self._conns]
+
+        except BaseException:
+            # The processes are in an unknown state so they can not
+            # be re-used.
+            self.close()
+            raise
+
+        out = []
+        for flag, vals in replies:
+            if not flag:
+                raise vals
+
+            out.extend(vals)
+
+        return out
+
+    def close(self) -> None:
+        """Stop the worker processes.
+
+        The pool then evaluates the functions in the calling process.
+        """
+
+        if not self._procs:
+            return
+
+        _close_pool(self._conns, self._procs)
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+
+        self._conns = []
+        self._procs = []
+
+
+def _close_pool(conns, procs) -> None:
+    """Stop the ResidentPool processes."""
+
+    for conn in conns:
+        try:
+            conn.send(None)
+            conn.close()
+        except (OSError, ValueError):
+            pass
+
+    for proc in procs:
+        proc.join(timeout=1)
+
+    cleanup_tasks(procs)
+
+
 def create_seeds(rng: RandomType | None,
                  nelem: int
                  ) -> list[np.random.SeedSequence]:
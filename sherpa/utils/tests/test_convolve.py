@@ -0,0 +1,267 @@
+#
+#  Copyright (C) 2026  Smithsonian Astrophysical Observatory
+#
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License along
+#  with this program; if not, write to the Free Software Foundation, Inc.,
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+import pickle
+
+import numpy as np
+
+import pytest
+
+from sherpa.data import Data1D, Data2D
+from sherpa.instrument import PSFModel
+from sherpa.models.basic import Gauss1D, Gauss2D, StepLo1D
+from sherpa.utils import _psf
+from sherpa.utils import convolve
+from sherpa.utils.err import ArgumentErr
+
+
+FFTLIBS = ["numpy",
+           pytest.param("scipy",
+                        marks=pytest.mark.skipif(not convolve.HAS_SCIPY,
+                                                 reason="scipy required"))]
+
+
+@pytest.fixture
+def reset_backend():
+    """Ensure the convolution backend is reset after the test."""
+
+    yield
+    convolve.set_convolution_backend("tcd")
+
+
+def test_next_fast_len_matches_tcd():
+    """The 5-smooth sizes match those used by the TCD code."""
+
+    for size in range(1, 2000):
+        assert convolve.next_fast_len(size) == _psf.get_padsize(size)
+
+
+def test_next_fast_len_large():
+    """There is no upper limit, unlike get_padsize."""
+
+    assert convolve.next_fast_len(32401) == 32768
+
+
+@pytest.mark.parametrize("fftlib", FFTLIBS)
+@pytest.mark.parametrize("method", convolve.CONVOLUTION_METHODS)
+@pytest.mark.parametrize("dsrc,dkern,origin",
+                         [((20, ), (5, ), (2, )),
+                          ((7, ), (11, ), (5, )),
+                          ((13, ), (13, ), (6, )),
+                          ((13, ), (4, ), (-1, )),
+                          ((500, ), (9, ), (4, )),
+                          ((12, 9), (5, 3), (2, 1)),
+                          ((9, 12), (9, 12), (4, 7)),
+                          ((6, 5), (8, 3), (3, 0)),
+                          ((31, 17), (4, 6), (0, 0)),
+                          ((150, 97), (7, 5), (3, 2)),
+                          ((64, 70), (33, 3), (20, 1))])
+def test_fftconvolver_matches_tcd(fftlib, method, dsrc, dkern, origin):
+    """The FFT code should match the TCD code."""
+
+    rng = np.random.default_rng(3987)
+    data = rng.random(np.prod(dsrc))
+    kernel = rng.random(np.prod(dkern))
+
+    expected = _psf.tcdData().convolve(data, kernel, dsrc, dkern, origin)
+
+    conv = convolve.FFTConvolver(fftlib, method=method)
+    got = conv.convolve(data, kernel, dsrc, dkern, origin)
+    assert got.shape == expected.shape
+    assert got == pytest.approx(expected)
+
+    # Check the cached values are used correctly.
+    #
+    got = conv.convolve(data, kernel, dsrc, dkern, origin)
+    assert got == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("fftlib", FFTLIBS)
+def test_fftconvolver_kernel_cache(fftlib):
+    """As with the TCD code, the kernel is re-used until cleared."""
+
+    data = np.asarray([0, 0, 0, 1, 2, 4, 3, 0, 0, 1, 0])
+    kernel1 = np.asarray([2, 4, 1])
+    kernel2 = np.asarray([1, 1, 1])
+
+    conv = convolve.FFTConvolver(fftlib)
+    out1 = conv.convolve(data, kernel1, data.shape, kernel1.shape, [0])
+    out2 = conv.convolve(data, kernel2, data.shape, kernel2.shape, [0])
+    assert out2 == pytest.approx(out1)
+
+    conv.clear_kernel_fft()
+    out3 = conv.convolve(data, kernel2, data.shape, kernel2.shape, [0])
+    expected = np.roll(np.convolve(data, kernel2, mode="same"), 1)
+    assert out3 == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("kshape,grid,expected",
+                         [((3, ), (100, ), "direct"),
+                          ((9, ), (10000, ), "direct"),
+                          ((5, 5), (2048, 2048), "direct"),
+                          ((1001, ), (100003, ), "overlap-add"),
+                          ((1001, ), (100000, ), "fft"),
+                          ((100, ), (100, ), "fft"),
+                          ((25, 25), (2048, 2048), "fft"),
+                          ((512, 512), (2048, 2048), "fft")])
+def test_fftconvolver_select_method(kshape, grid, expected):
+    """Check the automatic selection of the method."""
+
+    conv = convolve.FFTConvolver()
+    assert conv.select_method(kshape, grid) == expected
+
+
+@pytest.mark.parametrize("method", ["direct", "overlap-add", "fft"])
+def test_fftconvolver_select_method_fixed(method):
+    """The method is used when it is not auto."""
+
+    conv = convolve.FFTConvolver(method=method)
+    assert conv.select_method((3, ), (100, )) == method
+
+
+def test_fftconvolver_direct_skips_zeros():
+    """The number of non-zero kernel elements is used."""
+
+    conv = convolve.FFTConvolver()
+    assert conv.select_method((100, ), (1000, )) == "fft"
+    assert conv.select_method((100, ), (1000, ), nkernel=3) == "direct"
+
+
+def test_fftconvolver_changed_data_size():
+    """The work buffer is reset when the data size changes."""
+
+    conv = convolve.FFTConvolver()
+    data1 = np.ones(12)
+    data2 = np.ones(6)
+    kernel = np.ones(4)
+    conv.convolve(data1, kernel, (4, 3), (2, 2), (0, 0))
+    got = conv.convolve(data2, kernel, (3, 2), (2, 2), (0, 0))
+    expected = _psf.tcdData().convolve(data2, kernel, (3, 2), (2, 2), (0, 0))
+    assert got == pytest.approx(expected)
+
+
+def test_fftconvolver_pickle():
+    """The cached values are not pickled."""
+
+    conv = convolve.FFTConvolver()
+    conv.convolve(np.ones(10), np.ones(3), (10, ), (3, ), (1, ))
+    assert conv._kernel is not None
+
+    new = pickle.loads(pickle.dumps(conv))
+    assert new.fftlib == "numpy"
+    assert new.method == "auto"
+    assert new._kernel is None
+    assert new._kernel_fft is None
+    assert new._buffer is None
+
+
+def test_fftconvolver_invalid_fftlib():
+    with pytest.raises(ArgumentErr,
+                       match="^Invalid fftlib: ''fftw' is not 'numpy' or 'scipy''$"):
+        convolve.FFTConvolver("fftw")
+
+
+def test_fftconvolver_invalid_method():
+    with pytest.raises(ArgumentErr,
+                       match="^Invalid method: ''best' is not one of "):
+        convolve.FFTConvolver(method="best")
+
+
+def test_fftconvolver_invalid_size():
+    conv = convolve.FFTConvolver()
+    with pytest.raises(TypeError,
+                       match="^input array sizes do not match dimensions, "):
+        conv.convolve(np.ones(10), np.ones(3), (9, ), (3, ), (1, ))
+
+
+def test_set_convolution_backend(reset_backend):
+
+    assert convolve.get_convolution_backend() == "tcd"
+    assert isinstance(convolve.make_convolver(), _psf.tcdData)
+
+    convolve.set_convolution_backend("numpy")
+    assert convolve.get_convolution_backend() == "numpy"
+    conv = convolve.make_convolver()
+    assert isinstance(conv, convolve.FFTConvolver)
+    assert conv.fftlib == "numpy"
+    assert conv.method == "auto"
+
+    convolve.set_convolution_backend("numpy", method="direct")
+    assert convolve.make_convolver().method == "direct"
+
+
+def test_set_convolution_backend_invalid(reset_backend):
+    with pytest.raises(ArgumentErr,
+                       match="^Invalid convolution backend: "):
+        convolve.set_convolution_backend("fftw")
+
+    assert convolve.get_convolution_backend() == "tcd"
+
+
+def eval_psf1d():
+    """Convolve a 1D model."""
+
+    smdl = StepLo1D()
+    smdl.xcut = 100
+    smdl.ampl = 10
+
+    gsmooth = Gauss1D()
+    gsmooth.fwhm = 12
+    psf = PSFModel("psf", gsmooth)
+
+    x = np.arange(0, 200, 0.5)
+    psf.fold(Data1D("fake", x, x * 0))
+    return psf(smdl)(x)
+
+
+def eval_psf2d():
+    """Convolve a 2D model on a non-square grid."""
+
+    x1, x0 = np.mgrid[1:30, 1:45]
+    shape = x0.shape
+    x0 = x0.flatten()
+    x1 = x1.flatten()
+
+    src = Gauss2D()
+    src.xpos = 20
+    src.ypos = 12
+    src.fwhm = 3
+
+    gsmooth = Gauss2D()
+    gsmooth.xpos = 22
+    gsmooth.ypos = 15
+    gsmooth.fwhm = 5
+    gsmooth.ellip = 0.4
+    psf = PSFModel("psf", gsmooth)
+
+    psf.fold(Data2D("fake", x0, x1, x0 * 0, shape=shape))
+    return psf(src)(x0, x1)
+
+
+@pytest.mark.parametrize("fftlib", FFTLIBS)
+@pytest.mark.parametrize("method", convolve.CONVOLUTION_METHODS)
+@pytest.mark.parametrize("evalfunc", [eval_psf1d, eval_psf2d])
+def test_psfmodel_backend(fftlib, method, evalfunc, reset_backend):
+    """Check the backends give the same results for PSFModel."""
+
+    expected = evalfunc()
+
+    convolve.set_convolution_backend(fftlib, workers=2, method=method)
+    got = evalfunc()
+    assert got == pytest.approx(expected)
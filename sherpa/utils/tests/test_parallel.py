@@ -18,7 +18,9 @@
 #  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 #
 
+from contextlib import nullcontext
 import logging
+import os
 import time
 
 import numpy as np
@@ -26,13 +28,13 @@ import numpy as np
 import pytest
 
 from sherpa.data import Data1D
-from sherpa.models.basic import Gauss1D
+from sherpa.models.basic import Gauss1D, Polynom1D
 from sherpa.optmethods import LevMar
 from sherpa.stats import LeastSq
 from sherpa.fit import Fit, DataSimulFit, SimulFitModel
 from sherpa.utils.logging import SherpaVerbosity
 from sherpa.utils.parallel import multi, ncpus, \
-    parallel_map, parallel_map_funcs, parallel_map_rng
+    parallel_map, parallel_map_funcs, parallel_map_rng, ResidentPool
 
 
 def test_parallel_map_checks_callable():
@@ -278,6 +280,143 @@ def test_parallel_map_funcs2():
     cmp_results(result)
 
 
+def test_resident_pool_checks_callable():
+    """Check we error out."""
+
+    with pytest.raises(TypeError,
+                       match="^input func 'True' is not callable$"):
+        ResidentPool([np.sum, True])
+
+
+@pytest.mark.parametrize("numcores", [1, 2, 3, 5])
+def test_resident_pool(numcores):
+    """The results are returned in order, whatever the grouping."""
+
+    funcs = [np.sum, np.max, np.min, np.prod]
+    with ResidentPool(funcs, numcores=numcores) as pool:
+        if multi and numcores > 1:
+            assert pool.nprocs == min(numcores, 4)
+        else:
+            assert pool.nprocs == 0
+
+        assert pool([[1, 2], [4, 5], [6, 3], [2, 4]]) == [3, 5, 3, 8]
+        assert pool([[2], [8, 1], [1, 2], [3, 3]]) == [2, 8, 1, 9]
+
+        with pytest.raises(TypeError,
+                           match=r"^input funcs \(4\) and args \(1\) size must be same$"):
+            pool([[1]])
+
+    assert pool.nprocs == 0
+    assert pool([[1, 2], [4, 5], [6, 3], [2, 4]]) == [3, 5, 3, 8]
+
+
+def test_resident_pool_on_error():
+    """An error is passed back and the workers remain usable."""
+
+    with ResidentPool([func_fails_on_2, func_fails_on_2],
+                      numcores=2) as pool:
+        with pytest.raises(ValueError,
+                           match="^x can not be 2$"):
+            pool([1, 2])
+
+        assert pool([1, 3]) == [1, 3]
+
+
+# The processes in which CountingGauss1D has been evaluated.
+#
+CALC_PIDS = []
+
+
+class CountingGauss1D(Gauss1D):
+    """Record the process in which the model was evaluated."""
+
+    def calc(self, p, *args, **kwargs):
+        CALC_PIDS.append(os.getpid())
+        return super().calc(p, *args, **kwargs)
+
+
+def test_datasimulfit_resident():
+    """The models are evaluated in the worker processes."""
+
+    x = np.linspace(-5., 5., 20)
+    d1 = Data1D('d1', x, np.exp(-0.5 * (x - 1)**2))
+    d2 = Data1D('d2', x, 2 * np.exp(-0.5 * (x - 1)**2))
+    d2.ignore(3, None)
+
+    g1 = CountingGauss1D()
+    g2 = CountingGauss1D()
+    g2.pos = g1.pos
+    g2.fwhm = g1.fwhm
+    g1.fwhm = 2.5
+
+    sd = DataSimulFit('sd', [d1, d2], numcores=2)
+    sm = SimulFitModel('sm', [g1, g2])
+    expected = np.concatenate([g1(x), g2(x)[x < 3]])
+    CALC_PIDS.clear()
+
+    with sd.cache_filtered():
+        assert sd.eval_model_to_fit(sm.parts) == pytest.approx(expected)
+        resident = sd._resident
+
+        # The links are preserved.
+        g1.pos = 0.5
+        g1.fwhm = 1.8
+        g2.ampl = 3
+        expected = np.concatenate([g1(x), g2(x)[x < 3]])
+        CALC_PIDS.clear()
+        assert sd.eval_model_to_fit(sm.parts) == pytest.approx(expected)
+        assert sd._resident is resident
+
+        # Changing the filter is picked up.
+        d2.notice(-5, 5)
+        expected = np.concatenate([g1(x), g2(x)])
+        CALC_PIDS.clear()
+        assert sd.eval_model_to_fit(sm.parts) == pytest.approx(expected)
+
+    # The workers are stopped when the context ends.
+    assert sd._resident is None
+
+    if multi:
+        assert CALC_PIDS == []
+    else:
+        assert len(CALC_PIDS) == 6
+
+    assert g2.pos.link is g1.pos
+    assert g2.fwhm.link is g1.fwhm
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_datasimulfit_resident_data_changes(cached):
+    """Changes to the data are picked up by the workers."""
+
+    d1 = Data1D('d1', [1, 2, 3, 4], [2, 3, 4, 5])
+    d2 = Data1D('d2', [1, 2, 3], [1, 2, 3])
+    m1 = Polynom1D()
+    m2 = Polynom1D()
+    m1.c0 = 1
+    m2.c0 = 2
+
+    sd = DataSimulFit('sd', [d1, d2], numcores=2)
+    sm = SimulFitModel('sm', [m1, m2])
+    cm = sd.cache_filtered if cached else nullcontext
+    try:
+        with cm():
+            assert sd.eval_model_to_fit(sm.parts) == pytest.approx([1, 1, 1, 1, 2, 2, 2])
+
+            d1.indep = ([10, 20, 30, 40], )
+            m1.c1 = 1
+            assert sd.eval_model_to_fit(sm.parts) == pytest.approx([11, 21, 31, 41, 2, 2, 2])
+
+    finally:
+        sd.close()
+
+    # Outside of cache_filtered the workers are not kept.
+    if not cached:
+        d1.indep = ([1, 2, 3, 4], )
+        assert sd.eval_model_to_fit(sm.parts) == pytest.approx([2, 3, 4, 5, 2, 2, 2])
+        assert sd._resident is None
+
+
 def test_can_get_multi():
     """We don't do much with the value, just check it acts as a bool"""
 